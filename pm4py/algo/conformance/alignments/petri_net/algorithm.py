@@ -36,7 +36,7 @@ import importlib.util
 from typing import Optional, Dict, Any, Union
 from pm4py.objects.log.obj import EventLog, EventStream, Trace
 from pm4py.objects.petri_net.obj import PetriNet, Marking
-from pm4py.util import typing, constants, pandas_utils
+from pm4py.util import typing, constants, pandas_utils, parallel_utils
 import pandas as pd
 
 
@@ -239,7 +239,12 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
 
 def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parameters=None, variant=DEFAULT_VARIANT):
     """
-    Applies the alignments using a process pool (multiprocessing)
+    Applies the alignments using a process pool (multiprocessing).
+
+    The model is sent once to each worker process, and the variants are dispatched in chunks
+    (the longest variants first). The time limits (Parameters.PARAM_MAX_ALIGN_TIME_TRACE and
+    Parameters.PARAM_MAX_ALIGN_TIME) are applied to each variant as in apply_log: a variant
+    exceeding its time gets a None alignment, while the pool continues with the other variants.
 
     Parameters
     ---------------
@@ -252,7 +257,8 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
     final_marking
         Final marking
     parameters
-        Parameters of the algorithm
+        Parameters of the algorithm, including:
+        - Parameters.CORES => number of worker processes
 
     Returns
     ----------------
@@ -262,12 +268,9 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
     if parameters is None:
         parameters = {}
 
-    import multiprocessing
-
+    parameters = copy(parameters)
     variant = __variant_mapper(variant)
 
-    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2)
-
     enable_best_worst_cost = exec_utils.get_param_value(Parameters.ENABLE_BEST_WORST_COST, parameters, True)
 
     variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
@@ -276,33 +279,43 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
         best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
         parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
-    all_alignments = []
+    # the variants of the algorithm (modules) cannot be pickled, hence the name of the variant is sent to the workers
+    variant_name = __get_variant_name(variant)
 
-    from concurrent.futures import ProcessPoolExecutor
-    with ProcessPoolExecutor(max_workers=num_cores) as executor:
-        futures = []
-        for trace in one_tr_per_var:
-            futures.append(executor.submit(apply_trace, trace, petri_net, initial_marking, final_marking, parameters, str(variant)))
-        progress = __get_progress_bar(len(one_tr_per_var), parameters)
-        if progress is not None:
-            alignments_ready = 0
-            while alignments_ready != len(futures):
-                current = 0
-                for index, variant in enumerate(futures):
-                    current = current + 1 if futures[index].done() else current
-                if current > alignments_ready:
-                    for i in range(0, current - alignments_ready):
-                        progress.update()
-                alignments_ready = current
-        for index, variant in enumerate(futures):
-            all_alignments.append(futures[index].result())
-        __close_progress_bar(progress)
+    progress = __get_progress_bar(len(one_tr_per_var), parameters)
+    all_alignments = parallel_utils.apply(one_tr_per_var, __align_variant,
+                                          shared_args=(petri_net, initial_marking, final_marking, parameters,
+                                                       variant_name, time.time()),
+                                          progress=progress, parameters=parameters)
+    __close_progress_bar(progress)
 
     alignments = __form_alignments(variants_idxs, all_alignments)
 
     return alignments
 
 
+def __get_variant_name(variant):
+    for v in Variants:
+        if variant is v or variant is v.value:
+            return v.name
+    raise Exception("the multiprocessing alignments support only the variants in the Variants enumeration")
+
+
+def __align_variant(trace, petri_net, initial_marking, final_marking, parameters, variant_name, start_time):
+    # executed in the worker processes: the time limit of the alignment of the trace is set as in apply_log,
+    # so a variant exceeding its time returns None without affecting the other ones
+    max_align_time = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME, parameters, sys.maxsize)
+    max_align_time_case = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
+                                                     sys.maxsize)
+
+    parameters = copy(parameters)
+    parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = min(max_align_time_case,
+                                                            (max_align_time - (time.time() - start_time)) * 0.5)
+
+    return apply_trace(trace, petri_net, initial_marking, final_marking, parameters=parameters,
+                       variant=Variants[variant_name])
+
+
 def __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters):
     parameters_best_worst = copy(parameters)
 
@@ -27,7 +27,7 @@ from pm4py.objects.conversion.log import converter as log_converter
 from pm4py.objects.log.obj import EventLog
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.util import typing
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import get_calculator
 
 
 class Parameters(Enum):
@@ -90,6 +90,7 @@ def apply(log: EventLog, temporal_profile: typing.TemporalProfile,
 
     business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots)
 
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
@@ -111,10 +112,8 @@ def apply(log: EventLog, temporal_profile: typing.TemporalProfile,
                     act_j = trace[j][activity_key]
                     if (act_i, act_j) in temporal_profile:
                         if business_hours:
-                            bh = BusinessHours(trace[i][timestamp_key],
-                                               trace[j][start_timestamp_key],
-                                               business_hour_slots=business_hours_slots)
-                            this_diff = bh.get_seconds()
+                            this_diff = bh_calculator.get_seconds_between(trace[i][timestamp_key],
+                                                                          trace[j][start_timestamp_key])
                         else:
                             this_diff = time_j - time_i
                         mean = temporal_profile[(act_i, act_j)][0]
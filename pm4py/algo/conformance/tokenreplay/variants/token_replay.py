@@ -27,14 +27,17 @@ from pm4py.objects.petri_net.utils import align_utils
 from copy import copy
 from enum import Enum
 from pm4py.util import exec_utils, constants
-from pm4py.util import variants_util, pandas_utils
+from pm4py.util import variants_util, pandas_utils, parallel_utils
 import importlib.util
+import pickle
 from typing import Optional, Dict, Any, Union
 from pm4py.objects.log.obj import EventLog
+import numpy as np
 import pandas as pd
 from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.trie.obj import Trie
 from pm4py.util import typing
-from collections import Counter
+from collections import Counter, OrderedDict
 from pm4py.objects.conversion.log import converter as log_converter
 
 
@@ -56,6 +59,12 @@ class Parameters(Enum):
     CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS = "consider_activities_not_in_model_in_fitness"
     ENABLE_PLTR_FITNESS = "enable_pltr_fitness"
     SHOW_PROGRESS_BAR = "show_progress_bar"
+    USE_PREFIX_TRIE = "use_prefix_trie"
+    MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
+    PREPARED_MODEL = "prepared_model"
+    MAX_CACHE_SIZE = "max_cache_size"
+    USE_CACHES = "use_caches"
 
 
 class TechnicalParameters(Enum):
@@ -372,221 +381,177 @@ def break_condition_final_marking(marking, final_marking):
     return final_marking_dict_keys.issubset(marking_dict_keys)
 
 
-def apply_trace(trace, net, initial_marking, final_marking, trans_map, enable_pltr_fitness, place_fitness,
-                transition_fitness, notexisting_activities_in_model,
-                places_shortest_path_by_hidden, consider_remaining_in_fitness, activity_key="concept:name",
-                try_to_reach_final_marking_through_hidden=True, stop_immediately_unfit=False,
-                walk_through_hidden_trans=True, post_fix_caching=None,
-                marking_to_activity_caching=None, is_reduction=False,
-                thread_maximum_ex_time=TechnicalParameters.MAX_DEF_THR_EX_TIME.value,
-                enable_postfix_cache=False, enable_marktoact_cache=False, cleaning_token_flood=False,
-                s_components=None, trace_occurrences=1, consider_activities_not_in_model_in_fitness=False):
+def replay_activity(activity, event, trace, net, marking, act_trans, vis_mark, transitions_with_problems,
+                    current_event_map, current_remaining_map, trans_map, enable_pltr_fitness, place_fitness,
+                    transition_fitness, notexisting_activities_in_model, places_shortest_path_by_hidden,
+                    walk_through_hidden_trans=True, stop_immediately_unfit=False, cleaning_token_flood=False,
+                    s_components=None, trace_occurrences=1):
     """
-    Apply the token replaying algorithm to a trace
+    Replays an activity of a trace, starting from the current marking
 
     Parameters
     ----------
+    activity
+        Activity
+    event
+        Event of the trace
     trace
-        Trace in the event log
+        Trace (used as key in the place/transition level statistics)
     net
         Petri net
-    initial_marking
-        Initial marking
-    final_marking
-        Final marking
-    trans_map
-        Map between transitions labels and transitions
-    enable_pltr_fitness
-        Enable fitness retrieval at place/transition level
-    place_fitness
-        Current dictionary of places associated with unfit traces
-    transition_fitness
-        Current dictionary of transitions associated with unfit traces
-    notexisting_activities_in_model
-        Map that stores the notexisting activities in the model
-    places_shortest_path_by_hidden
-        Shortest paths between places by hidden transitions
-    consider_remaining_in_fitness
-        Boolean value telling if the remaining tokens should be considered in fitness evaluation
-    activity_key
-        Name of the attribute that contains the activity
-    try_to_reach_final_marking_through_hidden
-        Boolean value that decides if we shall try to reach the final marking through hidden transitions
-    stop_immediately_unfit
-        Boolean value that decides if we shall stop immediately when a non-conformance is detected
-    walk_through_hidden_trans
-        Boolean value that decides if we shall walk through hidden transitions in order to enable visible transitions
-    post_fix_caching
-        Stores the post fix caching object
-    marking_to_activity_caching
-        Stores the marking-to-activity cache
-    is_reduction
-        Expresses if the token-based replay is called in a reduction attempt
-    thread_maximum_ex_time
-        Alignment threads maximum allowed execution time
-    enable_postfix_cache
-        Enables postfix cache
-    enable_marktoact_cache
-        Enables marking to activity cache
-    cleaning_token_flood
-        Decides if a cleaning of the token flood shall be operated
-    s_components
-        S-components of the Petri net (if workflow net)
+    marking
+        Current marking (could be modified in place)
+    act_trans
+        Transitions activated so far
+    vis_mark
+        Markings visited so far
+    transitions_with_problems
+        Transitions that were fired with missing tokens so far
+    current_event_map
+        Map of the attributes of the events of the trace
+    current_remaining_map
+        Tokens removed so far by the cleaning of the token flood
+    (the other parameters are described in apply_trace)
+
+    Returns
+    ----------
+    [marking, act_trans, vis_mark, missing, consumed, produced, stop]
+        Reached marking, activated and visited transitions, missing/consumed/produced tokens during the replay of the
+        activity, and a boolean telling if the replay of the trace shall be stopped
     """
-    trace_activities = [event[activity_key] for event in trace]
-    act_trans = []
-    transitions_with_problems = []
-    vis_mark = []
-    activating_transition_index = {}
-    activating_transition_interval = []
-    used_postfix_cache = False
-    marking = copy(initial_marking)
-    vis_mark.append(marking)
     missing = 0
     consumed = 0
-    sum_tokens_im = 0
-    for place in initial_marking:
-        sum_tokens_im = sum_tokens_im + initial_marking[place]
-    sum_tokens_fm = 0
-    for place in final_marking:
-        sum_tokens_fm = sum_tokens_fm + final_marking[place]
-    produced = sum_tokens_im
-    current_event_map = {}
-    current_remaining_map = {}
-    for i in range(len(trace)):
-        if enable_postfix_cache and (str(trace_activities) in post_fix_caching.cache and
-                                     hash(marking) in post_fix_caching.cache[str(trace_activities)]):
-            trans_to_act = post_fix_caching.cache[str(trace_activities)][hash(marking)]["trans_to_activate"]
-            for z in range(len(trans_to_act)):
-                t = trans_to_act[z]
-                act_trans.append(t)
-            used_postfix_cache = True
-            marking = post_fix_caching.cache[str(trace_activities)][hash(marking)]["final_marking"]
-            break
+    produced = 0
+    if activity in trans_map:
+        current_event_map.update(event)
+        # change 14/10/2020: to better support duplicate transitions with this approach, we check
+        # whether in the current marking there is at least one transition corresponding to the activity
+        # key without looking at the transition map (that contains one entry per label)
+        corr_en_t = [x for x in semantics.enabled_transitions(net, marking) if x.label == activity]
+        if corr_en_t:
+            t = corr_en_t[0]
         else:
-            prev_len_activated_transitions = len(act_trans)
-            if enable_marktoact_cache and (hash(marking) in marking_to_activity_caching.cache and
-                                           trace[i][activity_key] in marking_to_activity_caching.cache[hash(marking)]
-                                           and trace[i - 1][activity_key] ==
-                                           marking_to_activity_caching.cache[hash(marking)][trace[i][activity_key]]
-                                           ["previousActivity"]):
-                this_end_marking = marking_to_activity_caching.cache[hash(marking)][trace[i][activity_key]][
-                    "end_marking"]
-                this_act_trans = marking_to_activity_caching.cache[hash(marking)][trace[i][activity_key]][
-                    "this_activated_transitions"]
-                this_vis_markings = marking_to_activity_caching.cache[hash(marking)][trace[i][activity_key]][
-                    "this_visited_markings"]
-                act_trans = act_trans + this_act_trans
-                vis_mark = vis_mark + this_vis_markings
-                marking = copy(this_end_marking)
-            else:
-                if trace[i][activity_key] in trans_map:
-                    current_event_map.update(trace[i])
-                    # change 14/10/2020: to better support duplicate transitions with this approach, we check
-                    # whether in the current marking there is at least one transition corresponding to the activity
-                    # key without looking at the transition map (that contains one entry per label)
-                    corr_en_t = [x for x in semantics.enabled_transitions(net, marking) if x.label == trace[i][activity_key]]
-                    if corr_en_t:
-                        t = corr_en_t[0]
-                    else:
-                        t = trans_map[trace[i][activity_key]]
-                    if walk_through_hidden_trans and not semantics.is_enabled(t, net,
-                                                                              marking):
-                        visited_transitions = set()
-                        prev_len_activated_transitions = len(act_trans)
-                        [net, new_marking, new_act_trans, new_vis_mark] = apply_hidden_trans(t, net,
-                                                                                             copy(marking),
-                                                                                             places_shortest_path_by_hidden,
-                                                                                             copy(act_trans),
-                                                                                             0,
-                                                                                             copy(visited_transitions),
-                                                                                             copy(vis_mark))
-                        for jj5 in range(len(act_trans), len(new_act_trans)):
-                            tt5 = new_act_trans[jj5]
-                            c, cmap = get_consumed_tokens(tt5)
-                            p, pmap = get_produced_tokens(tt5)
-                            if enable_pltr_fitness:
-                                for pl2 in cmap:
-                                    if pl2 in place_fitness:
-                                        place_fitness[pl2]["c"] += cmap[pl2] * trace_occurrences
-                                for pl2 in pmap:
-                                    if pl2 in place_fitness:
-                                        place_fitness[pl2]["p"] += pmap[pl2] * trace_occurrences
-                            consumed = consumed + c
-                            produced = produced + p
-                        marking, act_trans, vis_mark = new_marking, new_act_trans, new_vis_mark
-                    is_initially_enabled = True
-                    old_marking_names = [x.name for x in list(marking.keys())]
-                    if not semantics.is_enabled(t, net, marking):
-                        is_initially_enabled = False
-                        transitions_with_problems.append(t)
-                        if stop_immediately_unfit:
-                            missing = missing + 1
-                            break
-                        [m, tokens_added] = add_missing_tokens(t, marking)
-                        missing = missing + m
-                        if enable_pltr_fitness:
-                            for place in tokens_added.keys():
-                                if place in place_fitness:
-                                    place_fitness[place]["underfed_traces"].add(trace)
-                                place_fitness[place]["m"] += tokens_added[place]
-                            if trace not in transition_fitness[t]["underfed_traces"]:
-                                transition_fitness[t]["underfed_traces"][trace] = list()
-                            transition_fitness[t]["underfed_traces"][trace].append(current_event_map)
-                    elif enable_pltr_fitness:
-                        if trace not in transition_fitness[t]["fit_traces"]:
-                            transition_fitness[t]["fit_traces"][trace] = list()
-                        transition_fitness[t]["fit_traces"][trace].append(current_event_map)
-                    c, cmap = get_consumed_tokens(t)
-                    p, pmap = get_produced_tokens(t)
-                    consumed = consumed + c
-                    produced = produced + p
-                    if enable_pltr_fitness:
-                        for pl2 in cmap:
-                            if pl2 in place_fitness:
-                                place_fitness[pl2]["c"] += cmap[pl2] * trace_occurrences
-                        for pl2 in pmap:
-                            if pl2 in place_fitness:
-                                place_fitness[pl2]["p"] += pmap[pl2] * trace_occurrences
-                    if semantics.is_enabled(t, net, marking):
-                        marking = semantics.execute(t, net, marking)
-                        act_trans.append(t)
-                        vis_mark.append(marking)
-                    if not is_initially_enabled and cleaning_token_flood:
-                        # here, a routine for cleaning token flood shall go
-                        new_marking_names = [x.name for x in list(marking.keys())]
-                        new_marking_names_diff = [x for x in new_marking_names if x not in old_marking_names]
-                        new_marking_names_inte = [x for x in new_marking_names if x in old_marking_names]
-                        for p1 in new_marking_names_inte:
-                            for p2 in new_marking_names_diff:
-                                for comp in s_components:
-                                    if p1 in comp and p2 in comp:
-                                        place_to_delete = [place for place in list(marking.keys()) if place.name == p1]
-                                        if len(place_to_delete) == 1:
-                                            del marking[place_to_delete[0]]
-                                            if not place_to_delete[0] in current_remaining_map:
-                                                current_remaining_map[place_to_delete[0]] = 0
-                                            current_remaining_map[place_to_delete[0]] = current_remaining_map[
-                                                                                            place_to_delete[0]] + 1
-                        pass
-                else:
-                    if not trace[i][activity_key] in notexisting_activities_in_model:
-                        notexisting_activities_in_model[trace[i][activity_key]] = {}
-                    notexisting_activities_in_model[trace[i][activity_key]][trace] = current_event_map
-            del trace_activities[0]
-            if len(trace_activities) < TechnicalParameters.MAX_POSTFIX_SUFFIX_LENGTH.value:
-                activating_transition_index[str(trace_activities)] = {"index": len(act_trans),
-                                                                      "marking": hash(marking)}
-            if i > 0:
-                activating_transition_interval.append(
-                    [trace[i][activity_key], prev_len_activated_transitions, len(act_trans),
-                     trace[i - 1][activity_key]])
-            else:
-                activating_transition_interval.append(
-                    [trace[i][activity_key], prev_len_activated_transitions, len(act_trans),
-                     ""])
+            t = trans_map[activity]
+        if walk_through_hidden_trans and not semantics.is_enabled(t, net,
+                                                                  marking):
+            visited_transitions = set()
+            [net, new_marking, new_act_trans, new_vis_mark] = apply_hidden_trans(t, net,
+                                                                                 copy(marking),
+                                                                                 places_shortest_path_by_hidden,
+                                                                                 copy(act_trans),
+                                                                                 0,
+                                                                                 copy(visited_transitions),
+                                                                                 copy(vis_mark))
+            for jj5 in range(len(act_trans), len(new_act_trans)):
+                tt5 = new_act_trans[jj5]
+                c, cmap = get_consumed_tokens(tt5)
+                p, pmap = get_produced_tokens(tt5)
+                if enable_pltr_fitness:
+                    for pl2 in cmap:
+                        if pl2 in place_fitness:
+                            place_fitness[pl2]["c"] += cmap[pl2] * trace_occurrences
+                    for pl2 in pmap:
+                        if pl2 in place_fitness:
+                            place_fitness[pl2]["p"] += pmap[pl2] * trace_occurrences
+                consumed = consumed + c
+                produced = produced + p
+            marking, act_trans, vis_mark = new_marking, new_act_trans, new_vis_mark
+        is_initially_enabled = True
+        old_marking_names = [x.name for x in list(marking.keys())]
+        if not semantics.is_enabled(t, net, marking):
+            is_initially_enabled = False
+            transitions_with_problems.append(t)
+            if stop_immediately_unfit:
+                missing = missing + 1
+                return [marking, act_trans, vis_mark, missing, consumed, produced, True]
+            [m, tokens_added] = add_missing_tokens(t, marking)
+            missing = missing + m
+            if enable_pltr_fitness:
+                for place in tokens_added.keys():
+                    if place in place_fitness:
+                        place_fitness[place]["underfed_traces"].add(trace)
+                    place_fitness[place]["m"] += tokens_added[place]
+                if trace not in transition_fitness[t]["underfed_traces"]:
+                    transition_fitness[t]["underfed_traces"][trace] = list()
+                transition_fitness[t]["underfed_traces"][trace].append(current_event_map)
+        elif enable_pltr_fitness:
+            if trace not in transition_fitness[t]["fit_traces"]:
+                transition_fitness[t]["fit_traces"][trace] = list()
+            transition_fitness[t]["fit_traces"][trace].append(current_event_map)
+        c, cmap = get_consumed_tokens(t)
+        p, pmap = get_produced_tokens(t)
+        consumed = consumed + c
+        produced = produced + p
+        if enable_pltr_fitness:
+            for pl2 in cmap:
+                if pl2 in place_fitness:
+                    place_fitness[pl2]["c"] += cmap[pl2] * trace_occurrences
+            for pl2 in pmap:
+                if pl2 in place_fitness:
+                    place_fitness[pl2]["p"] += pmap[pl2] * trace_occurrences
+        if semantics.is_enabled(t, net, marking):
+            marking = semantics.execute(t, net, marking)
+            act_trans.append(t)
+            vis_mark.append(marking)
+        if not is_initially_enabled and cleaning_token_flood:
+            # here, a routine for cleaning token flood shall go
+            new_marking_names = [x.name for x in list(marking.keys())]
+            new_marking_names_diff = [x for x in new_marking_names if x not in old_marking_names]
+            new_marking_names_inte = [x for x in new_marking_names if x in old_marking_names]
+            for p1 in new_marking_names_inte:
+                for p2 in new_marking_names_diff:
+                    for comp in s_components:
+                        if p1 in comp and p2 in comp:
+                            place_to_delete = [place for place in list(marking.keys()) if place.name == p1]
+                            if len(place_to_delete) == 1:
+                                del marking[place_to_delete[0]]
+                                if not place_to_delete[0] in current_remaining_map:
+                                    current_remaining_map[place_to_delete[0]] = 0
+                                current_remaining_map[place_to_delete[0]] = current_remaining_map[
+                                                                                place_to_delete[0]] + 1
+            pass
+    else:
+        if not activity in notexisting_activities_in_model:
+            notexisting_activities_in_model[activity] = {}
+        notexisting_activities_in_model[activity][trace] = current_event_map
+    return [marking, act_trans, vis_mark, missing, consumed, produced, False]
+
+
+def complete_replay(trace, net, initial_marking, final_marking, marking, act_trans, vis_mark, missing, consumed,
+                    produced, current_remaining_map, enable_pltr_fitness, place_fitness,
+                    places_shortest_path_by_hidden, consider_remaining_in_fitness,
+                    try_to_reach_final_marking_through_hidden=True, trace_occurrences=1,
+                    activities_not_in_model=False):
+    """
+    Completes the replay of a trace (after its activities are replayed), trying to reach the final marking,
+    counting the remaining tokens and computing the fitness
 
-    if try_to_reach_final_marking_through_hidden and not used_postfix_cache:
+    Parameters
+    ----------
+    marking
+        Marking reached after the replay of the activities (modified in place)
+    act_trans
+        Transitions activated so far (modified in place)
+    vis_mark
+        Markings visited so far (modified in place)
+    missing
+        Missing tokens so far
+    consumed
+        Consumed tokens so far
+    produced
+        Produced tokens so far
+    current_remaining_map
+        Tokens removed by the cleaning of the token flood
+    activities_not_in_model
+        Boolean value telling if the trace shall be considered unfit since some activities are not in the model
+    (the other parameters are described in apply_trace)
+
+    Returns
+    ----------
+    [is_fit, trace_fitness, marking, marking_before_cleaning, missing, consumed, remaining, produced]
+        Result of the replay
+    """
+    if try_to_reach_final_marking_through_hidden:
         for i in range(TechnicalParameters.MAX_IT_FINAL1.value):
             if not break_condition_final_marking(marking, final_marking):
                 hidden_transitions_to_enable = get_req_transitions_for_final_marking(marking, final_marking,
@@ -690,7 +655,7 @@ def apply_trace(trace, net, initial_marking, final_marking, trans_map, enable_pl
     else:
         is_fit = (missing == 0)
 
-    if consider_activities_not_in_model_in_fitness and notexisting_activities_in_model:
+    if activities_not_in_model:
         is_fit = False
 
     # separate global counts from local statistics in the case these are not enabled by the options
@@ -714,14 +679,168 @@ def apply_trace(trace, net, initial_marking, final_marking, trans_map, enable_pl
     else:
         trace_fitness = 1.0
 
-    if is_fit:
+    return [is_fit, trace_fitness, marking, marking_before_cleaning, missing, consumed, remaining, produced]
+
+
+def apply_trace(trace, net, initial_marking, final_marking, trans_map, enable_pltr_fitness, place_fitness,
+                transition_fitness, notexisting_activities_in_model,
+                places_shortest_path_by_hidden, consider_remaining_in_fitness, activity_key="concept:name",
+                try_to_reach_final_marking_through_hidden=True, stop_immediately_unfit=False,
+                walk_through_hidden_trans=True, post_fix_caching=None,
+                marking_to_activity_caching=None, is_reduction=False,
+                thread_maximum_ex_time=TechnicalParameters.MAX_DEF_THR_EX_TIME.value,
+                enable_postfix_cache=False, enable_marktoact_cache=False, cleaning_token_flood=False,
+                s_components=None, trace_occurrences=1, consider_activities_not_in_model_in_fitness=False):
+    """
+    Apply the token replaying algorithm to a trace
+
+    Parameters
+    ----------
+    trace
+        Trace in the event log
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    trans_map
+        Map between transitions labels and transitions
+    enable_pltr_fitness
+        Enable fitness retrieval at place/transition level
+    place_fitness
+        Current dictionary of places associated with unfit traces
+    transition_fitness
+        Current dictionary of transitions associated with unfit traces
+    notexisting_activities_in_model
+        Map that stores the notexisting activities in the model
+    places_shortest_path_by_hidden
+        Shortest paths between places by hidden transitions
+    consider_remaining_in_fitness
+        Boolean value telling if the remaining tokens should be considered in fitness evaluation
+    activity_key
+        Name of the attribute that contains the activity
+    try_to_reach_final_marking_through_hidden
+        Boolean value that decides if we shall try to reach the final marking through hidden transitions
+    stop_immediately_unfit
+        Boolean value that decides if we shall stop immediately when a non-conformance is detected
+    walk_through_hidden_trans
+        Boolean value that decides if we shall walk through hidden transitions in order to enable visible transitions
+    post_fix_caching
+        Stores the post fix caching object
+    marking_to_activity_caching
+        Stores the marking-to-activity cache
+    is_reduction
+        Expresses if the token-based replay is called in a reduction attempt
+    thread_maximum_ex_time
+        Alignment threads maximum allowed execution time
+    enable_postfix_cache
+        Enables postfix cache
+    enable_marktoact_cache
+        Enables marking to activity cache
+    cleaning_token_flood
+        Decides if a cleaning of the token flood shall be operated
+    s_components
+        S-components of the Petri net (if workflow net)
+    """
+    trace_activities = [event[activity_key] for event in trace]
+    act_trans = []
+    transitions_with_problems = []
+    vis_mark = []
+    activating_transition_index = {}
+    activating_transition_interval = []
+    used_postfix_cache = False
+    marking = copy(initial_marking)
+    vis_mark.append(marking)
+    missing = 0
+    consumed = 0
+    sum_tokens_im = 0
+    for place in initial_marking:
+        sum_tokens_im = sum_tokens_im + initial_marking[place]
+    sum_tokens_fm = 0
+    for place in final_marking:
+        sum_tokens_fm = sum_tokens_fm + final_marking[place]
+    produced = sum_tokens_im
+    current_event_map = {}
+    current_remaining_map = {}
+    for i in range(len(trace)):
+        if enable_postfix_cache and post_fix_caching.lookup(str(trace_activities), marking):
+            cached = post_fix_caching.cache[str(trace_activities)][hash(marking)]
+            trans_to_act = cached["trans_to_activate"]
+            for z in range(len(trans_to_act)):
+                t = trans_to_act[z]
+                act_trans.append(t)
+            consumed = consumed + cached["consumed"]
+            produced = produced + cached["produced"]
+            used_postfix_cache = True
+            marking = copy(cached["final_marking"])
+            break
+        else:
+            prev_len_activated_transitions = len(act_trans)
+            if enable_marktoact_cache and marking_to_activity_caching.lookup(marking, trace[i][activity_key],
+                                                                             trace[i - 1][activity_key]):
+                cached = marking_to_activity_caching.cache[hash(marking)][trace[i][activity_key]]
+                act_trans = act_trans + cached["this_activated_transitions"]
+                vis_mark = vis_mark + cached["this_visited_markings"]
+                consumed = consumed + cached["consumed"]
+                produced = produced + cached["produced"]
+                marking = copy(cached["end_marking"])
+            else:
+                [marking, act_trans, vis_mark, event_missing, event_consumed, event_produced, stop] = \
+                    replay_activity(trace[i][activity_key], trace[i], trace, net, marking, act_trans, vis_mark,
+                                    transitions_with_problems, current_event_map, current_remaining_map, trans_map,
+                                    enable_pltr_fitness, place_fitness, transition_fitness,
+                                    notexisting_activities_in_model, places_shortest_path_by_hidden,
+                                    walk_through_hidden_trans=walk_through_hidden_trans,
+                                    stop_immediately_unfit=stop_immediately_unfit,
+                                    cleaning_token_flood=cleaning_token_flood, s_components=s_components,
+                                    trace_occurrences=trace_occurrences)
+                missing = missing + event_missing
+                consumed = consumed + event_consumed
+                produced = produced + event_produced
+                if stop:
+                    break
+            del trace_activities[0]
+            if enable_postfix_cache and len(trace_activities) < TechnicalParameters.MAX_POSTFIX_SUFFIX_LENGTH.value:
+                activating_transition_index[str(trace_activities)] = {"index": len(act_trans),
+                                                                      "marking": hash(marking),
+                                                                      "marking_object": copy(marking)}
+            if i > 0:
+                activating_transition_interval.append(
+                    [trace[i][activity_key], prev_len_activated_transitions, len(act_trans),
+                     trace[i - 1][activity_key]])
+            else:
+                activating_transition_interval.append(
+                    [trace[i][activity_key], prev_len_activated_transitions, len(act_trans),
+                     ""])
+
+    # (the marking is copied, since it is modified in place and it is also one of the visited markings)
+    [is_fit, trace_fitness, marking, marking_before_cleaning, missing, consumed, remaining, produced] = \
+        complete_replay(trace, net, initial_marking, final_marking, copy(marking), act_trans, vis_mark, missing,
+                        consumed, produced, current_remaining_map, enable_pltr_fitness, place_fitness,
+                        places_shortest_path_by_hidden, consider_remaining_in_fitness,
+                        try_to_reach_final_marking_through_hidden=try_to_reach_final_marking_through_hidden and
+                                                                  not used_postfix_cache,
+                        trace_occurrences=trace_occurrences,
+                        activities_not_in_model=consider_activities_not_in_model_in_fitness and
+                                                bool(notexisting_activities_in_model))
+
+    # the caches are populated only when they are used. Since the trace is fit, no token was missing, so the replay
+    # of a suffix (or of an activity) depends only on the marking in which it starts, and its effect (transitions,
+    # reached marking, consumed and produced tokens) can be re-used by other traces
+    if is_fit and enable_postfix_cache and all(x[activity_key] in trans_map for x in trace):
         for suffix in activating_transition_index:
             if suffix not in post_fix_caching.cache:
                 post_fix_caching.cache[suffix] = {}
             if activating_transition_index[suffix]["marking"] not in post_fix_caching.cache[suffix]:
+                trans_to_activate = act_trans[activating_transition_index[suffix]["index"]:]
                 post_fix_caching.cache[suffix][activating_transition_index[suffix]["marking"]] = \
-                    {"trans_to_activate": act_trans[activating_transition_index[suffix]["index"]:],
-                     "final_marking": marking}
+                    {"trans_to_activate": trans_to_activate,
+                     "final_marking": marking_before_cleaning,
+                     "start_marking": activating_transition_index[suffix]["marking_object"],
+                     "consumed": sum(get_consumed_tokens(t)[0] for t in trans_to_activate),
+                     "produced": sum(get_produced_tokens(t)[0] for t in trans_to_activate)}
+    if is_fit and enable_marktoact_cache:
         for trans in activating_transition_interval:
             activity = trans[0]
             start_marking_index = trans[1]
@@ -742,7 +861,9 @@ def apply_trace(trace, net, initial_marking, final_marking, trans_map, enable_pl
                             "start_marking": start_marking_object, "end_marking": end_marking_object,
                             "this_activated_transitions": this_activated_trans,
                             "this_visited_markings": this_visited_markings,
-                            "previousActivity": previous_activity}
+                            "previousActivity": previous_activity,
+                            "consumed": sum(get_consumed_tokens(t)[0] for t in this_activated_trans),
+                            "produced": sum(get_produced_tokens(t)[0] for t in this_activated_trans)}
 
     return [is_fit, trace_fitness, act_trans, transitions_with_problems, marking_before_cleaning,
             align_utils.get_visible_transitions_eventually_enabled_by_marking(net, marking_before_cleaning), missing,
@@ -758,7 +879,8 @@ class ApplyTraceTokenReplay:
                  walk_through_hidden_trans=True, post_fix_caching=None,
                  marking_to_activity_caching=None, is_reduction=False,
                  thread_maximum_ex_time=TechnicalParameters.MAX_DEF_THR_EX_TIME.value,
-                 cleaning_token_flood=False, s_components=None, trace_occurrences=1, consider_activities_not_in_model_in_fitness=False):
+                 cleaning_token_flood=False, s_components=None, trace_occurrences=1, consider_activities_not_in_model_in_fitness=False,
+                 use_caches=False):
         """
         Constructor
 
@@ -805,6 +927,8 @@ class ApplyTraceTokenReplay:
             S-components of the Petri net
         trace_occurrences
             Trace weight (number of occurrences)
+        use_caches
+            Enables the postfix and marking-to-activity caches
         """
         self.thread_is_alive = True
         self.trace = trace
@@ -830,7 +954,7 @@ class ApplyTraceTokenReplay:
         self.cleaning_token_flood = cleaning_token_flood
         self.enable_postfix_cache = TechnicalParameters.ENABLE_POSTFIX_CACHE.value
         self.enable_marktoact_cache = TechnicalParameters.ENABLE_MARKTOACT_CACHE.value
-        if self.is_reduction:
+        if self.is_reduction or use_caches:
             self.enable_postfix_cache = True
             self.enable_marktoact_cache = True
         self.t_fit = None
@@ -872,24 +996,677 @@ class ApplyTraceTokenReplay:
         self.thread_is_alive = False
 
 
+class LRUCache(OrderedDict):
+    """
+    Dictionary containing at most max_size keys: when a new key is inserted in a full cache,
+    the least recently used (read or written) key is removed
+    """
+
+    def __init__(self, max_size=None):
+        super().__init__()
+        self.max_size = max_size
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if self.max_size is not None and len(self) > self.max_size:
+            self.popitem(last=False)
+
+
 class PostFixCaching:
     """
-    Post fix caching object
+    Post fix caching object: associates to a suffix of a trace and to the (hash of the) marking in which the suffix
+    starts the transitions activated by the replay of the suffix, and the reached marking.
+    At most max_size suffixes are kept (the least recently used ones are removed).
     """
 
-    def __init__(self):
-        self.cache = 0
-        self.cache = {}
+    def __init__(self, max_size=None):
+        self.cache = LRUCache(max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, suffix, marking):
+        """
+        Checks if the replay of the suffix from the given marking is cached (updating the statistics)
+        """
+        marking_hash = hash(marking)
+        if suffix in self.cache and marking_hash in self.cache[suffix] and \
+                self.cache[suffix][marking_hash]["start_marking"] == marking:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # the hash of a marking depends on the identity of its places, hence it is recomputed on the restored markings
+        for suffix in list(self.cache.keys()):
+            self.cache[suffix] = {hash(x["start_marking"]): x for x in self.cache[suffix].values()}
 
 
 class MarkingToActivityCaching:
     """
-    Marking to activity caching
+    Marking to activity caching: associates to the (hash of a) marking and to an activity the transitions
+    activated by the replay of the activity, and the reached marking.
+    At most max_size markings are kept (the least recently used ones are removed).
+    """
+
+    def __init__(self, max_size=None):
+        self.cache = LRUCache(max_size)
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, marking, activity, previous_activity):
+        """
+        Checks if the replay of the activity (following the previous activity) from the given marking is cached
+        (updating the statistics)
+        """
+        marking_hash = hash(marking)
+        if marking_hash in self.cache and activity in self.cache[marking_hash] and \
+                self.cache[marking_hash][activity]["previousActivity"] == previous_activity and \
+                self.cache[marking_hash][activity]["start_marking"] == marking:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # the hash of a marking depends on the identity of its places, hence it is recomputed on the restored markings
+        cache = LRUCache(self.cache.max_size)
+        for entries in self.cache.values():
+            cache[hash(next(iter(entries.values()))["start_marking"])] = entries
+        self.cache = cache
+
+
+class PreparedModel:
+    """
+    Petri net prepared for the token-based replay, which can be re-used across different calls (and different logs).
+    It contains the structures depending only on the model (the shortest paths between places through hidden
+    transitions, and the S-components), and the postfix and marking-to-activity caches (bounded, with hit/miss
+    statistics), which are populated by the replays using the prepared model.
+
+    A prepared model can be stored on disk (write_prepared_model) and read by another process (read_prepared_model).
+    The replays should then use the Petri net and the markings of the read prepared model.
+    """
+
+    def __init__(self, net, initial_marking, final_marking, places_shortest_path_by_hidden, s_components,
+                 max_cache_size=None, use_caches=True):
+        self.net = net
+        self.initial_marking = initial_marking
+        self.final_marking = final_marking
+        self.places_shortest_path_by_hidden = places_shortest_path_by_hidden
+        self.s_components = s_components
+        self.use_caches = use_caches
+        self.max_cache_size = max_cache_size
+        self.cache_options = None
+        self.post_fix_caching = PostFixCaching(max_cache_size)
+        self.marking_to_activity_caching = MarkingToActivityCaching(max_cache_size)
+
+    def get_caches(self, options):
+        """
+        Gets the caches for a replay with the given options (the options changing the replay of the fit traces).
+        The caches are emptied when the options differ from the ones of the previous replays
+        """
+        if options != self.cache_options:
+            self.post_fix_caching = PostFixCaching(self.max_cache_size)
+            self.marking_to_activity_caching = MarkingToActivityCaching(self.max_cache_size)
+            self.cache_options = options
+        return self.post_fix_caching, self.marking_to_activity_caching
+
+    def get_cache_statistics(self):
+        """
+        Gets the statistics (hits, misses, number of cached entries) of the caches
+        """
+        return {"postfix": {"hits": self.post_fix_caching.hits, "misses": self.post_fix_caching.misses,
+                            "size": len(self.post_fix_caching.cache)},
+                "marking_to_activity": {"hits": self.marking_to_activity_caching.hits,
+                                        "misses": self.marking_to_activity_caching.misses,
+                                        "size": len(self.marking_to_activity_caching.cache)}}
+
+
+def prepare_model(net: PetriNet, initial_marking: Marking, final_marking: Marking,
+                  parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> PreparedModel:
+    """
+    Prepares a Petri net for the token-based replay (see PreparedModel).
+    The prepared model is then provided to the replay through Parameters.PREPARED_MODEL
+
+    Parameters
+    -------------
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the method, including:
+        - Parameters.MAX_CACHE_SIZE => maximum number of entries of each cache (default: 10000)
+        - Parameters.USE_CACHES => uses the postfix and marking-to-activity caches during the replay (default: True).
+        When the caches are not used, only the structures depending on the model are re-used
+
+    Returns
+    -------------
+    prepared_model
+        Prepared model
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_cache_size = exec_utils.get_param_value(Parameters.MAX_CACHE_SIZE, parameters, 10000)
+    use_caches = exec_utils.get_param_value(Parameters.USE_CACHES, parameters, True)
+
+    places_shortest_path_by_hidden = get_places_shortest_path_by_hidden(net, TechnicalParameters.MAX_REC_DEPTH.value)
+    s_components = get_s_components_from_petri(net, initial_marking, final_marking)
+
+    return PreparedModel(net, initial_marking, final_marking, places_shortest_path_by_hidden, s_components,
+                         max_cache_size=max_cache_size, use_caches=use_caches)
+
+
+def write_prepared_model(prepared_model: PreparedModel, file_path: str):
+    """
+    Writes a prepared model (including the content of its caches) to a file
+
+    Parameters
+    -------------
+    prepared_model
+        Prepared model
+    file_path
+        Path of the file
+    """
+    with open(file_path, "wb") as F:
+        pickle.dump(prepared_model, F, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def read_prepared_model(file_path: str) -> PreparedModel:
+    """
+    Reads a prepared model from a file (which should come from a trusted location, since it is read with pickle)
+
+    Parameters
+    -------------
+    file_path
+        Path of the file
+
+    Returns
+    -------------
+    prepared_model
+        Prepared model
+    """
+    with open(file_path, "rb") as F:
+        return pickle.load(F)
+
+
+class TrieReplayState:
+    """
+    State of the replay after the activities of a node of the prefix trie (and of its ancestors) are replayed.
+    The activated transitions and the transitions with problems are stored only for the activity of the node,
+    and are reconstructed following the parent states.
+    """
+    __slots__ = ("parent", "marking", "missing", "consumed", "produced", "remaining_map", "stopped",
+                 "activities_not_in_model", "act_trans", "transitions_with_problems")
+
+    def __init__(self, parent, marking, missing, consumed, produced, remaining_map, stopped, activities_not_in_model,
+                 act_trans, transitions_with_problems):
+        self.parent = parent
+        self.marking = marking
+        self.missing = missing
+        self.consumed = consumed
+        self.produced = produced
+        self.remaining_map = remaining_map
+        self.stopped = stopped
+        self.activities_not_in_model = activities_not_in_model
+        self.act_trans = act_trans
+        self.transitions_with_problems = transitions_with_problems
+
+    def get_path(self, attribute):
+        path = []
+        state = self
+        while state is not None:
+            path.append(getattr(state, attribute))
+            state = state.parent
+        return [x for delta in reversed(path) for x in delta]
+
+
+class TrieReplayResult:
+    """
+    Result of the replay of a variant through the prefix trie (same attributes as ApplyTraceTokenReplay)
+    """
+
+    def __init__(self, t_fit, t_value, act_trans, trans_probl, reached_marking, enabled_trans_in_mark, missing,
+                 consumed, remaining, produced, activities_not_in_model):
+        self.t_fit = t_fit
+        self.t_value = t_value
+        self.act_trans = act_trans
+        self.trans_probl = trans_probl
+        self.reached_marking = reached_marking
+        self.enabled_trans_in_mark = enabled_trans_in_mark
+        self.missing = missing
+        self.consumed = consumed
+        self.remaining = remaining
+        self.produced = produced
+        self.activities_not_in_model = activities_not_in_model
+
+
+def apply_variants_trie(variants, net, initial_marking, final_marking, trans_map, places_shortest_path_by_hidden,
+                        consider_remaining_in_fitness, reach_mark_through_hidden=True, stop_immediately_unfit=False,
+                        walk_through_hidden_trans=True, cleaning_token_flood=False, s_components=None, progress=None):
+    """
+    Replays a list of variants organizing them in a prefix trie: the activities of each node of the trie
+    are replayed once, and the state reached after a node (marking and token counts) is the starting point of
+    all its children. Hence, the common prefixes of the variants are replayed only once.
+
+    The results are identical to the ones of apply_trace (without place/transition level statistics and caches).
+
+    Parameters
+    ----------
+    variants
+        List of variants (tuples of activities)
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    trans_map
+        Map between transitions labels and transitions
+    places_shortest_path_by_hidden
+        Shortest paths between places by hidden transitions
+    (the other parameters are described in apply_trace)
+    progress
+        (optional) Progress bar, updated when the replay of a variant is completed
+
+    Returns
+    ----------
+    results
+        List of results (TrieReplayResult), one for each variant. The attribute activities_not_in_model tells if some
+        activities of the variant are not in the model
+    """
+    root = Trie()
+    children = {}
+    final_nodes = []
+    for variant in variants:
+        node = root
+        for activity in variant:
+            key = (id(node), activity)
+            if key not in children:
+                child = Trie(label=activity, parent=node, depth=node.depth + 1)
+                node.children.append(child)
+                children[key] = child
+            node = children[key]
+        node.final = True
+        final_nodes.append(node)
+
+    results = {}
+    root_state = TrieReplayState(None, copy(initial_marking), 0, 0, sum(initial_marking.values()), {}, False, False,
+                                 [], [])
+    to_visit = [(root, root_state)]
+    while to_visit:
+        node, state = to_visit.pop()
+
+        if node.final:
+            act_trans = state.get_path("act_trans")
+            [is_fit, trace_fitness, marking, marking_before_cleaning, missing, consumed, remaining, produced] = \
+                complete_replay(None, net, initial_marking, final_marking, copy(state.marking), act_trans, [],
+                                state.missing, state.consumed, state.produced, copy(state.remaining_map), False,
+                                None, places_shortest_path_by_hidden, consider_remaining_in_fitness,
+                                try_to_reach_final_marking_through_hidden=reach_mark_through_hidden)
+            results[id(node)] = TrieReplayResult(is_fit, trace_fitness, act_trans,
+                                                 state.get_path("transitions_with_problems"),
+                                                 marking_before_cleaning,
+                                                 align_utils.get_visible_transitions_eventually_enabled_by_marking(
+                                                     net, marking_before_cleaning), missing, consumed, remaining,
+                                                 produced, state.activities_not_in_model)
+            if progress is not None:
+                progress.update()
+
+        for child in node.children:
+            if state.stopped:
+                # the remaining activities are not replayed
+                to_visit.append((child, state))
+                continue
+            notexisting_activities_in_model = {}
+            transitions_with_problems = []
+            remaining_map = copy(state.remaining_map) if cleaning_token_flood else state.remaining_map
+            [marking, act_trans, vis_mark, missing, consumed, produced, stop] = \
+                replay_activity(child.label, {}, None, net, copy(state.marking), [], [], transitions_with_problems,
+                                {}, remaining_map, trans_map, False, None, None, notexisting_activities_in_model,
+                                places_shortest_path_by_hidden, walk_through_hidden_trans=walk_through_hidden_trans,
+                                stop_immediately_unfit=stop_immediately_unfit,
+                                cleaning_token_flood=cleaning_token_flood, s_components=s_components)
+            to_visit.append((child, TrieReplayState(state, marking, state.missing + missing, state.consumed + consumed,
+                                                    state.produced + produced, remaining_map, stop,
+                                                    state.activities_not_in_model or bool(
+                                                        notexisting_activities_in_model), act_trans,
+                                                    transitions_with_problems)))
+
+    return [results[id(node)] for node in final_nodes]
+
+
+class ColumnarReplayResult:
+    """
+    Compact (columnar) result of the token-based replay of a log: the results are stored once for each variant,
+    in arrays having one position for each variant, and each case points to the position of its variant.
+
+    Attributes
+    ----------
+    variants
+        List of variants (tuples of activities)
+    trace_is_fit
+        Boolean array telling if each variant is fit
+    trace_fitness
+        Fitness value of each variant
+    missing_tokens
+        Number of missing tokens of each variant
+    consumed_tokens
+        Number of consumed tokens of each variant
+    remaining_tokens
+        Number of remaining tokens of each variant
+    produced_tokens
+        Number of produced tokens of each variant
+    enabled_transitions_in_marking_labels
+        Labels of the visible transitions that are enabled in the marking reached by each variant
+    case_variant
+        Position of the variant of each case (in the order of the cases of the log)
+    case_ids
+        Identifiers of the cases (the case identifiers for dataframes, the positions of the traces for event logs)
+    """
+
+    def __init__(self, variants, trace_is_fit, trace_fitness, missing_tokens, consumed_tokens, remaining_tokens,
+                 produced_tokens, enabled_transitions_in_marking_labels, case_variant, case_ids=None):
+        self.variants = variants
+        self.trace_is_fit = trace_is_fit
+        self.trace_fitness = trace_fitness
+        self.missing_tokens = missing_tokens
+        self.consumed_tokens = consumed_tokens
+        self.remaining_tokens = remaining_tokens
+        self.produced_tokens = produced_tokens
+        self.enabled_transitions_in_marking_labels = enabled_transitions_in_marking_labels
+        self.case_variant = case_variant
+        self.case_ids = case_ids
+
+    def __len__(self):
+        return len(self.case_variant)
+
+    @property
+    def variant_counts(self):
+        """
+        Number of cases of each variant
+        """
+        return np.bincount(self.case_variant, minlength=len(self.variants))
+
+    def get_case_result(self, case_position):
+        """
+        Gets the result of the replay of a case (with the same keys of the output of the replay, for the
+        information stored in the columnar result)
+        """
+        v = self.case_variant[case_position]
+        return {"trace_is_fit": bool(self.trace_is_fit[v]), "trace_fitness": float(self.trace_fitness[v]),
+                "enabled_transitions_in_marking_labels": list(self.enabled_transitions_in_marking_labels[v]),
+                "missing_tokens": int(self.missing_tokens[v]), "consumed_tokens": int(self.consumed_tokens[v]),
+                "remaining_tokens": int(self.remaining_tokens[v]), "produced_tokens": int(self.produced_tokens[v])}
+
+
+def replay_variants_block(variants, net, initial_marking, final_marking, places_shortest_path_by_hidden,
+                          s_components, options):
+    """
+    Replays a block of variants through a prefix trie, getting a compact result for each variant
+    (executed by the worker processes of apply_variants_columnar)
+
+    Parameters
+    ----------
+    variants
+        List of variants (tuples of activities)
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    places_shortest_path_by_hidden
+        Shortest paths between places by hidden transitions
+    s_components
+        S-components of the Petri net (used when cleaning the token flood)
+    options
+        Options of the replay (keyword arguments of apply_variants_trie)
+
+    Returns
+    ----------
+    results
+        List of tuples (is fit, fitness, missing, consumed, remaining, produced, activities not in model,
+        labels of the enabled transitions), one for each variant
+    """
+    results = apply_variants_trie(variants, net, initial_marking, final_marking, get_trans_map(net),
+                                  places_shortest_path_by_hidden, s_components=s_components, **options)
+    return [(t.t_fit, t.t_value, t.missing, t.consumed, t.remaining, t.produced, t.activities_not_in_model,
+             tuple(x.label for x in t.enabled_trans_in_mark if x.label is not None)) for t in results]
+
+
+def __split_blocks(variants, num_blocks):
+    # the variants are sorted lexicographically, so the variants sharing a prefix fall (mostly) in the same block
+    order = sorted(range(len(variants)), key=lambda i: variants[i])
+    target_weight = sum(len(v) + 1 for v in variants) / max(1, num_blocks)
+    blocks = [[]]
+    weight = 0
+    for i in order:
+        if weight >= target_weight:
+            blocks.append([])
+            weight = 0
+        blocks[-1].append(i)
+        weight += len(variants[i]) + 1
+    return [b for b in blocks if b]
+
+
+def apply_variants_columnar(variants, net, initial_marking, final_marking, parameters=None):
+    """
+    Replays a list of variants, getting a compact (columnar) result.
+
+    The variants are split in blocks of variants sharing their prefixes, and each block is replayed through
+    a prefix trie. With Parameters.MULTIPROCESSING, the blocks are replayed by a pool of processes,
+    to which the Petri net (and the shortest paths between its places) is sent once.
+
+    Parameters
+    ----------
+    variants
+        List of variants (tuples of activities). When an activity that is not in the model is met, the variants
+        following it in the list are considered unfit (if Parameters.CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS)
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (the same of apply, except the place/transition level statistics and the
+        reduction mode), including:
+        - Parameters.MULTIPROCESSING => replays the variants using a pool of processes
+        - Parameters.CORES => number of processes of the pool
+        - Parameters.PREPARED_MODEL => prepared model (see prepare_model), re-using its shortest paths between places
+        and its S-components
+
+    Returns
+    ----------
+    columnar_result
+        Columnar result (in which case_variant and case_ids are not set)
+    """
+    if parameters is None:
+        parameters = {}
+
+    consider_remaining_in_fitness = exec_utils.get_param_value(Parameters.CONSIDER_REMAINING_IN_FITNESS, parameters,
+                                                               True)
+    try_to_reach_final_marking_through_hidden = exec_utils.get_param_value(
+        Parameters.TRY_TO_REACH_FINAL_MARKING_THROUGH_HIDDEN, parameters, True)
+    stop_immediately_unfit = exec_utils.get_param_value(Parameters.STOP_IMMEDIATELY_UNFIT, parameters, False)
+    walk_through_hidden_trans = exec_utils.get_param_value(Parameters.WALK_THROUGH_HIDDEN_TRANS, parameters, True)
+    cleaning_token_flood = exec_utils.get_param_value(Parameters.CLEANING_TOKEN_FLOOD, parameters, False)
+    places_shortest_path_by_hidden = exec_utils.get_param_value(Parameters.PLACES_SHORTEST_PATH_BY_HIDDEN, parameters,
+                                                                None)
+    consider_activities_not_in_model_in_fitness = exec_utils.get_param_value(
+        Parameters.CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS, parameters, False)
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters,
+                                                   constants.SHOW_PROGRESS_BAR)
+    multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters,
+                                                 constants.ENABLE_MULTIPROCESSING_DEFAULT)
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, parallel_utils.get_default_cores())
+    prepared_model = exec_utils.get_param_value(Parameters.PREPARED_MODEL, parameters, None)
+    if not multiprocessing:
+        cores = 1
+
+    if prepared_model is not None:
+        # only the structures depending on the model are re-used (the caches are not used by the trie replay)
+        if net is not prepared_model.net:
+            raise Exception("the prepared model refers to a different Petri net")
+        if places_shortest_path_by_hidden is None:
+            places_shortest_path_by_hidden = prepared_model.places_shortest_path_by_hidden
+        s_components = prepared_model.s_components if cleaning_token_flood else []
+    else:
+        if places_shortest_path_by_hidden is None:
+            places_shortest_path_by_hidden = get_places_shortest_path_by_hidden(
+                net, TechnicalParameters.MAX_REC_DEPTH.value)
+        s_components = get_s_components_from_petri(net, initial_marking, final_marking) if cleaning_token_flood else []
+
+    options = {"consider_remaining_in_fitness": consider_remaining_in_fitness,
+               "reach_mark_through_hidden": try_to_reach_final_marking_through_hidden,
+               "stop_immediately_unfit": stop_immediately_unfit,
+               "walk_through_hidden_trans": walk_through_hidden_trans,
+               "cleaning_token_flood": cleaning_token_flood}
+
+    # with a single process, all the variants are replayed through a single trie
+    blocks = __split_blocks(variants, 4 * cores if cores > 1 else 1)
+
+    progress = None
+    if importlib.util.find_spec("tqdm") and show_progress_bar and len(variants) > 1:
+        from tqdm.auto import tqdm
+        progress = tqdm(total=len(variants), desc="replaying log with TBR, completed traces :: ")
+
+    results = [None] * len(variants)
+    for idx, block_results in parallel_utils.iterate_results(
+            [[variants[i] for i in block] for block in blocks], replay_variants_block,
+            shared_args=(net, initial_marking, final_marking, places_shortest_path_by_hidden, s_components, options),
+            parameters={parallel_utils.Parameters.CORES: cores}):
+        for i, result in zip(blocks[idx], block_results):
+            results[i] = result
+        if progress is not None:
+            progress.update(len(blocks[idx]))
+
+    if progress is not None:
+        progress.close()
+    del progress
+
+    trace_is_fit = np.array([r[0] for r in results], dtype=bool)
+    if consider_activities_not_in_model_in_fitness:
+        # once an activity that is not in the model has been met, the following variants are considered unfit
+        activities_not_in_model = np.logical_or.accumulate(np.array([r[6] for r in results], dtype=bool))
+        trace_is_fit = trace_is_fit & ~activities_not_in_model
+
+    return ColumnarReplayResult(list(variants), trace_is_fit, np.array([r[1] for r in results], dtype=np.float64),
+                                np.array([r[2] for r in results], dtype=np.int64),
+                                np.array([r[3] for r in results], dtype=np.int64),
+                                np.array([r[4] for r in results], dtype=np.int64),
+                                np.array([r[5] for r in results], dtype=np.int64),
+                                [r[7] for r in results], np.zeros(0, dtype=np.int64))
+
+
+def apply_columnar(log: Union[EventLog, pd.DataFrame], net: PetriNet, initial_marking: Marking,
+                   final_marking: Marking,
+                   parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> ColumnarReplayResult:
+    """
+    Applies the token-based replay to a log, getting a compact (columnar) result, in which the results are stored
+    once for each variant (instead of building a dictionary for each case).
+
+    Parameters
+    -----------
+    log
+        Event log or Pandas dataframe
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (see apply_variants_columnar)
+
+    Returns
+    -----------
+    columnar_result
+        Columnar result of the replay
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_util.DEFAULT_NAME_KEY)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+
+    if type(log) is not pd.DataFrame:
+        log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
+
+    case_ids, vc = get_variants_cases(log, activity_key=activity_key, case_id_key=case_id_key)
+
+    result = apply_variants_columnar([x[0] for x in vc], net, initial_marking, final_marking, parameters=parameters)
+
+    case_variant = np.zeros(len(case_ids), dtype=np.int64)
+    for i in range(len(vc)):
+        case_variant[vc[i][1]] = i
+    result.case_variant = case_variant
+    result.case_ids = case_ids
+
+    return result
+
+
+def get_trans_map(net):
+    """
+    Gets the map between the labels and the transitions of the Petri net. In the case of duplicate labels,
+    the transition with the greatest name is kept (so the same transition is always chosen)
+    """
+    trans_map = {}
+    for t in sorted(list(net.transitions), key=lambda x: x.name):
+        trans_map[t.label] = t
+    return trans_map
+
+
+def get_variants_cases(log, activity_key=xes_util.DEFAULT_NAME_KEY, case_id_key=constants.CASE_CONCEPT_NAME):
+    """
+    Groups the cases of the log by their variant
+
+    Parameters
+    ----------
+    log
+        Event log or Pandas dataframe
+    activity_key
+        Activity key
+    case_id_key
+        Case identifier (for Pandas dataframes)
+
+    Returns
+    ----------
+    case_ids
+        Identifiers of the cases (the case identifiers for dataframes, the positions of the traces for event logs)
+    vc
+        List of couples (variant, positions of the cases of the variant), sorted by decreasing number of cases
     """
+    if pandas_utils.check_is_pandas_dataframe(log):
+        grouped = log.groupby(case_id_key)[activity_key].agg(list).to_dict()
+        case_ids = list(grouped.keys())
+        traces = [tuple(x) for x in grouped.values()]
+    else:
+        case_ids = list(range(len(log)))
+        traces = [tuple(x[activity_key] for x in trace) for trace in log]
 
-    def __init__(self):
-        self.cache = 0
-        self.cache = {}
+    variants = dict()
+    for i, t in enumerate(traces):
+        if t not in variants:
+            variants[t] = list()
+        variants[t].append(i)
+
+    vc = [(k, v) for k, v in variants.items()]
+    vc = list(sorted(vc, key=lambda x: (len(x[1]), x[0]), reverse=True))
+
+    return case_ids, vc
 
 
 def get_variant_from_trace(trace, activity_key, disable_variants=False):
@@ -958,7 +1735,8 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
               walk_through_hidden_trans=True, places_shortest_path_by_hidden=None,
               is_reduction=False, thread_maximum_ex_time=TechnicalParameters.MAX_DEF_THR_EX_TIME.value,
               cleaning_token_flood=False, disable_variants=False, return_object_names=False, show_progress_bar=True,
-              consider_activities_not_in_model_in_fitness=False, case_id_key=constants.CASE_CONCEPT_NAME):
+              consider_activities_not_in_model_in_fitness=False, case_id_key=constants.CASE_CONCEPT_NAME,
+              use_prefix_trie=True, prepared_model=None):
     """
     Apply token-based replay to a log
 
@@ -996,9 +1774,25 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
         Disable variants grouping
     return_object_names
         Decides whether names instead of object pointers shall be returned
+    use_prefix_trie
+        Replays the variants through a prefix trie, so the common prefixes are replayed only once. It is used only
+        when the place/transition level statistics are not requested, and the replay is not a reduction attempt
+    prepared_model
+        (optional) Prepared model (see prepare_model), providing the structures depending on the model and
+        the caches re-used across different calls
     """
-    post_fix_cache = PostFixCaching()
-    marking_to_activity_cache = MarkingToActivityCaching()
+    use_caches = False
+    if prepared_model is not None:
+        if net is not prepared_model.net:
+            raise Exception("the prepared model refers to a different Petri net")
+        post_fix_cache, marking_to_activity_cache = prepared_model.get_caches((walk_through_hidden_trans,
+                                                                               reach_mark_through_hidden))
+        use_caches = prepared_model.use_caches
+        if places_shortest_path_by_hidden is None:
+            places_shortest_path_by_hidden = prepared_model.places_shortest_path_by_hidden
+    else:
+        post_fix_cache = PostFixCaching()
+        marking_to_activity_cache = MarkingToActivityCaching()
     if places_shortest_path_by_hidden is None:
         places_shortest_path_by_hidden = get_places_shortest_path_by_hidden(net,
                                                                             TechnicalParameters.MAX_REC_DEPTH.value)
@@ -1019,7 +1813,10 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
     s_components = []
 
     if cleaning_token_flood:
-        s_components = get_s_components_from_petri(net, initial_marking, final_marking)
+        if prepared_model is not None:
+            s_components = prepared_model.s_components
+        else:
+            s_components = get_s_components_from_petri(net, initial_marking, final_marking)
 
     notexisting_activities_in_model = {}
 
@@ -1027,98 +1824,103 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
     # transitions are now fired as follows:
     # - (from a previous update on 14/10/2020) it is checked if in the current market any transition having as label the current activity is enabled. If that's true, then the given transition is fired
     # - otherwise, if there are no corresponding transitions enabled in the current marking, the TBR tries to enable with invisibles always the same transition (removing undeterminism)
-    trans_map = {}
-    for t in sorted(list(net.transitions), key=lambda x: x.name):
-        trans_map[t.label] = t
+    trans_map = get_trans_map(net)
 
-    if pandas_utils.check_is_pandas_dataframe(log):
-        traces = [(tuple(x), y) for y, x in log.groupby(case_id_key)[activity_key].agg(list).to_dict().items()]
-        traces = [(traces[i][0], i) for i in range(len(traces))]
-    else:
-        traces = [(tuple(x[activity_key] for x in log[i]), i) for i in range(len(log))]
-
-    variants = dict()
-    for t in traces:
-        if t[0] not in variants:
-            variants[t[0]] = list()
-        variants[t[0]].append(t[1])
-
-    traces = [t[0] for t in traces]
-
-    vc = [(k, v) for k, v in variants.items()]
-    vc = list(sorted(vc, key=lambda x: (len(x[1]), x[0]), reverse=True))
+    case_ids, vc = get_variants_cases(log, activity_key=activity_key, case_id_key=case_id_key)
 
     threads_results = {}
 
     progress = None
 
-    if importlib.util.find_spec("tqdm") and show_progress_bar and len(variants) > 1:
+    if importlib.util.find_spec("tqdm") and show_progress_bar and len(vc) > 1:
         from tqdm.auto import tqdm
 
         if disable_variants and not pandas_utils.check_is_pandas_dataframe(log):
-            progress = tqdm(total=len(traces), desc="replaying log with TBR, completed traces :: ")
+            progress = tqdm(total=len(case_ids), desc="replaying log with TBR, completed traces :: ")
         else:
-            progress = tqdm(total=len(variants), desc="replaying log with TBR, completed traces :: ")
-
-    for i in range(len(vc)):
-        variant = vc[i][0]
-        all_cases = vc[i][1]
-
-        if disable_variants and not pandas_utils.check_is_pandas_dataframe(log):
-            for j in range(len(all_cases)):
-                case_position = all_cases[j]
-                considered_case = log[case_position]
+            progress = tqdm(total=len(vc), desc="replaying log with TBR, completed traces :: ")
+
+    if use_prefix_trie and not enable_pltr_fitness and not is_reduction and not use_caches and not (
+            disable_variants and not pandas_utils.check_is_pandas_dataframe(log)):
+        trie_results = apply_variants_trie([x[0] for x in vc], net, initial_marking, final_marking, trans_map,
+                                           places_shortest_path_by_hidden, consider_remaining_in_fitness,
+                                           reach_mark_through_hidden=reach_mark_through_hidden,
+                                           stop_immediately_unfit=stop_immediately_unfit,
+                                           walk_through_hidden_trans=walk_through_hidden_trans,
+                                           cleaning_token_flood=cleaning_token_flood, s_components=s_components,
+                                           progress=progress)
+        # as in the replay of the single variants, once an activity that is not in the model has been met,
+        # the variants replayed afterwards are considered unfit
+        activities_not_in_model = False
+        for i in range(len(vc)):
+            t = trie_results[i]
+            activities_not_in_model = activities_not_in_model or t.activities_not_in_model
+            if consider_activities_not_in_model_in_fitness and activities_not_in_model:
+                t.t_fit = False
+            for case_position in vc[i][1]:
+                threads_results[case_position] = transcribe_result(t, return_object_names=return_object_names)
+    else:
+        for i in range(len(vc)):
+            variant = vc[i][0]
+            all_cases = vc[i][1]
+
+            if disable_variants and not pandas_utils.check_is_pandas_dataframe(log):
+                for j in range(len(all_cases)):
+                    case_position = all_cases[j]
+                    considered_case = log[case_position]
+                    t = ApplyTraceTokenReplay(considered_case, net, initial_marking, final_marking,
+                                              trans_map, enable_pltr_fitness, place_fitness_per_trace,
+                                              transition_fitness_per_trace,
+                                              notexisting_activities_in_model,
+                                              places_shortest_path_by_hidden,
+                                              consider_remaining_in_fitness,
+                                              activity_key=activity_key,
+                                              reach_mark_through_hidden=reach_mark_through_hidden,
+                                              stop_immediately_when_unfit=stop_immediately_unfit,
+                                              walk_through_hidden_trans=walk_through_hidden_trans,
+                                              post_fix_caching=post_fix_cache,
+                                              marking_to_activity_caching=marking_to_activity_cache,
+                                              is_reduction=is_reduction,
+                                              thread_maximum_ex_time=thread_maximum_ex_time,
+                                              cleaning_token_flood=cleaning_token_flood,
+                                              s_components=s_components, trace_occurrences=1,
+                                              use_caches=use_caches,
+                                              consider_activities_not_in_model_in_fitness=consider_activities_not_in_model_in_fitness)
+                    t.run()
+                    threads_results[case_position] = transcribe_result(t, return_object_names=return_object_names)
+                    if progress is not None:
+                        progress.update()
+            else:
+                considered_case = variants_util.variant_to_trace(variant, parameters={constants.PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key})
                 t = ApplyTraceTokenReplay(considered_case, net, initial_marking, final_marking,
-                                          trans_map, enable_pltr_fitness, place_fitness_per_trace,
-                                          transition_fitness_per_trace,
-                                          notexisting_activities_in_model,
-                                          places_shortest_path_by_hidden,
-                                          consider_remaining_in_fitness,
-                                          activity_key=activity_key,
-                                          reach_mark_through_hidden=reach_mark_through_hidden,
-                                          stop_immediately_when_unfit=stop_immediately_unfit,
-                                          walk_through_hidden_trans=walk_through_hidden_trans,
-                                          post_fix_caching=post_fix_cache,
-                                          marking_to_activity_caching=marking_to_activity_cache,
-                                          is_reduction=is_reduction,
-                                          thread_maximum_ex_time=thread_maximum_ex_time,
-                                          cleaning_token_flood=cleaning_token_flood,
-                                          s_components=s_components, trace_occurrences=1,
-                                          consider_activities_not_in_model_in_fitness=consider_activities_not_in_model_in_fitness)
+                                                         trans_map, enable_pltr_fitness, place_fitness_per_trace,
+                                                         transition_fitness_per_trace,
+                                                         notexisting_activities_in_model,
+                                                         places_shortest_path_by_hidden,
+                                                         consider_remaining_in_fitness,
+                                                         activity_key=activity_key,
+                                                         reach_mark_through_hidden=reach_mark_through_hidden,
+                                                         stop_immediately_when_unfit=stop_immediately_unfit,
+                                                         walk_through_hidden_trans=walk_through_hidden_trans,
+                                                         post_fix_caching=post_fix_cache,
+                                                         marking_to_activity_caching=marking_to_activity_cache,
+                                                         is_reduction=is_reduction,
+                                                         thread_maximum_ex_time=thread_maximum_ex_time,
+                                                         cleaning_token_flood=cleaning_token_flood,
+                                                         s_components=s_components, trace_occurrences=len(vc[i][1]),
+                                                         use_caches=use_caches,
+                                                         consider_activities_not_in_model_in_fitness=consider_activities_not_in_model_in_fitness)
                 t.run()
-                threads_results[case_position] = transcribe_result(t, return_object_names=return_object_names)
-                if progress is not None:
-                    progress.update()
-        else:
-            considered_case = variants_util.variant_to_trace(variant, parameters={constants.PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key})
-            t = ApplyTraceTokenReplay(considered_case, net, initial_marking, final_marking,
-                                                     trans_map, enable_pltr_fitness, place_fitness_per_trace,
-                                                     transition_fitness_per_trace,
-                                                     notexisting_activities_in_model,
-                                                     places_shortest_path_by_hidden,
-                                                     consider_remaining_in_fitness,
-                                                     activity_key=activity_key,
-                                                     reach_mark_through_hidden=reach_mark_through_hidden,
-                                                     stop_immediately_when_unfit=stop_immediately_unfit,
-                                                     walk_through_hidden_trans=walk_through_hidden_trans,
-                                                     post_fix_caching=post_fix_cache,
-                                                     marking_to_activity_caching=marking_to_activity_cache,
-                                                     is_reduction=is_reduction,
-                                                     thread_maximum_ex_time=thread_maximum_ex_time,
-                                                     cleaning_token_flood=cleaning_token_flood,
-                                                     s_components=s_components, trace_occurrences=len(vc[i][1]),
-                                                     consider_activities_not_in_model_in_fitness=consider_activities_not_in_model_in_fitness)
-            t.run()
-
-            for j in range(len(all_cases)):
-                case_position = all_cases[j]
 
-                threads_results[case_position] = transcribe_result(t, return_object_names=return_object_names)
+                for j in range(len(all_cases)):
+                    case_position = all_cases[j]
 
-            if progress is not None:
-                progress.update()
+                    threads_results[case_position] = transcribe_result(t, return_object_names=return_object_names)
+
+                if progress is not None:
+                    progress.update()
 
-    for i in range(len(traces)):
+    for i in range(len(case_ids)):
         aligned_traces.append(threads_results[i])
 
     # gracefully close progress bar
@@ -1173,6 +1975,8 @@ def apply(log: EventLog, net: PetriNet, initial_marking: Marking, final_marking:
 
     show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR)
     case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    use_prefix_trie = exec_utils.get_param_value(Parameters.USE_PREFIX_TRIE, parameters, True)
+    prepared_model = exec_utils.get_param_value(Parameters.PREPARED_MODEL, parameters, None)
 
     if type(log) is not pd.DataFrame:
         log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
@@ -1187,7 +1991,7 @@ def apply(log: EventLog, net: PetriNet, initial_marking: Marking, final_marking:
                      cleaning_token_flood=cleaning_token_flood, disable_variants=disable_variants,
                      return_object_names=return_names, show_progress_bar=show_progress_bar,
                      consider_activities_not_in_model_in_fitness=consider_activities_not_in_model_in_fitness,
-                     case_id_key=case_id_key)
+                     case_id_key=case_id_key, use_prefix_trie=use_prefix_trie, prepared_model=prepared_model)
 
 
 def apply_variants_list(variants_list, net, initial_marking, final_marking, parameters=None):
@@ -19,8 +19,9 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
+from pm4py.algo.discovery.dfg.adapters.pandas import efg_statistics
 from pm4py.util import xes_constants, pandas_utils, constants
-from pm4py.util.business_hours import soj_time_business_hours_diff
+from pm4py.util.business_hours import soj_time_business_hours_diff_array
 
 
 def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_glue="case:concept:name",
@@ -35,7 +36,7 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
     Parameters
     -----------
     df
-        Dataframe
+        Dataframe (or prepared log, see pm4py.objects.log.util.prepared_log)
     measure
         Measure to use (frequency/performance/both)
     activity_key
@@ -63,12 +64,22 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
         DFG in the chosen measure (may be only the frequency, only the performance, or both)
     """
     import pandas as pd
+    from pm4py.objects.log.util import prepared_log
 
     # added support to specify an activity key for the target event which is different
     # from the activity key of the source event.
     if target_activity_key is None:
         target_activity_key = activity_key
 
+    if prepared_log.is_prepared_log(df):
+        # the events of a prepared log are already sorted by case and timestamp
+        if measure in ["frequency", "performance", "both"] and not business_hours and \
+                target_activity_key == activity_key and \
+                df.matches(case_id_glue, activity_key, timestamp_key, start_timestamp_key):
+            return _get_dfg_graph_prepared(df, measure=measure, perf_aggregation_key=perf_aggregation_key,
+                                           keep_once_per_case=keep_once_per_case, window=window)
+        df = df.dataframe
+
     # if not differently specified, set the start timestamp key to the timestamp key
     # to avoid retro-compatibility problems
     st_eq_ct = start_timestamp_key == timestamp_key
@@ -128,8 +139,9 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
         if business_hours:
             if business_hours_slot is None:
                 business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
-            df_successive_rows[constants.DEFAULT_FLOW_TIME] = df_successive_rows.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[start_timestamp_key + '_2'], business_hours_slot, workcalendar), axis=1)
+            df_successive_rows[constants.DEFAULT_FLOW_TIME] = soj_time_business_hours_diff_array(
+                df_successive_rows[timestamp_key], df_successive_rows[start_timestamp_key + '_2'], business_hours_slot,
+                workcalendar)
         else:
             difference = df_successive_rows[start_timestamp_key + '_2'] - df_successive_rows[timestamp_key]
             df_successive_rows[constants.DEFAULT_FLOW_TIME] = pandas_utils.get_total_seconds(difference)
@@ -175,6 +187,131 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
         return [dfg_frequency, dfg_performance]
 
 
+def _get_dfg_graph_prepared(prepared, measure="frequency", perf_aggregation_key="mean", keep_once_per_case=False,
+                            window=1):
+    """
+    Computes the DFG on a prepared log (the events are already sorted and the activities encoded as integers)
+    """
+    import pandas as pd
+    import numpy as np
+
+    n_act = len(prepared.activities)
+    i = np.flatnonzero(np.arange(len(prepared), dtype=np.int64) + window < prepared.case_end)
+    j = i + window
+    # events without an activity are not grouped
+    mask = (prepared.activity_codes[i] >= 0) & (prepared.activity_codes[j] >= 0)
+    i = i[mask]
+    j = j[mask]
+    codes = prepared.activity_codes[i].astype(np.int64) * n_act + prepared.activity_codes[j]
+
+    if keep_once_per_case:
+        # keeps the first occurrence of the path in every case
+        case_codes = prepared.case_codes[i] * (n_act * n_act) + codes
+        first_idx = np.sort(np.unique(case_codes, return_index=True)[1])
+        i = i[first_idx]
+        j = j[first_idx]
+        codes = codes[first_idx]
+
+    def to_keys(dictio):
+        return {(prepared.activities[c // n_act], prepared.activities[c % n_act]): v for c, v in dictio.items()}
+
+    dfg_frequency = {}
+    dfg_performance = {}
+
+    if measure == "frequency" or measure == "both":
+        counts = np.bincount(codes, minlength=n_act * n_act)
+        dfg_frequency = to_keys({int(c): int(counts[c]) for c in np.flatnonzero(counts)})
+
+    if measure == "performance" or measure == "both":
+        # in the arc performance calculation, make sure to consider positive or null values
+        flow_times = (np.maximum(prepared.start_timestamps[j], prepared.timestamps[i]) - prepared.timestamps[i]) / 10**9
+        directly_follows_grouping = pd.Series(flow_times).groupby(codes)
+        if perf_aggregation_key == "all":
+            dfg_performance_mean = directly_follows_grouping.agg("mean").to_dict()
+            dfg_performance_median = directly_follows_grouping.agg("median").to_dict()
+            dfg_performance_max = directly_follows_grouping.agg("max").to_dict()
+            dfg_performance_min = directly_follows_grouping.agg("min").to_dict()
+            dfg_performance_sum = directly_follows_grouping.agg("sum").to_dict()
+            dfg_performance_std = directly_follows_grouping.agg("std").to_dict()
+            for key in dfg_performance_mean:
+                dfg_performance[key] = {"mean": dfg_performance_mean[key], "median": dfg_performance_median[key],
+                                        "max": dfg_performance_max[key], "min": dfg_performance_min[key],
+                                        "sum": dfg_performance_sum[key], "stdev": dfg_performance_std[key]}
+        elif perf_aggregation_key == "raw_values":
+            dfg_performance = directly_follows_grouping.agg(list).to_dict()
+        else:
+            dfg_performance = directly_follows_grouping.agg(perf_aggregation_key).to_dict()
+        dfg_performance = to_keys(dfg_performance)
+
+    if measure == "frequency":
+        return dfg_frequency
+
+    if measure == "performance":
+        return dfg_performance
+
+    return [dfg_frequency, dfg_performance]
+
+
+def _join_couples_same_case(df, case_id_glue, filter_couples):
+    """
+    Equivalent to joining the dataframe with itself on the case ID (the columns of the second event get the _2
+    suffix) and keeping the couples of events accepted by the provided filter.
+
+    The couples of rows of the same case are enumerated by a sweep over the cases, so only the accepted couples
+    are ever materialized.
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    case_id_glue
+        Column of the dataframe to use as case ID
+    filter_couples
+        Function that, given two arrays of positions (of events of the same case), returns a boolean mask
+        of the couples to keep (it is called with both orientations of each couple)
+
+    Returns
+    --------------
+    joined_dataframe
+        Dataframe containing the couples of events (case ID, attributes of the first event, attributes of the second
+        event)
+    """
+    import numpy as np
+    import pandas as pd
+
+    case_codes = pd.factorize(df[case_id_glue])[0]
+    grouping = np.argsort(case_codes, kind="stable")
+    case_end = efg_statistics.get_case_end(case_codes[grouping])
+
+    firsts = []
+    seconds = []
+    for i, j in efg_statistics.iterate_pairs(case_end):
+        i = grouping[i]
+        j = grouping[j]
+        for first, second in ((i, j), (j, i)):
+            mask = filter_couples(first, second)
+            firsts.append(first[mask])
+            seconds.append(second[mask])
+
+    if firsts:
+        firsts = np.concatenate(firsts)
+        seconds = np.concatenate(seconds)
+    else:
+        firsts = np.zeros(0, dtype=np.int64)
+        seconds = np.zeros(0, dtype=np.int64)
+    # same order of the rows as the join
+    order = np.lexsort((seconds, firsts))
+    firsts = firsts[order]
+    seconds = seconds[order]
+
+    other_columns = [x for x in df.columns if x != case_id_glue]
+    first_df = df[[case_id_glue] + other_columns].take(firsts).reset_index(drop=True)
+    second_df = df[other_columns].take(seconds).reset_index(drop=True)
+    second_df.columns = [str(x) + "_2" for x in other_columns]
+
+    return pandas_utils.concat([first_df, second_df], axis=1)
+
+
 def get_partial_order_dataframe(df, start_timestamp_key=None, timestamp_key="time:timestamp",
                                 case_id_glue="case:concept:name", activity_key="concept:name",
                                 sort_caseid_required=True,
@@ -237,19 +374,22 @@ def get_partial_order_dataframe(df, start_timestamp_key=None, timestamp_key="tim
     if event_index not in df.columns:
         df = pandas_utils.insert_index(df, event_index, copy_dataframe=False, reset_index=False)
 
-    df = df.set_index(case_id_glue)
+    # the couples of events are obtained by sweeping the cases, instead of self-joining the dataframe on the case ID
+    # (which would materialize the square of the length of each case before filtering)
+    event_indexes = df[event_index].to_numpy()
+    timestamps = df[timestamp_key].to_numpy(dtype="datetime64[ns]")
+    start_timestamps = df[start_timestamp_key].to_numpy(dtype="datetime64[ns]")
 
-    df = df.join(df, rsuffix="_2")
-    df = df[df[event_index] < df[event_index + "_2"]]
-    df = df[df[timestamp_key] <= df[start_timestamp_key + '_2']]
+    def filter_couples(first, second):
+        return (event_indexes[first] < event_indexes[second]) & (timestamps[first] <= start_timestamps[second])
 
-    df = df.reset_index()
+    df = _join_couples_same_case(df, case_id_glue, filter_couples)
 
     if business_hours:
         if business_hours_slot is None:
             business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
-        df[constants.DEFAULT_FLOW_TIME] = df.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[start_timestamp_key + '_2'], business_hours_slot, workcalendar), axis=1)
+        df[constants.DEFAULT_FLOW_TIME] = soj_time_business_hours_diff_array(
+            df[timestamp_key], df[start_timestamp_key + '_2'], business_hours_slot, workcalendar)
     else:
         df[constants.DEFAULT_FLOW_TIME] = pandas_utils.get_total_seconds(df[start_timestamp_key + "_2"] - df[timestamp_key])
 
@@ -313,11 +453,12 @@ def get_concurrent_events_dataframe(df, start_timestamp_key=None, timestamp_key=
         df = df[[case_id_glue, activity_key, start_timestamp_key, timestamp_key]]
 
     df = pandas_utils.insert_index(df)
-    df = df.set_index(case_id_glue)
-    df_copy = df.copy()
+    event_indexes = df[constants.DEFAULT_INDEX_KEY].to_numpy()
+
+    def filter_couples(first, second):
+        return event_indexes[first] < event_indexes[second]
 
-    df = df.join(df_copy, rsuffix="_2").dropna()
-    df = df[df[constants.DEFAULT_INDEX_KEY] < df[constants.DEFAULT_INDEX_KEY + "_2"]]
+    df = _join_couples_same_case(df, case_id_glue, filter_couples).set_index(case_id_glue).dropna()
     df[max_start_column] = df[[start_timestamp_key, start_timestamp_key + '_2']].max(axis=1)
     df[min_complete_column] = df[[timestamp_key, timestamp_key + '_2']].min(axis=1)
     df[max_start_column] = df[max_start_column].apply(lambda x: x.timestamp())
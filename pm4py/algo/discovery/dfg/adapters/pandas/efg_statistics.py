@@ -0,0 +1,368 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from typing import Dict, Tuple, Iterator, List, Optional
+
+import numpy as np
+
+from pm4py.util import xes_constants, constants
+from pm4py.util.business_hours import soj_time_business_hours_diff_array
+
+
+class SortedEventArrays(object):
+    """
+    Columnar view of a dataframe, with the events sorted by case (and, optionally, by timestamp along the case).
+
+    The events of the same case occupy a contiguous segment of the arrays. For every (sorted) event,
+    case_end stores the (exclusive) position where the segment of its case ends.
+    """
+
+    def __init__(self, order: np.ndarray, activity_codes: np.ndarray, activities: List[str], start_timestamps: np.ndarray,
+                 timestamps: np.ndarray, case_end: np.ndarray, tz=None):
+        self.order = order
+        self.activity_codes = activity_codes
+        self.activities = activities
+        self.start_timestamps = start_timestamps
+        self.timestamps = timestamps
+        self.case_end = case_end
+        self.tz = tz
+
+    def __len__(self):
+        return len(self.order)
+
+
+# integer representation of the missing timestamps (NaT)
+NAT_INT64 = np.iinfo(np.int64).min
+
+
+def _timestamp_to_int64(series) -> np.ndarray:
+    # nanoseconds since the epoch (UTC, if the column is timezone-aware)
+    return series.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+
+def get_case_end(sorted_case_codes: np.ndarray) -> np.ndarray:
+    """
+    Given the case codes of events grouped by case, returns for every position the (exclusive) end
+    of the segment of its case
+
+    Parameters
+    --------------
+    sorted_case_codes
+        Case codes (the events of the same case should be contiguous)
+
+    Returns
+    --------------
+    case_end
+        End of the segment of the case, for every position
+    """
+    n = len(sorted_case_codes)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    boundaries = np.flatnonzero(sorted_case_codes[1:] != sorted_case_codes[:-1]) + 1
+    ends = np.append(boundaries, n)
+    lengths = np.diff(np.concatenate(([0], ends)))
+    return np.repeat(ends, lengths)
+
+
+def get_sorted_event_arrays(df, case_id_glue: str = constants.CASE_CONCEPT_NAME,
+                            activity_key: str = xes_constants.DEFAULT_NAME_KEY,
+                            start_timestamp_key: Optional[str] = None,
+                            timestamp_key: str = xes_constants.DEFAULT_TIMESTAMP_KEY,
+                            sort_caseid_required: bool = True,
+                            sort_timestamp_along_case_id: bool = True) -> SortedEventArrays:
+    """
+    Extracts the columnar (NumPy) representation of the dataframe used by the sweeps.
+
+    Parameters
+    --------------
+    df
+        Dataframe (or prepared log, see pm4py.objects.log.util.prepared_log)
+    case_id_glue
+        Column of the dataframe to use as case ID
+    activity_key
+        Activity key
+    start_timestamp_key
+        Start timestamp key (if not provided, defaulted to the timestamp_key)
+    timestamp_key
+        Complete timestamp
+    sort_caseid_required
+        Tells if a sort by case ID is required (default: True). If False, the events of the same
+        case are grouped keeping their order in the dataframe.
+    sort_timestamp_along_case_id
+        Tells if a sort by timestamp is required along the case ID (default: True)
+
+    Returns
+    --------------
+    arrays
+        Sorted event arrays
+    """
+    import pandas as pd
+    from pm4py.objects.log.util import prepared_log
+
+    if prepared_log.is_prepared_log(df):
+        if sort_caseid_required and sort_timestamp_along_case_id and \
+                df.matches(case_id_glue, activity_key, timestamp_key, start_timestamp_key):
+            # the prepared log is already sorted and encoded
+            return SortedEventArrays(df.order, df.activity_codes, [str(x) for x in df.activities],
+                                     df.start_timestamps, df.timestamps, df.case_end, tz=df.tz)
+        df = df.dataframe
+
+    if start_timestamp_key is None or start_timestamp_key not in df.columns:
+        start_timestamp_key = timestamp_key
+
+    case_codes = pd.factorize(df[case_id_glue])[0]
+    activity_codes, activities = pd.factorize(df[activity_key])
+    start_timestamps = _timestamp_to_int64(df[start_timestamp_key])
+    timestamps = _timestamp_to_int64(df[timestamp_key])
+
+    if sort_caseid_required and sort_timestamp_along_case_id:
+        order = np.lexsort((timestamps, start_timestamps, case_codes))
+    else:
+        # a stable sort keeps the order of the events inside the case
+        order = np.argsort(case_codes, kind="stable")
+
+    case_end = get_case_end(case_codes[order])
+
+    return SortedEventArrays(order, activity_codes[order], [str(x) for x in activities], start_timestamps[order],
+                             timestamps[order], case_end, tz=getattr(df[timestamp_key].dt, "tz", None))
+
+
+def iterate_pairs(case_end: np.ndarray) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Iterates over the couples of positions (i, j), with i < j, belonging to the same case.
+
+    The couples are produced one lag (j - i) at a time, so each batch contains at most one couple per
+    event and the memory stays linear in the number of events, while the overall work is
+    proportional to the number of couples.
+
+    Parameters
+    --------------
+    case_end
+        For every position, the (exclusive) end of the segment of its case
+
+    Returns
+    --------------
+    iterator
+        Iterator over batches of couples (positions of the first events, positions of the second events)
+    """
+    active = np.arange(len(case_end), dtype=np.int64)
+    lag = 1
+    while True:
+        active = active[active + lag < case_end[active]]
+        if len(active) == 0:
+            break
+        yield active, active + lag
+        lag += 1
+
+
+def _flow_times(arrays: SortedEventArrays, i: np.ndarray, j: np.ndarray, business_hours: bool, business_hours_slot,
+                workcalendar) -> np.ndarray:
+    if business_hours:
+        import pandas as pd
+        # the business hours are evaluated on the local (wall) time of the timestamps
+        ct = pd.to_datetime(arrays.timestamps[i], utc=True)
+        st = pd.to_datetime(arrays.start_timestamps[j], utc=True)
+        if arrays.tz is not None:
+            ct = ct.tz_convert(arrays.tz)
+            st = st.tz_convert(arrays.tz)
+        return soj_time_business_hours_diff_array(ct, st, business_hours_slot, workcalendar)
+    return (arrays.start_timestamps[j] - arrays.timestamps[i]) / 10**9
+
+
+def get_eventually_follows_statistics(df, start_timestamp_key: Optional[str] = None,
+                                      timestamp_key: str = xes_constants.DEFAULT_TIMESTAMP_KEY,
+                                      case_id_glue: str = constants.CASE_CONCEPT_NAME,
+                                      activity_key: str = xes_constants.DEFAULT_NAME_KEY,
+                                      sort_caseid_required: bool = True, sort_timestamp_along_case_id: bool = True,
+                                      keep_first_following: bool = False, business_hours: bool = False,
+                                      business_hours_slot=None,
+                                      workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR,
+                                      measure: str = "frequency") -> Dict[Tuple[str, str], Tuple]:
+    """
+    Computes the eventually-follows relation between the activities of a dataframe (couples of events of the same
+    case in which the second event starts after the completion of the first), aggregating the count and
+    the flow times of the couples without materializing the table of the couples.
+
+    The statistics are equivalent to grouping the result of get_partial_order_dataframe by the couple of activities.
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    start_timestamp_key
+        Start timestamp key (if not provided, defaulted to the timestamp_key)
+    timestamp_key
+        Complete timestamp
+    case_id_glue
+        Column of the dataframe to use as case ID
+    activity_key
+        Activity key
+    sort_caseid_required
+        Tells if a sort by case ID is required (default: True)
+    sort_timestamp_along_case_id
+        Tells if a sort by timestamp is required along the case ID (default: True)
+    keep_first_following
+        Keep only the first event following the given event
+    business_hours
+        Computes the flow times considering only the business hours
+    business_hours_slot
+        Business hour slots
+    workcalendar
+        Work calendar
+    measure
+        The measure to compute:
+        - frequency => associates to each couple of activities the number of occurrences
+        - performance => associates to each couple of activities the mean and the (sample) standard deviation
+                         of the flow time
+        - both => associates to each couple of activities the number of occurrences, the mean and the
+                  (sample) standard deviation of the flow time
+
+    Returns
+    ---------------
+    statistics
+        Dictionary associating to each couple of activities the required statistics
+    """
+    if start_timestamp_key is None:
+        start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
+
+    if business_hours and business_hours_slot is None:
+        business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
+
+    arrays = get_sorted_event_arrays(df, case_id_glue=case_id_glue, activity_key=activity_key,
+                                     start_timestamp_key=start_timestamp_key, timestamp_key=timestamp_key,
+                                     sort_caseid_required=sort_caseid_required,
+                                     sort_timestamp_along_case_id=sort_timestamp_along_case_id)
+
+    n_act = len(arrays.activities)
+    n_pairs = n_act * n_act
+    count = np.zeros(n_pairs, dtype=np.int64)
+    mean = np.zeros(n_pairs, dtype=np.float64)
+    m2 = np.zeros(n_pairs, dtype=np.float64)
+    compute_performance = measure in ["performance", "both"]
+
+    found = np.zeros(len(arrays), dtype=bool) if keep_first_following else None
+
+    for i, j in iterate_pairs(arrays.case_end):
+        mask = arrays.timestamps[i] <= arrays.start_timestamps[j]
+        if keep_first_following:
+            mask = mask & ~found[i]
+        i = i[mask]
+        j = j[mask]
+        if len(i) == 0:
+            continue
+        if keep_first_following:
+            found[i] = True
+
+        # events without an activity are not grouped
+        mask = (arrays.activity_codes[i] >= 0) & (arrays.activity_codes[j] >= 0)
+        i = i[mask]
+        j = j[mask]
+        codes = arrays.activity_codes[i] * n_act + arrays.activity_codes[j]
+        batch_count = np.bincount(codes, minlength=n_pairs)
+
+        if compute_performance:
+            # merges the (count, mean, M2) of the batch with the accumulated ones (Chan et al.),
+            # which is numerically stabler than accumulating the sum of the squares
+            flow_times = _flow_times(arrays, i, j, business_hours, business_hours_slot, workcalendar)
+            nz = batch_count > 0
+            batch_mean = np.zeros(n_pairs, dtype=np.float64)
+            batch_mean[nz] = np.bincount(codes, weights=flow_times, minlength=n_pairs)[nz] / batch_count[nz]
+            batch_m2 = np.bincount(codes, weights=(flow_times - batch_mean[codes]) ** 2, minlength=n_pairs)
+            total = count + batch_count
+            delta = batch_mean - mean
+            mean[nz] = mean[nz] + delta[nz] * batch_count[nz] / total[nz]
+            m2[nz] = m2[nz] + batch_m2[nz] + delta[nz] ** 2 * count[nz] * batch_count[nz] / total[nz]
+
+        count += batch_count
+
+    ret = {}
+    for code in np.flatnonzero(count):
+        key = (arrays.activities[code // n_act], arrays.activities[code % n_act])
+        cnt = int(count[code])
+        std = float(np.sqrt(m2[code] / (cnt - 1))) if cnt > 1 else 0.0
+        if measure == "frequency":
+            ret[key] = cnt
+        elif measure == "performance":
+            ret[key] = (float(mean[code]), std)
+        else:
+            ret[key] = (cnt, float(mean[code]), std)
+
+    return {k: ret[k] for k in sorted(ret)}
+
+
+def get_concurrent_activities_statistics(df, start_timestamp_key: Optional[str] = None,
+                                         timestamp_key: str = xes_constants.DEFAULT_TIMESTAMP_KEY,
+                                         case_id_glue: str = constants.CASE_CONCEPT_NAME,
+                                         activity_key: str = xes_constants.DEFAULT_NAME_KEY,
+                                         sort_caseid_required: bool = True, sort_timestamp_along_case_id: bool = True,
+                                         strict: bool = False) -> Dict[Tuple[str, str], int]:
+    """
+    Counts the couples of events of the same case that are executed concurrently (i.e., their intervals intersect),
+    without materializing the table of the couples.
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    start_timestamp_key
+        Start timestamp key (if not provided, defaulted to the timestamp_key)
+    timestamp_key
+        Complete timestamp
+    case_id_glue
+        Column of the dataframe to use as case ID
+    activity_key
+        Activity key
+    sort_caseid_required
+        Tells if a sort by case ID is required (default: True)
+    sort_timestamp_along_case_id
+        Tells if a sort by timestamp is required along the case ID (default: True)
+    strict
+        Counts only the couples that are strictly concurrent (i.e. the length of the intersection as real interval is > 0)
+
+    Returns
+    ---------------
+    statistics
+        Dictionary associating to each couple of activities (first activity, second activity) the number of
+        concurrent couples of events
+    """
+    arrays = get_sorted_event_arrays(df, case_id_glue=case_id_glue, activity_key=activity_key,
+                                     start_timestamp_key=start_timestamp_key, timestamp_key=timestamp_key,
+                                     sort_caseid_required=sort_caseid_required,
+                                     sort_timestamp_along_case_id=sort_timestamp_along_case_id)
+
+    n_act = len(arrays.activities)
+    count = np.zeros(n_act * n_act, dtype=np.int64)
+    # as the dropna of the joined dataframe, skip the events without activity or with a missing (NaT) timestamp
+    valid = (arrays.activity_codes >= 0) & (arrays.timestamps != NAT_INT64) & (arrays.start_timestamps != NAT_INT64)
+
+    for i, j in iterate_pairs(arrays.case_end):
+        diff = np.minimum(arrays.timestamps[i], arrays.timestamps[j]) - np.maximum(arrays.start_timestamps[i],
+                                                                                    arrays.start_timestamps[j])
+        mask = diff > 0 if strict else diff >= 0
+        mask = mask & valid[i] & valid[j]
+        codes = arrays.activity_codes[i[mask]] * n_act + arrays.activity_codes[j[mask]]
+        count += np.bincount(codes, minlength=n_act * n_act)
+
+    ret = {}
+    for code in np.flatnonzero(count):
+        ret[(arrays.activities[code // n_act], arrays.activities[code % n_act])] = int(count[code])
+
+    return {k: ret[k] for k in sorted(ret)}
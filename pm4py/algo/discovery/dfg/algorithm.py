@@ -91,6 +91,11 @@ def apply(log: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional[
     dfg
         DFG graph
     """
+    from pm4py.objects.log.util import prepared_log
+
+    if prepared_log.is_prepared_log(log) and variant in [Variants.CLEAN, Variants.FREQ_TRIPLES]:
+        log = log.dataframe
+
     if variant == Variants.CLEAN and pandas_utils.check_is_pandas_dataframe(log):
         return clean.apply(log, parameters)
     elif variant is None:
@@ -103,7 +108,8 @@ def apply(log: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional[
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_util.DEFAULT_TIMESTAMP_KEY)
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, pmutil.constants.CASE_CONCEPT_NAME)
 
-    if pandas_utils.check_is_pandas_dataframe(log) and not variant == Variants.FREQ_TRIPLES:
+    if (pandas_utils.check_is_pandas_dataframe(log) or prepared_log.is_prepared_log(log)) and \
+            not variant == Variants.FREQ_TRIPLES:
         dfg_frequency, dfg_performance = df_statistics.get_dfg_graph(log, measure="both",
                                                                      activity_key=activity_key,
                                                                      timestamp_key=timestamp_key,
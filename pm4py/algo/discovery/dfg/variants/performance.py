@@ -24,7 +24,7 @@ from enum import Enum
 
 from pm4py.util import constants, exec_utils
 from pm4py.util import xes_constants as xes_util
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import soj_time_business_hours_diff_array
 from typing import Optional, Dict, Any, Union, Tuple
 from pm4py.objects.log.obj import EventLog, EventStream
 
@@ -90,12 +90,13 @@ def performance(log: Union[EventLog, EventStream], parameters: Optional[Dict[Uni
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
 
     if business_hours:
-        dfgs0 = map((lambda t: [
-            ((t[i - 1][activity_key], t[i][activity_key]),
-             max(0, BusinessHours(t[i - 1][timestamp_key],
-                                  t[i][start_timestamp_key],
-                                  business_hour_slots=business_hours_slots, workcalendar=workcalendar).get_seconds()))
-            for i in range(1, len(t))]), log)
+        # the business hours of all the couples are computed at once
+        couples = [(t[i - 1][activity_key], t[i][activity_key]) for t in log for i in range(1, len(t))]
+        flow_times = soj_time_business_hours_diff_array(
+            [t[i - 1][timestamp_key] for t in log for i in range(1, len(t))],
+            [t[i][start_timestamp_key] for t in log for i in range(1, len(t))],
+            business_hours_slots, workcalendar).tolist() if couples else []
+        dfgs0 = [list(zip(couples, flow_times))]
     else:
         dfgs0 = map((lambda t: [
             ((t[i - 1][activity_key], t[i][activity_key]),
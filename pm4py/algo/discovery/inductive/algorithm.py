@@ -48,6 +48,9 @@ class Parameters(Enum):
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    PARALLEL_RECURSION = "parallel_recursion"
+    MIN_PARALLEL_SIZE = "min_parallel_size"
+    CORES = "cores"
 
 
 class Variants(Enum):
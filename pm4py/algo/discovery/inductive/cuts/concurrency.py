@@ -20,13 +20,12 @@ Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
 from abc import ABC
-from collections import Counter
 from typing import List, Collection, Any, Optional, Generic, Dict
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut, T
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
 from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
-from pm4py.objects.dfg import util as dfu
+from pm4py.algo.discovery.inductive.dtypes.im_encoded import count_bits
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.process_tree.obj import Operator, ProcessTree
 
@@ -39,67 +38,39 @@ class ConcurrencyCut(Cut[T], ABC, Generic[T]):
 
     @classmethod
     def holds(cls, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Optional[List[Collection[Any]]]:
-        dfg = obj.dfg
-        alphabet = dfu.get_vertices(dfg)
-        alphabet = sorted(list(alphabet))
-        edges = dfu.get_edges(dfg)
-        edges = sorted(list(edges))
-
-        groups = [{a} for a in alphabet]
-        if len(groups) == 0:
+        bdfg = obj.bitset_dfg
+        if len(bdfg) == 0:
             return None
 
-        cont = True
-        while cont:
-            cont = False
-            i = 0
-            while i < len(groups):
-                j = i + 1
-                while j < len(groups):
-                    for act1 in groups[i]:
-                        for act2 in groups[j]:
-                            if (act1, act2) not in edges or (act2, act1) not in edges:
-                                groups[i] = groups[i].union(groups[j])
-                                del groups[j]
-                                cont = True
-                                break
-                        if cont:
-                            break
-                    if cont:
-                        break
-                    j = j + 1
-                if cont:
-                    break
-                i = i + 1
-
-        groups = list(sorted(groups, key=lambda g: len(g)))
+        # two activities end up in the same group unless they directly follow each other in both directions
+        not_parallel = [bdfg.all & ~(bdfg.successors[i] & bdfg.predecessors[i]) & ~(1 << i) for i in range(len(bdfg))]
+        groups = bdfg.components(not_parallel)
+
+        groups = list(sorted(groups, key=lambda g: count_bits(g)))
         i = 0
         while i < len(groups) and len(groups) > 1:
-            if len(groups[i].intersection(set(dfg.start_activities.keys()))) > 0 and len(
-                    groups[i].intersection(set(dfg.end_activities.keys()))) > 0:
+            if groups[i] & bdfg.start and groups[i] & bdfg.end:
                 i += 1
                 continue
             group = groups[i]
             del groups[i]
             if i == 0:
-                groups[i].update(group)
+                groups[i] |= group
             else:
-                groups[i - 1].update(group)
+                groups[i - 1] |= group
 
-        return groups if len(groups) > 1 else None
+        return [bdfg.to_activities(g) for g in groups] if len(groups) > 1 else None
 
 
 class ConcurrencyCutUVCL(ConcurrencyCut[IMDataStructureUVCL]):
 
     @classmethod
     def project(cls, obj: IMDataStructureUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureUVCL]:
-        r = list()
-        for g in groups:
-            c = Counter()
-            for t in obj.data_structure:
-                c[tuple(filter(lambda e: e in g, t))] = obj.data_structure[t]
-            r.append(c)
-        return list(map(lambda l: IMDataStructureUVCL(l), r))
+        log = obj.encoded
+        event_groups = log.group_index(groups)[log.events]
+        # as in the Counter-based projection, the count of an equal projected variant is overwritten (not summed)
+        return [IMDataStructureUVCL.from_encoded(log.project(event_groups == i, overwrite=True))
+                for i in range(len(groups))]
 
 
 class ConcurrencyCutDFG(ConcurrencyCut[IMDataStructureDFG]):
@@ -20,18 +20,16 @@ Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
 from abc import ABC
-from collections import Counter
-from typing import List, Optional, Collection, Any, Tuple, Generic, Dict
+from typing import List, Optional, Collection, Any, Generic, Dict
 
-from pm4py.util import nx_utils
+import numpy as np
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut, T
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
 from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
-from pm4py.objects.dfg import util as dfu
+from pm4py.algo.discovery.inductive.dtypes.im_encoded import BitsetDFG
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.process_tree.obj import Operator, ProcessTree
-from pm4py.util.compression.dtypes import UVCL
 
 
 class LoopCut(Cut[T], ABC, Generic[T]):
@@ -55,150 +53,119 @@ class LoopCut(Cut[T], ABC, Generic[T]):
         5. return the cut if at least two groups remain
 
         """
-        dfg = obj.dfg
-        start_activities = set(dfg.start_activities.keys())
-        end_activities = set(dfg.end_activities.keys())
-        if len(dfg.graph) == 0:
+        bdfg = obj.bitset_dfg
+        if not any(bdfg.successors):
             return None
 
-        groups = [start_activities.union(end_activities)]
-        for c in cls._compute_connected_components(dfg, start_activities, end_activities):
-            groups.append(set(c.nodes))
+        do = bdfg.start | bdfg.end
+        groups = [do] + cls._compute_connected_components(bdfg)
+
+        groups = cls._exclude_sets_non_reachable_from_start(bdfg, groups)
+        groups = cls._exclude_sets_no_reachable_from_end(bdfg, groups)
+        groups = cls._check_start_completeness(bdfg, groups)
+        groups = cls._check_end_completeness(bdfg, groups)
 
-        groups = cls._exclude_sets_non_reachable_from_start(dfg, start_activities, end_activities, groups)
-        groups = cls._exclude_sets_no_reachable_from_end(dfg, start_activities, end_activities, groups)
-        groups = cls._check_start_completeness(dfg, start_activities, end_activities, groups)
-        groups = cls._check_end_completeness(dfg, start_activities, end_activities, groups)
+        groups = list(filter(lambda g: g != 0, groups))
 
-        groups = list(filter(lambda g: len(g) > 0, groups))
+        return [bdfg.to_activities(g) for g in groups] if len(groups) > 1 else None
 
-        return groups if len(groups) > 1 else None
+    @classmethod
+    def _merge_into_do(cls, groups: List[int], merge: int) -> List[int]:
+        # merges into the 'do' group all the other groups containing some of the given activities
+        do = groups[0]
+        remaining = []
+        for group in groups[1:]:
+            if group & merge:
+                do |= group
+            else:
+                remaining.append(group)
+        return [do] + remaining
 
     @classmethod
-    def _check_start_completeness(cls, dfg: DFG, start_activities: Collection[Any], end_activities: Collection[Any],
-                                  groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[Collection[Any]]:
-        i = 1
-        while i < len(groups):
-            merge = False
-            for a in groups[i]:
-                if merge:
-                    break
-                for (x, b) in dfg.graph:
-                    if x == a and b in start_activities:
-                        for s in start_activities:
-                            if not (a, s) in dfg.graph:
-                                merge = True
-            if merge:
-                groups[0] = set(groups[0]).union(groups[i])
-                del groups[i]
-                continue
-            i = i + 1
-        return groups
+    def _check_start_completeness(cls, bdfg: BitsetDFG, groups: List[int], parameters: Optional[Dict[str, Any]] = None) -> List[int]:
+        # an activity going back to a start activity should reach all of them
+        merge = 0
+        for a in range(len(bdfg)):
+            if bdfg.successors[a] & bdfg.start and bdfg.start & ~bdfg.successors[a]:
+                merge |= 1 << a
+        return cls._merge_into_do(groups, merge)
 
     @classmethod
-    def _check_end_completeness(cls, dfg: DFG, start_activities: Collection[Any], end_activities: Collection[Any],
-                                groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[Collection[Any]]:
-        i = 1
-        while i < len(groups):
-            merge = False
-            for a in groups[i]:
-                if merge:
-                    break
-                for (b, x) in dfg.graph:
-                    if x == a and b in end_activities:
-                        for e in end_activities:
-                            if not (e, a) in dfg.graph:
-                                merge = True
-            if merge:
-                groups[0] = set(groups[0]).union(groups[i])
-                del groups[i]
-                continue
-            i = i + 1
-        return groups
+    def _check_end_completeness(cls, bdfg: BitsetDFG, groups: List[int], parameters: Optional[Dict[str, Any]] = None) -> List[int]:
+        # an activity reached from an end activity should be reached from all of them
+        merge = 0
+        for a in range(len(bdfg)):
+            if bdfg.predecessors[a] & bdfg.end and bdfg.end & ~bdfg.predecessors[a]:
+                merge |= 1 << a
+        return cls._merge_into_do(groups, merge)
 
     @classmethod
-    def _exclude_sets_non_reachable_from_start(cls, dfg: DFG, start_activities: Collection[Any],
-                                               end_activities: Collection[Any],
-                                               groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[Collection[Any]]:
-        for a in set(start_activities).difference(set(end_activities)):
-            for (x, b) in dfg.graph:
-                if x == a:
-                    group_a, group_b = None, None
-                    for group in groups:
-                        group_a = group if a in group else group_a
-                        group_b = group if b in group else group_b
-                    groups = [group for group in groups if group != group_a and group != group_b]
-                    # we are always merging on the do-part
-                    groups.insert(0, group_a.union(group_b))
-        return groups
+    def _exclude_sets_non_reachable_from_start(cls, bdfg: BitsetDFG, groups: List[int], parameters: Optional[Dict[str, Any]] = None) -> List[int]:
+        return cls._merge_into_do(groups, bdfg.successors_of(bdfg.start & ~bdfg.end))
 
     @classmethod
-    def _exclude_sets_no_reachable_from_end(cls, dfg: DFG, start_activities: Collection[Any],
-                                            end_activities: Collection[Any],
-                                            groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[Collection[Any]]:
-        for b in set(end_activities).difference(start_activities):
-            for (a, x) in dfg.graph:
-                if x == b:
-                    group_a, group_b = None, None
-                    for group in groups:
-                        group_a = group if a in group else group_a
-                        group_b = group if b in group else group_b
-                    groups = [group for group in groups if group != group_a and group != group_b]
-                    groups.insert(0, group_a.union(group_b))
-        return groups
+    def _exclude_sets_no_reachable_from_end(cls, bdfg: BitsetDFG, groups: List[int], parameters: Optional[Dict[str, Any]] = None) -> List[int]:
+        return cls._merge_into_do(groups, bdfg.predecessors_of(bdfg.end & ~bdfg.start))
 
     @classmethod
-    def _compute_connected_components(cls, dfg: DFG, start_activities: Collection[Any],
-                                      end_activities: Collection[Any], parameters: Optional[Dict[str, Any]] = None):
-        nxd = dfu.as_nx_graph(dfg)
-        [nxd.remove_edge(a, b) for (a, b) in dfg.graph if
-         a in start_activities or a in end_activities or b in start_activities or b in end_activities]
-        [nxd.remove_node(a) for a in start_activities if nxd.has_node(a)]
-        [nxd.remove_node(a) for a in end_activities if nxd.has_node(a)]
-        nxu = nxd.to_undirected()
-        return [nxd.subgraph(c).copy() for c in nx_utils.connected_components(nxu)]
+    def _compute_connected_components(cls, bdfg: BitsetDFG, parameters: Optional[Dict[str, Any]] = None) -> List[int]:
+        # connected components of the (undirected) graph without the start and end activities
+        undirected = [bdfg.successors[i] | bdfg.predecessors[i] for i in range(len(bdfg))]
+        return bdfg.components(undirected, bdfg.all & ~(bdfg.start | bdfg.end))
 
 
 class LoopCutUVCL(LoopCut[IMDataStructureUVCL]):
 
     @classmethod
     def project(cls, obj: IMDataStructureUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureUVCL]:
-        do = groups[0]
+        log = obj.encoded
         redo = groups[1:]
-        redo_activities = [y for x in redo for y in x]
-        do_log = Counter()
-        redo_logs = [Counter() for i in range(len(redo))]
-        for t in obj.data_structure:
-            do_trace = tuple()
-            redo_trace = tuple()
-            for e in t:
-                if e in do:
-                    do_trace = do_trace + (e,)
-                    if len(redo_trace) > 0:
-                        redo_logs = cls._append_trace_to_redo_log(redo_trace, redo_logs, redo, obj.data_structure[t])
-                        redo_trace = tuple()
-                else:
-                    if e in redo_activities:
-                        redo_trace = redo_trace + (e,)
-                        if len(do_trace) > 0:
-                            do_log.update({do_trace: obj.data_structure[t]})
-                            do_trace = tuple()
-            if len(redo_trace) > 0:
-                redo_logs = cls._append_trace_to_redo_log(redo_trace, redo_logs, redo)
-            do_log.update({do_trace: obj.data_structure[t]})
-        logs = [do_log]
-        logs.extend(redo_logs)
-        return list(map(lambda l: IMDataStructureUVCL(l), logs))
-
-    @classmethod
-    def _append_trace_to_redo_log(cls, redo_trace: Tuple, redo_logs: List[UVCL], redo_groups: List[Collection[Any]],
-                                  cardinality, parameters: Optional[Dict[str, Any]] = None) -> \
-            List[UVCL]:
-        activities = set(x for x in redo_trace)
-        inte = [(i, len(activities.intersection(redo_groups[i]))) for i in range(len(redo_groups))]
-        inte = sorted(inte, key=lambda x: (x[1], x[0]), reverse=True)
-        redo_logs[inte[0][0]].update({redo_trace: cardinality})
-        return redo_logs
+        # 0 for the activities of the 'do' group, 1 for the ones of the 'redo' groups (the others are skipped)
+        redo_group_of = log.group_index(redo)
+        kinds = np.full(len(log.activities), -1, dtype=np.int64)
+        kinds[redo_group_of >= 0] = 1
+        kinds[log.group_index([groups[0]]) >= 0] = 0
+        event_kinds = kinds[log.events]
+        keep = event_kinds >= 0
+        events, trace_ids, event_kinds = log.events[keep], log.trace_ids[keep], event_kinds[keep]
+
+        # every trace is split into the maximal segments of 'do' and 'redo' activities
+        new_segment = np.ones(len(events), dtype=bool)
+        new_segment[1:] = (trace_ids[1:] != trace_ids[:-1]) | (event_kinds[1:] != event_kinds[:-1])
+        segment_ids = np.cumsum(new_segment) - 1
+        segment_starts = np.flatnonzero(new_segment)
+        segment_lengths = np.diff(np.append(segment_starts, len(events)))
+        segment_traces = trace_ids[segment_starts]
+        segment_kinds = event_kinds[segment_starts]
+
+        # the 'do' log also gets an empty trace for every trace not ending with a 'do' segment
+        is_last = np.append(segment_traces[1:] != segment_traces[:-1], True)
+        ends_with_do = np.zeros(len(log), dtype=bool)
+        ends_with_do[segment_traces[is_last & (segment_kinds == 0)]] = True
+        do_segments = np.flatnonzero(segment_kinds == 0)
+        empty_traces = np.flatnonzero(~ends_with_do)
+        traces = np.concatenate((segment_traces[do_segments], empty_traces))
+        order = np.lexsort((np.concatenate((do_segments, np.full(len(empty_traces), len(segment_starts)))), traces))
+        lengths = np.concatenate((segment_lengths[do_segments], np.zeros(len(empty_traces), dtype=np.int64)))[order]
+        logs = [log.build(events[event_kinds == 0], lengths, log.counts[traces[order]])]
+
+        # every 'redo' segment goes to the group sharing most activities with it (the last one in case of ties)
+        k = len(redo)
+        redo_events = event_kinds == 1
+        redo_segments = np.flatnonzero(segment_kinds == 1)
+        segment_index = np.zeros(len(segment_starts), dtype=np.int64)
+        segment_index[redo_segments] = np.arange(len(redo_segments))
+        distinct = np.unique(segment_index[segment_ids[redo_events]] * len(log.activities) + events[redo_events])
+        shared = np.bincount((distinct // len(log.activities)) * k + redo_group_of[distinct % len(log.activities)],
+                             minlength=len(redo_segments) * k).reshape(len(redo_segments), k)
+        chosen = k - 1 - np.argmax(shared[:, ::-1], axis=1)
+        event_chosen = np.full(len(events), -1, dtype=np.int64)
+        event_chosen[redo_events] = chosen[segment_index[segment_ids[redo_events]]]
+        for i in range(k):
+            segments = redo_segments[chosen == i]
+            logs.append(log.build(events[event_chosen == i], segment_lengths[segments],
+                                  log.counts[segment_traces[segments]]))
+        return [IMDataStructureUVCL.from_encoded(l) for l in logs]
 
 
 class LoopCutDFG(LoopCut[IMDataStructureDFG]):
@@ -19,17 +19,18 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-import itertools
 import sys
 from abc import ABC
 from collections import Counter
 from typing import Collection, Any, List, Optional, Generic, Dict
-from typing import Tuple
+
+import numpy as np
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut
 from pm4py.algo.discovery.inductive.cuts.abc import T
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
 from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
+from pm4py.algo.discovery.inductive.dtypes.im_encoded import BitsetDFG, iterate_bits, rows_to_bits
 from pm4py.objects.dfg import util as dfu
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.process_tree.obj import Operator, ProcessTree
@@ -41,27 +42,26 @@ class SequenceCut(Cut[T], ABC, Generic[T]):
     def operator(cls, parameters: Optional[Dict[str, Any]] = None) -> ProcessTree:
         return ProcessTree(operator=Operator.SEQUENCE)
 
-    @staticmethod
-    def check_merge_condition(g1, g2, trans_succ):
-        for a1 in g1:
-            for a2 in g2:
-                if (a2 in trans_succ[a1] and a1 in trans_succ[a2]) or (a2 not in trans_succ[a1] and a1 not in trans_succ[a2]):
-                    return True
-        return False
+    @classmethod
+    def _find_groups(cls, bdfg: BitsetDFG) -> Optional[List[int]]:
+        if len(bdfg) == 0:
+            return None
+        closure = bdfg.transitive_closure()
+        transitive_predecessors = closure.sum(axis=0)
+        transitive_successors = closure.sum(axis=1)
 
-    @staticmethod
-    def merge_groups(groups, trans_succ):
-        i = 0
-        while i < len(groups):
-            j = i + 1
-            while j < len(groups):
-                if SequenceCut.check_merge_condition(groups[i], groups[j], trans_succ):
-                    groups[i] = groups[i].union(groups[j])
-                    del groups[j]
-                    continue
-                j = j + 1
-            i = i + 1
-        return groups
+        # two activities are merged when they are pairwise reachable or pairwise unreachable
+        merge = (closure & closure.T) | ~(closure | closure.T)
+        np.fill_diagonal(merge, False)
+        groups = bdfg.components(rows_to_bits(merge))
+
+        def position(g):
+            a = (g & -g).bit_length() - 1
+            return transitive_predecessors[a] + (len(bdfg) - transitive_successors[a])
+
+        groups = list(sorted(groups, key=position))
+
+        return groups if len(groups) > 1 else None
 
     @classmethod
     def holds(cls, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Optional[List[Collection[Any]]]:
@@ -76,48 +76,28 @@ class SequenceCut(Cut[T], ABC, Generic[T]):
         3. merge pairwise unreachable nodes (based on transitive relations)
         4. sort the groups based on their reachability
         '''
-        dfg = obj.dfg
-        alphabet = dfu.get_vertices(dfg)
-        transitive_predecessors, transitive_successors = dfu.get_transitive_relations(dfg)
-        groups = [{a} for a in alphabet]
-        if len(groups) == 0:
-            return None
-
-        old_size = None
-        while old_size != len(groups):
-            old_size = len(groups)
-            groups = SequenceCut.merge_groups(groups, transitive_successors)
-
-        groups = list(sorted(groups, key=lambda g: len(
-            transitive_predecessors[next(iter(g))]) + (len(alphabet) - len(transitive_successors[next(iter(g))]))))
-
-        return groups if len(groups) > 1 else None
+        bdfg = obj.bitset_dfg
+        groups = SequenceCut._find_groups(bdfg)
+        return [bdfg.to_activities(g) for g in groups] if groups is not None else None
 
 
 class StrictSequenceCut(SequenceCut[T], ABC, Generic[T]):
 
     @classmethod
-    def _skippable(cls, p: int, dfg: DFG, start: Collection[Any], end: Collection[Any],
-                   groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> bool:
+    def _skippable(cls, p: int, bdfg: BitsetDFG, groups: List[int], parameters: Optional[Dict[str, Any]] = None) -> bool:
         """
         This method implements the function SKIPPABLE as defined on page 233 of
         "Robust Process Mining with Guarantees" by Sander J.J. Leemans (ISBN: 978-90-386-4257-4)
         The function is used as a helper function for the strict sequence cut detection mechanism, which detects
         larger groups of skippable activities.
         """
-        for i, j in itertools.product(range(0, p), range(p + 1, len(groups))):
-            for a, b in itertools.product(groups[i], groups[j]):
-                if (a, b) in dfg.graph:
-                    return True
-        for i in range(p + 1, len(groups)):
-            for a in groups[i]:
-                if a in start:
-                    return True
-        for i in range(0, p):
-            for a in groups[i]:
-                if a in end:
-                    return True
-        return False
+        before = 0
+        for g in groups[:p]:
+            before |= g
+        after = 0
+        for g in groups[p + 1:]:
+            after |= g
+        return bool(bdfg.successors_of(before) & after or bdfg.start & after or bdfg.end & before)
 
     @classmethod
     def holds(cls, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Optional[List[Collection[Any]]]:
@@ -126,38 +106,37 @@ class StrictSequenceCut(SequenceCut[T], ABC, Generic[T]):
         "Robust Process Mining with Guarantees" by Sander J.J. Leemans (ISBN: 978-90-386-4257-4)
         The function merges groups that together can be skipped.
         """
-        dfg = obj.dfg
-        c = SequenceCut.holds(obj)
-        start = set(dfg.start_activities.keys())
-        end = set(dfg.end_activities.keys())
+        bdfg = obj.bitset_dfg
+        c = SequenceCut._find_groups(bdfg)
         if c is not None:
-            mf = [-1 * sys.maxsize if len(set(G).intersection(start)) > 0 else sys.maxsize for G in c]
-            mt = [sys.maxsize if len(set(G).intersection(end)) > 0 else -1 * sys.maxsize for G in c]
+            mf = [-1 * sys.maxsize if G & bdfg.start else sys.maxsize for G in c]
+            mt = [sys.maxsize if G & bdfg.end else -1 * sys.maxsize for G in c]
             cmap = cls._construct_alphabet_cluster_map(c)
-            for (a, b) in dfg.graph:
-                mf[cmap[b]] = min(mf[cmap[b]], cmap[a])
-                mt[cmap[a]] = max(mt[cmap[a]], cmap[b])
+            for a in range(len(bdfg)):
+                for b in iterate_bits(bdfg.successors[a]):
+                    mf[cmap[b]] = min(mf[cmap[b]], cmap[a])
+                    mt[cmap[a]] = max(mt[cmap[a]], cmap[b])
 
             for p in range(0, len(c)):
-                if cls._skippable(p, dfg, start, end, c):
+                if cls._skippable(p, bdfg, c):
                     q = p - 1
                     while q >= 0 and mt[q] <= p:
-                        c[p] = c[p].union(c[q])
-                        c[q] = set()
+                        c[p] |= c[q]
+                        c[q] = 0
                         q -= 1
                     q = p + 1
                     while q < len(mf) and mf[q] >= p:
-                        c[p] = c[p].union(c[q])
-                        c[q] = set()
+                        c[p] |= c[q]
+                        c[q] = 0
                         q += 1
-            return list(filter(lambda g: len(g) > 0, c))
+            return [bdfg.to_activities(g) for g in c if g]
         return None
 
     @classmethod
-    def _construct_alphabet_cluster_map(cls, c: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None):
+    def _construct_alphabet_cluster_map(cls, c: List[int], parameters: Optional[Dict[str, Any]] = None):
         map = dict()
         for i in range(0, len(c)):
-            for a in c[i]:
+            for a in iterate_bits(c[i]):
                 map[a] = i
         return map
 
@@ -166,45 +145,33 @@ class SequenceCutUVCL(SequenceCut[IMDataStructureUVCL]):
 
     @classmethod
     def project(cls, obj: IMDataStructureUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureUVCL]:
-        logs = [Counter() for g in groups]
-        for t in obj.data_structure:
-            i = 0
-            split_point = 0
-            act_union = set()
-            while i < len(groups):
-                new_split_point = cls._find_split_point(
-                    t, groups[i], split_point, act_union)
-                trace_i = tuple()
-                j = split_point
-                while j < new_split_point:
-                    if t[j] in groups[i]:
-                        trace_i = trace_i + (t[j],)
-                    j = j + 1
-                logs[i].update({trace_i: obj.data_structure[t]})
-                split_point = new_split_point
-                act_union = act_union.union(set(groups[i]))
-                i = i + 1
-        return list(map(lambda l: IMDataStructureUVCL(l), logs))
-
-    @classmethod
-    def _find_split_point(cls, t: Tuple[Any], group: Collection[Any], start: int, ignore: Collection[Any], parameters: Optional[Dict[str, Any]] = None) -> int:
-        least_cost = 0
-        position_with_least_cost = start
-        cost = 0
-        i = start
-        while i < len(t):
-            if t[i] in group:
-                cost = cost - 1
-            elif t[i] not in ignore:
-                cost = cost + 1
-
-            if cost < least_cost:
-                least_cost = cost
-                position_with_least_cost = i + 1
-
-            i = i + 1
-
-        return position_with_least_cost
+        # the split points of the groups are found for all the traces at once, on the cumulative costs of the events
+        log = obj.encoded
+        k = len(groups)
+        # the activities not belonging to any group are never ignored
+        event_groups = log.group_index(groups, default=k)[log.events]
+        trace_ids = log.trace_ids
+        positions = np.arange(len(log.events)) - log.offsets[:-1][trace_ids]
+        non_empty = np.flatnonzero(log.lengths > 0)
+        first_events = log.offsets[:-1][non_empty]
+        split_points = np.zeros(len(log), dtype=np.int64)
+        logs = []
+        for i in range(k):
+            active = positions >= split_points[trace_ids]
+            cost = np.where(event_groups == i, -1, np.where(event_groups > i, 1, 0)) * active
+            cumulative = np.cumsum(cost)
+            cumulative -= np.concatenate(([0], cumulative))[log.offsets[:-1]][trace_ids]
+            new_split_points = split_points.copy()
+            if len(non_empty) > 0:
+                least_cost = np.minimum.reduceat(cumulative, first_events)
+                is_least = (cumulative < 0) & (cumulative == np.repeat(least_cost, log.lengths[non_empty]))
+                position_with_least_cost = np.minimum.reduceat(np.where(is_least, positions, len(log.events)), first_events)
+                found = position_with_least_cost < len(log.events)
+                new_split_points[non_empty[found]] = position_with_least_cost[found] + 1
+            keep = active & (positions < new_split_points[trace_ids]) & (event_groups == i)
+            logs.append(IMDataStructureUVCL.from_encoded(log.project(keep)))
+            split_points = new_split_points
+        return logs
 
 
 class StrictSequenceCutUVCL(StrictSequenceCut[IMDataStructureUVCL], SequenceCutUVCL):
@@ -20,16 +20,15 @@ Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
 from abc import ABC
-from collections import Counter
 from typing import Optional, List, Collection, Any, Generic, Dict
 
-from pm4py.util import nx_utils
+import numpy as np
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut, T
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
 from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
-from pm4py.objects.dfg import util as dfu
 from pm4py.objects.dfg.obj import DFG
+from pm4py.objects.dfg import util as dfu
 from pm4py.objects.process_tree.obj import Operator, ProcessTree
 
 
@@ -51,14 +50,15 @@ class ExclusiveChoiceCut(Cut[T], ABC, Generic[T]):
         2.) we detect the connected components in the graph.
         3.) if there are more than one connected components, the cut exists and is non-minimal.
         '''
-        nx_dfg = dfu.as_nx_graph(obj.dfg)
-        nx_und = nx_dfg.to_undirected()
-        conn_comps = [nx_und.subgraph(c).copy() for c in nx_utils.connected_components(nx_und)]
+        bdfg = obj.bitset_dfg
+        undirected = [bdfg.successors[i] | bdfg.predecessors[i] for i in range(len(bdfg))]
+        conn_comps = bdfg.components(undirected)
         if len(conn_comps) > 1:
-            cuts = list()
-            for comp in conn_comps:
-                cuts.append(set(comp.nodes))
-            return cuts
+            # the projection breaks the ties on the position of the groups, so the groups are returned in the order
+            # of networkx.connected_components on the undirected DFG (by the first of their vertices in the vertex order)
+            position = {a: i for i, a in enumerate(dfu.get_vertices(obj.dfg))}
+            groups = [bdfg.to_activities(comp) for comp in conn_comps]
+            return sorted(groups, key=lambda g: min(position[a] for a in g))
         else:
             return None
 
@@ -66,20 +66,16 @@ class ExclusiveChoiceCut(Cut[T], ABC, Generic[T]):
 class ExclusiveChoiceCutUVCL(ExclusiveChoiceCut[IMDataStructureUVCL]):
     @classmethod
     def project(cls, obj: IMDataStructureUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureUVCL]:
-        logs = [Counter() for g in groups]
-        for t in obj.data_structure:
-            count = {i: 0 for i in range(len(groups))}
-            for index, group in enumerate(groups):
-                for e in t:
-                    if e in group:
-                        count[index] += 1
-            count = sorted(list((x, y) for x, y in count.items()), key=lambda x: (x[1], x[0]), reverse=True)
-            new_trace = tuple()
-            for e in t:
-                if e in groups[count[0][0]]:
-                    new_trace = new_trace + (e,)
-            logs[count[0][0]].update({new_trace: obj.data_structure[t]})
-        return list(map(lambda l: IMDataStructureUVCL(l), logs))
+        log = obj.encoded
+        k = len(groups)
+        event_groups = log.group_index(groups)[log.events]
+        in_group = event_groups >= 0
+        # each variant goes to the group containing most of its events (the last one in case of ties)
+        count = np.bincount(log.trace_ids[in_group] * k + event_groups[in_group],
+                            minlength=len(log) * k).reshape(len(log), k)
+        chosen = k - 1 - np.argmax(count[:, ::-1], axis=1)
+        keep = event_groups == chosen[log.trace_ids]
+        return [IMDataStructureUVCL.from_encoded(log.project(keep, chosen == i)) for i in range(k)]
 
 
 class ExclusiveChoiceCutDFG(ExclusiveChoiceCut[IMDataStructureDFG]):
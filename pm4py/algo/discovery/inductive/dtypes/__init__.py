@@ -19,4 +19,4 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from pm4py.algo.discovery.inductive.dtypes import im_ds, im_dfg
\ No newline at end of file
+from pm4py.algo.discovery.inductive.dtypes import im_ds, im_dfg, im_encoded
\ No newline at end of file
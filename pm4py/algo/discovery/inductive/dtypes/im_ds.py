@@ -23,8 +23,8 @@ from abc import ABC
 from typing import TypeVar, Generic, Optional
 
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
+from pm4py.algo.discovery.inductive.dtypes.im_encoded import EncodedUVCL, BitsetDFG
 from pm4py.objects.dfg.obj import DFG
-from pm4py.util.compression import util as comut
 from pm4py.util.compression.dtypes import UVCL
 
 T = TypeVar('T')
@@ -40,11 +40,21 @@ class IMDataStructure(ABC, Generic[T]):
 
     def __init__(self, obj: T):
         self._obj = obj
+        self._bitset_dfg = None
 
     @property
     def dfg(self) -> DFG:
         pass
 
+    @property
+    def bitset_dfg(self) -> BitsetDFG:
+        """
+        Bitset representation of the DFG (computed once), on which the cuts are detected
+        """
+        if self._bitset_dfg is None:
+            self._bitset_dfg = BitsetDFG.from_dfg(self.dfg)
+        return self._bitset_dfg
+
     @property
     def data_structure(self) -> T:
         return self._obj
@@ -59,19 +69,47 @@ class IMDataStructureLog(IMDataStructure[T], ABC, Generic[T]):
 class IMDataStructureUVCL(IMDataStructureLog[UVCL]):
     """
     Log-Based data structure class that represents the event log as a 'Univariate Variant Compressed Log (UVCL)'
+
+    The log is also kept in its integer-encoded form (EncodedUVCL), on which the DFG is computed and the cuts project
+    the sub-logs. The sub-logs obtained by projection are built from the encoded form only, and decoded to a UVCL when
+    data_structure is requested.
     """
 
-    def __init__(self, obj: UVCL, dfg: Optional[DFG] = None):
+    def __init__(self, obj: Optional[UVCL], dfg: Optional[DFG] = None, encoded: Optional[EncodedUVCL] = None):
         super().__init__(obj)
-        if dfg is None:
-            self._dfg = comut.discover_dfg_uvcl(self._obj)
-        else:
-            self._dfg = dfg
+        self._dfg = dfg
+        self._encoded = encoded
+
+    @classmethod
+    def from_encoded(cls, encoded: EncodedUVCL, dfg: Optional[DFG] = None) -> "IMDataStructureUVCL":
+        return cls(None, dfg=dfg, encoded=encoded)
+
+    @property
+    def data_structure(self) -> UVCL:
+        if self._obj is None:
+            self._obj = self._encoded.to_uvcl()
+        return self._obj
+
+    @property
+    def encoded(self) -> EncodedUVCL:
+        if self._encoded is None:
+            self._encoded = EncodedUVCL.from_uvcl(self._obj)
+        return self._encoded
 
     @property
     def dfg(self) -> DFG:
+        if self._dfg is None:
+            self._dfg = self.encoded.discover_dfg()
         return self._dfg
 
+    @property
+    def bitset_dfg(self) -> BitsetDFG:
+        if self._bitset_dfg is None:
+            # a DFG provided at construction (e.g., filtered by IMf) is used as it is
+            self._bitset_dfg = BitsetDFG.from_dfg(self._dfg) if self._dfg is not None else \
+                self.encoded.discover_bitset_dfg()
+        return self._bitset_dfg
+
 
 class IMDataStructureDFG(IMDataStructure[InductiveDFG]):
     """
@@ -0,0 +1,320 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from typing import List, Any, Dict, Optional, Collection, Tuple, Iterator
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+from pm4py.objects.dfg import util as dfu
+from pm4py.objects.dfg.obj import DFG
+from pm4py.util.compression import util as comut
+from pm4py.util.compression.dtypes import UVCL
+
+
+def iterate_bits(bits: int) -> Iterator[int]:
+    """
+    Iterates over the positions of the bits set in the given integer (from the lowest one)
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def count_bits(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+def rows_to_bits(matrix: np.ndarray) -> List[int]:
+    # every row of the boolean matrix becomes an integer (bit j set when the j-th column is true)
+    packed = np.packbits(matrix, axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+
+def _aggregate(keys: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # sums the weights of the equal keys; the keys are returned in the order of their first occurrence
+    uniq, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    sums = np.zeros(len(uniq), dtype=np.int64)
+    np.add.at(sums, inverse, weights)
+    order = np.argsort(first, kind="stable")
+    return uniq[order], sums[order]
+
+
+def _find_equal_variants(events: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    # maps every variant to the first variant equal to it. The candidates are found comparing the lengths and a
+    # fingerprint of the variants (computed on the whole array of events), and then checked event by event.
+    lengths = np.diff(offsets)
+    n = len(lengths)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    trace_ids = np.repeat(np.arange(n), lengths)
+    positions = np.arange(len(events)) - offsets[:-1][trace_ids]
+    fingerprints = np.bincount(trace_ids, weights=(events + 1.0) * np.sqrt(positions + 2.0), minlength=n)
+    order = np.lexsort((fingerprints, lengths))
+    same = (lengths[order][1:] == lengths[order][:-1]) & (fingerprints[order][1:] == fingerprints[order][:-1])
+    # the sort is stable, so the first variant of every block of candidates is also the first occurrence
+    block_starts = np.flatnonzero(np.concatenate(([True], ~same)))
+    merged = np.empty(n, dtype=np.int64)
+    merged[order] = order[block_starts][np.cumsum(np.concatenate(([True], ~same))) - 1]
+    if np.array_equal(events, events[offsets[:-1][merged][trace_ids] + positions]):
+        return merged
+    # (unlikely) collision of the fingerprints of different variants
+    positions_of = {}
+    offs = offsets.tolist()
+    return np.array([positions_of.setdefault(events[offs[i]:offs[i + 1]].tobytes(), i) for i in range(n)],
+                    dtype=np.int64)
+
+
+class EncodedUVCL:
+    """
+    Integer-encoded 'Univariate Variant Compressed Log (UVCL)'. The activities are replaced by their index in a lookup
+    table, which is shared by all the sub-logs obtained by projection (so that a sub-log never needs to be encoded
+    again), and the variants are stored in a single array of events, along with the offsets of the variants in it and
+    their counts.
+    """
+
+    def __init__(self, activities: List[Any], events: np.ndarray, offsets: np.ndarray, counts: np.ndarray,
+                 index: Optional[Dict[Any, int]] = None):
+        self.activities = activities
+        self.index = index if index is not None else {a: i for i, a in enumerate(activities)}
+        self.events = events
+        self.offsets = offsets
+        self.counts = counts
+        self._trace_ids = None
+
+    @classmethod
+    def from_uvcl(cls, log: UVCL) -> "EncodedUVCL":
+        activities = comut.get_alphabet(log)
+        index = {a: i for i, a in enumerate(activities)}
+        lengths = np.fromiter((len(t) for t in log), dtype=np.int64, count=len(log))
+        events = np.fromiter((index[a] for t in log for a in t), dtype=np.int32, count=int(lengths.sum()))
+        counts = np.fromiter(log.values(), dtype=np.int64, count=len(log))
+        return cls(activities, events, np.concatenate(([0], np.cumsum(lengths))), counts, index=index)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def trace_ids(self) -> np.ndarray:
+        """
+        Index of the variant of each event
+        """
+        if self._trace_ids is None:
+            self._trace_ids = np.repeat(np.arange(len(self.counts)), self.lengths)
+        return self._trace_ids
+
+    @property
+    def num_events(self) -> int:
+        return int(np.dot(self.lengths, self.counts))
+
+    def to_uvcl(self) -> UVCL:
+        activities = self.activities
+        decoded = [activities[e] for e in self.events.tolist()]
+        offsets = self.offsets.tolist()
+        log = UVCL()
+        for i, c in enumerate(self.counts.tolist()):
+            log[tuple(decoded[offsets[i]:offsets[i + 1]])] = c
+        return log
+
+    def group_index(self, groups: List[Collection[Any]], default: int = -1) -> np.ndarray:
+        """
+        Maps the index of every activity of the lookup table to the index of the group containing the activity
+        (or to the default value)
+        """
+        group_of = np.full(len(self.activities), default, dtype=np.int64)
+        for i, g in enumerate(groups):
+            group_of[[self.index[a] for a in g if a in self.index]] = i
+        return group_of
+
+    def build(self, events: np.ndarray, lengths: np.ndarray, counts: np.ndarray,
+              overwrite: bool = False) -> "EncodedUVCL":
+        """
+        Builds a sub-log (sharing the lookup table) from the given events, lengths and counts of the variants.
+        The equal variants are merged, keeping the order of their first occurrence. Their counts are summed, or
+        (overwrite) the count of the last occurrence is kept, as when a Counter is assigned variant by variant.
+        """
+        offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        merged = _find_equal_variants(events, offsets)
+        first = merged == np.arange(len(lengths))
+        if not first.all():
+            if overwrite:
+                last = np.zeros(len(lengths), dtype=np.int64)
+                np.maximum.at(last, merged, np.arange(len(lengths)))
+                counts = np.asarray(counts, dtype=np.int64)[last[first]]
+            else:
+                counts = np.bincount(merged, weights=counts, minlength=len(lengths)).astype(np.int64)[first]
+            events = events[np.repeat(first, lengths)]
+            lengths = lengths[first]
+            offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        return EncodedUVCL(self.activities, events, offsets, np.asarray(counts, dtype=np.int64), index=self.index)
+
+    def project(self, keep: np.ndarray, variants: Optional[np.ndarray] = None,
+                overwrite: bool = False) -> "EncodedUVCL":
+        """
+        Projects the log on the events of the given (boolean) mask, optionally restricting it to the given
+        (boolean) mask of variants (see build for the merge of the equal projected variants)
+        """
+        lengths = np.bincount(self.trace_ids[keep], minlength=len(self.counts))
+        counts = self.counts
+        if variants is not None:
+            keep = keep & variants[self.trace_ids]
+            lengths = lengths[variants]
+            counts = counts[variants]
+        return self.build(self.events[keep], lengths, counts, overwrite=overwrite)
+
+    def discover_dfg(self) -> DFG:
+        """
+        Discovers the DFG of the log (with the same frequencies as comut.discover_dfg_uvcl)
+        """
+        activities = self.activities
+        dfg = DFG()
+        m = len(activities)
+        trace_ids = self.trace_ids
+        weights = self.counts[trace_ids]
+        same_trace = trace_ids[:-1] == trace_ids[1:]
+        pairs = self.events[:-1].astype(np.int64) * m + self.events[1:]
+        for p, w in zip(*(x.tolist() for x in _aggregate(pairs[same_trace], weights[:-1][same_trace]))):
+            dfg.graph[(activities[p // m], activities[p % m])] = w
+        non_empty = self.lengths > 0
+        for target, positions in ((dfg.start_activities, self.offsets[:-1][non_empty]),
+                                  (dfg.end_activities, self.offsets[1:][non_empty] - 1)):
+            for a, w in zip(*(x.tolist() for x in _aggregate(self.events[positions], self.counts[non_empty]))):
+                target[activities[a]] = w
+        return dfg
+
+    def discover_bitset_dfg(self) -> "BitsetDFG":
+        """
+        Discovers the directly-follows relation of the log, directly in its bitset representation
+        """
+        codes = np.unique(self.events)
+        local = np.zeros(len(self.activities), dtype=np.int64)
+        local[codes] = np.arange(len(codes))
+        same_trace = self.trace_ids[:-1] == self.trace_ids[1:]
+        adjacency = np.zeros((len(codes), len(codes)), dtype=bool)
+        adjacency[local[self.events[:-1][same_trace]], local[self.events[1:][same_trace]]] = True
+        non_empty = self.lengths > 0
+        start, end = np.zeros((2, len(codes)), dtype=bool)
+        start[local[self.events[self.offsets[:-1][non_empty]]]] = True
+        end[local[self.events[self.offsets[1:][non_empty] - 1]]] = True
+        # the lookup table is sorted, so are the activities of the bitset representation
+        return BitsetDFG([self.activities[c] for c in codes.tolist()], adjacency, *rows_to_bits(np.vstack((start, end))))
+
+
+class BitsetDFG:
+    """
+    Representation of the directly-follows relation used by the cut detection of the Inductive Miner.
+    The vertices of the DFG are sorted and numbered; every set of vertices (successors, predecessors, start and end
+    activities, groups of a cut) is a Python integer in which the bit i is set when the i-th vertex belongs to the set.
+    """
+
+    def __init__(self, activities: List[Any], adjacency: np.ndarray, start: int, end: int):
+        self.activities = activities
+        self.index = {a: i for i, a in enumerate(activities)}
+        self.all = (1 << len(activities)) - 1
+        self.adjacency = adjacency
+        self.successors = rows_to_bits(adjacency)
+        self.predecessors = rows_to_bits(adjacency.T)
+        self.start = start
+        self.end = end
+        self._transitive_closure = None
+
+    @classmethod
+    def from_dfg(cls, dfg: DFG) -> "BitsetDFG":
+        activities = sorted(dfu.get_vertices(dfg))
+        index = {a: i for i, a in enumerate(activities)}
+        adjacency = np.zeros((len(activities), len(activities)), dtype=bool)
+        if dfg.graph:
+            adjacency[tuple(np.array([(index[a], index[b]) for (a, b) in dfg.graph]).T)] = True
+        start = 0
+        for a in dfg.start_activities:
+            start |= 1 << index[a]
+        end = 0
+        for a in dfg.end_activities:
+            end |= 1 << index[a]
+        return cls(activities, adjacency, start, end)
+
+    def __len__(self) -> int:
+        return len(self.activities)
+
+    def to_activities(self, bits: int) -> set:
+        return {self.activities[i] for i in iterate_bits(bits)}
+
+    def successors_of(self, bits: int) -> int:
+        succ = 0
+        for i in iterate_bits(bits):
+            succ |= self.successors[i]
+        return succ
+
+    def predecessors_of(self, bits: int) -> int:
+        pred = 0
+        for i in iterate_bits(bits):
+            pred |= self.predecessors[i]
+        return pred
+
+    def components(self, neighbours: List[int], nodes: Optional[int] = None) -> List[int]:
+        """
+        Computes the connected components of the (symmetric) relation described by the given neighbours,
+        restricted to the given nodes (default: all the vertices). The components are sorted by their lowest vertex.
+        """
+        remaining = self.all if nodes is None else nodes
+        components = []
+        while remaining:
+            component = frontier = remaining & -remaining
+            while frontier:
+                reached = 0
+                for i in iterate_bits(frontier):
+                    reached |= neighbours[i]
+                frontier = reached & remaining & ~component
+                component |= frontier
+            components.append(component)
+            remaining &= ~component
+        return components
+
+    def transitive_closure(self) -> np.ndarray:
+        """
+        Computes (once) the transitive closure of the directly-follows relation. The closure is computed on the
+        graph of the strongly connected components, by squaring its adjacency matrix until the fixpoint.
+        As in dfu.get_transitive_relations, a vertex is never reachable from itself.
+        """
+        if self._transitive_closure is None:
+            closure = np.zeros((len(self), len(self)), dtype=bool)
+            if len(self) > 0:
+                num_components, labels = connected_components(csr_matrix(self.adjacency), directed=True,
+                                                              connection="strong")
+                sources, targets = np.nonzero(self.adjacency)
+                reach = np.zeros((num_components, num_components), dtype=bool)
+                reach[labels[sources], labels[targets]] = True
+                while True:
+                    r = reach.astype(np.float32)
+                    squared = reach | (r @ r > 0)
+                    if np.array_equal(squared, reach):
+                        break
+                    reach = squared
+                closure = reach[np.ix_(labels, labels)]
+                np.fill_diagonal(closure, False)
+            self._transitive_closure = closure
+        return self._transitive_closure
@@ -19,16 +19,15 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from collections import Counter
 from typing import Optional, Tuple, List, Any, Dict
 
 from pm4py.algo.discovery.inductive.cuts.factory import CutFactory
 from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_encoded import EncodedUVCL
 from pm4py.algo.discovery.inductive.fall_through.abc import FallThrough
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree, Operator
 from pm4py.util.compression import util as comut
-from pm4py.util.compression.dtypes import UVCL
 from enum import Enum
 from pm4py.util import exec_utils, constants
 
@@ -41,11 +40,9 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
     MULTI_PROCESSING_LOWER_BOUND = 20
 
     @classmethod
-    def _process_candidate(cls, c: Any, log: UVCL, queue=None, ev=None, parameters: Optional[Dict[str, Any]] = None):
-        l_alt = Counter()
-        for t in log:
-            l_alt[tuple(filter(lambda e: e != c, t))] = log[t]
-        cut = cls._find_cut(IMDataStructureUVCL(l_alt), ev, parameters=parameters)
+    def _process_candidate(cls, c: Any, log: EncodedUVCL, queue=None, ev=None, parameters: Optional[Dict[str, Any]] = None):
+        l_alt = log.project(log.events != log.index[c], overwrite=True)
+        cut = cls._find_cut(IMDataStructureUVCL.from_encoded(l_alt), ev, parameters=parameters)
         if queue is not None:
             queue.put((c, cut))
         return cut if cut is not None else None
@@ -57,8 +54,8 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
 
         enable_multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT)
 
-        log = obj.data_structure
-        candidates = sorted(list(comut.get_alphabet(log)))
+        log = obj.encoded
+        candidates = sorted(list(comut.get_alphabet(obj.data_structure)))
         if pool is None or manager is None or not enable_multiprocessing or len(candidates) <= ActivityConcurrentUVCL.MULTI_PROCESSING_LOWER_BOUND:
             for a in candidates:
                 cut = cls._process_candidate(a, log, parameters=parameters)
@@ -72,7 +69,7 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
             manager.support_list.append(ev)
 
             for a in candidates:
-                pool.apply_async(cls._process_candidate, (a, log, q, ev, parameters))
+                pool.submit(cls._process_candidate, a, log, q, ev, parameters)
             potentials = set(candidates)
             while len(potentials) > 0:
                 (c, cut) = q.get(block=True)
@@ -104,10 +101,7 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
         candidate = cls._get_candidate(obj, pool, manager, parameters)
         if candidate is None:
             return None
-        log = obj.data_structure
-        l_a = Counter()
-        l_other = Counter()
-        for t in log:
-            l_a.update({tuple(filter(lambda e: e == candidate, t)): log[t]})
-            l_other.update({tuple(filter(lambda e: e != candidate, t)): log[t]})
-        return ProcessTree(operator=Operator.PARALLEL), [IMDataStructureUVCL(l_a), IMDataStructureUVCL(l_other)]
+        log = obj.encoded
+        is_candidate = log.events == log.index[candidate]
+        return ProcessTree(operator=Operator.PARALLEL), [IMDataStructureUVCL.from_encoded(log.project(is_candidate)),
+                                                         IMDataStructureUVCL.from_encoded(log.project(~is_candidate))]
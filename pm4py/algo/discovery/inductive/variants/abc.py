@@ -25,12 +25,12 @@ from typing import Optional, Tuple, List, TypeVar, Generic, Dict, Any
 
 from pm4py.algo.discovery.inductive.base_case.factory import BaseCaseFactory
 from pm4py.algo.discovery.inductive.cuts.factory import CutFactory
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL
 from pm4py.algo.discovery.inductive.fall_through.factory import FallThroughFactory
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree
 from enum import Enum
-from pm4py.util import exec_utils, constants
+from pm4py.util import exec_utils, constants, parallel_utils
 
 
 T = TypeVar('T', bound=IMDataStructure)
@@ -38,6 +38,28 @@ T = TypeVar('T', bound=IMDataStructure)
 
 class Parameters(Enum):
     MULTIPROCESSING = "multiprocessing"
+    PARALLEL_RECURSION = "parallel_recursion"
+    MIN_PARALLEL_SIZE = "min_parallel_size"
+    CORES = "cores"
+
+
+def get_size(obj: IMDataStructure) -> int:
+    """
+    Gets the size of the input of a recursion of the Inductive Miner (number of events of the log,
+    or sum of the frequencies of the arcs of the DFG), used to decide if it is worth mining it in another process
+    """
+    if isinstance(obj, IMDataStructureUVCL):
+        return obj.encoded.num_events
+    return sum(obj.dfg.graph.values())
+
+
+def _mine_subtree(framework_class, obj: IMDataStructure, parameters: Optional[Dict[Any, Any]] = None) -> ProcessTree:
+    # executed in a worker process of the shared pool: the sub-log is mined sequentially
+    parameters = {k: v for k, v in parameters.items() if exec_utils.unroll(k) not in (
+        Parameters.MULTIPROCESSING.value, Parameters.PARALLEL_RECURSION.value)} if parameters is not None else {}
+    parameters[Parameters.MULTIPROCESSING] = False
+    parameters[Parameters.PARALLEL_RECURSION] = False
+    return framework_class(parameters).apply(obj, parameters=parameters)
 
 
 class InductiveMinerFramework(ABC, Generic[T]):
@@ -48,6 +70,11 @@ class InductiveMinerFramework(ABC, Generic[T]):
     2. Create dedicated Base Cases, Cuts and Fall Throughs for the newly constructed IMDataStructure
     3. Extend the BaseCaseFactory, CutFactory and FallThroughFactory with the newly created functions
     4. Create a subclass of this class indicating the type on which it is defined and the corresponding IMInstance.
+
+    When Parameters.PARALLEL_RECURSION is enabled, the sub-logs (or sub-DFGs) produced by a cut or by a fall-through
+    whose size is at least Parameters.MIN_PARALLEL_SIZE are mined in the worker processes of a long-lived pool
+    (shared across the calls), while the current process mines the smaller ones. The children are attached in the
+    original order, so the resulting tree is identical to the one discovered sequentially.
     """
 
     def __init__(self, parameters: Optional[Dict[str, Any]] = None):
@@ -55,16 +82,19 @@ class InductiveMinerFramework(ABC, Generic[T]):
             parameters = {}
 
         enable_multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT)
-
+        self._parallel_recursion = exec_utils.get_param_value(Parameters.PARALLEL_RECURSION, parameters, False)
+        self._min_parallel_size = exec_utils.get_param_value(Parameters.MIN_PARALLEL_SIZE, parameters, 10000)
+        num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, max(1, os.cpu_count() - 1))
+
+        self._pool = None
+        self._manager = None
+        if enable_multiprocessing or self._parallel_recursion:
+            self._pool = parallel_utils.get_shared_executor(num_cores)
         if enable_multiprocessing:
-            from multiprocessing import Pool, Manager
+            from multiprocessing import Manager
 
-            self._pool = Pool(os.cpu_count() - 1)
             self._manager = Manager()
             self._manager.support_list = []
-        else:
-            self._pool = None
-            self._manager = None
 
     def apply_base_cases(self, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Optional[ProcessTree]:
         return BaseCaseFactory.apply_base_cases(obj, self.instance(), parameters=parameters)
@@ -87,12 +117,35 @@ class InductiveMinerFramework(ABC, Generic[T]):
         return tree
 
     def _recurse(self, tree: ProcessTree, objs: List[T], parameters: Optional[Dict[str, Any]] = None):
-        children = [self.apply(obj, parameters=parameters) for obj in objs]
+        if self._parallel_recursion and self._pool is not None:
+            children = self._apply_parallel(objs, parameters=parameters)
+        else:
+            children = [self.apply(obj, parameters=parameters) for obj in objs]
         for c in children:
             c.parent = tree
         tree.children.extend(children)
         return tree
 
+    def _apply_parallel(self, objs: List[T], parameters: Optional[Dict[str, Any]] = None) -> List[ProcessTree]:
+        sizes = [get_size(obj) for obj in objs]
+        large = [i for i in range(len(objs)) if sizes[i] >= self._min_parallel_size]
+        if len(large) < 2:
+            # a single large sub-log is mined in the current process, so that its own cuts can be parallelized
+            return [self.apply(obj, parameters=parameters) for obj in objs]
+
+        # the largest sub-logs are submitted first; the idle workers take the next pending one
+        futures = {}
+        for i in sorted(large, key=lambda i: -sizes[i]):
+            futures[i] = self._pool.submit(_mine_subtree, self.__class__, objs[i], parameters)
+
+        children = [None] * len(objs)
+        for i in range(len(objs)):
+            if i not in futures:
+                children[i] = self.apply(objs[i], parameters=parameters)
+        for i in futures:
+            children[i] = futures[i].result()
+        return children
+
     @abstractmethod
     def instance(self) -> IMInstance:
         pass
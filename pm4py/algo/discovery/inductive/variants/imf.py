@@ -100,4 +100,4 @@ class IMFUVCL(IMF[IMDataStructureUVCL]):
         for act in graph:
             dfg.graph[act] = graph[act]
 
-        return IMDataStructureUVCL(obj.data_structure, dfg)
+        return IMDataStructureUVCL(obj.data_structure, dfg, encoded=obj.encoded)
@@ -21,13 +21,14 @@ Contact: info@processintelligence.solutions
 '''
 from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any
-from pm4py.algo.discovery.ocel.ocdfg.variants import classic
+from pm4py.algo.discovery.ocel.ocdfg.variants import classic, aggregated
 from enum import Enum
 from pm4py.util import exec_utils
 
 
 class Variants(Enum):
     CLASSIC = classic
+    AGGREGATED = aggregated
 
 
 def apply(ocel: OCEL, variant=Variants.CLASSIC, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Any]:
@@ -43,6 +44,7 @@ def apply(ocel: OCEL, variant=Variants.CLASSIC, parameters: Optional[Dict[Any, A
     variant
         Variant of the algorithm to use:
         - Variants.CLASSIC
+        - Variants.AGGREGATED (count-only: keeps only the counts and the aggregated performance statistics)
     parameters
         Variant-specific parameters
 
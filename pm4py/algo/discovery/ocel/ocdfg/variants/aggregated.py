@@ -0,0 +1,337 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from typing import Optional, Dict, Any, Set, List
+from enum import Enum
+from pm4py.util import exec_utils, pandas_utils, constants
+from pm4py.objects.ocel import constants as ocel_constants
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.util.business_hours import soj_time_business_hours_diff_array
+import numpy as np
+import pandas as pd
+
+
+class Parameters(Enum):
+    EVENT_ID = ocel_constants.PARAM_EVENT_ID
+    OBJECT_ID = ocel_constants.PARAM_OBJECT_ID
+    OBJECT_TYPE = ocel_constants.PARAM_OBJECT_TYPE
+    EVENT_ACTIVITY = ocel_constants.PARAM_EVENT_ACTIVITY
+    EVENT_TIMESTAMP = ocel_constants.PARAM_EVENT_TIMESTAMP
+    COMPUTE_EDGES_PERFORMANCE = "compute_edges_performance"
+    BUSINESS_HOURS = "business_hours"
+    BUSINESS_HOUR_SLOTS = "business_hour_slots"
+    WORKCALENDAR = "workcalendar"
+    BUILD_INDEX = "build_index"
+
+
+PERFORMANCE_MEASURES = ["mean", "median", "min", "max", "sum"]
+
+
+class OCDFGIndex(object):
+    """
+    Index of the occurrences of the activities and of the edges of an OC-DFG, which allows to retrieve on demand
+    the sets of the classic variant (event identifiers, object identifiers, and their combinations)
+    """
+
+    def __init__(self, occurrences: pd.DataFrame, event_ids: np.ndarray, object_ids: np.ndarray,
+                 activities: np.ndarray, object_types: np.ndarray):
+        self.occurrences = occurrences
+        self.event_ids = event_ids
+        self.object_ids = object_ids
+        self.activities = activities
+        self.object_types = object_types
+        self._activity_code = {x: i for i, x in enumerate(activities)}
+        self._object_type_code = {x: i for i, x in enumerate(object_types)}
+
+    def _filter(self, section: str, key: Any, object_type: Optional[str]) -> pd.DataFrame:
+        occ = self.occurrences
+        if section != "activities_indep":
+            if object_type not in self._object_type_code:
+                return occ.iloc[0:0]
+            occ = occ[occ["@@ot"].to_numpy() == self._object_type_code[object_type]]
+        if section == "edges":
+            if key[0] not in self._activity_code or key[1] not in self._activity_code:
+                return occ.iloc[0:0]
+            return occ[(occ["@@prev_act"].to_numpy() == self._activity_code[key[0]]) & (
+                    occ["@@act"].to_numpy() == self._activity_code[key[1]])]
+        if key not in self._activity_code:
+            return occ.iloc[0:0]
+        occ = occ[occ["@@act"].to_numpy() == self._activity_code[key]]
+        if section == "start_activities":
+            occ = occ[occ["@@is_start"].to_numpy()]
+        elif section == "end_activities":
+            occ = occ[occ["@@is_end"].to_numpy()]
+        return occ
+
+    def get_set(self, section: str, metric: str, key: Any, object_type: Optional[str] = None) -> Set[Any]:
+        """
+        Gets the set that the classic variant would store at ocdfg[section][metric][object_type][key]
+        (or at ocdfg[section][metric][key] for the section activities_indep)
+
+        Parameters
+        ----------------
+        section
+            Section of the OC-DFG: activities_indep, activities_ot, start_activities, end_activities, edges
+        metric
+            Metric: events (event_couples for the edges), unique_objects, total_objects
+        key
+            Activity (or couple of activities for the edges)
+        object_type
+            Object type (not needed for the section activities_indep)
+
+        Returns
+        ----------------
+        set
+            Set of event identifiers, object identifiers, or tuples of them
+        """
+        occ = self._filter(section, key, object_type)
+        events = self.event_ids[occ["@@pos"].to_numpy()]
+        objects = self.object_ids[occ["@@obj"].to_numpy()]
+        if section == "edges":
+            prev_events = self.event_ids[occ["@@prev_pos"].to_numpy()]
+            if metric == "event_couples":
+                return set(zip(prev_events, events))
+            elif metric == "unique_objects":
+                return set(objects)
+            return set(zip(prev_events, events, objects))
+        if metric == "events":
+            return set(events)
+        elif metric == "unique_objects":
+            return set(objects)
+        return set(zip(events, objects))
+
+
+def __count_per_group(occurrences: pd.DataFrame, keys: List[str], unique_columns: List[Any]) -> pd.Series:
+    """
+    Counts, for every group, the number of distinct values of the given columns
+    """
+    return occurrences.drop_duplicates(keys + unique_columns).groupby(keys, sort=False).size()
+
+
+def __to_dict(counts: pd.Series, activities: np.ndarray, object_types: Optional[np.ndarray],
+              edges: bool = False) -> Dict[Any, Any]:
+    """
+    Transforms the counts of the groups (indexed by the codes of the object types and activities) into the
+    (nested) dictionaries of the OC-DFG
+    """
+    ret = {}
+    values = counts.to_numpy().tolist()
+    if object_types is None:
+        for act, v in zip(counts.index.tolist(), values):
+            ret[activities[act]] = v
+        return ret
+    for key, v in zip(counts.index.tolist(), values):
+        ot = object_types[key[0]]
+        if ot not in ret:
+            ret[ot] = {}
+        if edges:
+            ret[ot][(activities[key[1]], activities[key[2]])] = v
+        else:
+            ret[ot][activities[key[1]]] = v
+    return ret
+
+
+def __performance_to_dict(stats: pd.DataFrame, activities: np.ndarray, object_types: np.ndarray) -> Dict[
+    str, Dict[Any, Dict[str, float]]]:
+    """
+    Transforms the aggregated performance statistics of the edges into the dictionaries of the OC-DFG
+    """
+    ret = {}
+    records = stats[PERFORMANCE_MEASURES].to_numpy().tolist()
+    for key, rec in zip(stats.index.tolist(), records):
+        ot = object_types[key[0]]
+        if ot not in ret:
+            ret[ot] = {}
+        ret[ot][(activities[key[1]], activities[key[2]])] = dict(zip(PERFORMANCE_MEASURES, rec))
+    return ret
+
+
+def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Any]:
+    """
+    Discovers an OC-DFG model from an object-centric event log, keeping only the counts and the aggregated
+    performance statistics (count-only mode). All the measures are computed in a single vectorized pass over
+    the relations of the OCEL, which are sorted by object and by the position of the event in the log.
+
+    The result has the same structure as the classic variant, but:
+    - the sets of the classic variant are replaced by their size (e.g., ocdfg["edges"]["event_couples"][ot][(a, b)]
+      is the number of couples of events);
+    - the performance of every edge is a dictionary containing the mean, median, min, max and sum of the times
+      between the events;
+    - the key "index" contains an OCDFGIndex (if Parameters.BUILD_INDEX is enabled) that provides the sets of the
+      classic variant on demand, or None.
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.EVENT_ACTIVITY => the attribute to be used as activity
+        - Parameters.OBJECT_TYPE => the attribute to be used as object type
+        - Parameters.COMPUTE_EDGES_PERFORMANCE => (boolean) enables/disables the computation of the performance on the edges
+        - Parameters.BUSINESS_HOURS => enables/disables the business hours in the computation of the performance
+        - Parameters.BUSINESS_HOUR_SLOTS => work schedule of the company
+        - Parameters.WORKCALENDAR => work calendar of the company
+        - Parameters.BUILD_INDEX => (boolean) builds the index of the occurrences (default: False)
+
+    Returns
+    -----------------
+    ocdfg
+        Object-centric directly-follows graph (count-only)
+    """
+    if parameters is None:
+        parameters = {}
+
+    event_id = exec_utils.get_param_value(Parameters.EVENT_ID, parameters, ocel.event_id_column)
+    object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, ocel.object_id_column)
+    object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, ocel.object_type_column)
+    event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters, ocel.event_activity)
+    timestamp_key = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters, ocel.event_timestamp)
+    compute_edges_performance = exec_utils.get_param_value(Parameters.COMPUTE_EDGES_PERFORMANCE, parameters, True)
+    business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
+    business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters,
+                                                      constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+    workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters,
+                                              constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+    build_index = exec_utils.get_param_value(Parameters.BUILD_INDEX, parameters, False)
+
+    ret = {}
+    ret["activities"] = set(pandas_utils.format_unique(ocel.events[event_activity].unique()))
+    ret["object_types"] = set(pandas_utils.format_unique(ocel.objects[object_type].unique()))
+
+    # encodes the relations: position of the event in the log, activity, object and object type
+    event_ids = ocel.events[event_id].to_numpy()
+    act_codes, activities = pd.factorize(ocel.events[event_activity])
+    activities = np.asarray(activities, dtype=object)
+    use_index = ocel.has_index() and ocel.get_index().unique_event_ids and (event_id, object_id, object_type) == (
+        ocel.event_id_column, ocel.object_id_column, ocel.object_type_column)
+    if use_index:
+        # the relations are already grouped by object, and sorted by timestamp, in the index of the OCEL
+        index = ocel.get_index()
+        positions = index.o2e_events
+        obj_codes = np.repeat(np.arange(len(index.object_ids)), np.diff(index.o2e_indptr))
+        keep = positions < len(event_ids)
+        positions = positions[keep]
+        obj_codes = obj_codes[keep]
+        ot_codes = index.object_type_codes[obj_codes]
+        object_ids = index.object_ids
+        object_types = index.object_types
+        # the start and end activities follow the order of the relations (as in the classic variant)
+        rel_positions = pd.Index(event_ids).get_indexer(ocel.relations[event_id])
+        rel_objects = pd.Index(object_ids).get_indexer(ocel.relations[object_id])
+        valid = (rel_positions >= 0) & (rel_objects >= 0)
+        rel_positions = rel_positions[valid]
+        rel_objects = rel_objects[valid]
+    else:
+        positions = pd.Index(event_ids).get_indexer(ocel.relations[event_id])
+        relations = ocel.relations[positions >= 0]
+        positions = positions[positions >= 0]
+        obj_codes, object_ids = pd.factorize(relations[object_id])
+        ot_codes, object_types = pd.factorize(relations[object_type])
+        object_ids = np.asarray(object_ids, dtype=object)
+        object_types = np.asarray(object_types, dtype=object)
+        rel_positions = positions
+        rel_objects = obj_codes
+
+    occ = pd.DataFrame({"@@pos": positions, "@@obj": obj_codes, "@@ot": ot_codes, "@@act": act_codes[positions]})
+    # the same object is related at most once to the same event
+    occ = occ.drop_duplicates(["@@pos", "@@obj"])
+    if not use_index:
+        occ = occ.sort_values(["@@obj", "@@pos"], kind="stable")
+    occ = occ.reset_index(drop=True)
+
+    obj = occ["@@obj"].to_numpy()
+    pos = occ["@@pos"].to_numpy()
+    same_as_prev = np.zeros(len(occ), dtype=bool)
+    same_as_prev[1:] = obj[1:] == obj[:-1]
+
+    # the start (end) activity of an object is the one of its first (last) relation
+    _, first_relations = np.unique(rel_objects, return_index=True)
+    _, last_relations = np.unique(rel_objects[::-1], return_index=True)
+    last_relations = len(rel_objects) - 1 - last_relations
+    occ_keys = obj.astype(np.int64) * len(event_ids) + pos
+    rel_keys = rel_objects.astype(np.int64) * len(event_ids) + rel_positions
+    is_start = np.isin(occ_keys, rel_keys[first_relations])
+    is_end = np.isin(occ_keys, rel_keys[last_relations])
+    prev_pos = np.full(len(occ), -1, dtype=np.int64)
+    prev_pos[1:] = pos[:-1]
+    prev_pos[~same_as_prev] = -1
+    prev_act = np.full(len(occ), -1, dtype=np.int64)
+    prev_act[same_as_prev] = act_codes[prev_pos[same_as_prev]]
+
+    occ["@@is_start"] = is_start
+    occ["@@is_end"] = is_end
+    occ["@@prev_pos"] = prev_pos
+    occ["@@prev_act"] = prev_act
+
+    starts = occ[is_start]
+    ends = occ[is_end]
+    edges = occ[same_as_prev].copy()
+    edges["@@couple"] = edges["@@prev_pos"].to_numpy() * len(event_ids) + edges["@@pos"].to_numpy()
+
+    ret["edges"] = {}
+    edge_keys = ["@@ot", "@@prev_act", "@@act"]
+    ret["edges"]["event_couples"] = __to_dict(__count_per_group(edges, edge_keys, ["@@couple"]), activities,
+                                              object_types, edges=True)
+    ret["edges"]["unique_objects"] = __to_dict(__count_per_group(edges, edge_keys, ["@@obj"]), activities,
+                                               object_types, edges=True)
+    ret["edges"]["total_objects"] = __to_dict(edges.groupby(edge_keys, sort=False).size(), activities,
+                                              object_types, edges=True)
+
+    ret["activities_indep"] = {}
+    ret["activities_indep"]["events"] = __to_dict(__count_per_group(occ, ["@@act"], ["@@pos"]), activities, None)
+    ret["activities_indep"]["unique_objects"] = __to_dict(__count_per_group(occ, ["@@act"], ["@@obj"]), activities,
+                                                          None)
+    ret["activities_indep"]["total_objects"] = __to_dict(occ.groupby("@@act", sort=False).size(), activities, None)
+
+    for section, frame in [("activities_ot", occ), ("start_activities", starts), ("end_activities", ends)]:
+        ret[section] = {}
+        ret[section]["events"] = __to_dict(__count_per_group(frame, ["@@ot", "@@act"], ["@@pos"]), activities,
+                                           object_types)
+        ret[section]["unique_objects"] = __to_dict(__count_per_group(frame, ["@@ot", "@@act"], ["@@obj"]),
+                                                   activities, object_types)
+        ret[section]["total_objects"] = __to_dict(frame.groupby(["@@ot", "@@act"], sort=False).size(), activities,
+                                                  object_types)
+
+    ret["edges_performance"] = {}
+    ret["edges_performance"]["event_couples"] = {}
+    ret["edges_performance"]["total_objects"] = {}
+
+    if compute_edges_performance and len(edges) > 0:
+        timestamps = ocel.events[timestamp_key].to_numpy()
+        source_timestamps = timestamps[edges["@@prev_pos"].to_numpy()]
+        target_timestamps = timestamps[edges["@@pos"].to_numpy()]
+        if business_hours:
+            times = soj_time_business_hours_diff_array(source_timestamps, target_timestamps, business_hours_slots,
+                                                       workcalendar)
+        else:
+            times = (pd.to_datetime(target_timestamps) - pd.to_datetime(source_timestamps)).total_seconds()
+        edges["@@time"] = np.asarray(times, dtype=np.float64)
+
+        ret["edges_performance"]["event_couples"] = __performance_to_dict(
+            edges.drop_duplicates(edge_keys + ["@@couple"]).groupby(edge_keys, sort=False)["@@time"].agg(
+                PERFORMANCE_MEASURES), activities, object_types)
+        ret["edges_performance"]["total_objects"] = __performance_to_dict(
+            edges.groupby(edge_keys, sort=False)["@@time"].agg(PERFORMANCE_MEASURES), activities, object_types)
+
+    ret["index"] = OCDFGIndex(occ, event_ids, object_ids, activities, object_types) if build_index else None
+
+    return ret
@@ -111,6 +111,11 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str,
     double_arcs_on_activity = {}
     tbr_results = {}
 
+    flat_logs = None
+    if inductive_miner_variant == "im" or diagnostics_with_tbr:
+        # the flattened logs are required: encode the relations once and flatten the object types one at a time
+        flat_logs = flattening.iterate_flattened(ocel, object_types=list(ocpn["object_types"]), parameters=parameters)
+
     for ot in ocpn["object_types"]:
         activities_eo = ocpn["activities_ot"]["total_objects"][ot]
 
@@ -146,9 +151,10 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str,
         process_tree = None
         flat_log = None
 
-        if inductive_miner_variant == "im" or diagnostics_with_tbr:
-            # do the flattening only if it is required
-            flat_log = flattening.flatten(ocel, ot, parameters=parameters)
+        if flat_logs is not None:
+            # do the flattening only if it is required (the flattened logs are yielded in the order of the object types)
+            flat_ot, flat_log = next(flat_logs)
+            assert flat_ot == ot
 
         if inductive_miner_variant == "imd":
             obj = DFG()
@@ -26,7 +26,7 @@ from pm4py.objects.conversion.log import converter as log_converter
 from pm4py.objects.log.obj import EventLog
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.util import typing
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import get_calculator
 
 
 class Parameters(Enum):
@@ -81,6 +81,7 @@ def apply(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> typing.
 
     business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots)
 
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
@@ -101,10 +102,8 @@ def apply(log: EventLog, parameters: Optional[Dict[Any, Any]] = None) -> typing.
                     if not (act_i, act_j) in diff_time_recordings:
                         diff_time_recordings[(act_i, act_j)] = []
                     if business_hours:
-                        bh = BusinessHours(trace[i][timestamp_key],
-                                           trace[j][start_timestamp_key],
-                                           business_hour_slots=business_hours_slots)
-                        diff_time_recordings[(act_i, act_j)].append(bh.get_seconds())
+                        diff_time_recordings[(act_i, act_j)].append(
+                            bh_calculator.get_seconds_between(trace[i][timestamp_key], trace[j][start_timestamp_key]))
                     else:
                         diff_time_recordings[(act_i, act_j)].append(time_j - time_i)
 
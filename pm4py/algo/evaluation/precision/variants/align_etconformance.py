@@ -26,7 +26,7 @@ from pm4py.objects.petri_net.utils.petri_utils import construct_trace_net
 from pm4py.objects.petri_net.utils.synchronous_product import construct
 from pm4py.statistics.start_activities.log.get import get_start_activities
 from pm4py.objects.petri_net.utils.align_utils import get_visible_transitions_eventually_enabled_by_marking
-from pm4py.util import exec_utils
+from pm4py.util import exec_utils, parallel_utils
 from pm4py.util import xes_constants
 import importlib.util
 from enum import Enum
@@ -230,29 +230,11 @@ def align_fake_log_stop_marking(fake_log, net, marking, final_marking, parameter
         progress = tqdm(total=len(fake_log), desc="computing precision with alignments, completed variants :: ")
 
     if multiprocessing:
-        align_intermediate_result = __align_log_with_multiprocessing_stop_marking(fake_log, net, marking, final_marking,
-                                                                                progress, parameters=parameters)
+        align_result = __align_log_with_multiprocessing_stop_marking(fake_log, net, marking, final_marking,
+                                                                     progress, parameters=parameters)
     else:
-        align_intermediate_result = __align_log_wo_multiprocessing_stop_marking(fake_log, net, marking, final_marking,
-                                                                                progress, parameters=parameters)
-
-    align_result = []
-    for i in range(len(align_intermediate_result)):
-        res = align_intermediate_result[i]
-        if res is not None:
-            align_result.append([])
-            for mark in res:
-                res2 = {}
-                for pl in mark:
-                    # transforms the markings for easier correspondence at the end
-                    # (distributed engine friendly!)
-                    res2[(pl.name[0], pl.name[1])] = mark[pl]
-
-                align_result[-1].append(res2)
-        else:
-            # if there is no path from the initial marking
-            # replaying the given prefix, then add None
-            align_result.append(None)
+        align_result = __align_log_wo_multiprocessing_stop_marking(fake_log, net, marking, final_marking,
+                                                                   progress, parameters=parameters)
 
     # gracefully close progress bar
     if progress is not None:
@@ -265,7 +247,7 @@ def align_fake_log_stop_marking(fake_log, net, marking, final_marking, parameter
 def __align_log_wo_multiprocessing_stop_marking(fake_log, net, marking, final_marking, progress, parameters=None):
     align_intermediate_result = []
     for i in range(len(fake_log)):
-        res = __align_trace_stop_marking(fake_log[i], net, marking, final_marking, parameters=parameters)
+        res = __align_trace_stop_marking_by_name(fake_log[i], net, marking, final_marking, parameters=parameters)
         align_intermediate_result.append(res)
         if progress is not None:
             progress.update()
@@ -274,34 +256,41 @@ def __align_log_wo_multiprocessing_stop_marking(fake_log, net, marking, final_ma
 
 
 def __align_log_with_multiprocessing_stop_marking(fake_log, net, marking, final_marking, progress, parameters=None):
-    if parameters is not None:
+    if parameters is None:
         parameters = {}
 
-    import multiprocessing
-    from concurrent.futures import ProcessPoolExecutor
-
-    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2)
-    align_intermediate_result = []
-    with ProcessPoolExecutor(max_workers=num_cores) as executor:
-        futures = []
-        for i in range(len(fake_log)):
-            futures.append(executor.submit(__align_trace_stop_marking, fake_log[i], net, marking, final_marking, parameters))
-        if progress is not None:
-            alignments_ready = 0
-            while alignments_ready != len(futures):
-                current = 0
-                for index, variant in enumerate(futures):
-                    current = current + 1 if futures[index].done() else current
-                if current > alignments_ready:
-                    for i in range(0, current - alignments_ready):
-                        progress.update()
-                alignments_ready = current
-        for index, variant in enumerate(futures):
-            align_intermediate_result.append(futures[index].result())
+    # the model is sent once to each worker process, and the prefixes are dispatched in chunks
+    align_intermediate_result = parallel_utils.apply(fake_log, __align_trace_stop_marking_by_name,
+                                                     shared_args=(net, marking, final_marking, parameters),
+                                                     progress=progress, parameters=parameters)
 
     return align_intermediate_result
 
 
+def __get_stop_markings_by_name(res):
+    if res is None:
+        # if there is no path from the initial marking
+        # replaying the given prefix, then return None
+        return None
+
+    res_by_name = []
+    for mark in res:
+        res2 = {}
+        for pl in mark:
+            # transforms the markings for easier correspondence at the end
+            # (distributed engine friendly!)
+            res2[(pl.name[0], pl.name[1])] = mark[pl]
+
+        res_by_name.append(res2)
+
+    return res_by_name
+
+
+def __align_trace_stop_marking_by_name(trace, net, marking, final_marking, parameters=None):
+    return __get_stop_markings_by_name(__align_trace_stop_marking(trace, net, marking, final_marking,
+                                                                  parameters=parameters))
+
+
 def __align_trace_stop_marking(trace, net, marking, final_marking, parameters=None):
     sync_net, sync_initial_marking, sync_final_marking = build_sync_net(trace, net, marking, final_marking,
                                                                         parameters=parameters)
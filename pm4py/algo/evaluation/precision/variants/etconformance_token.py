@@ -26,7 +26,7 @@ from pm4py.objects import log as log_lib
 from pm4py.algo.evaluation.precision import utils as precision_utils
 from pm4py.statistics.start_activities.log.get import get_start_activities
 from pm4py.objects.petri_net.utils.align_utils import get_visible_transitions_eventually_enabled_by_marking
-from pm4py.util import exec_utils
+from pm4py.util import exec_utils, parallel_utils
 from enum import Enum
 from pm4py.util import constants
 from typing import Optional, Dict, Any, Union
@@ -44,6 +44,7 @@ class Parameters(Enum):
     SHOW_PROGRESS_BAR = "show_progress_bar"
     MULTIPROCESSING = "multiprocessing"
     CORES = "cores"
+    COLUMNAR_REPLAY = "columnar_replay"
 
 """
 Implementation of the approach described in paper
@@ -81,6 +82,8 @@ def apply(log: EventLog, net: PetriNet, marking: Marking, final_marking: Marking
     parameters
         Parameters of the algorithm, including:
             Parameters.ACTIVITY_KEY -> Activity key
+            Parameters.COLUMNAR_REPLAY -> replays the prefixes as variants with a columnar result, when the default
+            token-based replay is used (default: True). Otherwise, the prefixes are replayed through the executor
     """
 
     if parameters is None:
@@ -92,6 +95,10 @@ def apply(log: EventLog, net: PetriNet, marking: Marking, final_marking: Marking
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, log_lib.util.xes.DEFAULT_NAME_KEY)
     case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
     show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR)
+    multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters,
+                                                 constants.ENABLE_MULTIPROCESSING_DEFAULT)
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, parallel_utils.get_default_cores())
+    columnar_replay = exec_utils.get_param_value(Parameters.COLUMNAR_REPLAY, parameters, True)
 
     # default value for precision, when no activated transitions (not even by looking at the initial marking) are found
     precision = 1.0
@@ -113,10 +120,22 @@ def apply(log: EventLog, net: PetriNet, marking: Marking, final_marking: Marking
 
     prefixes, prefix_count = precision_utils.get_log_prefixes(log, activity_key=activity_key, case_id_key=case_id_key)
     prefixes_keys = list(prefixes.keys())
-    fake_log = precision_utils.form_fake_log(prefixes_keys, activity_key=activity_key)
 
-    aligned_traces = executor.apply(fake_log, net, marking, final_marking, variant=token_replay_variant,
+    if columnar_replay and exec_utils.get_variant(token_replay_variant) is token_replay:
+        # the prefixes are replayed as variants, getting a columnar result
+        parameters_tr[token_replay.Parameters.MULTIPROCESSING] = multiprocessing
+        parameters_tr[token_replay.Parameters.CORES] = cores
+        columnar_result = token_replay.apply_variants_columnar(
+            [tuple(prefix.split(constants.DEFAULT_VARIANT_SEP)) for prefix in prefixes_keys], net, marking,
+            final_marking, parameters=parameters_tr)
+        prefixes_is_fit = columnar_result.trace_is_fit
+        prefixes_activated_labels = columnar_result.enabled_transitions_in_marking_labels
+    else:
+        fake_log = precision_utils.form_fake_log(prefixes_keys, activity_key=activity_key)
+        aligned_traces = executor.apply(fake_log, net, marking, final_marking, variant=token_replay_variant,
                                         parameters=parameters_tr)
+        prefixes_is_fit = [x["trace_is_fit"] for x in aligned_traces]
+        prefixes_activated_labels = [[y.label for y in x["enabled_transitions_in_marking"]] for x in aligned_traces]
 
     # fix: also the empty prefix should be counted!
     start_activities = set(get_start_activities(log, parameters=parameters))
@@ -130,11 +149,10 @@ def apply(log: EventLog, net: PetriNet, marking: Marking, final_marking: Marking
         sum_ee += log[case_id_key].nunique() * len(diff)
     # end fix
 
-    for i in range(len(aligned_traces)):
-        if aligned_traces[i]["trace_is_fit"]:
+    for i in range(len(prefixes_keys)):
+        if prefixes_is_fit[i]:
             log_transitions = set(prefixes[prefixes_keys[i]])
-            activated_transitions_labels = set(
-                [x.label for x in aligned_traces[i]["enabled_transitions_in_marking"] if x.label is not None])
+            activated_transitions_labels = set([x for x in prefixes_activated_labels[i] if x is not None])
             sum_at += len(activated_transitions_labels) * prefix_count[prefixes_keys[i]]
             escaping_edges = activated_transitions_labels.difference(log_transitions)
             sum_ee += len(escaping_edges) * prefix_count[prefixes_keys[i]]
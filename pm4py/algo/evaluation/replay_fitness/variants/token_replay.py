@@ -21,9 +21,10 @@ Contact: info@processintelligence.solutions
 '''
 from pm4py.algo.conformance.tokenreplay import algorithm as executor
 from pm4py.algo.conformance.tokenreplay.variants import token_replay
-from pm4py.util import exec_utils
+from pm4py.util import exec_utils, parallel_utils
 from pm4py.util.xes_constants import DEFAULT_NAME_KEY
 from enum import Enum
+import numpy as np
 from pm4py.util import constants
 from typing import Optional, Dict, Any, Union
 from pm4py.objects.log.obj import EventLog
@@ -38,6 +39,7 @@ class Parameters(Enum):
     TOKEN_REPLAY_VARIANT = "token_replay_variant"
     CLEANING_TOKEN_FLOOD = "cleaning_token_flood"
     MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
     SHOW_PROGRESS_BAR = "show_progress_bar"
 
 
@@ -49,7 +51,7 @@ def evaluate(aligned_traces: typing.ListAlignments, parameters: Optional[Dict[Un
     Parameters
     ------------
     aligned_traces
-        Result of the token-based replayer
+        Result of the token-based replayer (list of results, or columnar result)
     parameters
         Possible parameters of the evaluation
 
@@ -61,15 +63,25 @@ def evaluate(aligned_traces: typing.ListAlignments, parameters: Optional[Dict[Un
     if parameters is None:
         parameters = {}
     no_traces = len(aligned_traces)
-    fit_traces = len([x for x in aligned_traces if x["trace_is_fit"]])
-    sum_of_fitness = sum([x["trace_fitness"] for x in aligned_traces])
+    if isinstance(aligned_traces, token_replay.ColumnarReplayResult):
+        # the results of each variant are weighted by the number of cases of the variant
+        counts = aligned_traces.variant_counts
+        fit_traces = int(counts[aligned_traces.trace_is_fit].sum())
+        sum_of_fitness = float(np.dot(counts, aligned_traces.trace_fitness))
+        total_m = int(np.dot(counts, aligned_traces.missing_tokens))
+        total_c = int(np.dot(counts, aligned_traces.consumed_tokens))
+        total_r = int(np.dot(counts, aligned_traces.remaining_tokens))
+        total_p = int(np.dot(counts, aligned_traces.produced_tokens))
+    else:
+        fit_traces = len([x for x in aligned_traces if x["trace_is_fit"]])
+        sum_of_fitness = sum([x["trace_fitness"] for x in aligned_traces])
+        total_m = sum([x["missing_tokens"] for x in aligned_traces])
+        total_c = sum([x["consumed_tokens"] for x in aligned_traces])
+        total_r = sum([x["remaining_tokens"] for x in aligned_traces])
+        total_p = sum([x["produced_tokens"] for x in aligned_traces])
     perc_fit_traces = 0.0
     average_fitness = 0.0
     log_fitness = 0
-    total_m = sum([x["missing_tokens"] for x in aligned_traces])
-    total_c = sum([x["consumed_tokens"] for x in aligned_traces])
-    total_r = sum([x["remaining_tokens"] for x in aligned_traces])
-    total_p = sum([x["produced_tokens"] for x in aligned_traces])
     if no_traces > 0 and total_c > 0 and total_p > 0:
         perc_fit_traces = float(100.0 * fit_traces) / float(no_traces)
         average_fitness = float(sum_of_fitness) / float(no_traces)
@@ -109,6 +121,9 @@ def apply(log: EventLog, petri_net: PetriNet, initial_marking: Marking, final_ma
     cleaning_token_flood = exec_utils.get_param_value(Parameters.CLEANING_TOKEN_FLOOD, parameters, False)
     show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, constants.SHOW_PROGRESS_BAR)
     case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters,
+                                                 constants.ENABLE_MULTIPROCESSING_DEFAULT)
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, parallel_utils.get_default_cores())
 
     parameters_tr = {token_replay.Parameters.ACTIVITY_KEY: activity_key,
                      token_replay.Parameters.CONSIDER_REMAINING_IN_FITNESS: True,
@@ -116,7 +131,14 @@ def apply(log: EventLog, petri_net: PetriNet, initial_marking: Marking, final_ma
                      token_replay.Parameters.SHOW_PROGRESS_BAR: show_progress_bar,
                      token_replay.Parameters.CASE_ID_KEY: case_id_key}
 
-    aligned_traces = executor.apply(log, petri_net, initial_marking, final_marking, variant=token_replay_variant,
-                                    parameters=parameters_tr)
+    if exec_utils.get_variant(token_replay_variant) is token_replay:
+        # the fitness is aggregated on the columnar result (without building a result for each case)
+        parameters_tr[token_replay.Parameters.MULTIPROCESSING] = multiprocessing
+        parameters_tr[token_replay.Parameters.CORES] = cores
+        aligned_traces = token_replay.apply_columnar(log, petri_net, initial_marking, final_marking,
+                                                     parameters=parameters_tr)
+    else:
+        aligned_traces = executor.apply(log, petri_net, initial_marking, final_marking, variant=token_replay_variant,
+                                        parameters=parameters_tr)
 
     return evaluate(aligned_traces)
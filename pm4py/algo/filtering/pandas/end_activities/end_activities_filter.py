@@ -27,6 +27,7 @@ from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY, PARAMETER_CONSTA
     RETURN_EA_COUNT_DICT_AUTOFILTER
 from enum import Enum
 from pm4py.util import exec_utils
+import numpy as np
 from copy import copy
 from typing import Optional, Dict, Any, Union, List
 import pandas as pd
@@ -48,7 +49,7 @@ def apply(df: pd.DataFrame, values: List[str], parameters: Optional[Dict[Union[s
     Parameters
     ----------
     df
-        Dataframe
+        Dataframe (or prepared log, see pm4py.objects.log.util.prepared_log)
     values
         Values to filter on
     parameters
@@ -71,6 +72,13 @@ def apply(df: pd.DataFrame, values: List[str], parameters: Optional[Dict[Union[s
     grouped_df = exec_utils.get_param_value(Parameters.GROUP_DATAFRAME, parameters, None)
     positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
 
+    from pm4py.objects.log.util import prepared_log
+    if prepared_log.is_prepared_log(df):
+        if df.matches(case_id_glue, activity_key):
+            case_mask = np.isin(df.get_end_activities_codes(), df.get_activity_codes(values))
+            return df.filter_cases(case_mask if positive else ~case_mask)
+        df = df.dataframe
+
     return filter_df_on_end_activities(df, values, case_id_glue=case_id_glue, activity_key=activity_key,
                                        positive=positive, grouped_df=grouped_df)
 
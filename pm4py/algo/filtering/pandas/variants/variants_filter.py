@@ -25,6 +25,8 @@ from pm4py.statistics.variants.pandas import get as variants_get
 from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY, PARAMETER_CONSTANT_ACTIVITY_KEY
 from enum import Enum
 from pm4py.util import exec_utils
+from pm4py.util import xes_constants
+import numpy as np
 from copy import copy
 from typing import Optional, Dict, Any, Union, List
 import pandas as pd
@@ -44,7 +46,7 @@ def apply(df: pd.DataFrame, admitted_variants: List[List[str]], parameters: Opti
     Parameters
     -----------
     df
-        Dataframe
+        Dataframe (or prepared log, see pm4py.objects.log.util.prepared_log)
     admitted_variants
         List of admitted variants (to include/exclude)
     parameters
@@ -65,6 +67,18 @@ def apply(df: pd.DataFrame, admitted_variants: List[List[str]], parameters: Opti
 
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
     positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+
+    from pm4py.objects.log.util import prepared_log
+    if prepared_log.is_prepared_log(df):
+        activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+        if df.matches(case_id_glue, activity_key):
+            variants, case_variant_idx = df.get_variants()
+            admitted_variants = set(tuple(v) for v in admitted_variants)
+            admitted_idx = np.array([v in admitted_variants for v in variants], dtype=bool)
+            case_mask = admitted_idx[case_variant_idx]
+            return df.filter_cases(case_mask if positive else ~case_mask)
+        df = df.dataframe
+
     variants_df = parameters["variants_df"] if "variants_df" in parameters else get_variants_df(df,
                                                                                                 parameters=parameters)
     variants_df = variants_df[variants_df["variant"].isin(admitted_variants)]
@@ -138,7 +152,9 @@ def filter_variants_by_coverage_percentage(log, min_coverage_percentage, paramet
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
 
     variants = variants_get.get_variants_count(log, parameters=parameters)
-    allowed_variants = [x for x, y in variants.items() if y >= min_coverage_percentage * log[case_id_glue].nunique()]
+    from pm4py.objects.log.util import prepared_log
+    num_cases = log.num_cases if prepared_log.is_prepared_log(log) else log[case_id_glue].nunique()
+    allowed_variants = [x for x, y in variants.items() if y >= min_coverage_percentage * num_cases]
 
     return apply(log, allowed_variants, parameters=parameters)
 
@@ -170,6 +186,8 @@ def filter_variants_by_maximum_coverage_percentage(log, max_coverage_percentage,
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
 
     variants = variants_get.get_variants_count(log, parameters=parameters)
-    allowed_variants = [x for x, y in variants.items() if y <= max_coverage_percentage * log[case_id_glue].nunique()]
+    from pm4py.objects.log.util import prepared_log
+    num_cases = log.num_cases if prepared_log.is_prepared_log(log) else log[case_id_glue].nunique()
+    allowed_variants = [x for x, y in variants.items() if y <= max_coverage_percentage * num_cases]
 
     return apply(log, allowed_variants, parameters=parameters)
\ No newline at end of file
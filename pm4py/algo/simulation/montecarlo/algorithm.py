@@ -20,7 +20,7 @@ Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
 
-from pm4py.algo.simulation.montecarlo.variants import petri_semaph_fifo
+from pm4py.algo.simulation.montecarlo.variants import petri_semaph_fifo, petri_des_fifo
 from pm4py.util import exec_utils
 from enum import Enum
 from typing import Optional, Dict, Any, Union, Tuple
@@ -32,11 +32,12 @@ from pm4py.objects.conversion.log import converter as log_converter
 
 class Variants(Enum):
     PETRI_SEMAPH_FIFO = petri_semaph_fifo
+    PETRI_DES_FIFO = petri_des_fifo
 
 
 DEFAULT_VARIANT = Variants.PETRI_SEMAPH_FIFO
 
-VERSIONS = {Variants.PETRI_SEMAPH_FIFO}
+VERSIONS = {Variants.PETRI_SEMAPH_FIFO, Variants.PETRI_DES_FIFO}
 
 
 def apply(log: Union[EventLog, pd.DataFrame], net: PetriNet, im: Marking, fm: Marking, variant=DEFAULT_VARIANT, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[EventLog, Dict[str, Any]]:
@@ -57,6 +58,8 @@ def apply(log: Union[EventLog, pd.DataFrame], net: PetriNet, im: Marking, fm: Ma
     variant
         Variant of the algorithm to use:
         - Variants.PETRI_SEMAPH_FIFO
+        - Variants.PETRI_DES_FIFO (discrete-event simulation on a virtual clock; deterministic given
+          Parameters.PARAM_SEED, supports Parameters.PARAM_NUM_REPLICATIONS)
     parameters
         Parameters of the algorithm:
             Parameters.PARAM_NUM_SIMULATIONS => (default: 100)
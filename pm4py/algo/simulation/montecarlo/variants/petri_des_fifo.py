@@ -0,0 +1,601 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import datetime
+import heapq
+import logging
+from collections import Counter, deque
+from enum import Enum
+from time import time
+from typing import Optional, Dict, Any, Union, Tuple, List
+
+import numpy as np
+
+from pm4py.algo.simulation.montecarlo.utils import replay
+from pm4py.objects.log.obj import EventLog, Trace, Event
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.stochastic_petri import utils as stochastic_utils
+from pm4py.statistics.traces.generic.log import case_arrival
+from pm4py.util import constants, exec_utils, xes_constants
+from pm4py.util.dt_parsing.variants import strpfromiso
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    TOKEN_REPLAY_VARIANT = "token_replay_variant"
+    PARAM_NUM_SIMULATIONS = "num_simulations"
+    PARAM_FORCE_DISTRIBUTION = "force_distribution"
+    PARAM_ENABLE_DIAGNOSTICS = "enable_diagnostics"
+    PARAM_DIAGN_INTERVAL = "diagn_interval"
+    PARAM_CASE_ARRIVAL_RATIO = "case_arrival_ratio"
+    PARAM_PROVIDED_SMAP = "provided_stochastic_map"
+    PARAM_MAP_RESOURCES_PER_PLACE = "map_resources_per_place"
+    PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE = "default_num_resources_per_place"
+    PARAM_SEED = "seed"
+    PARAM_NUM_REPLICATIONS = "num_replications"
+    PARAM_CONFIDENCE_LEVEL = "confidence_level"
+    MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
+
+
+class Outputs(Enum):
+    OUTPUT_PLACES_INTERVAL_TREES = "places_interval_trees"
+    OUTPUT_TRANSITIONS_INTERVAL_TREES = "transitions_interval_trees"
+    OUTPUT_CASES_EX_TIME = "cases_ex_time"
+    OUTPUT_MEDIAN_CASES_EX_TIME = "median_cases_ex_time"
+    OUTPUT_CASE_ARRIVAL_RATIO = "input_case_arrival_ratio"
+    OUTPUT_TOTAL_CASES_TIME = "total_cases_time"
+    OUTPUT_NUM_NOT_COMPLETED_CASES = "num_not_completed_cases"
+    OUTPUT_REPLICATIONS_STATISTICS = "replications_statistics"
+
+
+# kinds of the events of the calendar
+ARRIVAL = 0
+GRANT = 1
+COMPLETION = 2
+
+
+class SimulatedCase(object):
+    def __init__(self, id, marking):
+        """
+        State of a case in the discrete-event simulation
+
+        Parameters
+        -------------
+        id
+            Identifier
+        marking
+            Current marking of the case
+        """
+        self.id = id
+        self.marking = marking
+        self.trace = Trace()
+        # resources held by the case, per place
+        self.held = Counter()
+        # production times of the tokens of the case, per place (FIFO)
+        self.token_times = {}
+        self.transition = None
+        self.duration = 0.0
+        self.decision_time = 0.0
+        self.pending_places = deque()
+        self.first_timestamp = None
+        self.last_timestamp = None
+        self.completed = False
+
+
+class DiscreteEventSimulation(object):
+    def __init__(self, net, im, fm, smap, start_time, case_arrival_ratio, resources_per_places,
+                 default_num_resources_per_places, enable_diagnostics, diagn_interval):
+        """
+        Discrete-event simulation of an accepting Petri net, in which each place is a pool of resources
+        (with a FIFO queue of the cases waiting for them) and a virtual clock is advanced following
+        a priority queue of events (calendar).
+
+        Parameters
+        -------------
+        net
+            Petri net
+        im
+            Initial marking
+        fm
+            Final marking
+        smap
+            Stochastic map
+        start_time
+            Start time of the simulation
+        case_arrival_ratio
+            Inter-arrival time between the cases
+        resources_per_places
+            Number of resources of the specified places
+        default_num_resources_per_places
+            Number of resources of the places that are not specified
+        enable_diagnostics
+            Enable the logging of diagnostics about the current execution
+        diagn_interval
+            Interval (in seconds of wall-clock time) in which the diagnostics are printed
+        """
+        self.net = net
+        self.im = im
+        self.fm = fm
+        self.smap = smap
+        self.start_time = start_time
+        self.case_arrival_ratio = case_arrival_ratio
+        self.enable_diagnostics = enable_diagnostics
+        self.diagn_interval = diagn_interval
+        self.source = list(im)[0]
+
+        # fixes an order on the transitions and on the arcs, so the simulation does not depend on hashing
+        self.transitions = sorted(net.transitions, key=lambda x: (x.name, str(x.label)))
+        self.transition_index = {t: i for i, t in enumerate(self.transitions)}
+        self.out_places = {t: sorted((a.target for a in t.out_arcs), key=lambda x: x.name) for t in self.transitions}
+        self.in_places = {t: sorted((a.source for a in t.in_arcs), key=lambda x: x.name) for t in self.transitions}
+
+        self.capacity = {p: resources_per_places[p] if p in resources_per_places else default_num_resources_per_places
+                         for p in net.places}
+        self.in_use = Counter()
+        self.waiting = {p: deque() for p in net.places}
+
+        self.calendar = []
+        self.seq = 0
+        self.num_events = 0
+
+        # the intervals are collected during the simulation, and the interval trees are built at the end
+        # (inserting them one at a time would keep re-balancing the trees)
+        self.places_intervals = {p: [] for p in net.places}
+        self.transitions_intervals = {t: [] for t in net.transitions}
+
+    def schedule(self, timestamp, kind, case):
+        # the sequence number makes the order of simultaneous events deterministic (FIFO)
+        heapq.heappush(self.calendar, (timestamp, self.seq, kind, case))
+        self.seq += 1
+
+    def request(self, place, case, timestamp):
+        """
+        Requests a resource of the given place. Returns True if the resource is immediately obtained,
+        otherwise the case is put in the FIFO queue of the place.
+        """
+        if self.in_use[place] < self.capacity[place] and not self.waiting[place]:
+            self.in_use[place] += 1
+            case.held[place] += 1
+            return True
+        self.waiting[place].append(case)
+        return False
+
+    def release(self, place, case, timestamp):
+        """
+        Releases a resource of the given place, assigning it to the first case waiting for it
+        """
+        if case.held[place] <= 0:
+            return
+        case.held[place] -= 1
+        self.in_use[place] -= 1
+        if self.waiting[place]:
+            waiting_case = self.waiting[place].popleft()
+            self.in_use[place] += 1
+            waiting_case.held[place] += 1
+            self.schedule(timestamp, GRANT, waiting_case)
+
+    def decide(self, case, timestamp):
+        """
+        Chooses the next transition of the case and requests the resources of its output places
+        """
+        if self.fm <= case.marking:
+            self.finish(case, timestamp, True)
+            return
+        et = [t for t in self.transitions if all(case.marking[a.source] >= a.weight for a in t.in_arcs)]
+        if not et:
+            self.finish(case, timestamp, False)
+            return
+        ct = stochastic_utils.pick_transition(et, self.smap)
+        duration = -1
+        while duration < 0:
+            duration = self.smap[ct].get_value() if ct in self.smap else 0.0
+        case.transition = ct
+        case.duration = duration
+        case.decision_time = timestamp
+        case.pending_places = deque(self.out_places[ct])
+        self.acquire_outputs(case, timestamp)
+
+    def acquire_outputs(self, case, timestamp):
+        """
+        Acquires (one at a time, in FIFO order) the resources of the output places of the chosen transition,
+        and schedules its completion when all of them are obtained
+        """
+        while case.pending_places:
+            place = case.pending_places.popleft()
+            if not self.request(place, case, timestamp):
+                # the case is suspended until the resource is granted
+                return
+        waiting_time = timestamp - case.decision_time
+        if waiting_time > 0:
+            self.transitions_intervals[case.transition].append((case.decision_time, case.decision_time + waiting_time))
+        # the sampled duration includes the waiting time
+        execution_time = max(case.duration - waiting_time, 0)
+        self.schedule(timestamp + execution_time, COMPLETION, case)
+
+    def complete(self, case, timestamp):
+        """
+        Fires the chosen transition of the case
+        """
+        ct = case.transition
+        for a in ct.in_arcs:
+            case.marking[a.source] -= a.weight
+            if case.marking[a.source] <= 0:
+                del case.marking[a.source]
+        for a in ct.out_arcs:
+            case.marking[a.target] += a.weight
+
+        if ct.label is not None:
+            eve = Event({xes_constants.DEFAULT_NAME_KEY: ct.label,
+                         xes_constants.DEFAULT_TIMESTAMP_KEY: strpfromiso.fix_naivety(
+                             datetime.datetime.fromtimestamp(timestamp))})
+            case.trace.append(eve)
+            if case.first_timestamp is None:
+                case.first_timestamp = timestamp
+            case.last_timestamp = timestamp
+
+        for place in self.in_places[ct]:
+            token_times = case.token_times.get(place)
+            if token_times:
+                p_ex_time = token_times.popleft()
+                if timestamp - p_ex_time > 0:
+                    self.places_intervals[place].append((p_ex_time, timestamp))
+            self.release(place, case, timestamp)
+        for place in self.out_places[ct]:
+            if place not in case.token_times:
+                case.token_times[place] = deque()
+            case.token_times[place].append(timestamp)
+
+        self.decide(case, timestamp)
+
+    def finish(self, case, timestamp, completed):
+        case.completed = completed
+        for place in sorted(case.held, key=lambda x: x.name):
+            while case.held[place] > 0:
+                self.release(place, case, timestamp)
+
+    def resolve_deadlock(self, timestamp, logger):
+        """
+        When no event is scheduled but some cases are still waiting for resources, the cases are in a deadlock.
+        The case waiting since the longest time is aborted (as done by the timeout of the threads in the
+        semaphore-based variant), releasing its resources.
+
+        Returns True if a case has been aborted
+        """
+        waiting_cases = {}
+        for p in self.waiting:
+            for case in self.waiting[p]:
+                waiting_cases[case.id] = case
+        if not waiting_cases:
+            return False
+        case = waiting_cases[min(waiting_cases)]
+        if self.enable_diagnostics:
+            self.print_diagnostics(logger, timestamp)
+            logger.info(str(time()) + " aborted the case " + str(case.id) + " (deadlock on the resources)")
+        for p in self.waiting:
+            if case in self.waiting[p]:
+                self.waiting[p].remove(case)
+        self.finish(case, timestamp, False)
+        return True
+
+    def get_interval_trees(self):
+        """
+        Gets the interval trees of the places (times in which they were occupied) and of the transitions
+        (times in which they could not fire because the resources of their output places were not available)
+        """
+        from intervaltree import IntervalTree, Interval
+
+        places_interval_trees = {p: IntervalTree(Interval(x[0], x[1]) for x in self.places_intervals[p])
+                                 for p in self.places_intervals}
+        transitions_interval_trees = {t: IntervalTree(Interval(x[0], x[1]) for x in self.transitions_intervals[t])
+                                      for t in self.transitions_intervals}
+        return places_interval_trees, transitions_interval_trees
+
+    def print_diagnostics(self, logger, timestamp):
+        blocked = {p: len(self.waiting[p]) for p in self.waiting if self.waiting[p]}
+        if blocked:
+            logger.info(str(time()) + " diagnostics at simulated time " + str(timestamp) +
+                        ": places with cases waiting for resources: " + str(blocked))
+
+    def run(self, no_simulations):
+        """
+        Simulates the given number of cases
+
+        Parameters
+        -------------
+        no_simulations
+            Number of cases
+
+        Returns
+        -------------
+        cases
+            Simulated cases
+        """
+        logging.basicConfig()
+        logger = logging.getLogger(__name__)
+        logger.setLevel(logging.DEBUG)
+
+        cases = []
+        arrival_time = self.start_time
+        for i in range(no_simulations):
+            case = SimulatedCase(i, Marking(self.im))
+            case.token_times[self.source] = deque()
+            cases.append(case)
+            self.schedule(arrival_time, ARRIVAL, case)
+            arrival_time = arrival_time + self.case_arrival_ratio
+
+        last_diagnostics = time()
+        timestamp = self.start_time
+        while True:
+            if not self.calendar:
+                if not self.resolve_deadlock(timestamp, logger):
+                    break
+                continue
+            timestamp, _, kind, case = heapq.heappop(self.calendar)
+            self.num_events += 1
+            if kind == ARRIVAL:
+                case.token_times[self.source].append(timestamp)
+                if self.request(self.source, case, timestamp):
+                    self.decide(case, timestamp)
+            elif kind == GRANT:
+                if case.transition is None:
+                    # the resource of the source place was granted
+                    self.decide(case, timestamp)
+                else:
+                    self.acquire_outputs(case, timestamp)
+            else:
+                self.complete(case, timestamp)
+
+            if self.enable_diagnostics and time() - last_diagnostics > self.diagn_interval:
+                self.print_diagnostics(logger, timestamp)
+                last_diagnostics = time()
+
+        return cases
+
+
+def __simulate(net, im, fm, smap, case_arrival_ratio, no_simulations, resources_per_places,
+               default_num_resources_per_places, enable_diagnostics, diagn_interval, seed):
+    """
+    Performs a single replication of the simulation
+    """
+    if seed is not None:
+        # the distributions and the choices of the transitions use the global NumPy generator
+        previous_state = np.random.get_state()
+        np.random.seed(seed)
+
+    try:
+        # the start timestamp is set to 1000000 instead of 0 to avoid problems with 32 bit machines
+        simulation = DiscreteEventSimulation(net, im, fm, smap, 1000000, case_arrival_ratio, resources_per_places,
+                                             default_num_resources_per_places, enable_diagnostics, diagn_interval)
+        cases = simulation.run(no_simulations)
+    finally:
+        if seed is not None:
+            np.random.set_state(previous_state)
+
+    return simulation, cases
+
+
+def __get_replication_measures(cases) -> Dict[str, float]:
+    from statistics import median, mean
+
+    completed = [c for c in cases if c.completed]
+    cases_ex_time = [c.last_timestamp - c.first_timestamp if c.first_timestamp is not None else 0 for c in completed]
+    timestamps = [c.last_timestamp for c in completed if c.last_timestamp is not None]
+    first_timestamps = [c.first_timestamp for c in completed if c.first_timestamp is not None]
+
+    return {Outputs.OUTPUT_MEDIAN_CASES_EX_TIME.value: median(cases_ex_time) if cases_ex_time else 0.0,
+            "mean_cases_ex_time": mean(cases_ex_time) if cases_ex_time else 0.0,
+            Outputs.OUTPUT_TOTAL_CASES_TIME.value: max(timestamps) - min(first_timestamps) if timestamps else 0.0,
+            Outputs.OUTPUT_NUM_NOT_COMPLETED_CASES.value: len(cases) - len(completed)}
+
+
+def __simulate_replication_measures(net, im, fm, smap, case_arrival_ratio, no_simulations, resources_per_places,
+                                    default_num_resources_per_places, seed):
+    simulation, cases = __simulate(net, im, fm, smap, case_arrival_ratio, no_simulations, resources_per_places,
+                                   default_num_resources_per_places, False, 0, seed)
+    return __get_replication_measures(cases)
+
+
+def get_confidence_intervals(replications_measures: List[Dict[str, float]], confidence_level: float = 0.95) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregates the measures of independent replications of the simulation, computing for each measure
+    the mean and the (Student's t) confidence interval of the mean
+
+    Parameters
+    -------------
+    replications_measures
+        Measures obtained by each replication
+    confidence_level
+        Confidence level of the intervals (default: 0.95)
+
+    Returns
+    -------------
+    statistics
+        Dictionary associating to each measure the mean, the standard deviation, the confidence interval
+        and the values of the single replications
+    """
+    from scipy.stats import t as student_t
+
+    ret = {}
+    if not replications_measures:
+        return ret
+    n = len(replications_measures)
+    for measure in replications_measures[0]:
+        values = np.array([float(r[measure]) for r in replications_measures])
+        mean = float(np.mean(values))
+        stdev = float(np.std(values, ddof=1)) if n > 1 else 0.0
+        if n > 1:
+            half_width = float(student_t.ppf((1.0 + confidence_level) / 2.0, n - 1) * stdev / np.sqrt(n))
+        else:
+            half_width = 0.0
+        ret[measure] = {"mean": mean, "stdev": stdev, "confidence_interval": (mean - half_width, mean + half_width),
+                        "values": values.tolist()}
+    return ret
+
+
+def apply(log: EventLog, net: PetriNet, im: Marking, fm: Marking, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Tuple[EventLog, Dict[str, Any]]:
+    """
+    Performs a Monte Carlo simulation of an accepting Petri net without duplicate transitions and where the preset is always
+    distinct from the postset (discrete-event variant; each place is a pool of resources with a FIFO queue, and the simulation
+    advances a virtual clock following a calendar of events, so the result is obtained in a time proportional to the number
+    of simulated events and is reproducible given a seed)
+
+    Parameters
+    -------------
+    log
+        Event log
+    net
+        Accepting Petri net without duplicate transitions and where the preset is always distinct from the postset
+    im
+        Initial marking
+    fm
+        Final marking
+    parameters
+        Parameters of the algorithm:
+            PARAM_NUM_SIMULATIONS => (default: 100)
+            PARAM_FORCE_DISTRIBUTION => Force a particular stochastic distribution (e.g. normal) when the stochastic map
+            is discovered from the log (default: None; no distribution is forced)
+            PARAM_ENABLE_DIAGNOSTICS => Enable the printing of diagnostics (default: True)
+            PARAM_DIAGN_INTERVAL => Interval of time in which diagnostics of the simulation are printed (default: 32)
+            PARAM_CASE_ARRIVAL_RATIO => Case arrival of new cases (default: None; inferred from the log)
+            PARAM_PROVIDED_SMAP => Stochastic map that is used in the simulation (default: None; inferred from the log)
+            PARAM_MAP_RESOURCES_PER_PLACE => Specification of the number of resources available per place
+            (default: None; each place gets the default number of resources)
+            PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE => Default number of resources per place when not specified
+            (default: 1; each place gets 1 resource and has to wait for the resource to finish)
+            PARAM_SEED => Seed of the random number generator (default: None; the simulation is not reproducible)
+            PARAM_NUM_REPLICATIONS => Number of independent replications of the simulation (default: 1). The replication
+            i uses the seed PARAM_SEED + i.
+            PARAM_CONFIDENCE_LEVEL => Confidence level of the intervals computed on the replications (default: 0.95)
+            MULTIPROCESSING => Runs the additional replications in a process pool
+            (default: constants.ENABLE_MULTIPROCESSING_DEFAULT)
+            CORES => Number of processes of the pool (default: number of CPUs - 1)
+
+    Returns
+    ------------
+    simulated_log
+        Simulated event log (of the first replication)
+    simulation_result
+        Result of the simulation:
+            Outputs.OUTPUT_PLACES_INTERVAL_TREES => inteval trees that associate to each place the times in which it was occupied.
+            Outputs.OUTPUT_TRANSITIONS_INTERVAL_TREES => interval trees that associate to each transition the intervals of time
+            in which it could not fire because some token was in the output.
+            Outputs.OUTPUT_CASES_EX_TIME => Throughput time of the cases included in the simulated log
+            Outputs.OUTPUT_MEDIAN_CASES_EX_TIME => Median of the throughput times
+            Outputs.OUTPUT_CASE_ARRIVAL_RATIO => Case arrival ratio that was specified in the simulation
+            Outputs.OUTPUT_TOTAL_CASES_TIME => Total time occupied by cases of the simulated log
+            Outputs.OUTPUT_NUM_NOT_COMPLETED_CASES => Number of cases that could not reach the final marking
+            (deadlock on the resources of the places)
+            Outputs.OUTPUT_REPLICATIONS_STATISTICS => Mean and confidence interval of the measures
+            over the replications
+    """
+    if parameters is None:
+        parameters = {}
+
+    no_simulations = exec_utils.get_param_value(Parameters.PARAM_NUM_SIMULATIONS, parameters,
+                                                100)
+    force_distribution = exec_utils.get_param_value(Parameters.PARAM_FORCE_DISTRIBUTION, parameters,
+                                                    None)
+    enable_diagnostics = exec_utils.get_param_value(Parameters.PARAM_ENABLE_DIAGNOSTICS, parameters,
+                                                    True)
+    diagn_interval = exec_utils.get_param_value(Parameters.PARAM_DIAGN_INTERVAL, parameters,
+                                                32.0)
+    case_arrival_ratio = exec_utils.get_param_value(Parameters.PARAM_CASE_ARRIVAL_RATIO, parameters,
+                                                    None)
+    smap = exec_utils.get_param_value(Parameters.PARAM_PROVIDED_SMAP, parameters,
+                                      None)
+    resources_per_places = exec_utils.get_param_value(Parameters.PARAM_MAP_RESOURCES_PER_PLACE, parameters,
+                                                      None)
+    default_num_resources_per_places = exec_utils.get_param_value(Parameters.PARAM_DEFAULT_NUM_RESOURCES_PER_PLACE,
+                                                                  parameters, 1)
+    seed = exec_utils.get_param_value(Parameters.PARAM_SEED, parameters, None)
+    num_replications = exec_utils.get_param_value(Parameters.PARAM_NUM_REPLICATIONS, parameters, 1)
+    confidence_level = exec_utils.get_param_value(Parameters.PARAM_CONFIDENCE_LEVEL, parameters, 0.95)
+    enable_multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters,
+                                                        constants.ENABLE_MULTIPROCESSING_DEFAULT)
+
+    if case_arrival_ratio is None:
+        case_arrival_ratio = case_arrival.get_case_arrival_avg(log, parameters=parameters)
+    if resources_per_places is None:
+        resources_per_places = {}
+
+    logging.basicConfig()
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.DEBUG)
+
+    # when the user does not specify any map from transitions to random variables,
+    # a replay operation is performed
+    if smap is None:
+        if enable_diagnostics:
+            logger.info(str(time()) + " started the replay operation.")
+        if force_distribution is not None:
+            smap = replay.get_map_from_log_and_net(log, net, im, fm, force_distribution=force_distribution,
+                                                   parameters=parameters)
+        else:
+            smap = replay.get_map_from_log_and_net(log, net, im, fm, parameters=parameters)
+        if enable_diagnostics:
+            logger.info(str(time()) + " ended the replay operation.")
+
+    simulation, cases = __simulate(net, im, fm, smap, case_arrival_ratio, no_simulations, resources_per_places,
+                                   default_num_resources_per_places, enable_diagnostics, diagn_interval, seed)
+
+    replications_measures = [__get_replication_measures(cases)]
+    seeds = [seed + i if seed is not None else None for i in range(1, num_replications)]
+    if seeds:
+        if enable_multiprocessing:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, max(1, multiprocessing.cpu_count() - 1))
+            with ProcessPoolExecutor(max_workers=num_cores) as executor:
+                futures = [executor.submit(__simulate_replication_measures, net, im, fm, smap, case_arrival_ratio,
+                                           no_simulations, resources_per_places, default_num_resources_per_places, s)
+                           for s in seeds]
+                for future in futures:
+                    replications_measures.append(future.result())
+        else:
+            for s in seeds:
+                replications_measures.append(
+                    __simulate_replication_measures(net, im, fm, smap, case_arrival_ratio, no_simulations,
+                                                    resources_per_places, default_num_resources_per_places, s))
+
+    if enable_diagnostics:
+        logger.info(str(time()) + " ended the Monte carlo simulation (" + str(simulation.num_events) +
+                    " simulated events).")
+
+    completed = [c for c in cases if c.completed]
+    log = EventLog([c.trace for c in completed])
+    cases_ex_time = [c.last_timestamp - c.first_timestamp if c.first_timestamp is not None else 0 for c in completed]
+    measures = replications_measures[0]
+
+    places_interval_trees, transitions_interval_trees = simulation.get_interval_trees()
+    transitions_interval_trees = {t.name: y for t, y in transitions_interval_trees.items()}
+
+    return log, {Outputs.OUTPUT_PLACES_INTERVAL_TREES.value: places_interval_trees,
+                 Outputs.OUTPUT_TRANSITIONS_INTERVAL_TREES.value: transitions_interval_trees,
+                 Outputs.OUTPUT_CASES_EX_TIME.value: cases_ex_time,
+                 Outputs.OUTPUT_MEDIAN_CASES_EX_TIME.value: measures[Outputs.OUTPUT_MEDIAN_CASES_EX_TIME.value],
+                 Outputs.OUTPUT_CASE_ARRIVAL_RATIO.value: case_arrival_ratio,
+                 Outputs.OUTPUT_TOTAL_CASES_TIME.value: measures[Outputs.OUTPUT_TOTAL_CASES_TIME.value],
+                 Outputs.OUTPUT_NUM_NOT_COMPLETED_CASES.value: measures[Outputs.OUTPUT_NUM_NOT_COMPLETED_CASES.value],
+                 Outputs.OUTPUT_REPLICATIONS_STATISTICS.value: get_confidence_intervals(replications_measures,
+                                                                                        confidence_level)}
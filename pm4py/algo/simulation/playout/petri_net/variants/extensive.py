@@ -25,10 +25,10 @@ from collections import Counter
 from enum import Enum
 from typing import Optional, Dict, Any, Union
 
-from pm4py.objects import petri_net
 from pm4py.objects.log import obj as log_instance
 from pm4py.objects.log.obj import EventLog
 from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.petri_net.utils import compiled_net
 from pm4py.util.dt_parsing.variants import strpfromiso
 from pm4py.util import constants
 from pm4py.util import exec_utils
@@ -67,7 +67,8 @@ def apply(net: PetriNet, initial_marking: Marking, final_marking: Marking = None
     parameters
         Parameters of the algorithm:
             Parameters.MAX_TRACE_LENGTH -> Maximum trace length
-            Parameters.PETRI_SEMANTICS -> Petri net semantics
+            Parameters.PETRI_SEMANTICS -> Petri net semantics (if not provided, the classic semantics is applied
+            on a compiled version of the Petri net)
     """
     if parameters is None:
         parameters = {}
@@ -79,13 +80,20 @@ def apply(net: PetriNet, initial_marking: Marking, final_marking: Marking = None
     max_trace_length = exec_utils.get_param_value(Parameters.MAX_TRACE_LENGTH, parameters, 10)
     return_elements = exec_utils.get_param_value(Parameters.RETURN_ELEMENTS, parameters, False)
     max_marking_occ = exec_utils.get_param_value(Parameters.MAX_MARKING_OCC, parameters, sys.maxsize)
-    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, petri_net.semantics.ClassicSemantics())
+    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, None)
 
     # assigns to each event an increased timestamp from 1970
     curr_timestamp = 10000000
 
     feasible_elements = []
 
+    # without a custom semantics, the classic semantics is applied on a compiled version of the Petri net
+    compiled = compiled_net.construct(net) if semantics is None else None
+    if compiled is not None:
+        initial_marking = compiled.encode_marking(initial_marking)
+        if final_marking is not None:
+            final_marking = compiled.encode_marking(final_marking)
+
     to_visit = [(initial_marking, (), ())]
     visited = set()
 
@@ -100,13 +108,19 @@ def apply(net: PetriNet, initial_marking: Marking, final_marking: Marking = None
             continue
         visited.add((m, trace))
 
-        en_t = semantics.enabled_transitions(net, m)
+        if compiled is not None:
+            enabled = compiled.enabled_transitions(m)
+            en_t = [compiled.transitions[i] for i in enabled]
+            successors = compiled.fire_all(enabled, m)
+        else:
+            en_t = semantics.enabled_transitions(net, m)
+            successors = (semantics.weak_execute(t, net, m) for t in en_t)
 
         if (final_marking is not None and m == final_marking) or (final_marking is None and len(en_t) == 0):
             if len(trace) <= max_trace_length:
                 feasible_elements.append(elements)
 
-        for t in en_t:
+        for t, new_m in zip(en_t, successors):
             new_elements = elements + (m,)
             new_elements = new_elements + (t,)
 
@@ -115,7 +129,6 @@ def apply(net: PetriNet, initial_marking: Marking, final_marking: Marking = None
             if counter_elements[m] > max_marking_occ:
                 continue
 
-            new_m = semantics.weak_execute(t, net, m)
             if t.label is not None:
                 new_trace = trace + (t.label,)
             else:
@@ -128,6 +141,16 @@ def apply(net: PetriNet, initial_marking: Marking, final_marking: Marking = None
             to_visit.append(new_state)
 
     if return_elements:
+        if compiled is not None:
+            decoded = {}
+            for i in range(len(feasible_elements)):
+                elements = list(feasible_elements[i])
+                # the markings are in the even positions
+                for j in range(0, len(elements), 2):
+                    if elements[j] not in decoded:
+                        decoded[elements[j]] = compiled.decode_marking(elements[j])
+                    elements[j] = decoded[elements[j]]
+                feasible_elements[i] = tuple(elements)
         return feasible_elements
 
     log = log_instance.EventLog()
@@ -45,7 +45,10 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[
 
     graph = set()
 
-    ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
+    if ocel.has_index():
+        ev_rel_obj = ocel.get_index().related_objects_per_event()
+    else:
+        ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
 
     for ev in ev_rel_obj:
         rel_obj = ev_rel_obj[ev]
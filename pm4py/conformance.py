@@ -330,7 +330,8 @@ def fitness_token_based_replay(
     final_marking: Marking,
     activity_key: str = "concept:name",
     timestamp_key: str = "time:timestamp",
-    case_id_key: str = "case:concept:name"
+    case_id_key: str = "case:concept:name",
+    multi_processing: bool = constants.ENABLE_MULTIPROCESSING_DEFAULT
 ) -> Dict[str, float]:
     """
     Calculate the fitness using token-based replay.
@@ -359,6 +360,7 @@ def fitness_token_based_replay(
     :param activity_key: Attribute to be used for the activity (default is "concept:name").
     :param timestamp_key: Attribute to be used for the timestamp (default is "time:timestamp").
     :param case_id_key: Attribute to be used as the case identifier (default is "case:concept:name").
+    :param multi_processing: Boolean to enable multiprocessing (default is `constants.ENABLE_MULTIPROCESSING_DEFAULT`).
     :return: A dictionary containing fitness metrics.
     :rtype: ``Dict[str, float]``
 
@@ -400,6 +402,8 @@ def fitness_token_based_replay(
         case_id_key=case_id_key
     )
 
+    properties["multiprocessing"] = multi_processing
+
     from pm4py.algo.evaluation.replay_fitness import algorithm as replay_fitness
     result = replay_fitness.apply(
         log,
@@ -514,7 +518,8 @@ def precision_token_based_replay(
     final_marking: Marking,
     activity_key: str = "concept:name",
     timestamp_key: str = "time:timestamp",
-    case_id_key: str = "case:concept:name"
+    case_id_key: str = "case:concept:name",
+    multi_processing: bool = constants.ENABLE_MULTIPROCESSING_DEFAULT
 ) -> float:
     """
     Calculate precision using token-based replay.
@@ -538,6 +543,7 @@ def precision_token_based_replay(
     :param activity_key: Attribute to be used for the activity (default is "concept:name").
     :param timestamp_key: Attribute to be used for the timestamp (default is "time:timestamp").
     :param case_id_key: Attribute to be used as the case identifier (default is "case:concept:name").
+    :param multi_processing: Boolean to enable multiprocessing (default is `constants.ENABLE_MULTIPROCESSING_DEFAULT`).
     :return: The precision value.
     :rtype: ``float``
 
@@ -579,6 +585,8 @@ def precision_token_based_replay(
         case_id_key=case_id_key
     )
 
+    properties["multiprocessing"] = multi_processing
+
     from pm4py.algo.evaluation.precision import algorithm as precision_evaluator
     result = precision_evaluator.apply(
         log,
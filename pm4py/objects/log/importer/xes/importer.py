@@ -22,7 +22,8 @@ Contact: info@processintelligence.solutions
 from enum import Enum
 from pm4py.util import constants
 
-from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, iterparse_20, chunk_regex, rustxes
+from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, iterparse_20, chunk_regex, rustxes, \
+    chunk_regex_parallel
 
 
 class Variants(Enum):
@@ -32,6 +33,7 @@ class Variants(Enum):
     ITERPARSE_20 = iterparse_20
     CHUNK_REGEX = chunk_regex
     RUSTXES = rustxes
+    CHUNK_REGEX_PARALLEL = chunk_regex_parallel
 
 
 def __get_variant(variant_str: str):
@@ -53,6 +55,8 @@ def __get_variant(variant_str: str):
         variant = Variants.ITERPARSE_MEM_COMPRESSED
     elif variant_str == "rustxes":
         variant = Variants.RUSTXES
+    elif variant_str == "chunk_regex_parallel":
+        variant = Variants.CHUNK_REGEX_PARALLEL
 
     return variant
 
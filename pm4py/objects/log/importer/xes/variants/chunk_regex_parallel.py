@@ -0,0 +1,528 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import gzip
+import html
+import mmap
+import re
+from copy import copy
+from enum import Enum
+from typing import Optional, Dict, Any, Union, Generator, Tuple, List
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.log.obj import EventLog
+from pm4py.util import constants, exec_utils, xes_constants, parallel_utils
+from pm4py.util.dt_parsing import parser as dt_parser
+from pm4py.util.dt_parsing.variants import strpfromiso
+
+
+class Parameters(Enum):
+    ENCODING = "encoding"
+    RETURN_LEGACY_LOG_OBJECT = "return_legacy_log_object"
+    BLOCK_SIZE = "block_size"
+    CORES = parallel_utils.Parameters.CORES.value
+    MAX_IN_FLIGHT = parallel_utils.Parameters.MAX_IN_FLIGHT.value
+
+
+# the file is split before the opening tags of the traces
+_TRACE_START = re.compile(rb"<trace[\s>/]")
+_TAG = re.compile(r"<([^>]*)>")
+# a self-closing simple attribute (key before value), or any other tag
+_TOKEN = re.compile(r"<(?:(string|date|int|float|boolean|id)\s+key=\"([^\"]*)\"\s+value=\"([^\"]*)\"\s*/>|([^>]*)>)")
+_XML_ATTRIBUTE = re.compile(r"([\w:.-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+_TIMEZONE_SUFFIX = r"(?:Z|[+-]\d{2}:?\d{2})$"
+_ATTRIBUTE_TAGS = {xes_constants.TAG_STRING, xes_constants.TAG_DATE, xes_constants.TAG_INT, xes_constants.TAG_FLOAT,
+                   xes_constants.TAG_BOOLEAN, xes_constants.TAG_ID, xes_constants.TAG_LIST,
+                   xes_constants.TAG_CONTAINER}
+_NAT = np.iinfo(np.int64).min
+
+
+class _PendingAttribute(object):
+    # attribute that may have children (they are known only when the next tag is read)
+    def __init__(self, store, key, value):
+        self.store = store
+        self.key = key
+        self.value = value
+
+
+def __find_trace_start(buffer, start: int) -> int:
+    match = _TRACE_START.search(buffer, start)
+    return match.start() if match is not None else -1
+
+
+def __find_last_trace_start(buffer: bytes) -> int:
+    position = buffer.rfind(b"<trace")
+    while position > -1 and _TRACE_START.match(buffer, position) is None:
+        position = buffer.rfind(b"<trace", 0, position)
+    return position
+
+
+def __read_header(F, block_size: int) -> Tuple[bytes, bytes]:
+    # reads the part of the file preceding the first trace
+    buffer = b""
+    while True:
+        cont = F.read(block_size)
+        buffer = buffer + cont
+        position = __find_trace_start(buffer, 0)
+        if position > -1:
+            return buffer[:position], buffer[position:]
+        if not cont:
+            return buffer, b""
+
+
+def __iterate_compressed_blocks(F, remainder: bytes, block_size: int) -> Generator[bytes, None, None]:
+    # decompresses the file sequentially, cutting it in blocks containing complete traces
+    buffer = remainder
+    while True:
+        cont = F.read(block_size)
+        buffer = buffer + cont
+        if not cont:
+            if buffer:
+                yield buffer
+            return
+        if len(buffer) >= block_size:
+            position = __find_last_trace_start(buffer)
+            if position > 0:
+                yield buffer[:position]
+                buffer = buffer[position:]
+
+
+def __iterate_ranges(mm, header_size: int, block_size: int) -> Generator[Tuple[int, int], None, None]:
+    # cuts the (memory-mapped) file in ranges containing complete traces
+    position = header_size
+    size = len(mm)
+    while position < size:
+        end = __find_trace_start(mm, position + block_size) if position + block_size < size else -1
+        if end == -1:
+            end = size
+        yield position, end
+        position = end
+
+
+def __add_attribute(store, key, value):
+    if type(store) is list:
+        store.append((key, value))
+    else:
+        store[key] = value
+
+
+def __parse_value(tag: str, value: str):
+    if tag == xes_constants.TAG_INT:
+        return int(value)
+    elif tag == xes_constants.TAG_FLOAT:
+        return float(value)
+    elif tag == xes_constants.TAG_BOOLEAN:
+        return str(value).lower() == "true"
+    elif tag == xes_constants.TAG_LIST or tag == xes_constants.TAG_CONTAINER:
+        return None
+    return value
+
+
+def __dates_to_ns(values: List[str]) -> np.ndarray:
+    # parses the dates keeping their local (wall) time, as the date parser of pm4py does
+    try:
+        series = pd.Series(values, dtype=object).str.replace(_TIMEZONE_SUFFIX, "", regex=True)
+        parsed = pd.to_datetime(series, format="ISO8601")
+    except (ValueError, TypeError):
+        parser = dt_parser.get()
+        parsed = pd.to_datetime([parser.apply(x).replace(tzinfo=None) for x in values])
+    return parsed.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+
+def _parse_block(item: Union[bytes, Tuple[str, int, int]], encoding: str) -> Dict[str, Any]:
+    """
+    Parses a block of a XES file (containing complete traces) into a columnar representation.
+
+    Parameters
+    ---------------
+    item
+        Block of the file (bytes) or range (path of the file, start byte, end byte)
+    encoding
+        Encoding of the file
+
+    Returns
+    ---------------
+    block
+        Dictionary containing the number of events ("rows") and, for each column, the positions of the events
+        having a value and the values ("columns", and "dates" for the date values), along with the position
+        (row, index in the row) of the first occurrence of each column
+    """
+    if type(item) is tuple:
+        path, start, end = item
+        with open(path, "rb") as F:
+            F.seek(start)
+            item = F.read(end - start)
+    text = item.decode(encoding)
+
+    columns = {}
+    dates = {}
+    first_occurrence = {}
+    num_rows = 0
+
+    stack = []
+    event = None
+    trace = None
+    trace_first_row = 0
+    trace_first_event_size = 0
+
+    for match in _TOKEN.finditer(text):
+        tag, key, value, content = match.groups()
+
+        top = stack[-1] if stack else None
+        if type(top) is _PendingAttribute and (tag is not None or content[0] != "/"):
+            # the attribute has children
+            children = [] if content is not None and content.split(None, 1)[0] == xes_constants.TAG_VALUES else {}
+            __add_attribute(top.store, top.key, {xes_constants.KEY_VALUE: top.value,
+                                                 xes_constants.KEY_CHILDREN: children})
+            top = children
+            stack[-1] = top
+
+        if tag is not None:
+            # self-closing attribute (most common case)
+            if top is not None:
+                if "&" in key:
+                    key = html.unescape(key)
+                if "&" in value:
+                    value = html.unescape(value)
+                try:
+                    __add_attribute(top, key, _DateValue(value) if tag == xes_constants.TAG_DATE else
+                                    __parse_value(tag, value))
+                except ValueError:
+                    pass
+            continue
+
+        if not content or content[0] in "?!":
+            continue
+
+        if content[0] == "/":
+            tag = content[1:].strip()
+            if stack:
+                stack.pop()
+            if tag == xes_constants.TAG_EVENT and event is not None:
+                for pos, (key, value) in enumerate(event.items()):
+                    if type(value) is _DateValue:
+                        collection = dates
+                        value = value.value
+                    else:
+                        collection = columns
+                    entry = collection.get(key)
+                    if entry is None:
+                        entry = ([], [])
+                        collection[key] = entry
+                        if key not in first_occurrence:
+                            first_occurrence[key] = (num_rows, pos)
+                    entry[0].append(num_rows)
+                    entry[1].append(value)
+                if num_rows == trace_first_row:
+                    trace_first_event_size = len(event)
+                num_rows += 1
+                event = None
+            elif tag == xes_constants.TAG_TRACE and trace is not None:
+                rows = range(trace_first_row, num_rows)
+                if rows:
+                    for pos, (key, value) in enumerate(trace.items()):
+                        key = constants.CASE_ATTRIBUTE_PREFIX + key
+                        if type(value) is _DateValue:
+                            collection = dates
+                            value = value.value
+                        else:
+                            collection = columns
+                        entry = collection.get(key)
+                        if entry is None:
+                            entry = ([], [])
+                            collection[key] = entry
+                            if key not in first_occurrence:
+                                first_occurrence[key] = (trace_first_row, trace_first_event_size + pos)
+                        entry[0].extend(rows)
+                        entry[1].extend([value] * len(rows))
+                trace = None
+            continue
+
+        self_closing = content[-1] == "/"
+        if self_closing:
+            content = content[:-1]
+        idx = content.find(" ")
+        tag = content[:idx] if idx > -1 else content.strip()
+
+        if tag in _ATTRIBUTE_TAGS:
+            target = None
+            if top is not None:
+                xml_attributes = {x[0]: x[1] or x[2] for x in _XML_ATTRIBUTE.findall(content)}
+                key = xml_attributes.get(xes_constants.KEY_KEY)
+                value = xml_attributes.get(xes_constants.KEY_VALUE)
+                if key is not None:
+                    if "&" in key:
+                        key = html.unescape(key)
+                    if value is not None and "&" in value:
+                        value = html.unescape(value)
+                    try:
+                        value = _DateValue(value) if tag == xes_constants.TAG_DATE else __parse_value(tag, value)
+                        __add_attribute(top, key, value)
+                        target = _PendingAttribute(top, key, value)
+                    except (ValueError, TypeError):
+                        pass
+            if not self_closing:
+                stack.append(target)
+        elif tag == xes_constants.TAG_EVENT:
+            event = {}
+            if not self_closing:
+                stack.append(event)
+        elif tag == xes_constants.TAG_TRACE:
+            trace = {}
+            trace_first_row = num_rows
+            trace_first_event_size = 0
+            if not self_closing:
+                stack.append(trace)
+        elif tag == xes_constants.TAG_VALUES:
+            if not self_closing:
+                stack.append(top)
+        elif not self_closing:
+            stack.append(None)
+
+    for key in dates:
+        dates[key] = (np.array(dates[key][0], dtype=np.int64), __dates_to_ns(dates[key][1]))
+    for key in columns:
+        columns[key] = (np.array(columns[key][0], dtype=np.int64), columns[key][1])
+
+    return {"rows": num_rows, "columns": columns, "dates": dates, "first_occurrence": first_occurrence}
+
+
+class _DateValue(object):
+    # date (still to be parsed) read from the XES
+    __slots__ = ["value"]
+
+    def __init__(self, value):
+        self.value = value
+
+
+def __parse_header(text: str) -> EventLog:
+    # parses the attributes, the extensions, the classifiers and the global attributes of the log
+    log = EventLog()
+    stack = []
+    for match in _TAG.finditer(text):
+        content = match.group(1)
+        if not content or content[0] in "?!":
+            continue
+        if content[0] == "/":
+            if stack:
+                stack.pop()
+            continue
+        self_closing = content[-1] == "/"
+        if self_closing:
+            content = content[:-1]
+        idx = content.find(" ")
+        tag = content[:idx] if idx > -1 else content.strip()
+        xml_attributes = {x[0]: html.unescape(x[1] or x[2]) for x in _XML_ATTRIBUTE.findall(content)}
+        target = None
+        if tag == xes_constants.TAG_LOG:
+            target = log.attributes
+        elif tag == xes_constants.TAG_EXTENSION:
+            if all(x in xml_attributes for x in [xes_constants.KEY_NAME, xes_constants.KEY_PREFIX,
+                                                  xes_constants.KEY_URI]):
+                log.extensions[xml_attributes[xes_constants.KEY_NAME]] = {
+                    xes_constants.KEY_PREFIX: xml_attributes[xes_constants.KEY_PREFIX],
+                    xes_constants.KEY_URI: xml_attributes[xes_constants.KEY_URI]}
+        elif tag == xes_constants.TAG_GLOBAL:
+            if xes_constants.KEY_SCOPE in xml_attributes:
+                target = {}
+                log.omni_present[xml_attributes[xes_constants.KEY_SCOPE]] = target
+        elif tag == xes_constants.TAG_CLASSIFIER:
+            if xes_constants.KEY_KEYS in xml_attributes and xes_constants.KEY_NAME in xml_attributes:
+                keys = xml_attributes[xes_constants.KEY_KEYS]
+                log.classifiers[xml_attributes[xes_constants.KEY_NAME]] = [x for x in keys.split("'") if x.strip()] \
+                    if "'" in keys else keys.split()
+        elif tag in _ATTRIBUTE_TAGS and stack and stack[-1] is not None and xes_constants.KEY_KEY in xml_attributes:
+            value = xml_attributes.get(xes_constants.KEY_VALUE)
+            try:
+                value = dt_parser.get().apply(value) if tag == xes_constants.TAG_DATE else __parse_value(tag, value)
+                stack[-1][xml_attributes[xes_constants.KEY_KEY]] = value
+            except (ValueError, TypeError):
+                pass
+        if not self_closing:
+            stack.append(target)
+    return log
+
+
+def __to_dataframe(blocks: List[Dict[str, Any]], properties: Dict[str, Any]) -> pd.DataFrame:
+    offsets = np.cumsum([0] + [block["rows"] for block in blocks])
+    num_rows = int(offsets[-1])
+
+    first_occurrence = {}
+    for i, block in enumerate(blocks):
+        for name, (row, pos) in block["first_occurrence"].items():
+            if name not in first_occurrence:
+                first_occurrence[name] = (int(offsets[i]) + row, pos)
+
+    data = {}
+    for name in sorted(first_occurrence, key=lambda x: first_occurrence[x]):
+        has_values = any(name in block["columns"] for block in blocks)
+        has_dates = any(name in block["dates"] for block in blocks)
+        if has_dates and not has_values:
+            column = np.full(num_rows, _NAT, dtype=np.int64)
+            for i, block in enumerate(blocks):
+                if name in block["dates"]:
+                    rows, values = block["dates"][name]
+                    column[rows + offsets[i]] = values
+            column = strpfromiso.fix_dataframe_column(pd.Series(column.view("datetime64[ns]")))
+            data[name] = column.dt.as_unit("us") if hasattr(column.dt, "as_unit") else column
+        else:
+            column = np.full(num_rows, None, dtype=object)
+            for i, block in enumerate(blocks):
+                if name in block["columns"]:
+                    rows, values = block["columns"][name]
+                    column[rows + offsets[i]] = values
+                if name in block["dates"]:
+                    rows, values = block["dates"][name]
+                    values = strpfromiso.fix_dataframe_column(pd.Series(values.view("datetime64[ns]")))
+                    column[rows + offsets[i]] = values.tolist()
+            data[name] = column
+
+    dataframe = pd.DataFrame(data, index=pd.RangeIndex(num_rows)).infer_objects()
+    dataframe.attrs = copy(properties)
+    return dataframe
+
+
+def __get_properties() -> Dict[str, Any]:
+    # default keys, as set by the other XES importers
+    return {constants.PARAMETER_CONSTANT_ACTIVITY_KEY: xes_constants.DEFAULT_NAME_KEY,
+            constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY: xes_constants.DEFAULT_NAME_KEY,
+            constants.PARAMETER_CONSTANT_TIMESTAMP_KEY: xes_constants.DEFAULT_TIMESTAMP_KEY,
+            constants.PARAMETER_CONSTANT_RESOURCE_KEY: xes_constants.DEFAULT_RESOURCE_KEY,
+            constants.PARAMETER_CONSTANT_TRANSITION_KEY: xes_constants.DEFAULT_TRANSITION_KEY,
+            constants.PARAMETER_CONSTANT_GROUP_KEY: xes_constants.DEFAULT_GROUP_KEY}
+
+
+def __iterate_parsed_blocks(filename: str, parameters: Dict[Any, Any]) -> Tuple[EventLog, Generator]:
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    block_size = exec_utils.get_param_value(Parameters.BLOCK_SIZE, parameters, 2 ** 25)
+
+    if filename.endswith(".gz"):
+        F = gzip.open(filename, mode="rb")
+    else:
+        F = open(filename, "rb")
+    header, remainder = __read_header(F, 2 ** 16)
+    header_log = __parse_header(header.decode(encoding))
+
+    def generator():
+        try:
+            if filename.endswith(".gz"):
+                items = __iterate_compressed_blocks(F, remainder, block_size)
+            else:
+                # the workers read their own range of the file
+                with mmap.mmap(F.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    items = [(filename, start, end) for start, end in
+                             __iterate_ranges(mm, len(header), block_size)]
+            for block in parallel_utils.iterate_ordered(items, _parse_block, shared_args=(encoding,),
+                                                        parameters=parameters):
+                yield block
+        finally:
+            F.close()
+
+    return header_log, generator()
+
+
+def iterate_dataframes(filename: str, parameters: Optional[Dict[Any, Any]] = None) -> Generator[
+        pd.DataFrame, None, None]:
+    """
+    Imports a XES file as a sequence of dataframes, each one containing a block of complete traces
+    (in the order of the file). Only a bounded number of blocks is kept in memory, so logs larger than the main
+    memory can be processed.
+
+    Minimum viable example:
+
+        from pm4py.objects.log.importer.xes.variants import chunk_regex_parallel
+
+        for dataframe in chunk_regex_parallel.iterate_dataframes("tests/input_data/running-example.xes"):
+            print(len(dataframe))
+
+    Parameters
+    ---------------
+    filename
+        Path to the XES file (possibly compressed with gzip)
+    parameters
+        Parameters of the importer, including:
+        - Parameters.ENCODING => the encoding of the file (default: utf-8)
+        - Parameters.BLOCK_SIZE => (approximate) size of each block, in bytes (default: 32 MB)
+        - Parameters.CORES => number of worker processes parsing the blocks
+        - Parameters.MAX_IN_FLIGHT => maximum number of blocks read and not yet returned
+
+    Returns
+    ---------------
+    generator
+        Generator of dataframes
+    """
+    if parameters is None:
+        parameters = {}
+
+    header_log, blocks = __iterate_parsed_blocks(filename, parameters)
+    properties = __get_properties()
+    for block in blocks:
+        yield __to_dataframe([block], properties)
+
+
+def apply(filename: str, parameters: Optional[Dict[Any, Any]] = None) -> Union[EventLog, pd.DataFrame]:
+    """
+    Imports a XES file, parsing it in parallel.
+
+    The file is split in blocks at the opening tags of the traces (uncompressed files are memory-mapped and each
+    worker process reads its own range, while compressed files are decompressed in a streaming fashion).
+    The blocks are parsed by a pool of processes directly into columns, which are merged in the resulting dataframe.
+
+    Parameters
+    ---------------
+    filename
+        Path to the XES file (possibly compressed with gzip)
+    parameters
+        Parameters of the importer, including:
+        - Parameters.ENCODING => the encoding of the file (default: utf-8)
+        - Parameters.RETURN_LEGACY_LOG_OBJECT => returns an EventLog object instead of a dataframe (default: True)
+        - Parameters.BLOCK_SIZE => (approximate) size of each block, in bytes (default: 32 MB)
+        - Parameters.CORES => number of worker processes parsing the blocks
+        - Parameters.MAX_IN_FLIGHT => maximum number of blocks read and not yet merged
+
+    Returns
+    ---------------
+    log
+        Event log (EventLog object or dataframe)
+    """
+    if parameters is None:
+        parameters = {}
+
+    return_legacy_log_object = exec_utils.get_param_value(Parameters.RETURN_LEGACY_LOG_OBJECT, parameters, True)
+
+    header_log, blocks = __iterate_parsed_blocks(filename, parameters)
+    log = __to_dataframe(list(blocks), __get_properties())
+
+    if return_legacy_log_object:
+        from pm4py.objects.conversion.log import converter as log_converter
+        this_parameters = copy(parameters)
+        this_parameters["stream_postprocessing"] = True
+        log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=this_parameters)
+        log.attributes.clear()
+        log.attributes.update(header_log.attributes)
+        log.extensions.update(header_log.extensions)
+        log.classifiers.update(header_log.classifiers)
+        log.omni_present.update(header_log.omni_present)
+        log.properties.update(__get_properties())
+
+    return log
@@ -0,0 +1,374 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from datetime import datetime
+from enum import Enum
+from typing import Optional, Dict, Any
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    CATEGORICAL = "categorical"
+
+
+MAGIC = b"PM4PYCOL"
+VERSION = 2
+EXTENSION = ".pm4pycache"
+# the buffers of the columns are aligned, so they can be memory-mapped
+_ALIGNMENT = 64
+# number of bytes (at the beginning and at the end of the source file) included in its fingerprint
+_FINGERPRINT_BYTES = 2 ** 20
+
+_KIND_NUMERIC = "numeric"
+_KIND_DATETIME = "datetime"
+_KIND_DICTIONARY = "dictionary"
+_KIND_OBJECT = "object"
+
+# tags of the values of the object columns that have no JSON representation
+_TAG_DATETIME = "__pm4py_datetime__"
+_TAG_TIMESTAMP = "__pm4py_timestamp__"
+
+
+def __pad(F):
+    position = F.tell()
+    if position % _ALIGNMENT:
+        F.write(b"\0" * (_ALIGNMENT - position % _ALIGNMENT))
+
+
+def __is_string_column(values: np.ndarray) -> bool:
+    return all(type(x) is str for x in values)
+
+
+def __encode_object(value):
+    # JSON encoding of the (non-JSON) values of the object columns; other types are not supported
+    if isinstance(value, pd.Timestamp) or value is pd.NaT:
+        return {_TAG_TIMESTAMP: value.isoformat()}
+    if isinstance(value, datetime):
+        return {_TAG_DATETIME: value.isoformat()}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError("values of type " + type(value).__name__ + " cannot be stored in the columnar cache")
+
+
+def __decode_object(dct):
+    if len(dct) == 1:
+        if _TAG_TIMESTAMP in dct:
+            return pd.Timestamp(dct[_TAG_TIMESTAMP])
+        if _TAG_DATETIME in dct:
+            return datetime.fromisoformat(dct[_TAG_DATETIME])
+    return dct
+
+
+def __describe_column(series: pd.Series) -> Dict[str, Any]:
+    # determines how a column is stored, and gets the buffer (or the serialized object) containing its values
+    dtype = series.dtype
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        tz = getattr(dtype, "tz", None)
+        # timezone-aware timestamps are stored as UTC instants
+        values = series.dt.tz_convert(None) if tz is not None else series
+        unit = np.datetime_data(values.dtype)[0]
+        return {"kind": _KIND_DATETIME, "dtype": "<i8", "unit": unit, "tz": str(tz) if tz is not None else None,
+                "buffer": values.to_numpy(dtype="datetime64[%s]" % unit).view(np.int64)}
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        values = series.to_numpy()
+        return {"kind": _KIND_NUMERIC, "dtype": values.dtype.str, "buffer": values}
+    try:
+        codes, categories = pd.factorize(series, use_na_sentinel=True)
+    except TypeError:
+        # unhashable values (e.g., nested attributes)
+        categories = None
+    if categories is not None and __is_string_column(categories):
+        # dictionary encoding: the (distinct) strings are stored once, and the events point to them
+        return {"kind": _KIND_DICTIONARY, "dtype": "<i4", "categories": list(categories),
+                "buffer": codes.astype(np.int32)}
+    # the other columns (e.g., mixed types or nested attributes) are stored as a UTF-8 JSON document
+    return {"kind": _KIND_OBJECT, "buffer": json.dumps(series.tolist(), default=__encode_object).encode("utf-8")}
+
+
+def write(df: pd.DataFrame, file_path: str, source: Optional[Dict[str, Any]] = None,
+          parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Writes a dataframe to a columnar cache file.
+
+    The file contains a JSON header (describing the columns) followed by the (aligned) buffers of the columns:
+    - numeric and boolean columns are stored as they are
+    - timestamp columns are stored as int64 values (along with the unit and the timezone)
+    - string columns (e.g., the activities and the resources) are dictionary-encoded: the distinct values are stored
+      in the header, and the events contain int32 codes
+    - the other columns are stored as UTF-8 JSON documents (timestamps are encoded in the ISO format); values
+      of other types (not representable in JSON) are not supported, and a TypeError is raised
+    The index of the dataframe is not stored.
+
+    Parameters
+    ---------------
+    df
+        Dataframe
+    file_path
+        Path of the cache file
+    source
+        (optional) Information about the file from which the dataframe has been read (see get_source_info)
+    parameters
+        Parameters of the method
+    """
+    if parameters is None:
+        parameters = {}
+
+    columns = []
+    buffers = []
+    for name in df.columns:
+        description = __describe_column(df[name])
+        buffers.append(description.pop("buffer"))
+        description["name"] = name
+        columns.append(description)
+
+    try:
+        attrs = json.loads(json.dumps(df.attrs))
+    except (TypeError, ValueError):
+        attrs = {}
+
+    header = {"version": VERSION, "num_rows": len(df), "source": source, "attrs": attrs, "columns": columns}
+
+    # the offsets are relative to the (aligned) beginning of the data section, which follows the header
+    offset = 0
+    for description, buffer in zip(columns, buffers):
+        size = buffer.nbytes if isinstance(buffer, np.ndarray) else len(buffer)
+        description["offset"] = offset
+        description["size"] = size
+        offset += size + (-size) % _ALIGNMENT
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = len(MAGIC) + 8 + len(header_bytes)
+    data_start += (-data_start) % _ALIGNMENT
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    # the file is written in a temporary location and then moved, so a partially-written cache is never read
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=EXTENSION + ".tmp")
+    try:
+        with os.fdopen(fd, "wb") as F:
+            F.write(MAGIC)
+            F.write(struct.pack("<Q", len(header_bytes)))
+            F.write(header_bytes)
+            F.write(b"\0" * (data_start - F.tell()))
+            for buffer in buffers:
+                if isinstance(buffer, np.ndarray):
+                    F.write(np.ascontiguousarray(buffer).tobytes())
+                else:
+                    F.write(buffer)
+                __pad(F)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def read_header(file_path: str) -> Dict[str, Any]:
+    """
+    Reads the header of a columnar cache file
+
+    Parameters
+    ---------------
+    file_path
+        Path of the cache file
+
+    Returns
+    ---------------
+    header
+        Header of the cache file (number of rows, information about the source file, description of the columns)
+    """
+    with open(file_path, "rb") as F:
+        if F.read(len(MAGIC)) != MAGIC:
+            raise Exception("the file is not a pm4py columnar cache")
+        header_length = struct.unpack("<Q", F.read(8))[0]
+        header = json.loads(F.read(header_length).decode("utf-8"))
+    if header["version"] != VERSION:
+        raise Exception("unsupported version of the pm4py columnar cache: " + str(header["version"]))
+    data_start = len(MAGIC) + 8 + header_length
+    header["data_start"] = data_start + (-data_start) % _ALIGNMENT
+    return header
+
+
+def read(file_path: str, parameters: Optional[Dict[Any, Any]] = None) -> pd.DataFrame:
+    """
+    Reads a dataframe from a columnar cache file. The buffers of the numeric columns, of the timestamp columns,
+    and the codes of the dictionary-encoded columns are memory-mapped (and not parsed), so the log is loaded
+    in a fraction of the time needed to import it. The decoding of the strings can also be avoided by
+    setting Parameters.CATEGORICAL.
+
+    Parameters
+    ---------------
+    file_path
+        Path of the cache file
+    parameters
+        Parameters of the method, including:
+        - Parameters.CATEGORICAL => returns the dictionary-encoded columns as pandas categoricals, instead of
+        decoding the strings (default: False)
+
+    Returns
+    ---------------
+    dataframe
+        Dataframe
+    """
+    if parameters is None:
+        parameters = {}
+
+    categorical = exec_utils.get_param_value(Parameters.CATEGORICAL, parameters, False)
+
+    header = read_header(file_path)
+    num_rows = header["num_rows"]
+    data_start = header["data_start"]
+
+    data = {}
+    with open(file_path, "rb") as F:
+        for description in header["columns"]:
+            kind = description["kind"]
+            if kind == _KIND_OBJECT:
+                F.seek(data_start + description["offset"])
+                values = json.loads(F.read(description["size"]).decode("utf-8"), object_hook=__decode_object)
+                data[description["name"]] = pd.Series(values, dtype=object)
+                continue
+
+            dtype = np.dtype(description["dtype"])
+            if num_rows > 0:
+                # read-only mapping of the buffer (viewed as a plain array, without copying it)
+                values = np.memmap(file_path, dtype=dtype, mode="r", offset=data_start + description["offset"],
+                                   shape=(num_rows,)).view(np.ndarray)
+            else:
+                values = np.zeros(0, dtype=dtype)
+            if kind == _KIND_NUMERIC:
+                data[description["name"]] = pd.Series(values, copy=False)
+            elif kind == _KIND_DATETIME:
+                series = pd.Series(values.view("datetime64[%s]" % description["unit"]), copy=False)
+                if description["tz"] is not None:
+                    series = series.dt.tz_localize("UTC").dt.tz_convert(description["tz"])
+                data[description["name"]] = series
+            elif kind == _KIND_DICTIONARY:
+                categories = description["categories"]
+                if categorical:
+                    data[description["name"]] = pd.Series(pd.Categorical.from_codes(values, categories))
+                else:
+                    # the missing values (code -1) point to the last element
+                    dictionary = np.array(categories + [np.nan], dtype=object)
+                    data[description["name"]] = pd.Series(dictionary[values])
+
+    dataframe = pd.DataFrame(data, copy=False)
+    dataframe.attrs = header["attrs"]
+    return dataframe
+
+
+def get_source_info(source_path: str) -> Dict[str, Any]:
+    """
+    Gets the information identifying the version of a source file: path, size, modification time, and a fingerprint
+    (SHA-256 of the size and of the first and last megabyte of the file)
+
+    Parameters
+    ---------------
+    source_path
+        Path of the source file
+
+    Returns
+    ---------------
+    source_info
+        Dictionary containing the information about the source file
+    """
+    stat = os.stat(source_path)
+    digest = hashlib.sha256(str(stat.st_size).encode("utf-8"))
+    with open(source_path, "rb") as F:
+        digest.update(F.read(_FINGERPRINT_BYTES))
+        if stat.st_size > _FINGERPRINT_BYTES:
+            F.seek(max(_FINGERPRINT_BYTES, stat.st_size - _FINGERPRINT_BYTES))
+            digest.update(F.read())
+    return {"path": os.path.abspath(source_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "fingerprint": digest.hexdigest()}
+
+
+def __canonical_options(options) -> str:
+    # string representation of the options, independent from the order of the keys of the dictionaries
+    if isinstance(options, dict):
+        items = sorted((__canonical_options(k), __canonical_options(v)) for k, v in options.items())
+        return "{" + ",".join(k + ":" + v for k, v in items) + "}"
+    if isinstance(options, (list, tuple)):
+        return "[" + ",".join(__canonical_options(x) for x in options) + "]"
+    if isinstance(options, Enum):
+        return repr(options.value)
+    return repr(options)
+
+
+def get_cache_path(source_path: str, cache_dir: str, variant: str = "", options: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Gets the path of the cache file associated to a source file (depending on its path, size and modification time,
+    and on the way it has been read)
+
+    Parameters
+    ---------------
+    source_path
+        Path of the source file
+    cache_dir
+        Directory containing the cache files
+    variant
+        (optional) Additional string identifying the way the source file has been read
+    options
+        (optional) Options of the importer (e.g., the encoding and the parameters); different options lead to
+        different cache files
+
+    Returns
+    ---------------
+    cache_path
+        Path of the cache file
+    """
+    stat = os.stat(source_path)
+    key = hashlib.sha256("|".join([os.path.abspath(source_path), str(stat.st_size), str(stat.st_mtime_ns),
+                                   variant, __canonical_options(options if options is not None else {})])
+                         .encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, os.path.basename(source_path) + "." + key + EXTENSION)
+
+
+def is_valid(cache_path: str, source_path: str) -> bool:
+    """
+    Checks if a cache file exists and corresponds to the current version of the source file
+
+    Parameters
+    ---------------
+    cache_path
+        Path of the cache file
+    source_path
+        Path of the source file
+
+    Returns
+    ---------------
+    boolean
+        Boolean value
+    """
+    if not os.path.exists(cache_path):
+        return False
+    try:
+        header = read_header(cache_path)
+    except Exception:
+        return False
+    return header.get("source") == get_source_info(source_path)
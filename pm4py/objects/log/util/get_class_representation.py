@@ -20,7 +20,7 @@ Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
 import numpy as np
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import get_calculator
 from pm4py.util import constants
 
 def get_class_representation_by_str_ev_attr_value_presence(log, str_attr_name, str_attr_value):
@@ -129,6 +129,7 @@ def get_class_representation_by_trace_duration(log, target_trace_duration, times
 
     business_hours = parameters["business_hours"] if "business_hours" in parameters else False
     business_hours_slots = parameters["business_hour_slots"] if "business_hour_slots" in parameters else constants.DEFAULT_BUSINESS_HOUR_SLOTS
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots)
 
     count = 0
     dictionary = {}
@@ -141,9 +142,7 @@ def get_class_representation_by_trace_duration(log, target_trace_duration, times
             timestamp_st = trace[0][timestamp_key]
             timestamp_et = trace[-1][timestamp_key]
             if business_hours:
-                bh = BusinessHours(timestamp_st, timestamp_et,
-                                   business_hour_slots=business_hours_slots)
-                diff = bh.get_seconds()
+                diff = bh_calculator.get_seconds_between(timestamp_st, timestamp_et)
             else:
                 diff = (timestamp_et - timestamp_st).total_seconds()
             if diff > target_trace_duration:
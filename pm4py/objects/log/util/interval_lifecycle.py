@@ -19,7 +19,7 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import get_calculator
 from pm4py.objects.log.util import sorting
 from pm4py.util import constants
 from pm4py.util import xes_constants as xes
@@ -67,6 +67,7 @@ def to_interval(log, parameters=None):
     lifecycle_instance_key = exec_utils.get_param_value(Parameters.LIFECYCLE_INSTANCE_KEY, parameters, xes.DEFAULT_INSTANCE_KEY)
     business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots)
 
     if log is not None and len(log) > 0:
         if "PM4PY_TYPE" in log.attributes and log.attributes["PM4PY_TYPE"] == "interval":
@@ -115,9 +116,8 @@ def to_interval(log, parameters=None):
                     new_event["@@duration"] = (timestamp - start_timestamp).total_seconds()
 
                     if business_hours:
-                        bh = BusinessHours(start_timestamp, timestamp,
-                                           business_hour_slots=business_hours_slots)
-                        new_event["@@approx_bh_duration"] = bh.get_seconds()
+                        new_event["@@approx_bh_duration"] = bh_calculator.get_seconds_between(start_timestamp,
+                                                                                              timestamp)
 
                     new_trace.append(new_event)
             new_trace = sorting.sort_timestamp_trace(new_trace, start_timestamp_key)
@@ -211,6 +211,7 @@ def assign_lead_cycle_time(log, parameters=None):
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes.DEFAULT_TIMESTAMP_KEY)
     start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, xes.DEFAULT_START_TIMESTAMP_KEY)
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots)
 
     interval_log = to_interval(log, parameters=parameters)
 
@@ -228,24 +229,18 @@ def assign_lead_cycle_time(log, parameters=None):
             et_seconds = et.timestamp()
 
             if max_et_seconds > 0 and st_seconds > max_et_seconds:
-                bh_unworked = BusinessHours(max_et, st,
-                                                           business_hour_slots=business_hours_slots)
-                unworked_sec = bh_unworked.get_seconds()
+                unworked_sec = bh_calculator.get_seconds_between(max_et, st)
                 approx_partial_lead_time = approx_partial_lead_time + unworked_sec
                 approx_wasted_time = approx_wasted_time + unworked_sec
                 this_wasted_time = unworked_sec
 
             if st_seconds > max_et_seconds:
-                bh = BusinessHours(st, et,
-                                                  business_hour_slots=business_hours_slots)
-                approx_bh_duration = bh.get_seconds()
+                approx_bh_duration = bh_calculator.get_seconds_between(st, et)
 
                 approx_partial_cycle_time = approx_partial_cycle_time + approx_bh_duration
                 approx_partial_lead_time = approx_partial_lead_time + approx_bh_duration
             elif st_seconds < max_et_seconds and et_seconds > max_et_seconds:
-                bh = BusinessHours(max_et, et,
-                                                  business_hour_slots=business_hours_slots)
-                approx_bh_duration = bh.get_seconds()
+                approx_bh_duration = bh_calculator.get_seconds_between(max_et, et)
 
                 approx_partial_cycle_time = approx_partial_cycle_time + approx_bh_duration
                 approx_partial_lead_time = approx_partial_lead_time + approx_bh_duration
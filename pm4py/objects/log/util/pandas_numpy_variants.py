@@ -53,7 +53,7 @@ def apply(dataframe: pd.DataFrame, parameters=None) -> Tuple[Dict[Collection[str
     Parameters
     ------------------
     dataframe
-        Dataframe
+        Dataframe (or prepared log, see pm4py.objects.log.util.prepared_log)
     parameters
         Parameters of the algorithm, including:
         - Parameters.CASE_ID_KEY => the case identifier
@@ -76,6 +76,17 @@ def apply(dataframe: pd.DataFrame, parameters=None) -> Tuple[Dict[Collection[str
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
     index_key = exec_utils.get_param_value(Parameters.INDEX_KEY, parameters, constants.DEFAULT_INDEX_KEY)
 
+    from pm4py.objects.log.util import prepared_log
+    if prepared_log.is_prepared_log(dataframe):
+        if dataframe.matches(case_id_key, activity_key):
+            # the variants are computed once on the integer codes, and cached in the prepared log
+            variants, case_variant_idx = dataframe.get_variants()
+            variants_count = np.bincount(case_variant_idx, minlength=len(variants))
+            variants_dict = {variants[i]: int(variants_count[i]) for i in range(len(variants))}
+            case_variant = {c: variants[i] for c, i in zip(dataframe.cases.tolist(), case_variant_idx.tolist())}
+            return variants_dict, case_variant
+        dataframe = dataframe.dataframe
+
     if not (hasattr(dataframe, "attrs") and dataframe.attrs):
         # dataframe has not been initialized through format_dataframe
         dataframe = pandas_utils.insert_index(dataframe, index_key)
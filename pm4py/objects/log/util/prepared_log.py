@@ -0,0 +1,287 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from copy import copy
+from enum import Enum
+from typing import Optional, Dict, Any, List, Tuple, Collection
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import constants, xes_constants, exec_utils
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
+
+
+class PreparedLog(object):
+    """
+    Columnar, integer-encoded representation of an event log stored in a dataframe.
+
+    The dataframe is sorted (by case, start timestamp if provided, timestamp and position in the dataframe)
+    and the case identifiers and the activities are factorized only once, when the object is created.
+    The pandas-based algorithms supporting it (DFG, variants, start/end activities, and the corresponding
+    filters) then work directly on the arrays. The filters return the filtered dataframe.
+
+    Attributes
+    ----------------
+    dataframe
+        The original dataframe
+    order
+        Positions (in the dataframe) of the events, in the sorted order
+    cases
+        Case identifiers (sorted)
+    case_offsets
+        Offsets of the cases in the sorted arrays (the events of the i-th case are between
+        case_offsets[i] and case_offsets[i+1])
+    activities
+        Activities (sorted)
+    activity_codes
+        Code of the activity of each (sorted) event (index in activities, -1 if the activity is missing)
+    timestamps
+        Timestamps of the (sorted) events, as nanoseconds since the epoch
+    start_timestamps
+        Start timestamps of the (sorted) events, as nanoseconds since the epoch (equal to the timestamps
+        if no start timestamp is provided)
+    tz
+        Time zone of the timestamp column (if any)
+    """
+
+    def __init__(self, dataframe: pd.DataFrame, case_id_key: str, activity_key: str, timestamp_key: str,
+                 start_timestamp_key: Optional[str], order: np.ndarray, cases: np.ndarray, case_offsets: np.ndarray,
+                 activities: List[Any], activity_codes: np.ndarray, timestamps: np.ndarray,
+                 start_timestamps: np.ndarray, tz=None):
+        self.dataframe = dataframe
+        self.case_id_key = case_id_key
+        self.activity_key = activity_key
+        self.timestamp_key = timestamp_key
+        self.start_timestamp_key = start_timestamp_key
+        self.order = order
+        self.cases = cases
+        self.case_offsets = case_offsets
+        self.activities = activities
+        self.activity_codes = activity_codes
+        self.timestamps = timestamps
+        self.start_timestamps = start_timestamps
+        self.tz = tz
+        self.__cache = {}
+
+    def __len__(self):
+        return len(self.order)
+
+    @property
+    def num_cases(self) -> int:
+        return len(self.cases)
+
+    @property
+    def case_lengths(self) -> np.ndarray:
+        return np.diff(self.case_offsets)
+
+    @property
+    def case_codes(self) -> np.ndarray:
+        """
+        Case (index in cases) of each sorted event
+        """
+        if "case_codes" not in self.__cache:
+            self.__cache["case_codes"] = np.repeat(np.arange(self.num_cases, dtype=np.int64), self.case_lengths)
+        return self.__cache["case_codes"]
+
+    @property
+    def case_end(self) -> np.ndarray:
+        """
+        (Exclusive) end of the case, for each sorted event
+        """
+        if "case_end" not in self.__cache:
+            self.__cache["case_end"] = np.repeat(self.case_offsets[1:], self.case_lengths)
+        return self.__cache["case_end"]
+
+    def matches(self, case_id_key: str, activity_key: str, timestamp_key: Optional[str] = None,
+                start_timestamp_key: Optional[str] = None) -> bool:
+        """
+        Checks if the prepared log has been built on the given columns (a missing start timestamp key, or a start
+        timestamp key equal to the timestamp key, stands for the timestamp key)
+        """
+        if start_timestamp_key == timestamp_key:
+            start_timestamp_key = None
+        return self.case_id_key == case_id_key and self.activity_key == activity_key and \
+            (timestamp_key is None or (self.timestamp_key == timestamp_key and
+                                       self.start_timestamp_key == start_timestamp_key))
+
+    def get_start_activities_codes(self) -> np.ndarray:
+        return self.activity_codes[self.case_offsets[:-1]]
+
+    def get_end_activities_codes(self) -> np.ndarray:
+        return self.activity_codes[self.case_offsets[1:] - 1]
+
+    def count_activity_codes(self, codes: np.ndarray) -> Dict[Any, int]:
+        """
+        Counts the occurrences of the given activity codes, returning a dictionary activity -> count
+        """
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.activities))
+        return {self.activities[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def get_activity_codes(self, values: Collection[Any]) -> np.ndarray:
+        """
+        Gets the codes of the given activities (the activities not contained in the log are ignored)
+        """
+        return pd.Index(self.activities).get_indexer(list(values))
+
+    def get_variants(self) -> Tuple[List[Tuple[Any, ...]], np.ndarray]:
+        """
+        Gets the variants of the log (computed once and cached)
+
+        Returns
+        ----------------
+        variants
+            List of variants (tuples of activities), in order of first occurrence
+        case_variant_idx
+            For each case, the index of its variant in the list
+        """
+        if "variants" not in self.__cache:
+            labels = np.empty(len(self.activities) + 1, dtype=object)
+            labels[:len(self.activities)] = self.activities
+            labels[-1] = None
+            variants_idx = {}
+            variants = []
+            case_variant_idx = np.empty(self.num_cases, dtype=np.int64)
+            codes = self.activity_codes
+            offsets = self.case_offsets.tolist()
+            for c in range(self.num_cases):
+                key = codes[offsets[c]:offsets[c + 1]].tobytes()
+                idx = variants_idx.get(key)
+                if idx is None:
+                    idx = len(variants)
+                    variants_idx[key] = idx
+                    variants.append(tuple(labels[codes[offsets[c]:offsets[c + 1]]].tolist()))
+                case_variant_idx[c] = idx
+            self.__cache["variants"] = (variants, case_variant_idx)
+        return self.__cache["variants"]
+
+    def filter_cases(self, case_mask: np.ndarray) -> pd.DataFrame:
+        """
+        Filters the dataframe keeping the events of the given cases (keeping the order of the dataframe)
+
+        Parameters
+        ----------------
+        case_mask
+            Boolean mask over the cases (in the order of the cases attribute)
+
+        Returns
+        ----------------
+        filtered_df
+            Filtered dataframe
+        """
+        event_mask = np.zeros(len(self.dataframe), dtype=bool)
+        event_mask[self.order] = np.repeat(case_mask, self.case_lengths)
+        ret = self.dataframe[event_mask]
+        ret.attrs = copy(self.dataframe.attrs) if hasattr(self.dataframe, 'attrs') else {}
+        return ret
+
+
+def _timestamp_to_int64(series) -> np.ndarray:
+    # nanoseconds since the epoch (UTC, if the column is timezone-aware)
+    return series.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+
+def is_prepared_log(obj) -> bool:
+    """
+    Checks if the object is a prepared log
+    """
+    return isinstance(obj, PreparedLog)
+
+
+def apply(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> PreparedLog:
+    """
+    Prepares a dataframe for the repeated application of the pandas-based algorithms: the events are sorted and
+    the case identifiers and the activities are factorized once.
+
+    Minimum viable example:
+
+        import pm4py
+        from pm4py.objects.log.util import prepared_log
+        from pm4py.algo.discovery.dfg import algorithm as dfg_discovery
+
+        dataframe = pm4py.read_xes('tests/input_data/running-example.xes')
+        prepared = prepared_log.apply(dataframe)
+        dfg = dfg_discovery.apply(prepared)
+
+    Parameters
+    ---------------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => the case identifier
+        - Parameters.ACTIVITY_KEY => the activity
+        - Parameters.TIMESTAMP_KEY => the timestamp
+        - Parameters.START_TIMESTAMP_KEY => the start timestamp (optional)
+
+    Returns
+    ---------------
+    prepared_log
+        Prepared log
+    """
+    if parameters is None:
+        parameters = {}
+
+    if is_prepared_log(df):
+        return df
+
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
+    if start_timestamp_key == timestamp_key:
+        start_timestamp_key = None
+
+    # the codes follow the (sorted) order of the values
+    try:
+        case_codes, cases = pd.factorize(df[case_id_key], sort=True)
+    except TypeError:
+        case_codes, cases = pd.factorize(df[case_id_key])
+    try:
+        activity_codes, activities = pd.factorize(df[activity_key], sort=True)
+    except TypeError:
+        activity_codes, activities = pd.factorize(df[activity_key])
+
+    timestamps = _timestamp_to_int64(df[timestamp_key])
+    if start_timestamp_key is not None:
+        start_timestamps = _timestamp_to_int64(df[start_timestamp_key])
+        order = np.lexsort((timestamps, start_timestamps, case_codes))
+    else:
+        start_timestamps = timestamps
+        order = np.lexsort((timestamps, case_codes))
+
+    sorted_case_codes = case_codes[order]
+    case_offsets = np.searchsorted(sorted_case_codes, np.arange(len(cases) + 1), side="left").astype(np.int64)
+    # rows without a case identifier are not part of any case
+    order = order[case_offsets[0]:]
+    case_offsets = case_offsets - case_offsets[0]
+
+    return PreparedLog(df, case_id_key, activity_key, timestamp_key, start_timestamp_key, order,
+                       np.asarray(cases), case_offsets, list(activities), activity_codes[order], timestamps[order],
+                       start_timestamps[order] if start_timestamp_key is not None else timestamps[order],
+                       tz=getattr(df[timestamp_key].dt, "tz", None))
@@ -22,7 +22,7 @@ Contact: info@processintelligence.solutions
 from enum import Enum
 from typing import Optional, Dict, Any
 
-from pm4py.objects.ocel.exporter.jsonocel.variants import classic, ocel20, ocel20_standard
+from pm4py.objects.ocel.exporter.jsonocel.variants import classic, ocel20, ocel20_standard, ocel20_streaming
 from pm4py.objects.ocel.obj import OCEL
 from pm4py.util import exec_utils
 
@@ -31,6 +31,7 @@ class Variants(Enum):
     CLASSIC = classic
     OCEL20 = ocel20
     OCEL20_STANDARD = ocel20_standard
+    OCEL20_STREAMING = ocel20_streaming
 
 
 def apply(ocel: OCEL, target_path: str, variant=Variants.CLASSIC, parameters: Optional[Dict[Any, Any]] = None):
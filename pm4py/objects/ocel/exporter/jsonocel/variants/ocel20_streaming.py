@@ -0,0 +1,146 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import json
+from enum import Enum
+from typing import Optional, Dict, Any
+
+import pandas as pd
+
+from pm4py.objects.ocel import constants
+from pm4py.objects.ocel.exporter.util import clean_dataframes
+from pm4py.objects.ocel.exporter.util.grouped_rows import GroupedRows
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import attributes_per_type
+from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util import ocel_consistency
+from pm4py.util import exec_utils, constants as pm4_constants
+
+
+class Parameters(Enum):
+    EVENT_ID = constants.PARAM_EVENT_ID
+    EVENT_ACTIVITY = constants.PARAM_EVENT_ACTIVITY
+    EVENT_TIMESTAMP = constants.PARAM_EVENT_TIMESTAMP
+    OBJECT_ID = constants.PARAM_OBJECT_ID
+    OBJECT_TYPE = constants.PARAM_OBJECT_TYPE
+    QUALIFIER = constants.PARAM_QUALIFIER
+    CHANGED_FIELD = constants.PARAM_CHNGD_FIELD
+    ENCODING = "encoding"
+    BATCH_SIZE = "batch_size"
+
+
+def apply(ocel: OCEL, target_path: str, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Exports an object-centric event log (OCEL 2.0) in a JSON-OCEL 2.0 standard file, incrementally.
+
+    The objects and the events are serialized in batches straight from the dataframes of the OCEL and written
+    to the file stream, without building the whole JSON document in memory.
+    The content of the file is equivalent to the one of the OCEL20_STANDARD variant.
+
+    Parameters
+    ------------------
+    ocel
+        Object-centric event log
+    target_path
+        Destination path
+    parameters
+        Possible parameters of the method, including:
+        - Parameters.EVENT_ID => the event ID column
+        - Parameters.EVENT_ACTIVITY => the activity column
+        - Parameters.EVENT_TIMESTAMP => the timestamp column
+        - Parameters.OBJECT_ID => the object ID column
+        - Parameters.OBJECT_TYPE => the object type column
+        - Parameters.QUALIFIER => the qualifier column
+        - Parameters.CHANGED_FIELD => the changed field column (of the object changes)
+        - Parameters.ENCODING
+        - Parameters.BATCH_SIZE => number of objects/events serialized at once (default: 10000)
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, pm4_constants.DEFAULT_ENCODING)
+    event_id = exec_utils.get_param_value(Parameters.EVENT_ID, parameters, ocel.event_id_column)
+    event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters, ocel.event_activity)
+    event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters, ocel.event_timestamp)
+    object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, ocel.object_id_column)
+    object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, ocel.object_type_column)
+    qualifier = exec_utils.get_param_value(Parameters.QUALIFIER, parameters, ocel.qualifier)
+    changed_field = exec_utils.get_param_value(Parameters.CHANGED_FIELD, parameters, ocel.changed_field)
+    batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 10000)
+
+    ocel = ocel_consistency.apply(ocel, parameters=parameters)
+    ocel = filtering_utils.propagate_relations_filtering(ocel, parameters=parameters)
+
+    ets, ots = attributes_per_type.get_standard(ocel, parameters=parameters)
+
+    object_ids = pd.Index(ocel.objects[object_id].to_numpy())
+    event_ids = pd.Index(ocel.events[event_id].to_numpy())
+    o2o = GroupedRows(ocel.o2o[[object_id, object_id + "_2", qualifier]], object_id, object_ids)
+    object_changes = GroupedRows(ocel.object_changes, object_id, object_ids)
+    relations = GroupedRows(ocel.relations[[event_id, object_id, qualifier]], event_id, event_ids)
+
+    F = open(target_path, "w", encoding=encoding)
+
+    F.write("{\n\"objectTypes\": ")
+    F.write(json.dumps([{"name": ot, "attributes": [{"name": x, "type": y} for x, y in attrs.items()]} for ot, attrs in ots.items()]))
+    F.write(",\n\"eventTypes\": ")
+    F.write(json.dumps([{"name": et, "attributes": [{"name": x, "type": y} for x, y in attrs.items()]} for et, attrs in ets.items()]))
+
+    F.write(",\n\"objects\": [")
+    for start in range(0, len(ocel.objects), batch_size):
+        end = min(start + batch_size, len(ocel.objects))
+        objects = clean_dataframes.clean_dataframe(ocel.objects.iloc[start:end]).to_dict("records")
+        batch_o2o = o2o.get_batch(start, end)
+        batch_changes = object_changes.get_batch(start, end)
+
+        for i, obj in enumerate(objects):
+            descr = {"id": obj[object_id], "type": obj[object_type]}
+            attributes = [{"name": k, "time": "1970-01-01T00:00:00Z", "value": v} for k, v in obj.items() if
+                          not k.startswith(constants.OCEL_PREFIX) and pd.notnull(v)]
+            for change in batch_changes.get(start + i, []):
+                attributes.append({"name": change[changed_field], "time": change[event_timestamp].isoformat(),
+                                   "value": change[change[changed_field]]})
+            if attributes:
+                descr["attributes"] = attributes
+            if start + i in batch_o2o:
+                descr["relationships"] = [{"objectId": x[object_id + "_2"], "qualifier": x[qualifier]} for x in
+                                          batch_o2o[start + i]]
+            F.write(("," if start + i > 0 else "") + "\n" + json.dumps(descr, default=str))
+
+    F.write("\n],\n\"events\": [")
+    for start in range(0, len(ocel.events), batch_size):
+        end = min(start + batch_size, len(ocel.events))
+        events = clean_dataframes.clean_dataframe(ocel.events.iloc[start:end]).to_dict("records")
+        batch_relations = relations.get_batch(start, end)
+
+        for i, eve in enumerate(events):
+            descr = {"id": eve[event_id], "type": eve[event_activity], "time": eve[event_timestamp]}
+            attributes = [{"name": k, "value": v} for k, v in eve.items() if
+                          not k.startswith(constants.OCEL_PREFIX) and pd.notnull(v)]
+            if attributes:
+                descr["attributes"] = attributes
+            if start + i in batch_relations:
+                descr["relationships"] = [{"objectId": x[object_id], "qualifier": x[qualifier]} for x in
+                                          batch_relations[start + i]]
+            F.write(("," if start + i > 0 else "") + "\n" + json.dumps(descr, default=str))
+
+    F.write("\n]\n}\n")
+    F.close()
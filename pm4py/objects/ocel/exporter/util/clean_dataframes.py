@@ -26,23 +26,27 @@ import pandas as pd
 from pm4py.objects.ocel.obj import OCEL
 
 
+def clean_dataframe(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of the dataframe where the object columns are converted to strings,
+    and the date columns are formatted as ISO strings
+    """
+    dataframe = dataframe.copy()
+    for col in dataframe.columns:
+        if str(dataframe[col].dtype) == "object":
+            dataframe[col] = dataframe[col].astype('string')
+        elif "date" in str(dataframe[col].dtype):
+            dataframe[col] = dataframe[col].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    return dataframe
+
+
 def get_dataframes_from_ocel(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Tuple[
     pd.DataFrame, pd.DataFrame]:
     if parameters is None:
         parameters = {}
 
-    events = ocel.events.copy()
-    for col in events.columns:
-        if str(events[col].dtype) == "object":
-            events[col] = events[col].astype('string')
-        elif "date" in str(events[col].dtype):
-            events[col] = events[col].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
-
-    objects = ocel.objects.copy()
-    for col in objects.columns:
-        if str(objects[col].dtype) == "object":
-            objects[col] = objects[col].astype('string')
-        elif "date" in str(objects[col].dtype):
-            objects[col] = objects[col].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    events = clean_dataframe(ocel.events)
+    objects = clean_dataframe(ocel.objects)
 
     return events, objects
@@ -0,0 +1,55 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from typing import Dict, Any, List
+
+import numpy as np
+import pandas as pd
+
+
+class GroupedRows(object):
+    """
+    Groups the rows of a dataframe (e.g., the relations) by the position of their key in a reference index
+    (e.g., the identifiers of the events), so that the rows related to a batch of consecutive reference positions
+    can be retrieved without grouping the whole dataframe in Python objects (used by the incremental exporters)
+    """
+
+    def __init__(self, dataframe: pd.DataFrame, key_column: str, reference_ids: pd.Index):
+        if not reference_ids.is_unique:
+            reference_ids = reference_ids.drop_duplicates()
+        positions = reference_ids.get_indexer(dataframe[key_column].to_numpy())
+        self.dataframe = dataframe
+        self.order = np.argsort(positions, kind="stable")
+        self.positions = positions[self.order]
+
+    def get_batch(self, start: int, end: int) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Gets the rows (as records, in the order of the dataframe) related to the reference positions
+        between start (included) and end (excluded)
+        """
+        lo, hi = np.searchsorted(self.positions, [start, end], side="left")
+        records = self.dataframe.iloc[self.order[lo:hi]].to_dict("records")
+        ret = {}
+        for pos, record in zip(self.positions[lo:hi].tolist(), records):
+            if pos not in ret:
+                ret[pos] = []
+            ret[pos].append(record)
+        return ret
@@ -22,7 +22,7 @@ Contact: info@processintelligence.solutions
 from enum import Enum
 from typing import Optional, Dict, Any
 
-from pm4py.objects.ocel.exporter.xmlocel.variants import classic, ocel20
+from pm4py.objects.ocel.exporter.xmlocel.variants import classic, ocel20, ocel20_streaming
 from pm4py.objects.ocel.obj import OCEL
 from pm4py.util import exec_utils
 
@@ -30,6 +30,7 @@ from pm4py.util import exec_utils
 class Variants(Enum):
     CLASSIC = classic
     OCEL20 = ocel20
+    OCEL20_STREAMING = ocel20_streaming
 
 
 def apply(ocel: OCEL, target_path: str, variant=Variants.CLASSIC, parameters: Optional[Dict[Any, Any]] = None):
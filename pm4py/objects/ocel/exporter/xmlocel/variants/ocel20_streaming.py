@@ -0,0 +1,182 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from enum import Enum
+from typing import Optional, Dict, Any
+
+import pandas as pd
+from lxml import etree
+
+from pm4py.objects.ocel import constants
+from pm4py.objects.ocel.exporter.util.grouped_rows import GroupedRows
+from pm4py.objects.ocel.exporter.xmlocel.variants.ocel20 import RELOBJ_TAG
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import attributes_per_type
+from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util import ocel_consistency
+from pm4py.util import exec_utils, constants as pm4_constants
+
+
+class Parameters(Enum):
+    EVENT_ID = constants.PARAM_EVENT_ID
+    EVENT_ACTIVITY = constants.PARAM_EVENT_ACTIVITY
+    EVENT_TIMESTAMP = constants.PARAM_EVENT_TIMESTAMP
+    OBJECT_ID = constants.PARAM_OBJECT_ID
+    OBJECT_TYPE = constants.PARAM_OBJECT_TYPE
+    QUALIFIER = constants.PARAM_QUALIFIER
+    CHANGED_FIELD = constants.PARAM_CHNGD_FIELD
+    ENCODING = "encoding"
+    BATCH_SIZE = "batch_size"
+
+
+def __get_types_element(tag: str, types: Dict[str, Dict[str, str]]):
+    types_element = etree.Element(tag + "s")
+    for t, attrs in types.items():
+        type_element = etree.SubElement(types_element, tag)
+        type_element.set("name", str(t))
+        attributes = etree.SubElement(type_element, "attributes")
+        for k, v in attrs.items():
+            attribute = etree.SubElement(attributes, "attribute")
+            attribute.set("name", k)
+            attribute.set("type", v)
+    return types_element
+
+
+def apply(ocel: OCEL, target_path: str, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Exports an object-centric event log (OCEL 2.0) in a XML-OCEL 2.0 file, incrementally.
+
+    The objects and the events are serialized in batches straight from the dataframes of the OCEL and written
+    to the file stream (lxml incremental writer), without building the whole XML tree in memory.
+    The content of the file is equivalent to the one of the OCEL20 variant.
+
+    Parameters
+    ------------------
+    ocel
+        Object-centric event log
+    target_path
+        Destination path
+    parameters
+        Possible parameters of the method, including:
+        - Parameters.EVENT_ID => the event ID column
+        - Parameters.EVENT_ACTIVITY => the activity column
+        - Parameters.EVENT_TIMESTAMP => the timestamp column
+        - Parameters.OBJECT_ID => the object ID column
+        - Parameters.OBJECT_TYPE => the object type column
+        - Parameters.QUALIFIER => the qualifier column
+        - Parameters.CHANGED_FIELD => the changed field column (of the object changes)
+        - Parameters.ENCODING
+        - Parameters.BATCH_SIZE => number of objects/events serialized at once (default: 10000)
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, pm4_constants.DEFAULT_ENCODING)
+    event_id_column = exec_utils.get_param_value(Parameters.EVENT_ID, parameters, ocel.event_id_column)
+    event_activity_column = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters, ocel.event_activity)
+    event_timestamp_column = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters, ocel.event_timestamp)
+    object_id_column = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, ocel.object_id_column)
+    object_type_column = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, ocel.object_type_column)
+    qualifier_column = exec_utils.get_param_value(Parameters.QUALIFIER, parameters, ocel.qualifier)
+    changed_field_column = exec_utils.get_param_value(Parameters.CHANGED_FIELD, parameters, ocel.changed_field)
+    batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 10000)
+
+    ocel = ocel_consistency.apply(ocel, parameters=parameters)
+    ocel = filtering_utils.propagate_relations_filtering(ocel, parameters=parameters)
+
+    ets, ots = attributes_per_type.get_standard(ocel, parameters=parameters)
+
+    object_ids = pd.Index(ocel.objects[object_id_column].to_numpy())
+    event_ids = pd.Index(ocel.events[event_id_column].to_numpy())
+    o2o = GroupedRows(ocel.o2o[[object_id_column, object_id_column + "_2", qualifier_column]], object_id_column,
+                      object_ids)
+    object_changes = GroupedRows(ocel.object_changes, object_id_column, object_ids)
+    relations = GroupedRows(ocel.relations[[event_id_column, object_id_column, qualifier_column]], event_id_column,
+                            event_ids)
+
+    F = open(target_path, "wb")
+
+    with etree.xmlfile(F, encoding=encoding) as xf:
+        xf.write_declaration()
+        with xf.element("log"):
+            xf.write(__get_types_element("object-type", ots), pretty_print=True)
+            xf.write(__get_types_element("event-type", ets), pretty_print=True)
+
+            with xf.element("objects"):
+                for start in range(0, len(ocel.objects), batch_size):
+                    end = min(start + batch_size, len(ocel.objects))
+                    objects = ocel.objects.iloc[start:end].to_dict("records")
+                    batch_o2o = o2o.get_batch(start, end)
+                    batch_changes = object_changes.get_batch(start, end)
+
+                    for i, obj in enumerate(objects):
+                        object = etree.Element("object")
+                        object.set("id", str(obj[object_id_column]))
+                        object.set("type", str(obj[object_type_column]))
+
+                        object_attributes = etree.SubElement(object, "attributes")
+                        for x, y in obj.items():
+                            if not x.startswith("ocel:") and y is not None and not pd.isna(y):
+                                object_attribute = etree.SubElement(object_attributes, "attribute")
+                                object_attribute.set("name", x)
+                                object_attribute.set("time", "1970-01-01T00:00:00Z")
+                                object_attribute.text = str(y)
+                        for chng in batch_changes.get(start + i, []):
+                            object_attribute = etree.SubElement(object_attributes, "attribute")
+                            object_attribute.set("name", chng[changed_field_column])
+                            object_attribute.set("time", chng[event_timestamp_column].isoformat())
+                            object_attribute.text = str(chng[chng[changed_field_column]])
+
+                        if start + i in batch_o2o:
+                            object_objects = etree.SubElement(object, "objects")
+                            for rel in batch_o2o[start + i]:
+                                object_object = etree.SubElement(object_objects, RELOBJ_TAG)
+                                object_object.set("object-id", str(rel[object_id_column + "_2"]))
+                                object_object.set("qualifier", str(rel[qualifier_column]))
+
+                        xf.write(object, pretty_print=True)
+
+            with xf.element("events"):
+                for start in range(0, len(ocel.events), batch_size):
+                    end = min(start + batch_size, len(ocel.events))
+                    events = ocel.events.iloc[start:end].to_dict("records")
+                    batch_relations = relations.get_batch(start, end)
+
+                    for i, eve in enumerate(events):
+                        event = etree.Element("event")
+                        event.set("id", str(eve[event_id_column]))
+                        event.set("type", str(eve[event_activity_column]))
+                        event.set("time", eve[event_timestamp_column].isoformat())
+                        event_attributes = etree.SubElement(event, "attributes")
+                        event_objects = etree.SubElement(event, "objects")
+                        for rel in batch_relations.get(start + i, []):
+                            event_object = etree.SubElement(event_objects, RELOBJ_TAG)
+                            event_object.set("object-id", str(rel[object_id_column]))
+                            event_object.set("qualifier", str(rel[qualifier_column]))
+                        for k, v in eve.items():
+                            if not k.startswith("ocel:") and v is not None and not pd.isna(v):
+                                event_attribute = etree.SubElement(event_attributes, "attribute")
+                                event_attribute.set("name", k)
+                                event_attribute.text = str(v)
+
+                        xf.write(event, pretty_print=True)
+
+    F.close()
@@ -75,7 +75,7 @@ def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None) -> OCEL:
         dct["ocel:typedOmap"] = []
         if "relationships" in eve and eve["relationships"]:
             dct["ocel:typedOmap"] = [{"ocel:oid": x["objectId"], "ocel:qualifier": x["qualifier"]} for x in eve["relationships"]]
-        dct["ocel:omap"] = list(set(x["ocel:oid"] for x in dct["ocel:typedOmap"]))
+        dct["ocel:omap"] = list(dict.fromkeys(x["ocel:oid"] for x in dct["ocel:typedOmap"]))
         legacy_obj["ocel:events"][eve["id"]] = dct
 
     for obj in json_obj["objects"]:
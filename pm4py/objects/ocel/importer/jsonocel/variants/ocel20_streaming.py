@@ -0,0 +1,268 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import json
+import re
+from enum import Enum
+from typing import Optional, Dict, Any, Iterator
+
+from pm4py.objects.ocel import constants
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util import ocel_consistency
+from pm4py.objects.ocel.util.columnar_buffer import ColumnarBuffer, DEFAULT_BATCH_SIZE
+from pm4py.objects.log.util import dataframe_utils
+from pm4py.util import exec_utils, dt_parsing, constants as pm4_constants, pandas_utils
+
+
+class Parameters(Enum):
+    EVENT_ID = constants.PARAM_EVENT_ID
+    EVENT_ACTIVITY = constants.PARAM_EVENT_ACTIVITY
+    EVENT_TIMESTAMP = constants.PARAM_EVENT_TIMESTAMP
+    OBJECT_ID = constants.PARAM_OBJECT_ID
+    OBJECT_TYPE = constants.PARAM_OBJECT_TYPE
+    INTERNAL_INDEX = constants.PARAM_INTERNAL_INDEX
+    QUALIFIER = constants.PARAM_QUALIFIER
+    CHANGED_FIELD = constants.PARAM_CHNGD_FIELD
+    ENCODING = "encoding"
+    BATCH_SIZE = "batch_size"
+    READ_SIZE = "read_size"
+
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamReader(object):
+    """
+    Event-driven reader of a JSON document, which decodes the elements of the (possibly huge) arrays one at a time
+    while reading the file in blocks
+    """
+
+    def __init__(self, file, read_size: int = 1 << 20):
+        self.file = file
+        self.read_size = read_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def read_more(self, min_size: int = 0) -> bool:
+        block = self.file.read(max(self.read_size, min_size))
+        if not block:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + block
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self.read_more():
+                break
+        return self.buffer[self.pos] if self.pos < len(self.buffer) else ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise Exception("malformed JSON: expected '%s' at character %d of the current block" % (char, self.pos))
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        """
+        Decodes the next (complete) JSON value
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # a number could be truncated at the end of the block
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # the value continues in the next block: doubles the amount of data read to avoid quadratic retries
+            self.read_more(min_size=len(self.buffer) - self.pos)
+
+    def iterate_array(self) -> Iterator[Any]:
+        """
+        Iterates over the elements of the next JSON array
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.decode_value()
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            elif char != ",":
+                raise Exception("malformed JSON: expected ',' or ']' in an array")
+
+    def iterate_keys(self) -> Iterator[str]:
+        """
+        Iterates over the keys of the next JSON object. The value associated to each key should be consumed
+        (decode_value or iterate_array) before advancing the iteration.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.decode_value()
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == "}":
+                return
+            elif char != ",":
+                raise Exception("malformed JSON: expected ',' or '}' in an object")
+
+
+def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None) -> OCEL:
+    """
+    Imports an OCEL from a JSON-OCEL 2 standard file, incrementally.
+
+    The objects and the events are decoded one at a time and appended to columnar buffers, which are converted to
+    dataframes in batches, so the whole JSON document is never loaded in memory.
+    The resulting OCEL is equivalent to the one of the OCEL20_STANDARD variant.
+
+    Parameters
+    --------------
+    file_path
+        Path to the object-centric event log
+    parameters
+        Possible parameters of the method, including:
+        - Parameters.EVENT_ID
+        - Parameters.EVENT_ACTIVITY
+        - Parameters.EVENT_TIMESTAMP
+        - Parameters.OBJECT_ID
+        - Parameters.OBJECT_TYPE
+        - Parameters.INTERNAL_INDEX
+        - Parameters.ENCODING
+        - Parameters.BATCH_SIZE => number of rows converted to a dataframe at once (default: 100000)
+        - Parameters.READ_SIZE => number of characters read from the file at once (default: 1048576)
+
+    Returns
+    -------------
+    ocel
+        Object-centric event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, pm4_constants.DEFAULT_ENCODING)
+    event_id = exec_utils.get_param_value(Parameters.EVENT_ID, parameters, constants.DEFAULT_EVENT_ID)
+    event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters, constants.DEFAULT_EVENT_ACTIVITY)
+    event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters,
+                                                 constants.DEFAULT_EVENT_TIMESTAMP)
+    object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, constants.DEFAULT_OBJECT_ID)
+    object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, constants.DEFAULT_OBJECT_TYPE)
+    internal_index = exec_utils.get_param_value(Parameters.INTERNAL_INDEX, parameters, constants.DEFAULT_INTERNAL_INDEX)
+    qualifier = exec_utils.get_param_value(Parameters.QUALIFIER, parameters, constants.DEFAULT_QUALIFIER)
+    changed_field = exec_utils.get_param_value(Parameters.CHANGED_FIELD, parameters, constants.DEFAULT_CHNGD_FIELD)
+    batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, DEFAULT_BATCH_SIZE)
+    read_size = exec_utils.get_param_value(Parameters.READ_SIZE, parameters, 1 << 20)
+
+    date_parser = dt_parsing.parser.get()
+
+    events = ColumnarBuffer(batch_size)
+    objects = ColumnarBuffer(batch_size)
+    relations = ColumnarBuffer(batch_size)
+    o2o = ColumnarBuffer(batch_size)
+    object_changes = ColumnarBuffer(batch_size)
+
+    F = open(file_path, "r", encoding=encoding)
+    reader = JsonStreamReader(F, read_size=read_size)
+
+    for key in reader.iterate_keys():
+        if key == "objects":
+            for obj in reader.iterate_array():
+                dct = {object_id: obj["id"], object_type: obj["type"]}
+                if obj.get("attributes"):
+                    for x in obj["attributes"]:
+                        if x["name"] in dct:
+                            object_changes.append({object_id: obj["id"], object_type: obj["type"],
+                                                   changed_field: x["name"], x["name"]: x["value"],
+                                                   event_timestamp: x["time"]})
+                        else:
+                            dct[x["name"]] = x["value"]
+                if obj.get("relationships"):
+                    for x in obj["relationships"]:
+                        o2o.append({object_id: obj["id"], object_id + "_2": x["objectId"], qualifier: x["qualifier"]})
+                objects.append(dct)
+        elif key == "events":
+            for eve in reader.iterate_array():
+                timestamp = date_parser.apply(eve["time"])
+                dct = {event_id: eve["id"], event_timestamp: timestamp, event_activity: eve["type"]}
+                if eve.get("attributes"):
+                    for x in eve["attributes"]:
+                        dct[x["name"]] = x["value"]
+                if eve.get("relationships"):
+                    # one relationship per related object (with the last qualifier), as in the standard importer
+                    related = {}
+                    for x in eve["relationships"]:
+                        related[x["objectId"]] = x["qualifier"]
+                    for oid, qual in related.items():
+                        relations.append({event_id: eve["id"], event_activity: eve["type"],
+                                          event_timestamp: timestamp, object_id: oid, qualifier: qual})
+                events.append(dct)
+        else:
+            # object types and event types are not needed to build the dataframes
+            reader.decode_value()
+
+    F.close()
+
+    events = events.to_dataframe(columns=[event_id, event_timestamp, event_activity])
+    objects = objects.to_dataframe(columns=[object_id, object_type])
+    relations = relations.to_dataframe(columns=[event_id, event_activity, event_timestamp, object_id, qualifier])
+    o2o = o2o.to_dataframe()
+    object_changes = object_changes.to_dataframe()
+
+    # the type of the related objects is resolved at the end, so the objects can also follow the events in the file
+    obj_types = objects.drop_duplicates(object_id).set_index(object_id)[object_type]
+    relations.insert(4, object_type, relations[object_id].map(obj_types))
+    relations = relations.dropna(subset=[object_type])
+
+    events = pandas_utils.insert_index(events, internal_index, reset_index=False, copy_dataframe=False)
+    relations = pandas_utils.insert_index(relations, internal_index, reset_index=True, copy_dataframe=False)
+
+    events = events.sort_values([event_timestamp, internal_index])
+    relations = relations.sort_values([event_timestamp, internal_index])
+
+    del events[internal_index]
+    del relations[internal_index]
+
+    if object_changes is not None:
+        object_changes = dataframe_utils.convert_timestamp_columns_in_df(object_changes, timest_format=pm4_constants.DEFAULT_XES_TIMESTAMP_PARSE_FORMAT, timest_columns=[event_timestamp])
+
+    globals = {constants.OCEL_GLOBAL_LOG: {}, constants.OCEL_GLOBAL_EVENT: {}, constants.OCEL_GLOBAL_OBJECT: {}}
+
+    log = OCEL(events=events, objects=objects, relations=relations, o2o=o2o, object_changes=object_changes, globals=globals, parameters=parameters)
+
+    log = ocel_consistency.apply(log, parameters=parameters)
+    log = filtering_utils.propagate_relations_filtering(log, parameters=parameters)
+
+    return log
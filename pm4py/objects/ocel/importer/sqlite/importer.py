@@ -24,13 +24,14 @@ from pm4py.objects.ocel.obj import OCEL
 from typing import Dict, Any
 from enum import Enum
 from typing import Optional
-from pm4py.objects.ocel.importer.sqlite.variants import pandas_importer, ocel20
+from pm4py.objects.ocel.importer.sqlite.variants import pandas_importer, ocel20, ocel20_lazy
 from pm4py.util import exec_utils
 
 
 class Variants(Enum):
     PANDAS_IMPORTER = pandas_importer
     OCEL20 = ocel20
+    OCEL20_LAZY = ocel20_lazy
 
 
 def apply(file_path: str, variant=Variants.PANDAS_IMPORTER, parameters: Optional[Dict[Any, Any]] = None) -> OCEL:
@@ -44,6 +45,8 @@ def apply(file_path: str, variant=Variants.PANDAS_IMPORTER, parameters: Optional
     variant
         Variant of the importer to use:
         - Variants.PANDAS_IMPORTER => Pandas
+        - Variants.OCEL20 => OCEL 2.0
+        - Variants.OCEL20_LAZY => OCEL 2.0, importing only the slice selected by the filters in the parameters
     parameters
         Variant-specific parameters
 
@@ -0,0 +1,586 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, List, Collection, Iterator, Tuple, Union
+from copy import copy
+from datetime import datetime, timedelta
+import warnings
+
+import pandas as pd
+
+from pm4py.objects.ocel import constants
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.util import exec_utils, pandas_utils
+from pm4py.objects.ocel.util import ocel_consistency
+from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.validation import ocel20_rel_validation
+from pm4py.util import constants as pm4_constants
+from pm4py.objects.log.util import dataframe_utils
+from pm4py.algo.filtering.common.timestamp.timestamp_common import get_dt_from_string
+
+
+class Parameters(Enum):
+    EVENT_ID = constants.PARAM_EVENT_ID
+    EVENT_ACTIVITY = constants.PARAM_EVENT_ACTIVITY
+    EVENT_TIMESTAMP = constants.PARAM_EVENT_TIMESTAMP
+    OBJECT_ID = constants.PARAM_OBJECT_ID
+    OBJECT_TYPE = constants.PARAM_OBJECT_TYPE
+    INTERNAL_INDEX = constants.PARAM_INTERNAL_INDEX
+    QUALIFIER = constants.PARAM_QUALIFIER
+    CHANGED_FIELD = constants.PARAM_CHNGD_FIELD
+    CUMCOUNT = "cumcount"
+    VALIDATION = "validation"
+    EXCEPT_IF_INVALID = "except_if_invalid"
+    OBJECT_TYPES = "object_types"
+    ACTIVITIES = "activities"
+    MIN_TIMESTAMP = "min_timestamp"
+    MAX_TIMESTAMP = "max_timestamp"
+    EVENT_ATTRIBUTES = "event_attributes"
+    OBJECT_ATTRIBUTES = "object_attributes"
+    CHUNK_SIZE = "chunk_size"
+
+
+def _declared_dtype(declared_type: str) -> Optional[str]:
+    """
+    Gets the type (int or float) of the values of a column, given the type declared in the SQLite schema
+    (following the type affinity rules of SQLite)
+    """
+    declared_type = declared_type.upper() if declared_type else ""
+    if "INT" in declared_type:
+        return "int"
+    if "REAL" in declared_type or "FLOA" in declared_type or "DOUB" in declared_type:
+        return "float"
+    return None
+
+
+def _apply_declared_types(df: pd.DataFrame, declared_types: Dict[str, Optional[str]]) -> pd.DataFrame:
+    """
+    Casts the numeric columns of a chunk to the type declared in the schema, so that all the chunks of a table
+    share the same types (integer columns containing nulls are read as floats, as pd.read_sql does)
+    """
+    for col, dtype in declared_types.items():
+        if dtype is None or col not in df.columns:
+            continue
+        values = pd.to_numeric(df[col], errors="coerce")
+        if dtype == "int" and not values.isna().any():
+            df[col] = values.astype("int64")
+        else:
+            df[col] = values.astype("float64")
+    return df
+
+
+class LazyOCEL(object):
+    """
+    Lazy handle on an OCEL 2.0 SQLite database.
+
+    The filters on the object types, the activities and the timestamps, and the projection on the attributes,
+    are pushed into the SQL queries. The tables are read in chunks, and an OCEL (containing only the selected
+    slice of the database) is materialized only when materialize() is called.
+
+    The filtering methods return a new handle and leave the current one untouched.
+    The materialized OCEL is equal to the one obtained importing the full database and applying the
+    corresponding pm4py filters (pm4py.filter_ocel_object_types, pm4py.filter_ocel_event_attribute on the
+    activity, pm4py.filter_ocel_events_timestamp).
+    """
+
+    def __init__(self, file_path: str, parameters: Optional[Dict[Any, Any]] = None):
+        if parameters is None:
+            parameters = {}
+
+        self.file_path = file_path
+        self.parameters = parameters
+        self.chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, 100000)
+
+        object_types = exec_utils.get_param_value(Parameters.OBJECT_TYPES, parameters, None)
+        activities = exec_utils.get_param_value(Parameters.ACTIVITIES, parameters, None)
+        self.object_types = set(object_types) if object_types is not None else None
+        self.activities = set(activities) if activities is not None else None
+        min_timestamp = exec_utils.get_param_value(Parameters.MIN_TIMESTAMP, parameters, None)
+        max_timestamp = exec_utils.get_param_value(Parameters.MAX_TIMESTAMP, parameters, None)
+        self.min_timestamp = get_dt_from_string(min_timestamp) if min_timestamp is not None else None
+        self.max_timestamp = get_dt_from_string(max_timestamp) if max_timestamp is not None else None
+        self.event_attributes = exec_utils.get_param_value(Parameters.EVENT_ATTRIBUTES, parameters, None)
+        self.object_attributes = exec_utils.get_param_value(Parameters.OBJECT_ATTRIBUTES, parameters, None)
+
+        conn = self._connect()
+        try:
+            self._tables = set(x[0] for x in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'"))
+            self._event_type_map = {x[0]: x[1] for x in
+                                    conn.execute("SELECT ocel_type, ocel_type_map FROM event_map_type")}
+            self._object_type_map = {x[0]: x[1] for x in
+                                     conn.execute("SELECT ocel_type, ocel_type_map FROM object_map_type")}
+            self._columns = {}
+            for table in self._tables:
+                if table.startswith("event_") or table.startswith("object_"):
+                    self._columns[table] = [(x[1], x[2]) for x in
+                                            conn.execute("PRAGMA table_info(\"" + table.replace("\"", "\"\"") + "\")")]
+        finally:
+            conn.close()
+
+    def _connect(self):
+        import sqlite3
+        from urllib.request import pathname2url
+        return sqlite3.connect("file:" + pathname2url(self.file_path) + "?mode=ro", uri=True)
+
+    def _derive(self, **changes) -> "LazyOCEL":
+        ret = copy(self)
+        for k, v in changes.items():
+            setattr(ret, k, v)
+        return ret
+
+    def filter_object_types(self, object_types: Collection[str]) -> "LazyOCEL":
+        """
+        Keeps only the objects of the given object types (and the events related to them)
+        """
+        object_types = set(object_types)
+        if self.object_types is not None:
+            object_types = object_types.intersection(self.object_types)
+        return self._derive(object_types=object_types)
+
+    def filter_activities(self, activities: Collection[str]) -> "LazyOCEL":
+        """
+        Keeps only the events of the given activities (and the objects related to them)
+        """
+        activities = set(activities)
+        if self.activities is not None:
+            activities = activities.intersection(self.activities)
+        return self._derive(activities=activities)
+
+    def filter_timestamp(self, min_timestamp: Union[datetime, str], max_timestamp: Union[datetime, str]) -> "LazyOCEL":
+        """
+        Keeps only the events happening in the given time window (and the objects related to them)
+        """
+        min_timestamp = get_dt_from_string(min_timestamp)
+        max_timestamp = get_dt_from_string(max_timestamp)
+        if self.min_timestamp is not None:
+            min_timestamp = max(min_timestamp, self.min_timestamp)
+        if self.max_timestamp is not None:
+            max_timestamp = min(max_timestamp, self.max_timestamp)
+        return self._derive(min_timestamp=min_timestamp, max_timestamp=max_timestamp)
+
+    def select_attributes(self, event_attributes: Optional[Collection[str]] = None,
+                          object_attributes: Optional[Collection[str]] = None) -> "LazyOCEL":
+        """
+        Keeps only the given event and object attributes (None keeps all the attributes)
+        """
+        return self._derive(event_attributes=list(event_attributes) if event_attributes is not None else None,
+                            object_attributes=list(object_attributes) if object_attributes is not None else None)
+
+    def get_activities(self) -> List[str]:
+        """
+        Gets the (sorted) activities of the events selected by the handle
+        """
+        return sorted(x for x in self._event_type_map if self.activities is None or x in self.activities)
+
+    def get_object_types(self) -> List[str]:
+        """
+        Gets the (sorted) object types of the objects selected by the handle
+        """
+        return sorted(x for x in self._object_type_map if self.object_types is None or x in self.object_types)
+
+    def get_event_attribute_names(self) -> List[str]:
+        """
+        Gets the (sorted) names of the attributes of the events selected by the handle
+        """
+        return sorted(set(c for act in self.get_activities() for c in self._selected_columns(
+            "event_" + self._event_type_map[act], self.event_attributes, ["ocel_id", "ocel_time"]) if
+                          c not in ["ocel_id", "ocel_time"]))
+
+    def get_object_attribute_names(self) -> List[str]:
+        """
+        Gets the (sorted) names of the attributes of the objects selected by the handle
+        """
+        fixed = ["ocel_id", "ocel_time", "ocel_changed_field"]
+        return sorted(set(c for ot in self.get_object_types() for c in self._selected_columns(
+            "object_" + self._object_type_map[ot], self.object_attributes, fixed) if c not in fixed))
+
+    def _selected_columns(self, table: str, attributes: Optional[List[str]], fixed: List[str]) -> List[str]:
+        columns = [x[0] for x in self._columns.get(table, [])]
+        if attributes is None:
+            return columns
+        return [c for c in columns if c in fixed or c in attributes]
+
+    def _all_columns(self, prefix: str, type_map: Dict[str, str], attributes: Optional[List[str]],
+                     fixed: List[str]) -> List[str]:
+        # columns of all the tables of the given kind (also of the tables excluded by the filters), in the order
+        # in which they appear in the OCEL imported without filters
+        columns = []
+        for t in sorted(type_map):
+            for c in self._selected_columns(prefix + type_map[t], attributes, fixed):
+                if c not in columns:
+                    columns.append(c)
+        return columns
+
+    def _declared_types(self, table: str) -> Dict[str, Optional[str]]:
+        return {x[0]: _declared_dtype(x[1]) for x in self._columns.get(table, [])}
+
+    def _timestamp_bounds(self) -> Tuple[str, str]:
+        # conservative bounds on the date (the timezone offsets are at most one day), used to skip in SQL the
+        # rows stored as ISO strings that are surely outside the time window. The exact filter is applied
+        # after parsing the timestamps.
+        min_date = "0000-00-00"
+        max_date = "9999-99-99"
+        if self.min_timestamp is not None:
+            min_date = (self.min_timestamp - timedelta(days=2)).strftime("%Y-%m-%d")
+        if self.max_timestamp is not None:
+            max_date = (self.max_timestamp + timedelta(days=2)).strftime("%Y-%m-%d")
+        return min_date, max_date
+
+    @staticmethod
+    def _placeholders(values: Collection[Any]) -> str:
+        return ", ".join(["?"] * len(values))
+
+    def _read_chunks(self, conn, query: str, params: List[Any]) -> Iterator[pd.DataFrame]:
+        return pd.read_sql(query, conn, params=params, chunksize=self.chunk_size)
+
+    def _events_query(self, act: str) -> Tuple[str, List[Any]]:
+        table = "event_" + self._event_type_map[act]
+        columns = self._selected_columns(table, self.event_attributes, ["ocel_id", "ocel_time"])
+        query = "SELECT " + ", ".join("\"" + c + "\"" for c in columns) + " FROM \"" + table + "\""
+        conditions = []
+        params = []
+        if self.min_timestamp is not None or self.max_timestamp is not None:
+            conditions.append("(typeof(ocel_time) != 'text' OR substr(ocel_time, 5, 1) != '-' OR "
+                              "substr(ocel_time, 1, 10) BETWEEN ? AND ?)")
+            params.extend(self._timestamp_bounds())
+        if self.object_types is not None:
+            object_types = sorted(self.object_types)
+            conditions.append("ocel_id IN (SELECT ocel_event_id FROM event_object WHERE ocel_object_id IN "
+                              "(SELECT ocel_id FROM object WHERE ocel_type IN (" +
+                              self._placeholders(object_types) + ")))")
+            params.extend(object_types)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions) + " ORDER BY rowid"
+        return query, params
+
+    def _objects_query(self, ot: str) -> Tuple[str, List[Any]]:
+        table = "object_" + self._object_type_map[ot]
+        columns = self._selected_columns(table, self.object_attributes, ["ocel_id", "ocel_time", "ocel_changed_field"])
+        query = "SELECT " + ", ".join("\"" + c + "\"" for c in columns) + " FROM \"" + table + "\""
+        params = []
+        if self.activities is not None:
+            activities = sorted(self.activities)
+            query += " WHERE ocel_id IN (SELECT ocel_object_id FROM event_object WHERE ocel_event_id IN " \
+                     "(SELECT ocel_id FROM event WHERE ocel_type IN (" + self._placeholders(activities) + "))) " \
+                     "ORDER BY rowid"
+            params.extend(activities)
+        return query, params
+
+    def iterate_events(self) -> Iterator[pd.DataFrame]:
+        """
+        Iterates over the events selected by the handle (applying the filters on the activities and on the
+        timestamps), in chunks of at most chunk_size events (one activity per chunk)
+        """
+        event_id = exec_utils.get_param_value(Parameters.EVENT_ID, self.parameters, constants.DEFAULT_EVENT_ID)
+        event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, self.parameters,
+                                                    constants.DEFAULT_EVENT_ACTIVITY)
+        event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, self.parameters,
+                                                     constants.DEFAULT_EVENT_TIMESTAMP)
+
+        conn = self._connect()
+        try:
+            for act in self.get_activities():
+                table = "event_" + self._event_type_map[act]
+                if table not in self._tables:
+                    continue
+                declared_types = self._declared_types(table)
+                query, params = self._events_query(act)
+                for df in self._read_chunks(conn, query, params):
+                    df = _apply_declared_types(df, declared_types)
+                    df = df.rename(columns={"ocel_id": event_id, "ocel_time": event_timestamp})
+                    df[event_activity] = act
+                    df = dataframe_utils.convert_timestamp_columns_in_df(
+                        df, timest_format=pm4_constants.DEFAULT_TIMESTAMP_PARSE_FORMAT,
+                        timest_columns=[event_timestamp])
+                    if self.min_timestamp is not None:
+                        df = df[df[event_timestamp] >= self.min_timestamp]
+                    if self.max_timestamp is not None:
+                        df = df[df[event_timestamp] <= self.max_timestamp]
+                    if len(df) > 0:
+                        yield df
+        finally:
+            conn.close()
+
+    def iterate_objects(self) -> Iterator[pd.DataFrame]:
+        """
+        Iterates over the rows of the object tables selected by the handle (applying the filter on the object
+        types), in chunks of at most chunk_size rows (one object type per chunk). The rows include the
+        changes of the attributes of the objects.
+        """
+        object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, self.parameters, constants.DEFAULT_OBJECT_ID)
+        object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, self.parameters,
+                                                 constants.DEFAULT_OBJECT_TYPE)
+        event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, self.parameters,
+                                                     constants.DEFAULT_EVENT_TIMESTAMP)
+        changed_field = exec_utils.get_param_value(Parameters.CHANGED_FIELD, self.parameters,
+                                                   constants.DEFAULT_CHNGD_FIELD)
+
+        conn = self._connect()
+        try:
+            for ot in self.get_object_types():
+                table = "object_" + self._object_type_map[ot]
+                if table not in self._tables:
+                    continue
+                declared_types = self._declared_types(table)
+                query, params = self._objects_query(ot)
+                for df in self._read_chunks(conn, query, params):
+                    df = _apply_declared_types(df, declared_types)
+                    df = df.rename(columns={"ocel_id": object_id, "ocel_time": event_timestamp,
+                                            "ocel_changed_field": changed_field})
+                    df[object_type] = ot
+                    if len(df) > 0:
+                        yield df
+        finally:
+            conn.close()
+
+    def _read_relations(self, conn, events: pd.DataFrame) -> pd.DataFrame:
+        event_id = exec_utils.get_param_value(Parameters.EVENT_ID, self.parameters, constants.DEFAULT_EVENT_ID)
+        event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, self.parameters,
+                                                    constants.DEFAULT_EVENT_ACTIVITY)
+        event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, self.parameters,
+                                                     constants.DEFAULT_EVENT_TIMESTAMP)
+        object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, self.parameters, constants.DEFAULT_OBJECT_ID)
+        object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, self.parameters,
+                                                 constants.DEFAULT_OBJECT_TYPE)
+        qualifier_field = exec_utils.get_param_value(Parameters.QUALIFIER, self.parameters,
+                                                     constants.DEFAULT_QUALIFIER)
+
+        conditions = []
+        params = []
+        activities = self.get_activities()
+        object_types = self.get_object_types()
+        if self.activities is not None:
+            conditions.append("eo.ocel_event_id IN (SELECT ocel_id FROM event WHERE ocel_type IN (" +
+                              self._placeholders(activities) + "))")
+            params.extend(activities)
+        if self.object_types is not None:
+            conditions.append("o.ocel_type IN (" + self._placeholders(object_types) + ")")
+            params.extend(object_types)
+        query = "SELECT eo.ocel_event_id, eo.ocel_object_id, eo.ocel_qualifier, o.ocel_type FROM event_object eo " \
+                "JOIN object o ON o.ocel_id = eo.ocel_object_id"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY eo.rowid"
+
+        events_activity = events.set_index(event_id)[event_activity]
+        events_timestamp = events.set_index(event_id)[event_timestamp]
+
+        chunks = []
+        for df in self._read_chunks(conn, query, params):
+            df = df.rename(columns={"ocel_event_id": event_id, "ocel_object_id": object_id,
+                                    "ocel_qualifier": qualifier_field, "ocel_type": object_type})
+            # the relations to the events excluded by the filter on the timestamps are removed
+            df = df[df[event_id].isin(events_activity.index)]
+            df[event_activity] = df[event_id].map(events_activity)
+            df[event_timestamp] = df[event_id].map(events_timestamp)
+            chunks.append(df[[event_id, object_id, qualifier_field, event_activity, event_timestamp, object_type]])
+        if not chunks:
+            return pd.DataFrame({event_id: [], object_id: [], qualifier_field: [], event_activity: [],
+                                 event_timestamp: pd.Series([], dtype=events[event_timestamp].dtype),
+                                 object_type: []})
+        return pandas_utils.concat(chunks).reset_index(drop=True)
+
+    def _read_o2o(self, conn) -> Optional[pd.DataFrame]:
+        object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, self.parameters, constants.DEFAULT_OBJECT_ID)
+        qualifier_field = exec_utils.get_param_value(Parameters.QUALIFIER, self.parameters,
+                                                     constants.DEFAULT_QUALIFIER)
+
+        query = "SELECT ocel_source_id, ocel_target_id, ocel_qualifier FROM object_object"
+        params = []
+        if self.object_types is not None:
+            object_types = self.get_object_types()
+            query += " WHERE ocel_source_id IN (SELECT ocel_id FROM object WHERE ocel_type IN (" + self._placeholders(
+                object_types) + ")) AND ocel_target_id IN (SELECT ocel_id FROM object WHERE ocel_type IN (" + \
+                     self._placeholders(object_types) + ")) ORDER BY rowid"
+            params = object_types + object_types
+
+        chunks = list(self._read_chunks(conn, query, params))
+        O2O = pandas_utils.concat(chunks) if chunks else pd.DataFrame()
+        if len(O2O) == 0:
+            return None
+        return O2O.rename(columns={"ocel_source_id": object_id, "ocel_target_id": object_id + "_2",
+                                   "ocel_qualifier": qualifier_field}).reset_index(drop=True)
+
+    def materialize(self) -> OCEL:
+        """
+        Materializes the slice of the database selected by the handle as an OCEL
+
+        Returns
+        ----------------
+        ocel
+            Object-centric event log
+        """
+        event_id = exec_utils.get_param_value(Parameters.EVENT_ID, self.parameters, constants.DEFAULT_EVENT_ID)
+        event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, self.parameters,
+                                                    constants.DEFAULT_EVENT_ACTIVITY)
+        event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, self.parameters,
+                                                     constants.DEFAULT_EVENT_TIMESTAMP)
+        object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, self.parameters, constants.DEFAULT_OBJECT_ID)
+        object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, self.parameters,
+                                                 constants.DEFAULT_OBJECT_TYPE)
+        internal_index = exec_utils.get_param_value(Parameters.INTERNAL_INDEX, self.parameters,
+                                                    constants.DEFAULT_INTERNAL_INDEX)
+        changed_field = exec_utils.get_param_value(Parameters.CHANGED_FIELD, self.parameters,
+                                                   constants.DEFAULT_CHNGD_FIELD)
+        cumcount_field = exec_utils.get_param_value(Parameters.CUMCOUNT, self.parameters, "@@cumcount")
+        qualifier_field = exec_utils.get_param_value(Parameters.QUALIFIER, self.parameters,
+                                                     constants.DEFAULT_QUALIFIER)
+
+        events = list(self.iterate_events())
+        events = pandas_utils.concat(events).reset_index(drop=True) if events else pd.DataFrame()
+        object_types_coll = list(self.iterate_objects())
+        object_types_coll = pandas_utils.concat(object_types_coll).reset_index(
+            drop=True) if object_types_coll else pd.DataFrame()
+        # the attributes of the tables that are not read are kept as empty columns
+        rename = {"ocel_id": event_id, "ocel_time": event_timestamp}
+        events = events.reindex(columns=[rename.get(c, c) for c in self._all_columns(
+            "event_", self._event_type_map, self.event_attributes, ["ocel_id", "ocel_time"])] + [event_activity])
+        rename = {"ocel_id": object_id, "ocel_time": event_timestamp, "ocel_changed_field": changed_field}
+        object_types_coll = object_types_coll.reindex(columns=[rename.get(c, c) for c in self._all_columns(
+            "object_", self._object_type_map, self.object_attributes,
+            ["ocel_id", "ocel_time", "ocel_changed_field"])] + [object_type])
+
+        conn = self._connect()
+        try:
+            E2O = self._read_relations(conn, events) if len(events) > 0 else None
+            O2O = self._read_o2o(conn)
+        finally:
+            conn.close()
+
+        if E2O is None or len(events) == 0 or len(object_types_coll) == 0:
+            # empty slice: the attribute columns are kept, as in the OCEL imported without filters
+            events = events.iloc[0:0].copy()
+            events[event_timestamp] = pd.to_datetime(events[event_timestamp], utc=True)
+            relations = pd.DataFrame({event_id: [], object_id: [], qualifier_field: [], event_activity: [],
+                                      event_timestamp: pd.Series([], dtype=events[event_timestamp].dtype),
+                                      object_type: []})
+            object_changes = object_types_coll.iloc[0:0].copy()
+            object_changes[event_timestamp] = pd.to_datetime(object_changes[event_timestamp], utc=True)
+            object_changes[cumcount_field] = []
+            objects = object_types_coll.iloc[0:0].drop(columns=[changed_field, event_timestamp])
+            return OCEL(events=events, objects=objects, relations=relations, object_changes=object_changes,
+                        parameters=self.parameters)
+
+        object_types_coll[cumcount_field] = object_types_coll.groupby(object_id).cumcount()
+
+        if changed_field in object_types_coll:
+            objects = object_types_coll[object_types_coll[changed_field].isna()]
+            object_changes = object_types_coll[~object_types_coll[changed_field].isna()]
+            if len(objects) == 0:
+                objects = object_types_coll[object_types_coll[cumcount_field] == 0]
+                object_changes = object_types_coll[object_types_coll[cumcount_field] > 0]
+            if len(object_changes) == 0:
+                object_changes = None
+            del objects[changed_field]
+        else:
+            objects = object_types_coll
+            object_changes = None
+
+        if event_timestamp in objects:
+            del objects[event_timestamp]
+        del objects[cumcount_field]
+
+        events[internal_index] = events.index
+        E2O[internal_index] = E2O.index
+        events = events.sort_values([event_timestamp, internal_index])
+        E2O = E2O.sort_values([event_timestamp, internal_index])
+        del events[internal_index]
+        del E2O[internal_index]
+
+        if object_changes is not None:
+            object_changes = dataframe_utils.convert_timestamp_columns_in_df(object_changes,
+                                                                               timest_format=pm4_constants.DEFAULT_TIMESTAMP_PARSE_FORMAT,
+                                                                               timest_columns=[event_timestamp])
+            object_changes[internal_index] = object_changes.index
+            object_changes = object_changes.sort_values([event_timestamp, internal_index])
+            del object_changes[internal_index]
+
+        ocel = OCEL(events=events, objects=objects, relations=E2O, object_changes=object_changes, o2o=O2O,
+                    parameters=self.parameters)
+        ocel = ocel_consistency.apply(ocel, parameters=self.parameters)
+        ocel = filtering_utils.propagate_relations_filtering(ocel, parameters=self.parameters)
+
+        return ocel
+
+
+def open_lazy(file_path: str, parameters: Optional[Dict[Any, Any]] = None) -> LazyOCEL:
+    """
+    Opens a lazy handle on an OCEL 2.0 SQLite database, without reading the events and the objects
+
+    Parameters
+    ----------------
+    file_path
+        Path to the SQLite database
+    parameters
+        Parameters of the importer, including:
+        - Parameters.OBJECT_TYPES => object types to keep (default: all)
+        - Parameters.ACTIVITIES => activities to keep (default: all)
+        - Parameters.MIN_TIMESTAMP => left extreme of the allowed timestamp interval (default: none)
+        - Parameters.MAX_TIMESTAMP => right extreme of the allowed timestamp interval (default: none)
+        - Parameters.EVENT_ATTRIBUTES => event attributes to keep (default: all)
+        - Parameters.OBJECT_ATTRIBUTES => object attributes to keep (default: all)
+        - Parameters.CHUNK_SIZE => number of rows read at once from the database (default: 100000)
+        - Parameters.VALIDATION => validates the database against the OCEL 2.0 constraints (default: False, as it
+        requires to read the full database)
+        - Parameters.EXCEPT_IF_INVALID => raises an exception if the validation fails
+
+    Returns
+    ----------------
+    lazy_ocel
+        Lazy handle on the database
+    """
+    if parameters is None:
+        parameters = {}
+
+    validation = exec_utils.get_param_value(Parameters.VALIDATION, parameters, False)
+    except_if_invalid = exec_utils.get_param_value(Parameters.EXCEPT_IF_INVALID, parameters, False)
+
+    if validation:
+        satisfied, unsatisfied = ocel20_rel_validation.apply(file_path)
+        if unsatisfied:
+            if pm4_constants.SHOW_INTERNAL_WARNINGS:
+                warnings.warn("There are unsatisfied OCEL 2.0 constraints in the given relational database: "+str(unsatisfied))
+
+            if except_if_invalid:
+                raise Exception("OCEL 2.0 validation failed.")
+
+    return LazyOCEL(file_path, parameters=parameters)
+
+
+def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None) -> OCEL:
+    """
+    Imports the slice of an OCEL 2.0 SQLite database selected by the filters provided in the parameters
+    (see open_lazy), pushing the filters into the SQL queries
+
+    Parameters
+    ----------------
+    file_path
+        Path to the SQLite database
+    parameters
+        Parameters of the importer (see open_lazy)
+
+    Returns
+    ----------------
+    ocel
+        Object-centric event log
+    """
+    return open_lazy(file_path, parameters=parameters).materialize()
@@ -0,0 +1,213 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from enum import Enum
+from typing import Optional, Dict, Any
+
+from lxml import etree
+
+from pm4py.objects.ocel import constants
+from pm4py.objects.ocel.importer.xmlocel.variants.ocel20 import parse_xml, embed_date_parser
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util import ocel_consistency
+from pm4py.objects.ocel.util.columnar_buffer import ColumnarBuffer, DEFAULT_BATCH_SIZE
+from pm4py.util import exec_utils, dt_parsing
+
+
+class Parameters(Enum):
+    EVENT_ID = constants.PARAM_EVENT_ID
+    EVENT_ACTIVITY = constants.PARAM_EVENT_ACTIVITY
+    EVENT_TIMESTAMP = constants.PARAM_EVENT_TIMESTAMP
+    OBJECT_ID = constants.PARAM_OBJECT_ID
+    OBJECT_TYPE = constants.PARAM_OBJECT_TYPE
+    INTERNAL_INDEX = constants.PARAM_INTERNAL_INDEX
+    QUALIFIER = constants.PARAM_QUALIFIER
+    CHANGED_FIELD = constants.PARAM_CHNGD_FIELD
+    ENCODING = "encoding"
+    BATCH_SIZE = "batch_size"
+
+
+def __read_type_attributes(element) -> Dict[str, str]:
+    attributes = {}
+    for child in element:
+        for attribute in child:
+            attributes[attribute.get("name")] = attribute.get("type")
+    return attributes
+
+
+def apply(file_path: str, parameters: Optional[Dict[Any, Any]] = None) -> OCEL:
+    """
+    Imports an OCEL from a XML-OCEL 2 file, incrementally.
+
+    The document is parsed with an event-driven (iterparse) reader: every object and event is converted and appended
+    to columnar buffers (converted to dataframes in batches) and then removed from the tree, so the whole XML
+    tree is never kept in memory. The resulting OCEL is equivalent to the one of the OCEL20 variant.
+
+    Parameters
+    --------------
+    file_path
+        Path to the object-centric event log
+    parameters
+        Possible parameters of the method, including:
+        - Parameters.EVENT_ID
+        - Parameters.EVENT_ACTIVITY
+        - Parameters.EVENT_TIMESTAMP
+        - Parameters.OBJECT_ID
+        - Parameters.OBJECT_TYPE
+        - Parameters.INTERNAL_INDEX
+        - Parameters.QUALIFIER
+        - Parameters.CHANGED_FIELD
+        - Parameters.ENCODING
+        - Parameters.BATCH_SIZE => number of rows converted to a dataframe at once (default: 100000)
+
+    Returns
+    -------------
+    ocel
+        Object-centric event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, None)
+    event_id_column = exec_utils.get_param_value(Parameters.EVENT_ID, parameters, constants.DEFAULT_EVENT_ID)
+    event_activity_column = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters, constants.DEFAULT_EVENT_ACTIVITY)
+    event_timestamp_column = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters,
+                                                        constants.DEFAULT_EVENT_TIMESTAMP)
+    object_id_column = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, constants.DEFAULT_OBJECT_ID)
+    object_type_column = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, constants.DEFAULT_OBJECT_TYPE)
+    internal_index_column = exec_utils.get_param_value(Parameters.INTERNAL_INDEX, parameters, constants.DEFAULT_INTERNAL_INDEX)
+    qualifier_field = exec_utils.get_param_value(Parameters.QUALIFIER, parameters, constants.DEFAULT_QUALIFIER)
+    changed_field = exec_utils.get_param_value(Parameters.CHANGED_FIELD, parameters, constants.DEFAULT_CHNGD_FIELD)
+    batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, DEFAULT_BATCH_SIZE)
+
+    date_parser = dt_parsing.parser.get()
+
+    events = ColumnarBuffer(batch_size)
+    objects = ColumnarBuffer(batch_size)
+    relations = ColumnarBuffer(batch_size)
+    o2o = ColumnarBuffer(batch_size)
+    object_changes = ColumnarBuffer(batch_size)
+
+    object_type_attributes = {}
+    event_type_attributes = {}
+
+    F = open(file_path, "rb")
+    context = etree.iterparse(F, events=("end",), remove_comments=True, encoding=encoding, huge_tree=True)
+
+    root = None
+    for _, element in context:
+        if root is None:
+            root = element.getroottree().getroot()
+        parent = element.getparent()
+        if parent is None or parent.getparent() is not root:
+            # only the children of the sections (object types, event types, objects, events) are processed
+            continue
+
+        section = parent.tag
+
+        if section.endswith("object-types"):
+            object_type_attributes[element.get("name")] = __read_type_attributes(element)
+        elif section.endswith("event-types"):
+            event_type_attributes[element.get("name")] = __read_type_attributes(element)
+        elif section.endswith("objects"):
+            object_id = element.get("id")
+            object_type = element.get("type")
+            obj_dict = {object_id_column: object_id, object_type_column: object_type}
+            this_type_attributes = object_type_attributes.get(object_type, {})
+
+            for child in element:
+                if child.tag.endswith("objects"):
+                    for target_object in child:
+                        o2o.append({object_id_column: object_id, object_id_column + "_2": target_object.get("object-id"),
+                                    qualifier_field: target_object.get("qualifier")})
+                elif child.tag.endswith("attributes"):
+                    for attribute in child:
+                        attribute_name = attribute.get("name")
+                        attribute_time = attribute.get("time")
+                        attribute_text = parse_xml(attribute.text, this_type_attributes.get(attribute_name, "string"),
+                                                   date_parser)
+                        if attribute_time == "0" or attribute_time.startswith("1970-01-01T00:00:00"):
+                            obj_dict[attribute_name] = attribute_text
+                        else:
+                            object_changes.append({object_id_column: object_id, object_type_column: object_type,
+                                                   attribute_name: attribute_text, changed_field: attribute_name,
+                                                   event_timestamp_column: embed_date_parser(date_parser.apply,
+                                                                                             attribute_time)})
+
+            objects.append(obj_dict)
+        elif section.endswith("events"):
+            event_id = element.get("id")
+            event_type = element.get("type")
+            event_time = embed_date_parser(date_parser.apply, element.get("time"))
+            ev_dict = {event_id_column: event_id, event_activity_column: event_type, event_timestamp_column: event_time}
+            this_type_attributes = event_type_attributes.get(event_type, {})
+
+            for child in element:
+                if child.tag.endswith("objects"):
+                    for target_object in child:
+                        relations.append({event_id_column: event_id, event_activity_column: event_type,
+                                          event_timestamp_column: event_time,
+                                          object_id_column: target_object.get("object-id"),
+                                          qualifier_field: target_object.get("qualifier")})
+                elif child.tag.endswith("attributes"):
+                    for attribute in child:
+                        attribute_name = attribute.get("name")
+                        ev_dict[attribute_name] = parse_xml(attribute.text,
+                                                            this_type_attributes.get(attribute_name, "string"),
+                                                            date_parser)
+
+            events.append(ev_dict)
+
+        # frees the memory of the processed elements
+        element.clear()
+        while element.getprevious() is not None:
+            del parent[0]
+
+    F.close()
+    del context
+
+    events = events.to_dataframe(columns=[event_id_column, event_activity_column, event_timestamp_column])
+    objects = objects.to_dataframe(columns=[object_id_column, object_type_column])
+    relations = relations.to_dataframe(columns=[event_id_column, event_activity_column, event_timestamp_column,
+                                                object_id_column, qualifier_field])
+    o2o = o2o.to_dataframe()
+    object_changes = object_changes.to_dataframe()
+
+    # the type of the related objects is resolved at the end (only the relations to existing objects are kept)
+    obj_types = objects.drop_duplicates(object_id_column).set_index(object_id_column)[object_type_column]
+    relations.insert(4, object_type_column, relations[object_id_column].map(obj_types))
+    relations = relations.dropna(subset=[object_type_column]).reset_index(drop=True)
+
+    events[internal_index_column] = events.index
+    relations[internal_index_column] = relations.index
+
+    events = events.sort_values([event_timestamp_column, internal_index_column])
+    relations = relations.sort_values([event_timestamp_column, internal_index_column])
+
+    del events[internal_index_column]
+    del relations[internal_index_column]
+
+    ocel = OCEL(events=events, objects=objects, relations=relations, globals={}, o2o=o2o, object_changes=object_changes, parameters=parameters)
+    ocel = ocel_consistency.apply(ocel, parameters=parameters)
+    ocel = filtering_utils.propagate_relations_filtering(ocel)
+
+    return ocel
@@ -39,6 +39,9 @@ class Parameters(Enum):
 
 
 class OCEL(object):
+    # replacing one of these dataframes invalidates the index of the relationships
+    _INDEXED_FRAMES = ("events", "objects", "relations")
+
     def __init__(self, events=None, objects=None, relations=None, globals=None, parameters=None, o2o=None, e2e=None, object_changes=None):
         if parameters is None:
             parameters = {}
@@ -84,6 +87,45 @@ class OCEL(object):
         self.object_changes = object_changes
 
         self.parameters = parameters
+        self._index = None
+
+    def __setattr__(self, name, value):
+        if name in OCEL._INDEXED_FRAMES:
+            self.__dict__["_index"] = None
+        object.__setattr__(self, name, value)
+
+    def get_index(self):
+        """
+        Gets the index of the relationships between the events and the objects (see OCELIndex), building it
+        if needed. The index is kept until one of the events, objects or relations dataframes is replaced.
+        If these dataframes are modified in-place, invalidate_index() should be called.
+        """
+        if not self.has_index():
+            from pm4py.objects.ocel.util.ocel_index import OCELIndex
+            index = OCELIndex(self.events, self.objects, self.relations, self.event_id_column,
+                              self.object_id_column, self.object_type_column, self.event_timestamp)
+            self.__dict__["_index"] = index
+            self.__dict__["_index_sizes"] = self.__frame_sizes()
+        return self._index
+
+    def has_index(self) -> bool:
+        """
+        Checks if the index of the relationships has been built (and is still valid)
+        """
+        index = self.__dict__.get("_index", None)
+        if index is not None and self.__dict__.get("_index_sizes", None) != self.__frame_sizes():
+            self.invalidate_index()
+            return False
+        return index is not None
+
+    def invalidate_index(self):
+        """
+        Removes the index of the relationships
+        """
+        self.__dict__["_index"] = None
+
+    def __frame_sizes(self):
+        return len(self.events), len(self.objects), len(self.relations)
 
     def get_extended_table(self, ot_prefix=constants.DEFAULT_OBJECT_TYPE_PREFIX_EXTENDED) -> pd.DataFrame:
         """
@@ -93,9 +135,12 @@ class OCEL(object):
         object_types = pandas_utils.format_unique(self.relations[self.object_type_column].unique())
         table = self.events.copy().set_index(self.event_id_column)
         for ot in object_types:
-            table[ot_prefix + ot] = \
-                self.relations[self.relations[self.object_type_column] == ot].groupby(self.event_id_column)[
-                    self.object_id_column].agg(list)
+            if self.has_index():
+                related_objects = pd.Series(self.get_index().related_objects_per_event(object_type=ot), dtype=object)
+            else:
+                related_objects = self.relations[self.relations[self.object_type_column] == ot].groupby(
+                    self.event_id_column)[self.object_id_column].agg(list)
+            table[ot_prefix + ot] = related_objects
         table = table.reset_index()
         return table
 
@@ -143,7 +188,11 @@ class OCEL(object):
         return str(self.get_summary())
 
     def __copy__(self):
-        return OCEL(self.events, self.objects, self.relations, copy(self.globals), copy(self.parameters), copy(self.o2o), copy(self.e2e), copy(self.object_changes))
+        ocel = OCEL(self.events, self.objects, self.relations, copy(self.globals), copy(self.parameters), copy(self.o2o), copy(self.e2e), copy(self.object_changes))
+        # the dataframes are shared, so the index is still valid
+        ocel.__dict__["_index"] = self.__dict__.get("_index", None)
+        ocel.__dict__["_index_sizes"] = self.__dict__.get("_index_sizes", None)
+        return ocel
 
     def __deepcopy__(self, memo):
         return OCEL(self.events.copy(), self.objects.copy(), self.relations.copy(), deepcopy(self.globals),
@@ -51,3 +51,27 @@ def get(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
                     ots[k][x] = ots2[k][x]
 
     return ets, ots
+
+
+def get_standard_type(dtype: str) -> str:
+    """
+    Maps the dtype of a column to the attribute type of the OCEL 2.0 standard (string, date or float)
+    """
+    if "date" in dtype or "time" in dtype:
+        return "date"
+    elif "float" in dtype or "double" in dtype:
+        return "float"
+    return "string"
+
+
+def get_standard(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Gets the attributes of every event type and object type, along with their OCEL 2.0 standard type
+    (string, date or float)
+    """
+    ets, ots = get(ocel, parameters=parameters)
+
+    ets = {et: {k: get_standard_type(v) for k, v in atts.items()} for et, atts in ets.items()}
+    ots = {ot: {k: get_standard_type(v) for k, v in atts.items()} for ot, atts in ots.items()}
+
+    return ets, ots
@@ -0,0 +1,102 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from typing import Optional, Dict, Any, List
+
+import pandas as pd
+
+from pm4py.util import pandas_utils
+
+
+DEFAULT_BATCH_SIZE = 100000
+
+
+class ColumnarBuffer(object):
+    """
+    Accumulates rows (dictionaries) in per-column lists and converts them to a dataframe every batch_size rows,
+    so that the Python objects of at most one batch are alive at the same time (used by the incremental importers)
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.columns: Dict[str, List[Any]] = {}
+        self.num_rows = 0
+        self.frames: List[pd.DataFrame] = []
+        self.total_rows = 0
+
+    def append(self, row: Dict[str, Any]):
+        """
+        Appends a row to the buffer (the columns not specified in the row are left empty)
+        """
+        num_rows = self.num_rows
+        for k, v in row.items():
+            col = self.columns.get(k, None)
+            if col is None:
+                col = [None] * num_rows
+                self.columns[k] = col
+            col.append(v)
+        num_rows += 1
+        if len(row) < len(self.columns):
+            for col in self.columns.values():
+                if len(col) < num_rows:
+                    col.append(None)
+        self.num_rows = num_rows
+        self.total_rows += 1
+
+        if num_rows >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Converts the rows in the buffer to a dataframe
+        """
+        if self.num_rows > 0:
+            # the columns without values in the batch are omitted, otherwise their dtype (object)
+            # would override the one of the other batches in the concatenation
+            self.frames.append(pandas_utils.instantiate_dataframe(
+                {k: v for k, v in self.columns.items() if any(x is not None for x in v)}, index=range(self.num_rows)))
+        self.columns = {k: [] for k in self.columns}
+        self.num_rows = 0
+
+    def __len__(self):
+        return self.total_rows
+
+    def to_dataframe(self, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Returns the dataframe containing all the rows appended to the buffer, or None if the buffer is empty
+        (or an empty dataframe with the provided columns)
+        """
+        column_names = list(self.columns)
+        self.flush()
+        if not self.frames:
+            return pandas_utils.instantiate_dataframe(columns=columns) if columns is not None else None
+        if len(self.frames) == 1:
+            dataframe = self.frames[0]
+        else:
+            dataframe = pd.concat(self.frames, ignore_index=True)
+        self.frames = []
+        if list(dataframe.columns) != column_names:
+            # the columns without any value are kept (as columns of None), in their order of appearance
+            for col in column_names:
+                if col not in dataframe.columns:
+                    dataframe[col] = None
+            dataframe = dataframe[column_names]
+        return dataframe
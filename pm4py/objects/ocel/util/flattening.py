@@ -20,8 +20,9 @@ Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple, Collection
 
+import numpy as np
 import pandas as pd
 
 from pm4py.objects.ocel import constants as ocel_constants
@@ -33,6 +34,7 @@ from pm4py.util import exec_utils
 class Parameters(Enum):
     EVENT_ACTIVITY = ocel_constants.PARAM_EVENT_ACTIVITY
     EVENT_TIMESTAMP = ocel_constants.PARAM_EVENT_TIMESTAMP
+    CATEGORICAL = "categorical"
 
 
 def flatten(ocel: OCEL, ot: str, parameters: Optional[Dict[Any, Any]] = None) -> pd.DataFrame:
@@ -69,8 +71,12 @@ def flatten(ocel: OCEL, ot: str, parameters: Optional[Dict[Any, Any]] = None) ->
     objects = objects.rename(columns={ocel.object_id_column: xes_constants.DEFAULT_TRACEID_KEY})
     objects = objects.rename(columns={x: constants.CASE_ATTRIBUTE_PREFIX + x for x in objects.columns})
 
-    relations = ocel.relations[ocel.relations[ocel.object_type_column] == ot][
-        [ocel.object_id_column, ocel.event_id_column]]
+    if ocel.has_index():
+        relations = ocel.relations.iloc[ocel.get_index().relations_per_type.get(ot, [])][
+            [ocel.object_id_column, ocel.event_id_column]]
+    else:
+        relations = ocel.relations[ocel.relations[ocel.object_type_column] == ot][
+            [ocel.object_id_column, ocel.event_id_column]]
     relations = relations.rename(columns={ocel.object_id_column: constants.CASE_CONCEPT_NAME})
 
     objects = objects.merge(relations, on=constants.CASE_CONCEPT_NAME)
@@ -79,3 +85,159 @@ def flatten(ocel: OCEL, ot: str, parameters: Optional[Dict[Any, Any]] = None) ->
         columns={event_activity: xes_constants.DEFAULT_NAME_KEY, event_timestamp: xes_constants.DEFAULT_TIMESTAMP_KEY})
 
     return events
+
+
+def __prepare_all_types(ocel: OCEL, object_types: Optional[Collection[str]]):
+    """
+    Encodes the relations of the OCEL once, for the flattening on all the object types.
+
+    Returns the positions of the events and of the objects of the relations, sorted by object type and then as in
+    flatten (position of the event, position of the object, position of the relation), and the boundaries of the
+    rows of every object type.
+    """
+    event_positions = pd.Index(ocel.events[ocel.event_id_column].to_numpy()).get_indexer(
+        ocel.relations[ocel.event_id_column].to_numpy())
+    objects_index = pd.Index(ocel.objects[ocel.object_id_column].to_numpy())
+    if not objects_index.is_unique:
+        objects_index = objects_index.drop_duplicates()
+    object_positions = objects_index.get_indexer(ocel.relations[ocel.object_id_column].to_numpy())
+
+    # as in flatten, the object type of the relation should match the one of the objects table
+    relation_types = ocel.relations[ocel.object_type_column].to_numpy()
+    keep = (event_positions >= 0) & (object_positions >= 0)
+    keep[keep] = relation_types[keep] == ocel.objects[ocel.object_type_column].to_numpy()[object_positions[keep]]
+
+    type_codes, types = pd.factorize(relation_types)
+    types = list(types)
+    if object_types is None:
+        object_types = types
+    else:
+        object_types = list(object_types)
+        type_position = {ot: i for i, ot in enumerate(object_types)}
+        # the codes follow the order of the requested object types
+        remap = np.array([type_position.get(ot, -1) for ot in types] + [-1], dtype=np.int64)
+        type_codes = remap[type_codes]
+        keep &= type_codes >= 0
+
+    rows = np.nonzero(keep)[0]
+    order = np.lexsort((rows, object_positions[rows], event_positions[rows], type_codes[rows]))
+    rows = rows[order]
+    boundaries = np.searchsorted(type_codes[rows], np.arange(len(object_types) + 1))
+
+    return object_types, event_positions[rows], object_positions[rows], boundaries
+
+
+def __build_flattened(ocel: OCEL, event_positions: np.ndarray, object_positions: np.ndarray, event_activity: str,
+                      event_timestamp: str) -> pd.DataFrame:
+    """
+    Builds the flattened dataframe (with the same columns as flatten) given the positions of the events and of
+    the objects
+    """
+    events = ocel.events.iloc[event_positions].reset_index(drop=True).rename(
+        columns={event_activity: xes_constants.DEFAULT_NAME_KEY, event_timestamp: xes_constants.DEFAULT_TIMESTAMP_KEY})
+    objects = ocel.objects.iloc[object_positions].reset_index(drop=True)
+    objects = objects.rename(columns={ocel.object_id_column: xes_constants.DEFAULT_TRACEID_KEY})
+    objects = objects.rename(columns={x: constants.CASE_ATTRIBUTE_PREFIX + x for x in objects.columns})
+    return pd.concat([events, objects], axis=1)
+
+
+def iterate_flattened(ocel: OCEL, object_types: Optional[Collection[str]] = None,
+                      parameters: Optional[Dict[Any, Any]] = None) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Flattens the object-centric event log on all the object types (or on the given object types).
+    The relations are encoded and sorted once, and the flattened logs are yielded one at a time, so only one
+    flattened log needs to be in memory at once.
+
+    Parameters
+    -------------------
+    ocel
+        Object-centric event log
+    object_types
+        Object types (in the order in which they should be yielded). If None, all the object types of the relations.
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.EVENT_ACTIVITY
+        - Parameters.EVENT_TIMESTAMP
+        - Parameters.CATEGORICAL => stores the activity and the object type as categorical columns (default: False)
+
+    Returns
+    ------------------
+    iterator
+        Iterator of couples (object type, flattened log), where the flattened log is equal to the one of flatten
+    """
+    if parameters is None:
+        parameters = {}
+
+    event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters,
+                                                ocel.event_activity)
+    event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters,
+                                                 ocel.event_timestamp)
+    categorical = exec_utils.get_param_value(Parameters.CATEGORICAL, parameters, False)
+
+    object_types, event_positions, object_positions, boundaries = __prepare_all_types(ocel, object_types)
+
+    for i, ot in enumerate(object_types):
+        flattened = __build_flattened(ocel, event_positions[boundaries[i]:boundaries[i + 1]],
+                                      object_positions[boundaries[i]:boundaries[i + 1]], event_activity,
+                                      event_timestamp)
+        if categorical:
+            for col in [xes_constants.DEFAULT_NAME_KEY, constants.CASE_ATTRIBUTE_PREFIX + ocel.object_type_column]:
+                flattened[col] = flattened[col].astype("category")
+        yield ot, flattened
+
+
+def flatten_all(ocel: OCEL, object_types: Optional[Collection[str]] = None,
+                parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Flattens the object-centric event log on all the object types (or on the given object types), encoding
+    and sorting the relations only once (see iterate_flattened).
+
+    Returns
+    ------------------
+    flattened_logs
+        Dictionary associating each object type to its flattened log
+    """
+    return {ot: flattened for ot, flattened in iterate_flattened(ocel, object_types, parameters=parameters)}
+
+
+def flatten_long(ocel: OCEL, object_types: Optional[Collection[str]] = None,
+                 parameters: Optional[Dict[Any, Any]] = None) -> pd.DataFrame:
+    """
+    Flattens the object-centric event log on all the object types (or on the given object types) into a single
+    long table, partitioned by object type. The rows of every object type are contiguous and equal to the
+    flattened log of the object type; the column case:ocel:type (categorical, as the activity) identifies the
+    partition.
+
+    Parameters
+    -------------------
+    ocel
+        Object-centric event log
+    object_types
+        Object types (in the order of the partitions). If None, all the object types of the relations.
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.EVENT_ACTIVITY
+        - Parameters.EVENT_TIMESTAMP
+        - Parameters.CATEGORICAL => stores the activity and the object type as categorical columns (default: True)
+
+    Returns
+    ------------------
+    dataframe
+        Long table containing the flattened logs of all the object types
+    """
+    if parameters is None:
+        parameters = {}
+
+    event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters,
+                                                ocel.event_activity)
+    event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters,
+                                                 ocel.event_timestamp)
+    categorical = exec_utils.get_param_value(Parameters.CATEGORICAL, parameters, True)
+
+    object_types, event_positions, object_positions, boundaries = __prepare_all_types(ocel, object_types)
+    flattened = __build_flattened(ocel, event_positions, object_positions, event_activity, event_timestamp)
+    if categorical:
+        flattened[xes_constants.DEFAULT_NAME_KEY] = flattened[xes_constants.DEFAULT_NAME_KEY].astype("category")
+        flattened[constants.CASE_ATTRIBUTE_PREFIX + ocel.object_type_column] = pd.Categorical(
+            flattened[constants.CASE_ATTRIBUTE_PREFIX + ocel.object_type_column], categories=object_types)
+    return flattened
@@ -0,0 +1,196 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _csr_pointers(keys: np.ndarray, num_keys: int) -> np.ndarray:
+    """
+    Builds the pointers of a CSR structure, whose entries are sorted by key
+    """
+    counts = np.bincount(keys, minlength=num_keys)
+    indptr = np.zeros(num_keys + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return indptr
+
+
+class OCELIndex(object):
+    """
+    Index on the relationships of an object-centric event log, built once from the dataframes of the OCEL
+    (see OCEL.get_index()):
+
+    - the events and the objects are encoded as integers (event_ids, object_ids); the objects/events that appear
+      only in the relations are appended after the ones of the events/objects tables;
+    - CSR adjacency event -> objects (e2o_indptr, e2o_objects, e2o_relations), keeping the order of the relations;
+    - CSR adjacency object -> events (o2e_indptr, o2e_events, o2e_relations), where the events of every object are
+      sorted by timestamp (and then by position in the events table);
+    - partition of the objects (objects_per_type) and of the relations (relations_per_type) by object type.
+
+    The *_relations arrays contain the positions of the rows in the relations dataframe.
+    """
+
+    def __init__(self, events: pd.DataFrame, objects: pd.DataFrame, relations: pd.DataFrame, event_id: str,
+                 object_id: str, object_type: str, event_timestamp: str):
+        rel_events, event_ids = self.__encode(events[event_id], relations[event_id])
+        rel_objects, object_ids = self.__encode(objects[object_id], relations[object_id])
+        # if the identifiers of the events are unique, the code of an event of the events table is its position
+        self.unique_event_ids = len(event_ids) >= len(events) and events[event_id].is_unique
+        self.event_ids = event_ids
+        self.object_ids = object_ids
+        self.event_index = pd.Index(event_ids)
+        self.object_index = pd.Index(object_ids)
+
+        # object type of every object (from the objects table, or from the relations)
+        types = pd.Series(np.asarray(objects[object_type], dtype=object), index=objects[object_id].to_numpy())
+        types = types[~types.index.duplicated()]
+        rel_types = pd.Series(np.asarray(relations[object_type], dtype=object), index=relations[object_id].to_numpy())
+        rel_types = rel_types[~rel_types.index.duplicated()]
+        types = types.reindex(object_ids)
+        missing = types.isna().to_numpy()
+        if missing.any():
+            types[missing] = rel_types.reindex(object_ids[missing]).to_numpy()
+        type_codes, object_types = pd.factorize(types)
+        self.object_types = np.asarray(object_types, dtype=object)
+        self.object_type_codes = type_codes
+        self.object_type_index = {ot: i for i, ot in enumerate(self.object_types)}
+        self.objects_per_type = {ot: np.nonzero(type_codes == i)[0] for i, ot in enumerate(self.object_types)}
+        rel_type_codes, rel_object_types = pd.factorize(relations[object_type])
+        self.relations_per_type = {ot: np.nonzero(rel_type_codes == i)[0] for i, ot in enumerate(rel_object_types)}
+
+        num_events = len(event_ids)
+        num_objects = len(object_ids)
+        positions = np.arange(len(relations), dtype=np.int64)
+
+        # event -> objects (stable: the order of the relations is kept)
+        order = np.argsort(rel_events, kind="stable")
+        self.e2o_indptr = _csr_pointers(rel_events, num_events)
+        self.e2o_objects = rel_objects[order]
+        self.e2o_relations = positions[order]
+
+        # object -> events, sorted by timestamp and position of the event
+        if event_timestamp in relations.columns:
+            timestamps = relations[event_timestamp].to_numpy()
+        else:
+            timestamps = events[event_timestamp].to_numpy()[np.minimum(rel_events, len(events) - 1)]
+        timestamps = pd.factorize(timestamps, sort=True)[0]
+        order = np.lexsort((rel_events, timestamps, rel_objects))
+        self.o2e_indptr = _csr_pointers(rel_objects, num_objects)
+        self.o2e_events = rel_events[order]
+        self.o2e_relations = positions[order]
+
+    @staticmethod
+    def __encode(table_ids: pd.Series, relation_ids: pd.Series):
+        ids = pd.Index(table_ids.to_numpy())
+        if not ids.is_unique:
+            ids = ids.drop_duplicates()
+        codes = ids.get_indexer(relation_ids.to_numpy())
+        missing = codes < 0
+        if missing.any():
+            extra = pd.Index(relation_ids.to_numpy()[missing]).drop_duplicates()
+            ids = ids.append(extra)
+            codes[missing] = len(ids) - len(extra) + extra.get_indexer(relation_ids.to_numpy()[missing])
+        return codes.astype(np.int64), np.asarray(ids, dtype=object)
+
+    def get_objects_of_event(self, event_id: Any) -> List[Any]:
+        """
+        Gets the objects related to the given event (in the order of the relations)
+        """
+        i = self.event_index.get_indexer([event_id])[0]
+        if i < 0:
+            return []
+        return self.object_ids[self.e2o_objects[self.e2o_indptr[i]:self.e2o_indptr[i + 1]]].tolist()
+
+    def get_events_of_object(self, object_id: Any) -> List[Any]:
+        """
+        Gets the events related to the given object (sorted by timestamp)
+        """
+        i = self.object_index.get_indexer([object_id])[0]
+        if i < 0:
+            return []
+        return self.event_ids[self.o2e_events[self.o2e_indptr[i]:self.o2e_indptr[i + 1]]].tolist()
+
+    def get_objects_of_type(self, object_type: str) -> List[Any]:
+        """
+        Gets the objects of the given object type
+        """
+        if object_type not in self.objects_per_type:
+            return []
+        return self.object_ids[self.objects_per_type[object_type]].tolist()
+
+    def related_objects_per_event(self, object_type: Optional[str] = None,
+                                  include_empty: bool = False) -> Dict[Any, List[Any]]:
+        """
+        Associates every event to the list of its related objects (optionally, only of the given object type)
+
+        Parameters
+        --------------
+        object_type
+            If provided, only the objects of the given type are considered
+        include_empty
+            Includes also the events that are not related to any object (with an empty list)
+        """
+        objects = self.e2o_objects
+        events = np.repeat(np.arange(len(self.event_ids)), np.diff(self.e2o_indptr))
+        if object_type is not None:
+            mask = self.object_type_codes[objects] == self.object_type_index.get(object_type, -2)
+            objects = objects[mask]
+            events = events[mask]
+        return self.__group(events, self.object_ids[objects], self.event_ids, include_empty)
+
+    def related_events_per_object(self, object_type: Optional[str] = None,
+                                  include_empty: bool = False) -> Dict[Any, List[Any]]:
+        """
+        Associates every object (optionally, only of the given object type) to the list of its related events
+        (sorted by timestamp)
+        """
+        events = self.o2e_events
+        objects = np.repeat(np.arange(len(self.object_ids)), np.diff(self.o2e_indptr))
+        object_ids = self.object_ids
+        if object_type is not None:
+            codes = self.objects_per_type.get(object_type, np.zeros(0, dtype=np.int64))
+            mask = np.zeros(len(self.object_ids), dtype=bool)
+            mask[codes] = True
+            keep = mask[objects]
+            events = events[keep]
+            objects = objects[keep]
+            if include_empty:
+                object_ids = self.object_ids[codes]
+                objects = np.searchsorted(codes, objects)
+        return self.__group(objects, self.event_ids[events], object_ids, include_empty)
+
+    @staticmethod
+    def __group(keys: np.ndarray, values: np.ndarray, key_ids: np.ndarray, include_empty: bool) -> Dict[Any, List[Any]]:
+        # keys are sorted: the values are split at the boundaries between the keys
+        ret = {}
+        if include_empty:
+            ret = {x: [] for x in key_ids.tolist()}
+        if len(keys) == 0:
+            return ret
+        boundaries = np.nonzero(np.diff(keys))[0] + 1
+        starts = np.concatenate(([0], boundaries))
+        values = values.tolist()
+        ends = np.concatenate((boundaries, [len(keys)])).tolist()
+        for k, s, e in zip(key_ids[keys[starts]].tolist(), starts.tolist(), ends):
+            ret[k] = values[s:e]
+        return ret
@@ -29,6 +29,7 @@ import pandas as pd
 
 class Parameters(Enum):
     OCEL_TYPE_PREFIX = ocel_constants.PARAM_OBJECT_TYPE_PREFIX_EXTENDED
+    CHUNK_SIZE = "chunk_size"
 
 
 def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
@@ -42,6 +43,7 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
     parameters
         Parameters of the method, including:
         - Parameters.OCEL_TYPE_PREFIX => the prefix of the object types in the OCEL (default: ocel:type)
+        - Parameters.CHUNK_SIZE => number of rows of the extended table converted to records at once (default: 10000)
 
     Returns
     ----------------
@@ -53,8 +55,11 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
 
     ot_prefix = exec_utils.get_param_value(Parameters.OCEL_TYPE_PREFIX, parameters,
                                            ocel_constants.DEFAULT_OBJECT_TYPE_PREFIX_EXTENDED)
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, 10000)
 
     ext_table = ocel.get_extended_table(ot_prefix)
 
-    for k, ev in ext_table.iterrows():
-        yield {x: y for x, y in dict(ev).items() if isinstance(y, list) or not pd.isna(y)}
+    # iterates over the records of the table, chunk by chunk (without building a Series for each row)
+    for i in range(0, len(ext_table), chunk_size):
+        for ev in ext_table.iloc[i:i + chunk_size].to_dict("records"):
+            yield {x: y for x, y in ev.items() if isinstance(y, list) or not pd.isna(y)}
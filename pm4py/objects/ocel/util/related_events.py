@@ -32,6 +32,9 @@ def related_events_dct(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None)
     object_types = pandas_utils.format_unique(ocel.relations[ocel.object_type_column].unique())
     dct = {}
     for ot in object_types:
+        if ocel.has_index():
+            dct[ot] = ocel.get_index().related_events_per_object(object_type=ot)
+            continue
         dct[ot] = ocel.relations[ocel.relations[ocel.object_type_column] == ot].groupby(ocel.object_id_column)[ocel.event_id_column].apply(
             list).to_dict()
     return dct
@@ -32,6 +32,9 @@ def related_objects_dct_per_type(ocel: OCEL, parameters: Optional[Dict[Any, Any]
     object_types = pandas_utils.format_unique(ocel.relations[ocel.object_type_column].unique())
     dct = {}
     for ot in object_types:
+        if ocel.has_index():
+            dct[ot] = ocel.get_index().related_objects_per_event(object_type=ot)
+            continue
         dct[ot] = ocel.relations[ocel.relations[ocel.object_type_column] == ot].groupby(ocel.event_id_column)[ocel.object_id_column].apply(
             list).to_dict()
     return dct
@@ -41,6 +44,9 @@ def related_objects_dct_overall(ocel: OCEL, parameters: Optional[Dict[Any, Any]]
     if parameters is None:
         parameters = {}
 
+    if ocel.has_index():
+        return ocel.get_index().related_objects_per_event(include_empty=True)
+
     evids = pandas_utils.format_unique(ocel.events[ocel.event_id_column].unique())
     dct = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
 
@@ -19,6 +19,6 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from pm4py.objects.petri_net.utils import align_utils, check_soundness, consumption_matrix, decomposition, \
+from pm4py.objects.petri_net.utils import align_utils, check_soundness, compiled_net, consumption_matrix, decomposition, \
     embed_stochastic_map, explore_path, final_marking, incidence_matrix, initial_marking, performance_map, petri_utils, \
-    projection, reachability_graph, reduction, synchronous_product
+    projection, reachability_graph, reduction, state_space, synchronous_product
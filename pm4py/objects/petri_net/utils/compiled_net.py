@@ -0,0 +1,156 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from typing import List, Iterable
+
+import numpy as np
+
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+
+
+class CompiledMarking(object):
+    """
+    Immutable marking of a compiled Petri net: the number of tokens in each place (in the order of the places
+    of the compiled net) is stored in a read-only array, and the hash is computed once, when the marking is created.
+    Two compiled markings can be compared only if they refer to the same compiled net.
+    """
+    __slots__ = ("values", "key", "_hash")
+
+    def __init__(self, values: np.ndarray):
+        values.flags.writeable = False
+        self.values = values
+        self.key = values.tobytes()
+        self._hash = hash(self.key)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return isinstance(other, CompiledMarking) and self.key == other.key
+
+    def __le__(self, other):
+        return bool(np.all(self.values <= other.values))
+
+    def __repr__(self):
+        return "CompiledMarking(" + str(self.values.tolist()) + ")"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class CompiledPetriNet(object):
+    """
+    Compiled representation of a Petri net (classic semantics), in which the places and the transitions are
+    identified by their index.
+
+    The arcs are stored in the pre- and post-incidence matrices (one row per transition, one column per place),
+    so the transitions enabled in a marking are computed with a single (vectorized) comparison, and firing a
+    transition is the sum of the marking and of a row of the incidence matrix.
+
+    Attributes
+    ----------------
+    net
+        The original Petri net
+    places
+        Places (sorted by name)
+    transitions
+        Transitions (sorted by name)
+    place_indices
+        Dictionary associating to each place its index
+    transition_indices
+        Dictionary associating to each transition its index
+    pre
+        Pre-incidence matrix (tokens consumed by each transition from each place)
+    post
+        Post-incidence matrix (tokens produced by each transition in each place)
+    delta
+        Incidence matrix (post - pre)
+    """
+
+    def __init__(self, net: PetriNet):
+        self.net = net
+        self.places = sorted(net.places, key=lambda x: (str(x.name), id(x)))
+        self.transitions = sorted(net.transitions, key=lambda x: (str(x.name), id(x)))
+        self.place_indices = {p: i for i, p in enumerate(self.places)}
+        self.transition_indices = {t: i for i, t in enumerate(self.transitions)}
+
+        pre = np.zeros((len(self.transitions), len(self.places)), dtype=np.int64)
+        post = np.zeros((len(self.transitions), len(self.places)), dtype=np.int64)
+        for i, t in enumerate(self.transitions):
+            for a in t.in_arcs:
+                pre[i, self.place_indices[a.source]] += a.weight
+            for a in t.out_arcs:
+                post[i, self.place_indices[a.target]] += a.weight
+        delta = post - pre
+        for matrix in (pre, post, delta):
+            matrix.flags.writeable = False
+        self.pre = pre
+        self.post = post
+        self.delta = delta
+
+    def encode_marking(self, marking: Marking) -> CompiledMarking:
+        """
+        Encodes a marking of the Petri net
+        """
+        values = np.zeros(len(self.places), dtype=np.int64)
+        for p, n in marking.items():
+            values[self.place_indices[p]] = n
+        return CompiledMarking(values)
+
+    def decode_marking(self, marking: CompiledMarking) -> Marking:
+        """
+        Decodes a compiled marking to a marking of the Petri net
+        """
+        ret = Marking()
+        for i in np.flatnonzero(marking.values > 0):
+            ret[self.places[i]] = int(marking.values[i])
+        return ret
+
+    def is_enabled(self, transition: int, marking: CompiledMarking) -> bool:
+        """
+        Checks if the transition (index) is enabled in the given marking
+        """
+        return bool(np.all(self.pre[transition] <= marking.values))
+
+    def enabled_transitions(self, marking: CompiledMarking) -> np.ndarray:
+        """
+        Gets the (indices of the) transitions enabled in the given marking
+        """
+        return np.flatnonzero(np.all(self.pre <= marking.values, axis=1))
+
+    def fire(self, transition: int, marking: CompiledMarking) -> CompiledMarking:
+        """
+        Fires a transition (index) in the given marking. The enabling is not checked (as in the semantics of the
+        Petri net), hence the resulting marking could contain negative values.
+        """
+        return CompiledMarking(marking.values + self.delta[transition])
+
+    def fire_all(self, transitions: Iterable[int], marking: CompiledMarking) -> List[CompiledMarking]:
+        """
+        Fires each of the given transitions (indices) in the given marking, getting the list of the reached markings
+        (computed together as rows of a single matrix)
+        """
+        successors = marking.values + self.delta[np.asarray(transitions, dtype=np.int64)]
+        return [CompiledMarking(row) for row in successors]
+
+
+def construct(net: PetriNet) -> CompiledPetriNet:
+    return CompiledPetriNet(net)
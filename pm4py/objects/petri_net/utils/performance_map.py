@@ -25,7 +25,7 @@ from pm4py.objects.petri_net import semantics
 from pm4py.objects.petri_net.obj import PetriNet
 from pm4py.util.vis_utils import human_readable_stat, get_arc_penwidth, get_trans_freq_color
 from pm4py.objects.log.obj import EventLog
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import get_calculator
 from pm4py.util import constants
 
 MAX_NO_THREADS = 1000
@@ -194,6 +194,7 @@ def single_element_statistics(log, net, initial_marking, aligned_traces, variant
 
     business_hours = parameters["business_hours"] if "business_hours" in parameters else False
     business_hours_slots = parameters["business_hour_slots"] if "business_hour_slots" in parameters else constants.DEFAULT_BUSINESS_HOUR_SLOTS
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots)
     count_once_per_trace = parameters["count_once_per_trace"] if "count_once_per_trace" in parameters else False
 
     statistics = {}
@@ -229,10 +230,8 @@ def single_element_statistics(log, net, initial_marking, aligned_traces, variant
                     for perf_couple in annotations_places_trans[el]["performance"]:
                         if timestamp_key in trace[perf_couple[0]] and timestamp_key in trace[perf_couple[1]]:
                             if business_hours:
-                                bh = BusinessHours(trace[perf_couple[1]][timestamp_key],
-                                                   trace[perf_couple[0]][timestamp_key],
-                                                   business_hour_slots=business_hours_slots)
-                                perf = bh.get_seconds()
+                                perf = bh_calculator.get_seconds_between(trace[perf_couple[1]][timestamp_key],
+                                                                         trace[perf_couple[0]][timestamp_key])
                             else:
                                 perf = (trace[perf_couple[0]][timestamp_key] - trace[perf_couple[1]][
                                     timestamp_key]).total_seconds()
@@ -249,10 +248,8 @@ def single_element_statistics(log, net, initial_marking, aligned_traces, variant
                 for perf_couple in annotations_arcs[el]["performance"]:
                     if timestamp_key in trace[perf_couple[0]] and timestamp_key in trace[perf_couple[1]]:
                         if business_hours:
-                            bh = BusinessHours(trace[perf_couple[1]][timestamp_key],
-                                               trace[perf_couple[0]][timestamp_key],
-                                               business_hour_slots=business_hours_slots)
-                            perf = bh.get_seconds()
+                            perf = bh_calculator.get_seconds_between(trace[perf_couple[1]][timestamp_key],
+                                                                     trace[perf_couple[0]][timestamp_key])
                         else:
                             perf = (trace[perf_couple[0]][timestamp_key] - trace[perf_couple[1]][
                                 timestamp_key]).total_seconds()
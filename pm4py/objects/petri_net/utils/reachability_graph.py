@@ -21,9 +21,10 @@ Contact: info@processintelligence.solutions
 '''
 import re
 
-from pm4py.objects import petri_net
+import numpy as np
+
 from pm4py.objects.transition_system.obj import TransitionSystem
-from pm4py.objects.petri_net.utils import align_utils
+from pm4py.objects.petri_net.utils import align_utils, compiled_net, state_space
 from pm4py.objects.transition_system import obj as ts
 from pm4py.objects.transition_system import utils
 from pm4py.util import exec_utils
@@ -53,6 +54,53 @@ def staterep(name):
     return re.sub(r'\W+', '', name)
 
 
+def __compiled_marking_flow_petri(net, im, max_exec_time, return_eventually_enabled=False):
+    # explores the markings of the compiled net (classic semantics) as integer vectors, decoding them only at the end.
+    # the decoding is part of the time budget: when the time is over, only the states decoded so far are returned
+    start_time = time.time()
+    compiled = compiled_net.construct(net)
+    transitions = compiled.transitions
+    space = state_space.explore(compiled, compiled.encode_marking(im).values, max_elab_time=max_exec_time,
+                                max_tokens=None)
+
+    decoded = []
+    for s in range(space.num_states):
+        if s > 0 and s % 1000 == 0 and (time.time() - start_time) >= max_exec_time:
+            break
+        decoded.append(space.get_marking(s))
+    num_decoded = len(decoded)
+
+    sources = space.sources
+    targets = space.targets
+    # an expanded state is kept as expanded only if all its successors have been decoded
+    in_range = sources < num_decoded
+    expanded = space.expanded[:num_decoded].copy()
+    expanded[sources[in_range & (targets >= num_decoded)]] = False
+
+    eventually_enabled = {}
+    if return_eventually_enabled:
+        # as for the decoding, the states whose eventually enabled transitions cannot be computed within the time
+        # budget are returned as not expanded (so every state of outgoing_transitions is in eventually_enabled)
+        expanded_states = np.flatnonzero(expanded).tolist()
+        for i, s in enumerate(expanded_states):
+            if (time.time() - start_time) >= max_exec_time:
+                expanded[expanded_states[i:]] = False
+                break
+            eventually_enabled[decoded[s]] = align_utils.get_visible_transitions_eventually_enabled_by_marking(
+                net, decoded[s])
+
+    kept = in_range.copy()
+    kept[in_range] = expanded[sources[in_range]]
+
+    incoming_transitions = {m: set() for m in decoded}
+    outgoing_transitions = {decoded[s]: {} for s in np.flatnonzero(expanded).tolist()}
+    for s1, t, s2 in zip(sources[kept].tolist(), space.transitions[kept].tolist(), targets[kept].tolist()):
+        outgoing_transitions[decoded[s1]][transitions[t]] = decoded[s2]
+        incoming_transitions[decoded[s2]].add(transitions[t])
+
+    return incoming_transitions, outgoing_transitions, eventually_enabled
+
+
 def marking_flow_petri(net, im, return_eventually_enabled=False, parameters=None):
     """
     Construct the marking flow of a Petri net
@@ -65,13 +113,21 @@ def marking_flow_petri(net, im, return_eventually_enabled=False, parameters=None
         Initial marking
     return_eventually_enabled
         Return the eventually enabled (visible) transitions
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.MAX_ELAB_TIME => maximum execution time (in seconds)
+        - Parameters.PETRI_SEMANTICS => semantics of the Petri net (if not provided, the classic semantics is
+        applied on a compiled version of the Petri net)
     """
     if parameters is None:
         parameters = {}
 
     # set a maximum execution time of 1 day (it can be changed by providing the parameter)
     max_exec_time = exec_utils.get_param_value(Parameters.MAX_ELAB_TIME, parameters, 86400)
-    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, petri_net.semantics.ClassicSemantics())
+    semantics = exec_utils.get_param_value(Parameters.PETRI_SEMANTICS, parameters, None)
+
+    if semantics is None:
+        return __compiled_marking_flow_petri(net, im, max_exec_time, return_eventually_enabled=return_eventually_enabled)
 
     start_time = time.time()
 
@@ -94,8 +150,7 @@ def marking_flow_petri(net, im, return_eventually_enabled=False, parameters=None
             outgoing_transitions[m][t] = nm
             if nm not in incoming_transitions:
                 incoming_transitions[nm] = set()
-                if nm not in active:
-                    active.append(nm)
+                active.append(nm)
             incoming_transitions[nm].add(t)
 
     return incoming_transitions, outgoing_transitions, eventually_enabled
@@ -0,0 +1,544 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import time
+from enum import Enum
+from itertools import repeat
+from typing import Optional, Dict, Any, Union, Tuple, List, Collection
+
+import numpy as np
+
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.petri_net.utils import compiled_net
+from pm4py.objects.petri_net.utils.compiled_net import CompiledPetriNet, CompiledMarking
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    MAX_STATES = "max_states"
+    MAX_ELAB_TIME = "max_elab_time"
+    MAX_TOKENS = "max_tokens"
+    REDUCTION = "reduction"
+    STOP_AT_DEADLOCK = "stop_at_deadlock"
+    STORE_EDGES = "store_edges"
+    BATCH_SIZE = "batch_size"
+
+
+# partial-order reduction based on stubborn sets (preserves the reachable deadlocks)
+REDUCTION_STUBBORN = "stubborn"
+
+# reasons for which an exploration is interrupted
+INTERRUPTED_MAX_STATES = "max_states"
+INTERRUPTED_MAX_ELAB_TIME = "max_elab_time"
+INTERRUPTED_MAX_TOKENS = "max_tokens"
+INTERRUPTED_DEADLOCK = "deadlock"
+
+DEFAULT_MAX_TOKENS = 255
+DEFAULT_BATCH_SIZE = 10000
+
+# maximum number of cells of the (states x transitions x places) comparison computed at once
+MAX_BROADCAST_CELLS = 1 << 22
+
+
+class StateSpace(object):
+    """
+    Reachable state space of a (compiled) Petri net.
+
+    The states are identified by an integer (0 is the initial marking) and stored as the rows of a single
+    matrix of token counts (one column per place of the compiled net, in the smallest integer type that can
+    contain the maximum number of tokens). The edges are stored in three parallel arrays (source state,
+    index of the transition in the compiled net, target state).
+
+    Attributes
+    ----------------
+    compiled
+        Compiled Petri net
+    states
+        Matrix of the markings (one row per state)
+    sources
+        Source state of each edge
+    transitions
+        Transition (index in the compiled net) of each edge
+    targets
+        Target state of each edge
+    deadlocks
+        States in which no transition is enabled
+    expanded
+        Boolean mask of the states whose successors have been computed
+    interrupted
+        Reason of the interruption of the exploration (None if the exploration is complete)
+    reduction
+        Reduction applied during the exploration (None if the full state space is explored)
+    """
+
+    def __init__(self, compiled: CompiledPetriNet, states: np.ndarray, sources: np.ndarray, transitions: np.ndarray,
+                 targets: np.ndarray, deadlocks: np.ndarray, expanded: np.ndarray, interrupted: Optional[str] = None,
+                 reduction: Optional[str] = None):
+        self.compiled = compiled
+        self.states = states
+        self.sources = sources
+        self.transitions = transitions
+        self.targets = targets
+        self.deadlocks = deadlocks
+        self.expanded = expanded
+        self.interrupted = interrupted
+        self.reduction = reduction
+
+    @property
+    def num_states(self) -> int:
+        return self.states.shape[0]
+
+    @property
+    def num_edges(self) -> int:
+        return self.sources.shape[0]
+
+    @property
+    def complete(self) -> bool:
+        return self.interrupted is None
+
+    def get_marking(self, state: int) -> Marking:
+        """
+        Decodes the marking of the given state
+        """
+        return self.compiled.decode_marking(CompiledMarking(self.states[state].astype(np.int64)))
+
+    def get_state(self, marking: Union[Marking, np.ndarray]) -> Optional[int]:
+        """
+        Gets the state corresponding to the given marking (or vector of token counts), or None if the marking
+        has not been reached
+        """
+        if isinstance(marking, Marking):
+            marking = self.compiled.encode_marking(marking).values
+        matches = np.flatnonzero(np.all(self.states == np.asarray(marking), axis=1))
+        return int(matches[0]) if len(matches) > 0 else None
+
+    def get_fired_transitions(self) -> List[PetriNet.Transition]:
+        """
+        Gets the transitions of the Petri net that label at least an edge of the state space
+        """
+        return [self.compiled.transitions[t] for t in np.unique(self.transitions).tolist()]
+
+    def can_reach(self, targets: Collection[int]) -> np.ndarray:
+        """
+        Computes the states from which at least one of the given states is reachable, visiting backwards the
+        edges of the state space (one level at a time)
+
+        Parameters
+        ----------------
+        targets
+            Target states
+
+        Returns
+        ----------------
+        mask
+            Boolean mask of the states from which a target state is reachable
+        """
+        reached = np.zeros(self.num_states, dtype=bool)
+        frontier = np.unique(np.asarray(list(targets), dtype=np.int64))
+        reached[frontier] = True
+
+        # edges grouped by target state (CSR layout)
+        order = np.argsort(self.targets, kind="stable")
+        predecessors = self.sources[order]
+        offsets = np.zeros(self.num_states + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.targets, minlength=self.num_states), out=offsets[1:])
+
+        while len(frontier) > 0:
+            starts = offsets[frontier]
+            counts = offsets[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+            # positions of all the incoming edges of the frontier states
+            positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+            candidates = np.unique(predecessors[positions])
+            frontier = candidates[~reached[candidates]]
+            reached[frontier] = True
+
+        return reached
+
+
+class _StubbornSets(object):
+    """
+    Computes, for a marking, a stubborn set of transitions: firing only the enabled transitions of the stubborn set
+    preserves all the deadlocks reachable from the marking.
+
+    The set is the closure of a seed (enabled) transition under the rules:
+    - for an enabled transition t, all the transitions that consume from a place of the preset of t belong to the set;
+    - for a disabled transition t, all the transitions that produce in a place of the preset of t with insufficient
+    tokens (the "scapegoat" place) belong to the set.
+    """
+
+    def __init__(self, compiled: CompiledPetriNet, num_seeds: int = 3):
+        pre = compiled.pre
+        num_transitions, num_places = pre.shape
+        self.num_seeds = num_seeds
+        self.pre_places = []
+        for t in range(num_transitions):
+            places = np.flatnonzero(pre[t])
+            self.pre_places.append(list(zip(places.tolist(), pre[t, places].tolist())))
+        consumers = [np.flatnonzero(pre[:, p]).tolist() for p in range(num_places)]
+        self.producers = [np.flatnonzero(compiled.delta[:, p] > 0).tolist() for p in range(num_places)]
+        self.conflicts = []
+        for t in range(num_transitions):
+            conflicting = set()
+            for p, _ in self.pre_places[t]:
+                conflicting.update(consumers[p])
+            self.conflicts.append(sorted(conflicting))
+
+    def closure(self, marking: List[int], enabled: set, seed: int) -> List[int]:
+        stubborn = {seed}
+        stack = [seed]
+        while stack:
+            t = stack.pop()
+            if t in enabled:
+                added = self.conflicts[t]
+            else:
+                # choose the scapegoat place with the fewest producers
+                added = None
+                for p, w in self.pre_places[t]:
+                    if marking[p] < w and (added is None or len(self.producers[p]) < len(added)):
+                        added = self.producers[p]
+            for t2 in added:
+                if t2 not in stubborn:
+                    stubborn.add(t2)
+                    stack.append(t2)
+        return [t for t in stubborn if t in enabled]
+
+    def reduce(self, markings: np.ndarray, enabled: np.ndarray) -> np.ndarray:
+        """
+        Restricts the enabled transitions (boolean matrix, one row per marking) to the ones of a stubborn set
+        """
+        reduced = enabled.copy()
+        counts = enabled.sum(axis=1)
+        for i in np.flatnonzero(counts > 1).tolist():
+            enabled_list = np.flatnonzero(enabled[i]).tolist()
+            enabled_set = set(enabled_list)
+            marking = markings[i].tolist()
+            best = enabled_list
+            for seed in enabled_list[:self.num_seeds]:
+                candidate = self.closure(marking, enabled_set, seed)
+                if len(candidate) < len(best):
+                    best = candidate
+                    if len(best) == 1:
+                        break
+            if len(best) < len(enabled_list):
+                reduced[i] = False
+                reduced[i, best] = True
+        return reduced
+
+
+def _row_view(rows: np.ndarray) -> np.ndarray:
+    # views each row as a single (opaque) value, so the rows can be compared and hashed at once
+    rows = np.ascontiguousarray(rows)
+    return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel()
+
+
+def _row_keys(rows: np.ndarray) -> List[bytes]:
+    # byte representation of each row, used to hash-cons the markings
+    if rows.shape[1] == 0:
+        return [b""] * rows.shape[0]
+    return _row_view(rows).tolist()
+
+
+def _enabled_matrix(markings: np.ndarray, pre: np.ndarray, pre_places: List[np.ndarray]) -> np.ndarray:
+    # enabled transitions (columns) in each marking (rows)
+    if markings.shape[0] * pre.size <= MAX_BROADCAST_CELLS:
+        return np.all(markings[:, None, :] >= pre[None, :, :], axis=2)
+    enabled = np.ones((markings.shape[0], pre.shape[0]), dtype=bool)
+    for t, places in enumerate(pre_places):
+        if len(places) > 0:
+            enabled[:, t] = np.all(markings[:, places] >= pre[t, places], axis=1)
+    return enabled
+
+
+def explore(compiled: CompiledPetriNet, initial: np.ndarray, final: Optional[np.ndarray] = None,
+            max_states: Optional[int] = None, max_elab_time: Optional[float] = None,
+            max_tokens: Optional[int] = DEFAULT_MAX_TOKENS, reduction: Optional[str] = None,
+            stop_at_deadlock: bool = False, store_edges: bool = True,
+            batch_size: int = DEFAULT_BATCH_SIZE) -> StateSpace:
+    """
+    Explores (breadth-first, in batches of states) the state space of a compiled Petri net from the given vector
+    of token counts.
+
+    Parameters
+    ----------------
+    compiled
+        Compiled Petri net
+    initial
+        Initial vector of token counts (in the order of the places of the compiled net)
+    final
+        (Optional) final vector of token counts, which is not considered as a deadlock when stop_at_deadlock is set
+    max_states
+        Maximum number of states (None: no limit)
+    max_elab_time
+        Maximum exploration time, in seconds (None: no limit)
+    max_tokens
+        Maximum number of tokens in a place (None: no limit, the token counts are stored as 64-bit integers)
+    reduction
+        Partial-order reduction (None or REDUCTION_STUBBORN)
+    stop_at_deadlock
+        Interrupt the exploration at the first deadlock (different from the final vector)
+    store_edges
+        Store the edges of the state space
+    batch_size
+        Number of states expanded together
+
+    Returns
+    ----------------
+    state_space
+        State space (possibly incomplete)
+    """
+    start_time = time.time()
+    pre = compiled.pre
+    delta = compiled.delta
+    num_places = len(compiled.places)
+    pre_places = [np.flatnonzero(pre[t]) for t in range(pre.shape[0])]
+    dtype = np.int64 if max_tokens is None else np.min_scalar_type(max_tokens)
+    stubborn = _StubbornSets(compiled) if reduction == REDUCTION_STUBBORN else None
+    final_key = _row_keys(np.asarray(final, dtype=dtype).reshape(1, num_places))[0] if final is not None else None
+
+    initial = np.asarray(initial, dtype=np.int64).reshape(1, num_places)
+    if max_tokens is not None and initial.size > 0 and initial.max() > max_tokens:
+        raise Exception("the initial marking contains more than max_tokens tokens in a place")
+
+    index = {}
+    chunks = [initial.astype(dtype)]
+    index[_row_keys(chunks[0])[0]] = 0
+    num_states = 1
+
+    sources, transitions, targets = [], [], []
+    deadlocks, expanded = [], []
+    interrupted = None
+
+    frontier = chunks[0]
+    frontier_ids = np.zeros(1, dtype=np.int64)
+    while len(frontier) > 0 and interrupted is None:
+        next_frontier, next_ids = [], []
+        for start in range(0, len(frontier), batch_size):
+            if max_elab_time is not None and (time.time() - start_time) >= max_elab_time:
+                interrupted = INTERRUPTED_MAX_ELAB_TIME
+                break
+            markings = frontier[start:start + batch_size]
+            ids = frontier_ids[start:start + batch_size]
+
+            enabled = _enabled_matrix(markings, pre, pre_places)
+            dead = ~enabled.any(axis=1)
+            if dead.any():
+                deadlocks.append(ids[dead])
+                if stop_at_deadlock:
+                    dead_keys = _row_keys(markings[dead])
+                    if any(k != final_key for k in dead_keys):
+                        interrupted = INTERRUPTED_DEADLOCK
+            if stubborn is not None:
+                enabled = stubborn.reduce(markings, enabled)
+
+            rows, fired = np.nonzero(enabled)
+            successors = markings[rows].astype(np.int64) + delta[fired]
+            if max_tokens is not None and successors.size > 0 and successors.max() > max_tokens:
+                interrupted = INTERRUPTED_MAX_TOKENS
+                break
+            successors = successors.astype(dtype)
+
+            # the same marking is often reached from several markings of the batch: it is looked up once
+            if num_places > 0:
+                _, positions, inverse = np.unique(_row_view(successors), return_index=True, return_inverse=True)
+            else:
+                positions, inverse = np.zeros(min(1, len(successors)), dtype=np.int64), np.zeros(len(successors))
+            successors = successors[positions]
+            keys = _row_keys(successors)
+
+            reached = np.fromiter(map(index.get, keys, repeat(-1)), dtype=np.int64, count=len(keys))
+            new_positions = np.flatnonzero(reached < 0)
+            if max_states is not None and num_states + len(new_positions) > max_states:
+                interrupted = INTERRUPTED_MAX_STATES
+                new_positions = new_positions[:max(0, max_states - num_states)]
+            new_ids = np.arange(num_states, num_states + len(new_positions), dtype=np.int64)
+            index.update(zip(map(keys.__getitem__, new_positions.tolist()), new_ids.tolist()))
+            reached[new_positions] = new_ids
+            num_states += len(new_positions)
+            reached = reached[inverse.ravel().astype(np.int64)]
+
+            if store_edges:
+                keep = reached >= 0
+                sources.append(ids[rows][keep])
+                transitions.append(fired[keep])
+                targets.append(reached[keep])
+            if interrupted != INTERRUPTED_MAX_STATES:
+                # the states of a batch interrupted by the budget have been expanded only partially
+                expanded.append(ids)
+            if len(new_positions) > 0:
+                new_states = successors[new_positions]
+                chunks.append(new_states)
+                next_frontier.append(new_states)
+                next_ids.append(new_ids)
+            if interrupted is not None:
+                break
+        frontier = np.concatenate(next_frontier) if next_frontier else np.zeros((0, num_places), dtype=dtype)
+        frontier_ids = np.concatenate(next_ids) if next_ids else np.zeros(0, dtype=np.int64)
+
+    del index
+    expanded_mask = np.zeros(num_states, dtype=bool)
+    if expanded:
+        expanded_mask[np.concatenate(expanded)] = True
+
+    def concat(arrays):
+        return np.concatenate(arrays).astype(np.int64) if arrays else np.zeros(0, dtype=np.int64)
+
+    return StateSpace(compiled, np.concatenate(chunks), concat(sources), concat(transitions), concat(targets),
+                      np.sort(concat(deadlocks)), expanded_mask, interrupted=interrupted, reduction=reduction)
+
+
+def apply(net: PetriNet, im: Marking, fm: Optional[Marking] = None,
+          parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> StateSpace:
+    """
+    Explores the reachable state space of a Petri net (classic semantics). The markings are stored as compact
+    vectors of token counts (hash-consed, so every marking is stored once) and the successors of many markings are
+    computed together.
+
+    Parameters
+    ----------------
+    net
+        Petri net
+    im
+        Initial marking
+    fm
+        (Optional) final marking, which is not considered as a deadlock by Parameters.STOP_AT_DEADLOCK
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.MAX_STATES => maximum number of states (budget); the exploration is interrupted when reached
+        - Parameters.MAX_ELAB_TIME => maximum exploration time (in seconds)
+        - Parameters.MAX_TOKENS => maximum number of tokens in a place (default: 255); the exploration is
+        interrupted when a marking exceeds it
+        - Parameters.REDUCTION => partial-order reduction (None or "stubborn"); the reduced state space contains
+        all the reachable deadlocks
+        - Parameters.STOP_AT_DEADLOCK => interrupts the exploration at the first deadlock (default: False)
+        - Parameters.STORE_EDGES => stores the edges of the state space (default: True)
+        - Parameters.BATCH_SIZE => number of states expanded together (default: 10000)
+
+    Returns
+    ----------------
+    state_space
+        State space (the attribute "interrupted" reports whether, and why, the exploration is incomplete)
+    """
+    if parameters is None:
+        parameters = {}
+
+    compiled = compiled_net.construct(net)
+    initial = compiled.encode_marking(im).values
+    final = compiled.encode_marking(fm).values if fm is not None else None
+
+    return explore(compiled, initial, final=final,
+                   max_states=exec_utils.get_param_value(Parameters.MAX_STATES, parameters, None),
+                   max_elab_time=exec_utils.get_param_value(Parameters.MAX_ELAB_TIME, parameters, None),
+                   max_tokens=exec_utils.get_param_value(Parameters.MAX_TOKENS, parameters, DEFAULT_MAX_TOKENS),
+                   reduction=exec_utils.get_param_value(Parameters.REDUCTION, parameters, None),
+                   stop_at_deadlock=exec_utils.get_param_value(Parameters.STOP_AT_DEADLOCK, parameters, False),
+                   store_edges=exec_utils.get_param_value(Parameters.STORE_EDGES, parameters, True),
+                   batch_size=exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, DEFAULT_BATCH_SIZE))
+
+
+def check_soundness(net: PetriNet, im: Marking, fm: Marking,
+                    parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> Tuple[Optional[bool], Dict[str, Any]]:
+    """
+    Checks the (classical) soundness of a Petri net on its reachable state space:
+    - option to complete: the final marking is reachable from every reachable marking;
+    - proper completion: no reachable marking strictly covers the final marking;
+    - no dead transitions: every transition is enabled in some reachable marking.
+
+    The deadlocks different from the final marking are searched first on the state space reduced with stubborn
+    sets (stopping at the first one), so many unsound nets are rejected without exploring the full state space.
+
+    Parameters
+    ----------------
+    net
+        Petri net
+    im
+        Initial marking
+    fm
+        Final marking
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.MAX_STATES => maximum number of states (budget)
+        - Parameters.MAX_ELAB_TIME => maximum exploration time (in seconds)
+        - Parameters.MAX_TOKENS => maximum number of tokens in a place (default: 255)
+        - Parameters.BATCH_SIZE => number of states expanded together (default: 10000)
+
+    Returns
+    ----------------
+    sound
+        True if the net is sound, False if it is not sound, None if the budget is exhausted before an answer
+    diagnostics
+        Dictionary with the details of the check (number of states, improper deadlocks, number of states without
+        the option to complete, markings covering the final marking, dead transitions, reason of the interruption)
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_states = exec_utils.get_param_value(Parameters.MAX_STATES, parameters, None)
+    max_elab_time = exec_utils.get_param_value(Parameters.MAX_ELAB_TIME, parameters, None)
+    max_tokens = exec_utils.get_param_value(Parameters.MAX_TOKENS, parameters, DEFAULT_MAX_TOKENS)
+    batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, DEFAULT_BATCH_SIZE)
+
+    start_time = time.time()
+    compiled = compiled_net.construct(net)
+    initial = compiled.encode_marking(im).values
+    final = compiled.encode_marking(fm).values
+    diagnostics = {}
+
+    reduced = explore(compiled, initial, final=final, max_states=max_states, max_elab_time=max_elab_time,
+                      max_tokens=max_tokens, reduction=REDUCTION_STUBBORN, stop_at_deadlock=True,
+                      store_edges=False, batch_size=batch_size)
+    improper_deadlocks = [s for s in reduced.deadlocks.tolist() if not np.array_equal(reduced.states[s], final)]
+    if improper_deadlocks:
+        diagnostics["num_states"] = reduced.num_states
+        diagnostics["deadlocks"] = [reduced.get_marking(s) for s in improper_deadlocks]
+        return False, diagnostics
+    if reduced.interrupted == INTERRUPTED_MAX_TOKENS:
+        diagnostics["num_states"] = reduced.num_states
+        diagnostics["interrupted"] = reduced.interrupted
+        return None, diagnostics
+
+    if max_elab_time is not None:
+        max_elab_time = max(0.0, max_elab_time - (time.time() - start_time))
+    space = explore(compiled, initial, max_states=max_states, max_elab_time=max_elab_time, max_tokens=max_tokens,
+                    batch_size=batch_size)
+    diagnostics["num_states"] = space.num_states
+    if not space.complete:
+        diagnostics["interrupted"] = space.interrupted
+        return None, diagnostics
+
+    final_state = space.get_state(final)
+    if final_state is None:
+        diagnostics["no_option_to_complete"] = space.num_states
+        return False, diagnostics
+
+    no_option_to_complete = int(space.num_states - np.count_nonzero(space.can_reach([final_state])))
+    covering = np.flatnonzero(np.all(space.states >= final, axis=1))
+    improper_completion = [space.get_marking(s) for s in covering.tolist() if s != final_state]
+    fired = set(np.unique(space.transitions).tolist())
+    dead_transitions = [t for i, t in enumerate(compiled.transitions) if i not in fired]
+
+    diagnostics["no_option_to_complete"] = no_option_to_complete
+    diagnostics["improper_completion"] = improper_completion
+    diagnostics["dead_transitions"] = dead_transitions
+
+    return no_option_to_complete == 0 and not improper_completion and not dead_transitions, diagnostics
@@ -23,7 +23,7 @@ __doc__ = """
 The ``pm4py.ocel`` module contains the object-centric process mining features offered in ``pm4py``.
 """
 
-from typing import List, Dict, Collection, Any, Optional, Set, Tuple
+from typing import List, Dict, Collection, Any, Optional, Set, Tuple, Union
 
 import pandas as pd
 
@@ -99,6 +99,34 @@ def ocel_flattening(ocel: OCEL, object_type: str) -> pd.DataFrame:
     return flattening.flatten(ocel, object_type)
 
 
+def ocel_flattening_all(ocel: OCEL, object_types: Optional[Collection[str]] = None, long_format: bool = False) -> Union[Dict[str, pd.DataFrame], pd.DataFrame]:
+    """
+    Flattens the object-centric event log on all the object types (or on the specified object types) at once.
+    The relations are encoded and sorted only once, instead of once per object type.
+    Each flattened log is equal to the one returned by ``ocel_flattening`` for the object type.
+
+    :param ocel: Object-centric event log.
+    :type ocel: OCEL
+    :param object_types: The object types to use as cases (default: all the object types).
+    :type object_types: Optional[Collection[str]]
+    :param long_format: If True, returns a single table in which the rows of every object type are contiguous and identified by the (categorical) "case:ocel:type" column. If False, returns a dictionary associating each object type to its flattened log.
+    :type long_format: bool
+    :return: Flattened traditional event logs.
+    :rtype: Union[Dict[str, pd.DataFrame], pd.DataFrame]
+
+    .. code-block:: python3
+
+        import pm4py
+
+        flattened_logs = pm4py.ocel_flattening_all(ocel)
+        event_log_items = flattened_logs['items']
+    """
+    from pm4py.objects.ocel.util import flattening
+    if long_format:
+        return flattening.flatten_long(ocel, object_types=object_types)
+    return flattening.flatten_all(ocel, object_types=object_types)
+
+
 def ocel_object_type_activities(ocel: OCEL) -> Dict[str, Collection[str]]:
     """
     Returns the set of activities performed for each object type.
@@ -235,7 +263,12 @@ def ocel_objects_interactions_summary(ocel: OCEL) -> pd.DataFrame:
     """
     obj_types = ocel.objects.groupby(ocel.object_id_column)[ocel.object_type_column].first().to_dict()
     eve_activities = ocel.events.groupby(ocel.event_id_column)[ocel.event_activity].first().to_dict()
-    ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
+    if ocel.has_index():
+        # the events are sorted as in the groupby on the relations
+        ev_rel_obj = ocel.get_index().related_objects_per_event()
+        ev_rel_obj = {ev: ev_rel_obj[ev] for ev in sorted(ev_rel_obj)}
+    else:
+        ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
     stream = []
     for ev in ev_rel_obj:
         rel_obj = ev_rel_obj[ev]
@@ -256,7 +289,7 @@ def ocel_objects_interactions_summary(ocel: OCEL) -> pd.DataFrame:
     return pandas_utils.instantiate_dataframe(stream)
 
 
-def discover_ocdfg(ocel: OCEL, business_hours: bool = False, business_hour_slots: Optional[List[Tuple[int, int]]] = constants.DEFAULT_BUSINESS_HOUR_SLOTS) -> Dict[str, Any]:
+def discover_ocdfg(ocel: OCEL, business_hours: bool = False, business_hour_slots: Optional[List[Tuple[int, int]]] = constants.DEFAULT_BUSINESS_HOUR_SLOTS, aggregated: bool = False) -> Dict[str, Any]:
     """
     Discovers an Object-Centric Directly-Follows Graph (OC-DFG) from an object-centric event log.
 
@@ -278,6 +311,9 @@ def discover_ocdfg(ocel: OCEL, business_hours: bool = False, business_hour_slots
                                  [(25200, 61200), (9072, 43200), (46800, 61200)] meaning that business hours 
                                  are Mondays 07:00 - 17:00, Tuesdays 02:32 - 12:00, and Wednesdays 13:00 - 17:00.
     :type business_hour_slots: Optional[List[Tuple[int, int]]]
+    :param aggregated: If True, computes only the counts and the aggregated performance statistics (instead of the
+                       sets of events and objects), in a single vectorized pass over the relations.
+    :type aggregated: bool
     :return: OC-DFG discovery result.
     :rtype: Dict[str, Any]
 
@@ -292,7 +328,8 @@ def discover_ocdfg(ocel: OCEL, business_hours: bool = False, business_hour_slots
         "business_hour_slots": business_hour_slots,
     }
     from pm4py.algo.discovery.ocel.ocdfg import algorithm as ocdfg_discovery
-    return ocdfg_discovery.apply(ocel, parameters=parameters)
+    variant = ocdfg_discovery.Variants.AGGREGATED if aggregated else ocdfg_discovery.Variants.CLASSIC
+    return ocdfg_discovery.apply(ocel, variant=variant, parameters=parameters)
 
 
 def discover_oc_petri_net(ocel: OCEL, inductive_miner_variant: str = "im", diagnostics_with_tbr: bool = False) -> Dict[str, Any]:
@@ -19,7 +19,7 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, Optional, Collection
 
 from pm4py.objects.bpmn.obj import BPMN
 from pm4py.objects.log.obj import EventLog
@@ -29,9 +29,13 @@ from pm4py.objects.process_tree.obj import ProcessTree
 from pm4py.util import constants
 
 import os
+import datetime
 
 from pandas import DataFrame
-from typing import Union
+from typing import Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pm4py.objects.ocel.importer.sqlite.variants.ocel20_lazy import LazyOCEL
 
 INDEX_COLUMN = "@@index"
 
@@ -45,6 +49,7 @@ def read_xes(
     variant: Optional[str] = None,
     return_legacy_log_object: bool = constants.DEFAULT_READ_XES_LEGACY_OBJECT,
     encoding: str = constants.DEFAULT_ENCODING,
+    cache_dir: Optional[str] = None,
     **kwargs
 ) -> Union[DataFrame, EventLog]:
     """
@@ -57,9 +62,12 @@ def read_xes(
         - "line_by_line" – text-based line-by-line importer,
         - "chunk_regex" – chunk-of-bytes importer (default),
         - "iterparse20" – XES 2.0 importer,
-        - "rustxes" – Rust-based importer.
+        - "rustxes" – Rust-based importer,
+        - "chunk_regex_parallel" – chunk-of-bytes importer parsing the file in parallel (directly to a dataframe).
     :param return_legacy_log_object: Boolean indicating whether to return a legacy `EventLog` object (default: `False`).
     :param encoding: Encoding to be used (default: `utf-8`).
+    :param cache_dir: [Optional] Directory of the columnar caches. If provided, the dataframe is stored (the first time
+        the file is read) in a columnar cache, which is re-used as long as the file is not modified (see `read_cache`).
     :param **kwargs: Additional parameters to pass to the importer.
     :rtype: `pandas.DataFrame` or `pm4py.objects.log.obj.EventLog`
 
@@ -75,6 +83,29 @@ def read_xes(
     if variant is None:
         variant = constants.DEFAULT_XES_PARSER
 
+    if cache_dir is not None:
+        from pm4py.objects.log.util import columnar_cache
+
+        cache_path = columnar_cache.get_cache_path(file_path, cache_dir, variant=variant,
+                                                   options={"encoding": encoding, "kwargs": kwargs})
+        if columnar_cache.is_valid(cache_path, file_path):
+            log = columnar_cache.read(cache_path)
+        else:
+            source = columnar_cache.get_source_info(file_path)
+            log = read_xes(file_path, variant=variant, return_legacy_log_object=False, encoding=encoding, **kwargs)
+            os.makedirs(cache_dir, exist_ok=True)
+            try:
+                columnar_cache.write(log, cache_path, source=source)
+            except TypeError:
+                # the log contains values that cannot be stored in the cache: it is returned without caching it
+                pass
+
+        if return_legacy_log_object:
+            from pm4py.objects.conversion.log import converter as log_converter
+            log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG)
+
+        return log
+
     from pm4py.objects.log.importer.xes import importer as xes_importer
 
     v = xes_importer.Variants.CHUNK_REGEX
@@ -92,6 +123,8 @@ def read_xes(
         v = xes_importer.Variants.CHUNK_REGEX
     elif variant == "rustxes":
         v = xes_importer.Variants.RUSTXES
+    elif variant == "chunk_regex_parallel":
+        v = xes_importer.Variants.CHUNK_REGEX_PARALLEL
 
     from copy import copy
     parameters = copy(kwargs)
@@ -406,7 +439,7 @@ def read_ocel2_json(
     Reads an OCEL 2.0 event log from a JSON-OCEL2 file.
 
     :param file_path: Path to the JSON file (`.jsonocel`).
-    :param variant_str: [Optional] Specification of the importer variant to be used.
+    :param variant_str: [Optional] Specification of the importer variant to be used (e.g., `ocel20_streaming` parses the file incrementally, for logs that do not fit in memory as a JSON document).
     :param encoding: Encoding to be used (default: `utf-8`).
     :rtype: `OCEL`
 
@@ -423,6 +456,8 @@ def read_ocel2_json(
     variant = jsonocel_importer.Variants.OCEL20_STANDARD
     if variant_str == "ocel20_rustxes":
         variant = jsonocel_importer.Variants.OCEL20_RUSTXES
+    elif variant_str == "ocel20_streaming":
+        variant = jsonocel_importer.Variants.OCEL20_STREAMING
 
     return jsonocel_importer.apply(
         file_path,
@@ -434,30 +469,68 @@ def read_ocel2_json(
 def read_ocel2_sqlite(
     file_path: str,
     variant_str: Optional[str] = None,
-    encoding: str = constants.DEFAULT_ENCODING
-) -> OCEL:
+    encoding: str = constants.DEFAULT_ENCODING,
+    object_types: Optional[Collection[str]] = None,
+    activities: Optional[Collection[str]] = None,
+    min_timestamp: Optional[Union[datetime.datetime, str]] = None,
+    max_timestamp: Optional[Union[datetime.datetime, str]] = None,
+    lazy: bool = False
+) -> Union[OCEL, "LazyOCEL"]:
     """
     Reads an OCEL 2.0 event log from a SQLite database.
 
+    When filters are provided, the `ocel20_lazy` importer variant is used (it is the only one supporting them):
+    the filters are pushed into the SQL queries, and only the selected slice of the database is read (in chunks),
+    returning an OCEL. With lazy=True, a lazy handle on the database (`LazyOCEL`) is returned instead of an OCEL:
+    it can be further filtered (filter_object_types, filter_activities, filter_timestamp, select_attributes) and
+    the OCEL is materialized when calling materialize().
+
     :param file_path: Path to the OCEL 2.0 SQLite database file (`.sqlite`).
-    :param variant_str: [Optional] Specification of the importer variant to be used.
+    :param variant_str: [Optional] Specification of the importer variant to be used (`ocel20`, the default without
+        filters, or `ocel20_lazy`, the default with filters).
     :param encoding: Encoding to be used (default: `utf-8`).
-    :rtype: `OCEL`
+    :param object_types: [Optional] Object types to keep (the events related to no object of these types are removed).
+    :param activities: [Optional] Activities to keep.
+    :param min_timestamp: [Optional] Left extreme of the allowed timestamp interval (format: YYYY-mm-dd HH:MM:SS).
+    :param max_timestamp: [Optional] Right extreme of the allowed timestamp interval (format: YYYY-mm-dd HH:MM:SS).
+    :param lazy: Returns a lazy handle on the database instead of an OCEL (default: False).
+    :rtype: `OCEL` (or `LazyOCEL` if lazy=True)
 
     .. code-block:: python3
 
         import pm4py
 
         ocel = pm4py.read_ocel2_sqlite("<path_to_ocel_file.sqlite>")
+
+        lazy_ocel = pm4py.read_ocel2_sqlite("<path_to_ocel_file.sqlite>", lazy=True)
+        ocel = lazy_ocel.filter_object_types(["order"]).filter_timestamp("2023-01-01 00:00:00", "2023-02-01 00:00:00").materialize()
     """
     if not os.path.exists(file_path):
         raise Exception("File does not exist")
 
     from pm4py.objects.ocel.importer.sqlite import importer as sqlite_importer
+
+    parameters = {"encoding": encoding}
+    filters = {"object_types": object_types, "activities": activities, "min_timestamp": min_timestamp,
+               "max_timestamp": max_timestamp}
+    filters = {x: y for x, y in filters.items() if y is not None}
+
+    if (filters or lazy) and variant_str not in (None, "ocel20_lazy"):
+        raise Exception("the filters and the lazy handle are supported only by the ocel20_lazy variant")
+    parameters.update(filters)
+
+    if lazy:
+        from pm4py.objects.ocel.importer.sqlite.variants import ocel20_lazy
+        return ocel20_lazy.open_lazy(file_path, parameters=parameters)
+
+    variant = sqlite_importer.Variants.OCEL20
+    if filters or variant_str == "ocel20_lazy":
+        variant = sqlite_importer.Variants.OCEL20_LAZY
+
     return sqlite_importer.apply(
         file_path,
-        variant=sqlite_importer.Variants.OCEL20,
-        parameters={"encoding": encoding}
+        variant=variant,
+        parameters=parameters
     )
 
 
@@ -470,7 +543,7 @@ def read_ocel2_xml(
     Reads an OCEL 2.0 event log from an XML file.
 
     :param file_path: Path to the OCEL 2.0 XML file (`.xmlocel`).
-    :param variant_str: [Optional] Specification of the importer variant to be used.
+    :param variant_str: [Optional] Specification of the importer variant to be used (e.g., `ocel20_streaming` parses the file incrementally, for logs that do not fit in memory as a XML tree).
     :param encoding: Encoding to be used (default: `utf-8`).
     :rtype: `OCEL`
 
@@ -487,9 +560,35 @@ def read_ocel2_xml(
     variant = xml_importer.Variants.OCEL20
     if variant_str == "ocel20_rustxes":
         variant = xml_importer.Variants.OCEL20_RUSTXES
+    elif variant_str == "ocel20_streaming":
+        variant = xml_importer.Variants.OCEL20_STREAMING
 
     return xml_importer.apply(
         file_path,
         variant=variant,
         parameters={"encoding": encoding}
     )
+
+
+def read_cache(file_path: str, categorical: bool = False) -> DataFrame:
+    """
+    Reads an event log stored in the columnar cache format of pm4py (see `write_cache`).
+    The numeric and timestamp columns, and the codes of the string columns, are memory-mapped,
+    so the log is loaded much faster than from the original file.
+
+    :param file_path: Path to the cache file (`.pm4pycache`) on disk.
+    :param categorical: Boolean indicating whether the string columns (e.g., the activities and the resources) should
+        be returned as pandas categoricals instead of being decoded (default: `False`).
+    :rtype: `pandas.DataFrame`
+
+    .. code-block:: python3
+
+        import pm4py
+
+        dataframe = pm4py.read_cache("<path_to_cache_file>")
+    """
+    if not os.path.exists(file_path):
+        raise Exception("File does not exist")
+
+    from pm4py.objects.log.util import columnar_cache
+    return columnar_cache.read(file_path, parameters={columnar_cache.Parameters.CATEGORICAL: categorical})
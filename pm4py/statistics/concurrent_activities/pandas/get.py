@@ -21,7 +21,7 @@ Contact: info@processintelligence.solutions
 '''
 from enum import Enum
 
-from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_concurrent_events_dataframe
+from pm4py.algo.discovery.dfg.adapters.pandas.efg_statistics import get_concurrent_activities_statistics
 from pm4py.util import exec_utils, constants, xes_constants
 from typing import Optional, Dict, Any, Union, Tuple
 import pandas as pd
@@ -68,11 +68,9 @@ def apply(dataframe: pd.DataFrame, parameters: Optional[Dict[Union[str, Paramete
     start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
     strict = exec_utils.get_param_value(Parameters.STRICT, parameters, False)
 
-    concurrent_dataframe = get_concurrent_events_dataframe(dataframe, start_timestamp_key=start_timestamp_key,
-                                                           timestamp_key=timestamp_key, case_id_glue=case_id_glue,
-                                                           activity_key=activity_key, strict=strict)
-
-    ret_dict0 = concurrent_dataframe.groupby([activity_key, activity_key + '_2']).size().to_dict()
+    ret_dict0 = get_concurrent_activities_statistics(dataframe, start_timestamp_key=start_timestamp_key,
+                                                     timestamp_key=timestamp_key, case_id_glue=case_id_glue,
+                                                     activity_key=activity_key, strict=strict)
     ret_dict = {}
 
     # assure to avoid problems with np.float64, by using the Python float type
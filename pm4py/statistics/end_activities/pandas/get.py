@@ -47,7 +47,7 @@ def get_end_activities(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Pa
     Parameters
     -----------
     df
-        Pandas dataframe
+        Pandas dataframe (or prepared log, see pm4py.objects.log.util.prepared_log)
     parameters
         Parameters of the algorithm, including:
             Parameters.CASE_ID_KEY -> Case ID column in the dataframe
@@ -63,6 +63,12 @@ def get_end_activities(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Pa
 
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+
+    from pm4py.objects.log.util import prepared_log
+    if prepared_log.is_prepared_log(df):
+        if df.matches(case_id_glue, activity_key):
+            return df.count_activity_codes(df.get_end_activities_codes())
+        df = df.dataframe
     grouped_df = parameters[GROUPED_DATAFRAME] if GROUPED_DATAFRAME in parameters else None
 
     if grouped_df is None:
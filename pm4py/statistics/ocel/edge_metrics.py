@@ -24,7 +24,7 @@ from typing import Optional, Dict, Any, Tuple, Collection, Set, List
 from enum import Enum
 from pm4py.util import exec_utils, constants
 from pm4py.objects.ocel import constants as ocel_constants
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import soj_time_business_hours_diff_array
 import numpy as np
 import datetime
 
@@ -94,21 +94,22 @@ def performance_calculation_ocel_aggregation(ocel: OCEL, aggregation: Dict[str,
         ret[ot] = {}
         for act in aggregation[ot]:
             ret[ot][act] = []
-            for el in aggregation[ot][act]:
-                if business_hours:
-                    bh = BusinessHours(timestamps[el[0]],
-                                       timestamps[el[1]],
-                                       business_hour_slots=business_hours_slots,
-                                       workcalendar=workcalendar)
-                    diff = bh.get_seconds()
-                else:
+            couples = list(aggregation[ot][act])
+            if business_hours:
+                # the business hours of all the couples are computed at once
+                if couples:
+                    ret[ot][act] = soj_time_business_hours_diff_array([timestamps[el[0]] for el in couples],
+                                                                      [timestamps[el[1]] for el in couples],
+                                                                      business_hours_slots, workcalendar).tolist()
+            else:
+                for el in couples:
                     timedelta = timestamps[el[1]] - timestamps[el[0]]
                     diff = 0
                     if isinstance(timedelta, np.timedelta64):
                         diff = timedelta / np.timedelta64(1, 's')
                     elif isinstance(timedelta, datetime.timedelta):
                         diff = timedelta.total_seconds()
-                ret[ot][act].append(diff)
+                    ret[ot][act].append(diff)
             ret[ot][act] = sorted(ret[ot][act])
 
     return ret
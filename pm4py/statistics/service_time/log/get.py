@@ -23,7 +23,7 @@ from enum import Enum
 
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.objects.conversion.log import converter as log_converter
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import get_calculator
 from typing import Optional, Dict, Any, Union
 from pm4py.objects.log.obj import EventLog
 
@@ -81,6 +81,7 @@ def apply(log: EventLog, parameters: Optional[Dict[Union[str, Parameters], Any]]
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
 
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots, work_calendar=workcalendar)
 
     log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
 
@@ -101,9 +102,8 @@ def apply(log: EventLog, parameters: Optional[Dict[Union[str, Parameters], Any]]
         for event in trace:
             activity = event[activity_key]
             if business_hours:
-                bh = BusinessHours(event[start_timestamp_key], event[timestamp_key],
-                                   business_hour_slots=business_hours_slots, workcalendar=workcalendar)
-                durations_dict[activity].append(bh.get_seconds())
+                durations_dict[activity].append(bh_calculator.get_seconds_between(event[start_timestamp_key],
+                                                                                  event[timestamp_key]))
             else:
                 start_time = event[start_timestamp_key].timestamp()
                 complete_time = event[timestamp_key].timestamp()
@@ -21,7 +21,7 @@ Contact: info@processintelligence.solutions
 '''
 from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
 import statistics
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import get_calculator
 from pm4py.util import exec_utils, constants
 from enum import Enum
 from typing import Optional, Dict, Any, Union
@@ -65,6 +65,7 @@ def get_case_arrival_avg(log: EventLog, parameters: Optional[Dict[Union[str, Par
     business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots, work_calendar=workcalendar)
 
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
 
@@ -74,9 +75,7 @@ def get_case_arrival_avg(log: EventLog, parameters: Optional[Dict[Union[str, Par
     case_diff_start_time = []
     for i in range(len(case_start_time)-1):
         if business_hours:
-            bh = BusinessHours(case_start_time[i], case_start_time[i+1],
-                               business_hour_slots=business_hours_slots, workcalendar=workcalendar)
-            case_diff_start_time.append(bh.get_seconds())
+            case_diff_start_time.append(bh_calculator.get_seconds_between(case_start_time[i], case_start_time[i+1]))
         else:
             case_diff_start_time.append((case_start_time[i+1]-case_start_time[i]).total_seconds())
 
@@ -112,6 +111,7 @@ def get_case_dispersion_avg(log: EventLog, parameters: Optional[Dict[Union[str,
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
 
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots, work_calendar=workcalendar)
 
     timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, DEFAULT_TIMESTAMP_KEY)
 
@@ -121,9 +121,7 @@ def get_case_dispersion_avg(log: EventLog, parameters: Optional[Dict[Union[str,
     case_diff_end_time = []
     for i in range(len(case_end_time)-1):
         if business_hours:
-            bh = BusinessHours(case_end_time[i], case_end_time[i+1],
-                               business_hour_slots=business_hours_slots, workcalendar=workcalendar)
-            case_diff_end_time.append(bh.get_seconds())
+            case_diff_end_time.append(bh_calculator.get_seconds_between(case_end_time[i], case_end_time[i+1]))
         else:
             case_diff_end_time.append((case_end_time[i+1]-case_end_time[i]).total_seconds())
 
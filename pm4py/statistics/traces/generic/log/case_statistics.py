@@ -23,7 +23,7 @@ from pm4py.statistics.variants.log import get as variants_get
 from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
 from pm4py.util.xes_constants import DEFAULT_TRACEID_KEY
 from pm4py.statistics.traces.generic.common import case_duration as case_duration_commons
-from pm4py.util.business_hours import BusinessHours
+from pm4py.util.business_hours import get_calculator
 import numpy as np
 from enum import Enum
 from pm4py.util import exec_utils
@@ -142,6 +142,7 @@ def get_cases_description(log: EventLog,  parameters: Optional[Dict[Union[str, P
     business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
 
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+    bh_calculator = get_calculator(business_hour_slots=business_hours_slots, work_calendar=workcalendar)
 
     statistics_list = []
 
@@ -151,9 +152,7 @@ def get_cases_description(log: EventLog,  parameters: Optional[Dict[Union[str, P
             st = trace[0][timestamp_key]
             et = trace[-1][timestamp_key]
             if business_hours:
-                bh = BusinessHours(st, et,
-                                   business_hour_slots=business_hours_slots, workcalendar=workcalendar)
-                diff = bh.get_seconds()
+                diff = bh_calculator.get_seconds_between(st, et)
             else:
                 diff = et.timestamp() - st.timestamp()
             st = st.timestamp()
@@ -52,8 +52,10 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         footprints
             Footprints
         parameters
-            Parameters of the algorithm
+            Parameters of the algorithm (including the parameters of the windows, see StreamingAlgorithm)
         """
+        if parameters is None:
+            parameters = {}
         self.footprints = footprints
         self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
         self.activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters,
@@ -63,7 +65,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         self.activities = footprints[ACTIVITIES]
         self.all_fps = set(footprints[SEQUENCE]).union(set(footprints[PARALLEL]))
         self.build_dictionaries(parameters=parameters)
-        StreamingAlgorithm.__init__(self)
+        StreamingAlgorithm.__init__(self, parameters=parameters)
 
     def build_dictionaries(self, parameters):
         """
@@ -87,6 +89,9 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         self.case_dict = generator.apply(variant=dict_variant, parameters=parameters_case_dict)
         self.dev_dict = generator.apply(variant=dict_variant, parameters=parameters_dev_dict)
 
+    def _get_dictionaries(self):
+        return [self.case_dict, self.dev_dict]
+
     def encode_str(self, stru):
         """
         Encodes a string for storage in generic dictionaries
@@ -123,6 +128,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         """
         if case not in self.case_dict.keys():
             self.dev_dict[case] = 0
+        self._window_add(("events", case))
         if activity in self.activities:
             if case not in self.case_dict.keys():
                 self.verify_start_case(case, activity)
@@ -130,7 +136,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
                 self.verify_intra_case(case, activity)
             self.case_dict[case] = activity
         else:
-            self.dev_dict[case] = int(self.dev_dict[case]) + 1
+            self.add_deviation(case)
             self.message_activity_not_possible(activity, case)
 
     def verify_intra_case(self, case, activity):
@@ -147,7 +153,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
         prev = self.case_dict[case]
         df = (prev, activity)
         if df not in self.all_fps:
-            self.dev_dict[case] = int(self.dev_dict[case]) + 1
+            self.add_deviation(case)
             self.message_footprints_not_possible(df, case)
 
     def verify_start_case(self, case, activity):
@@ -162,9 +168,21 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
             Activity
         """
         if activity not in self.start_activities:
-            self.dev_dict[case] = int(self.dev_dict[case]) + 1
+            self.add_deviation(case)
             self.message_start_activity_not_possible(activity, case)
 
+    def add_deviation(self, case):
+        """
+        Counts a deviation for the given case
+
+        Parameters
+        ----------------
+        case
+            Case
+        """
+        self.dev_dict[case] = int(self.dev_dict[case]) + 1
+        self._window_add(("deviations", case))
+
     def get_status(self, case):
         """
         Gets the current status of a case
@@ -206,7 +224,7 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
             curr = self.case_dict[case]
             if curr not in self.end_activities:
                 self.message_end_activity_not_possible(curr, case)
-                self.dev_dict[case] = int(self.dev_dict[case]) + 1
+                self.add_deviation(case)
             num_dev = int(self.dev_dict[case])
             del self.case_dict[case]
             del self.dev_dict[case]
@@ -318,6 +336,30 @@ class FootprintsStreamingConformance(StreamingAlgorithm):
 
         return pandas_utils.instantiate_dataframe(diagn_stream)
 
+    def _window_result(self, aggregate):
+        """
+        Gets a diagnostics dataframe with the status of the cases in a window
+        (considering only the deviations happened in the window)
+
+        Returns
+        -------
+        diagn_df
+            Diagnostics dataframe
+        """
+        deviations = {}
+        for (kind, case), count in aggregate.items():
+            if kind == "deviations":
+                deviations[case] = deviations.get(case, 0) + count
+            elif case not in deviations:
+                deviations[case] = 0
+
+        diagn_stream = []
+
+        for case, num_dev in deviations.items():
+            diagn_stream.append({"case": case, "is_fit": num_dev == 0, "deviations": num_dev})
+
+        return pandas_utils.instantiate_dataframe(diagn_stream)
+
 
 def apply(footprints, parameters=None):
     """
@@ -21,9 +21,10 @@ Contact: info@processintelligence.solutions
 '''
 from pm4py.util import constants, exec_utils, xes_constants
 from pm4py.streaming.util.dictio import generator
+from pm4py.streaming.util.dictio.versions import bounded
 import logging
 from pm4py.objects.petri_net.obj import PetriNet, Marking
-from pm4py.streaming.algo.interface import StreamingAlgorithm
+from pm4py.streaming.algo.interface import StreamingAlgorithm, get_dictionary_state, set_dictionary_state
 from pm4py.objects.petri_net import semantics
 from pm4py.util import pandas_utils, nx_utils
 from copy import copy
@@ -36,6 +37,8 @@ class Parameters:
     CASE_DICT_ID = "case_dict_id"
     MISSING_DICT_ID = "missing_dict_id"
     REMAINING_DICT_ID = "remaining_dict_id"
+    MAX_CASES = "max_cases"
+    CASE_IDLE_TTL = "case_idle_ttl"
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     MAXIMUM_ITERATIONS_INVISIBLES = "maximum_iterations_invisibles"
@@ -54,6 +57,16 @@ class TbrStreamingConformance(StreamingAlgorithm):
             Initial marking
         fm
             Final marking
+        parameters
+            Parameters of the algorithm, including:
+            - Parameters.CASE_ID_KEY => the key of the event to use as case identifier
+            - Parameters.ACTIVITY_KEY => the key of the event to use as activity
+            - Parameters.MAXIMUM_ITERATIONS_INVISIBLES => maximum number of iterations to enable a transition
+                                                          through invisible transitions (default: 10)
+            - Parameters.MAX_CASES => maximum number of open cases kept in memory (the least recently updated cases
+                                      are evicted and finalized as incomplete, see case_evicted) (default: None)
+            - Parameters.CASE_IDLE_TTL => seconds after which a case without events is evicted (default: None)
+            - the parameters of the checkpoints and of the windows (see StreamingAlgorithm)
         """
         if parameters is None:
             parameters = {}
@@ -69,7 +82,7 @@ class TbrStreamingConformance(StreamingAlgorithm):
         self.activities = list(set(x.label for x in self.net.transitions))
         self.dictio_spaths = self.get_paths_net()
         self.build_dictionaries(parameters=parameters)
-        StreamingAlgorithm.__init__(self)
+        StreamingAlgorithm.__init__(self, parameters=parameters)
 
     def build_dictionaries(self, parameters):
         """
@@ -83,18 +96,27 @@ class TbrStreamingConformance(StreamingAlgorithm):
              - Parameters.CASE_DICT_ID: identifier of the dictionary hosting the markings (0)
              - Parameters.MISSING_DICT_ID: identifier of the dictionary hosting the missing tokens (1)
              - Parameters.REMAINING_DICT_ID: identifier of the dictionary hosting the remaining tokens (2)
+             - Parameters.MAX_CASES, Parameters.CASE_IDLE_TTL: if provided, the dictionary hosting the markings
+                is a bounded case-state store (with the given maximum size and idle TTL)
         """
         dict_variant = exec_utils.get_param_value(Parameters.DICT_VARIANT, parameters, generator.Variants.THREAD_SAFE)
         case_dict_id = exec_utils.get_param_value(Parameters.CASE_DICT_ID, parameters, 0)
         missing_dict_id = exec_utils.get_param_value(Parameters.MISSING_DICT_ID, parameters, 1)
         remaining_dict_id = exec_utils.get_param_value(Parameters.REMAINING_DICT_ID, parameters, 2)
+        max_cases = exec_utils.get_param_value(Parameters.MAX_CASES, parameters, None)
+        case_idle_ttl = exec_utils.get_param_value(Parameters.CASE_IDLE_TTL, parameters, None)
         parameters_case_dict = copy(parameters)
         parameters_case_dict[Parameters.DICT_ID] = case_dict_id
         parameters_missing = copy(parameters)
-        parameters_case_dict[Parameters.DICT_ID] = missing_dict_id
+        parameters_missing[Parameters.DICT_ID] = missing_dict_id
         parameters_remaining = copy(parameters)
         parameters_remaining[Parameters.DICT_ID] = remaining_dict_id
-        self.case_dict = generator.apply(variant=dict_variant, parameters=parameters_case_dict)
+        if max_cases is not None or case_idle_ttl is not None:
+            self.case_dict = bounded.apply(parameters={bounded.Parameters.MAX_SIZE: max_cases,
+                                                       bounded.Parameters.IDLE_TTL: case_idle_ttl,
+                                                       bounded.Parameters.EVICTION_CALLBACK: self.case_evicted})
+        else:
+            self.case_dict = generator.apply(variant=dict_variant, parameters=parameters_case_dict)
         self.missing = generator.apply(variant=dict_variant, parameters=parameters_missing)
         self.remaining = generator.apply(variant=dict_variant, parameters=parameters_remaining)
 
@@ -189,12 +211,16 @@ class TbrStreamingConformance(StreamingAlgorithm):
         activity
             Activity
         """
+        self._window_add(("events", case))
         if activity in self.activities:
-            if case not in self.case_dict:
-                self.case_dict[case] = self.encode_marking(copy(self.im))
+            # a single access to the dictionary of the markings (the case could expire between two accesses)
+            encoded_marking = self.case_dict.get(case)
+            if encoded_marking is None:
+                encoded_marking = self.encode_marking(copy(self.im))
+                self.case_dict[case] = encoded_marking
                 self.missing[case] = 0
                 self.remaining[case] = 0
-            marking = self.decode_marking(self.case_dict[case])
+            marking = self.decode_marking(encoded_marking)
             new_marking = marking
             prev_marking = None
             correct_exec = False
@@ -223,6 +249,7 @@ class TbrStreamingConformance(StreamingAlgorithm):
                     mark = a.weight
                     if pl not in marking or new_marking[pl] < mark:
                         self.missing[case] = int(self.missing[case]) + (mark - marking[pl])
+                        self._window_add(("missing", case), mark - marking[pl])
                         marking[pl] = mark
                 new_marking = semantics.weak_execute(t, marking)
                 self.case_dict[case] = self.encode_marking(new_marking)
@@ -276,8 +303,9 @@ class TbrStreamingConformance(StreamingAlgorithm):
         case
             Case
         """
-        if case in self.case_dict:
-            return {"marking": self.decode_marking(self.case_dict[case]), "missing": int(self.missing[case])}
+        encoded_marking = self.case_dict.get(case)
+        if encoded_marking is not None:
+            return {"marking": self.decode_marking(encoded_marking), "missing": int(self.missing[case])}
         else:
             self.message_case_not_in_dictionary(case)
 
@@ -296,40 +324,87 @@ class TbrStreamingConformance(StreamingAlgorithm):
             Dictionary containing: the marking, the count of missing and remaining tokens
         """
         case = self.encode_str(case)
-        if case in self.case_dict:
-            remaining = 0
-            if not self.decode_marking(self.case_dict[case]) == self.fm:
-                new_marking = self.reach_fm_with_invisibles(self.case_dict[case])
-                if new_marking is None:
-                    new_marking = self.decode_marking(self.case_dict[case])
-                if not new_marking == self.fm:
-                    self.message_final_marking_not_reached(case, new_marking)
-                    fm_copy = copy(self.fm)
-                    for m in fm_copy:
-                        if not m in new_marking:
-                            new_marking[m] = 0
-                        self.missing[case] = int(self.missing[case]) + (fm_copy[m] - new_marking[m])
-                    for m in new_marking:
-                        if not m in fm_copy:
-                            fm_copy[m] = 0
-                        remaining += new_marking[m] - fm_copy[m]
-            missing = int(self.missing[case])
-            is_fit = missing == 0 and remaining == 0
-            ret = {"marking": self.decode_marking(self.case_dict[case]), "missing": missing, "remaining": remaining, "is_fit": is_fit}
+        encoded_marking = self.case_dict.get(case)
+        if encoded_marking is not None:
+            ret = self.finalize_case(case, encoded_marking)
             del self.case_dict[case]
-            del self.missing[case]
-            del self.remaining[case]
             return ret
         else:
             self.message_case_not_in_dictionary(case)
 
+    def finalize_case(self, case, encoded_marking, incomplete=False):
+        """
+        Computes the final diagnostics of a case, removing its missing and remaining tokens from the dictionaries
+
+        Parameters
+        ----------------
+        case
+            Case ID
+        encoded_marking
+            Current (encoded) marking of the case
+        incomplete
+            Boolean value (if True, the case is evicted before its termination, and the missed final marking
+            is not notified)
+
+        Returns
+        ---------------
+        dictio
+            Dictionary containing: the marking, the count of missing and remaining tokens
+        """
+        remaining = 0
+        if not self.decode_marking(encoded_marking) == self.fm:
+            new_marking = self.reach_fm_with_invisibles(encoded_marking)
+            if new_marking is None:
+                new_marking = self.decode_marking(encoded_marking)
+            if not new_marking == self.fm:
+                if not incomplete:
+                    self.message_final_marking_not_reached(case, new_marking)
+                fm_copy = copy(self.fm)
+                for m in fm_copy:
+                    if not m in new_marking:
+                        new_marking[m] = 0
+                    self.missing[case] = int(self.missing[case]) + (fm_copy[m] - new_marking[m])
+                    self._window_add(("missing", case), fm_copy[m] - new_marking[m])
+                for m in new_marking:
+                    if not m in fm_copy:
+                        fm_copy[m] = 0
+                    remaining += new_marking[m] - fm_copy[m]
+        missing = int(self.missing[case])
+        is_fit = missing == 0 and remaining == 0
+        ret = {"marking": self.decode_marking(encoded_marking), "missing": missing, "remaining": remaining, "is_fit": is_fit}
+        del self.missing[case]
+        del self.remaining[case]
+        return ret
+
+    def case_evicted(self, case, encoded_marking, reason):
+        """
+        Finalizes a case evicted from the (bounded) dictionary of the markings as incomplete
+
+        Parameters
+        ----------------
+        case
+            Case ID
+        encoded_marking
+            Current (encoded) marking of the case
+        reason
+            Reason of the eviction (size or ttl)
+        """
+        if case in self.missing:
+            ret = self.finalize_case(case, encoded_marking, incomplete=True)
+            ret["incomplete"] = True
+            self.message_case_evicted(case, ret, reason)
+
     def terminate_all(self):
         """
         Terminate all open cases
         """
         cases = list(self.case_dict.keys())
         for case in cases:
-            self.terminate(case)
+            encoded_marking = self.case_dict.get(case)
+            # the cases expired during the iteration have already been finalized (see case_evicted)
+            if encoded_marking is not None:
+                self.finalize_case(case, encoded_marking)
+                del self.case_dict[case]
 
     def reach_fm_with_invisibles(self, marking):
         """
@@ -415,6 +490,21 @@ class TbrStreamingConformance(StreamingAlgorithm):
         """
         logging.error("the case " + str(case) + " is not in the dictionary! case: " + str(case))
 
+    def message_case_evicted(self, case, diagnostics, reason):
+        """
+        Sends a message if a case is evicted before its termination (and finalized as incomplete)
+
+        Parameters
+        ---------------
+        case
+            Case
+        diagnostics
+            Diagnostics of the case (marking, missing and remaining tokens)
+        reason
+            Reason of the eviction (size or ttl)
+        """
+        logging.warning("the case " + str(case) + " is evicted (" + str(reason) + ") before its termination! diagnostics: " + str(diagnostics))
+
     def message_final_marking_not_reached(self, case, marking):
         """
         Sends a message if the final marking could not be reached
@@ -445,13 +535,48 @@ class TbrStreamingConformance(StreamingAlgorithm):
         diagn_stream = []
 
         for case in cases:
-            status = self.get_status(case)
-            missing = status["missing"]
+            missing = int(self.missing[case])
             is_fit = missing == 0
             diagn_stream.append({"case": case, "is_fit": is_fit, "missing": missing})
 
         return pandas_utils.instantiate_dataframe(diagn_stream)
 
+    def _window_result(self, aggregate):
+        """
+        Gets a diagnostics dataframe with the status of the cases in a window
+        (considering only the missing tokens inserted in the window)
+
+        Returns
+        -------
+        diagn_df
+            Diagnostics dataframe
+        """
+        missing = {}
+        for (kind, case), count in aggregate.items():
+            if kind == "missing":
+                missing[case] = missing.get(case, 0) + count
+            elif case not in missing:
+                missing[case] = 0
+
+        diagn_stream = []
+
+        for case, case_missing in missing.items():
+            diagn_stream.append({"case": case, "is_fit": case_missing == 0, "missing": case_missing})
+
+        return pandas_utils.instantiate_dataframe(diagn_stream)
+
+    def _get_dictionaries(self):
+        return [self.case_dict, self.missing, self.remaining]
+
+    def _get_state(self):
+        return {"case_dict": get_dictionary_state(self.case_dict), "missing": get_dictionary_state(self.missing),
+                "remaining": get_dictionary_state(self.remaining)}
+
+    def _set_state(self, state):
+        set_dictionary_state(self.case_dict, state["case_dict"])
+        set_dictionary_state(self.missing, state["missing"])
+        set_dictionary_state(self.remaining, state["remaining"])
+
 
 def apply(net, im, fm, parameters=None):
     """
@@ -67,6 +67,7 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
              - Parameters.DICT_VARIANT => the variant of dictionary to use
              - Parameters.CASE_DICT_ID => the identifier of the case dictionary
              - Parameters.DEV_DICT_ID => the identifier of the deviations dictionary
+             - the parameters of the windows (see StreamingAlgorithm)
         """
         if parameters is None:
             parameters = {}
@@ -89,7 +90,10 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
         dev_dict_id = exec_utils.get_param_value(Parameters.DEV_DICT_ID, parameters, 1)
         parameters_dev[Parameters.DICT_ID] = dev_dict_id
         self.deviations_dict = generator.apply(variant=dict_variant, parameters=parameters_dev)
-        StreamingAlgorithm.__init__(self)
+        StreamingAlgorithm.__init__(self, parameters=parameters)
+
+    def _get_dictionaries(self):
+        return [self.case_dictionary, self.deviations_dict]
 
     def _process(self, event: Event):
         """
@@ -140,6 +144,7 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
                         this_dev = json.loads(self.deviations_dict[case])
                         this_dev.append(dev_descr)
                         self.deviations_dict[case] = json.dumps(this_dev)
+                        self._window_add(dev_descr)
                         self.message_deviation(dev_descr)
 
     def message_event_is_not_complete(self, event: Event):
@@ -180,6 +185,23 @@ class TemporalProfileStreamingConformance(StreamingAlgorithm):
                 dev_dict[x] = y
         return dev_dict
 
+    def _window_result(self, aggregate) -> typing.TemporalProfileStreamingConfResults:
+        """
+        Gets the deviations identified by conformance checking in a window
+
+        Returns
+        -------------
+        deviations_dict
+            Deviations dictionary
+        """
+        dev_dict = {}
+        for dev_descr, count in aggregate.items():
+            if count > 0:
+                if dev_descr[0] not in dev_dict:
+                    dev_dict[dev_descr[0]] = []
+                dev_dict[dev_descr[0]].extend([list(dev_descr)] * count)
+        return dev_dict
+
 
 def apply(temporal_profile: typing.TemporalProfile, parameters: Optional[Dict[Any, Any]] = None):
     """
@@ -22,7 +22,8 @@ Contact: info@processintelligence.solutions
 from collections import Counter
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.streaming.util.dictio import generator
-from pm4py.streaming.algo.interface import StreamingAlgorithm
+from pm4py.streaming.util.dictio.versions import bounded
+from pm4py.streaming.algo.interface import StreamingAlgorithm, get_dictionary_state, set_dictionary_state
 from enum import Enum
 from copy import copy
 import logging
@@ -35,6 +36,8 @@ class Parameters(Enum):
     DFG_DICT_ID = "dfg_dict_id"
     ACT_DICT_ID = "act_dict_id"
     START_ACT_DICT_ID = "start_act_dict_id"
+    MAX_CASES = "max_cases"
+    CASE_IDLE_TTL = "case_idle_ttl"
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
 
@@ -49,6 +52,10 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         parameters of the algorithm, including:
          - Parameters.ACTIVITY_KEY: the key of the event to use as activity
          - Parameters.CASE_ID_KEY: the key of the event to use as case identifier
+         - Parameters.MAX_CASES: maximum number of open cases kept in memory (the least recently updated cases
+                                 are evicted, and their last activity is counted as end activity) (default: None)
+         - Parameters.CASE_IDLE_TTL: seconds after which a case without events is evicted (default: None)
+         - the parameters of the checkpoints and of the windows (see StreamingAlgorithm)
         """
         if parameters is None:
             parameters = {}
@@ -58,8 +65,11 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
                                                        xes_constants.DEFAULT_NAME_KEY)
         self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters,
                                                       constants.CASE_CONCEPT_NAME)
+        self.evicted_end_activities = {}
+        # pane of the window and activity of the last event of every case counted in the windows
+        self.window_case_pane = {}
         self.build_dictionaries(parameters)
-        StreamingAlgorithm.__init__(self)
+        StreamingAlgorithm.__init__(self, parameters=parameters)
 
     def build_dictionaries(self, parameters):
         """
@@ -75,12 +85,16 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
              - Parameters.DFG_DICT_ID: identifier of the DFG dictionary (1)
              - Parameters.ACT_ID: identifier of the dictionary hosting the count of the activities (2)
              - Parameters.START_ACT_DICT_ID: identifier of the dictionary hosting the count of the start activities (3)
+             - Parameters.MAX_CASES, Parameters.CASE_IDLE_TTL: if provided, the case dictionary is a bounded
+                case-state store (with the given maximum size and idle TTL)
         """
         dict_variant = exec_utils.get_param_value(Parameters.DICT_VARIANT, parameters, generator.Variants.THREAD_SAFE)
         case_dict_id = exec_utils.get_param_value(Parameters.CASE_DICT_ID, parameters, 0)
         dfg_dict_id = exec_utils.get_param_value(Parameters.DFG_DICT_ID, parameters, 1)
         act_dict_id = exec_utils.get_param_value(Parameters.ACT_DICT_ID, parameters, 2)
         start_act_dict_id = exec_utils.get_param_value(Parameters.START_ACT_DICT_ID, parameters, 3)
+        max_cases = exec_utils.get_param_value(Parameters.MAX_CASES, parameters, None)
+        case_idle_ttl = exec_utils.get_param_value(Parameters.CASE_IDLE_TTL, parameters, None)
         parameters_case_dict = copy(parameters)
         parameters_case_dict[Parameters.DICT_ID] = case_dict_id
         parameters_dfg = copy(parameters)
@@ -89,11 +103,32 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         parameters_activities[Parameters.DICT_ID] = act_dict_id
         parameters_start_activities = copy(parameters)
         parameters_start_activities[Parameters.DICT_ID] = start_act_dict_id
-        self.case_dict = generator.apply(variant=dict_variant, parameters=parameters_case_dict)
+        if max_cases is not None or case_idle_ttl is not None:
+            self.case_dict = bounded.apply(parameters={bounded.Parameters.MAX_SIZE: max_cases,
+                                                       bounded.Parameters.IDLE_TTL: case_idle_ttl,
+                                                       bounded.Parameters.EVICTION_CALLBACK: self.case_evicted})
+        else:
+            self.case_dict = generator.apply(variant=dict_variant, parameters=parameters_case_dict)
         self.dfg = generator.apply(variant=dict_variant, parameters=parameters_dfg)
         self.activities = generator.apply(variant=dict_variant, parameters=parameters_activities)
         self.start_activities = generator.apply(variant=dict_variant, parameters=parameters_start_activities)
 
+    def case_evicted(self, case, last_activity, reason):
+        """
+        Finalizes a case evicted from the (bounded) case dictionary, counting its last activity as end activity
+
+        Parameters
+        ----------------
+        case
+            Case
+        last_activity
+            Last activity of the case
+        reason
+            Reason of the eviction (size or ttl)
+        """
+        self.evicted_end_activities[last_activity] = self.evicted_end_activities.get(last_activity, 0) + 1
+        self.window_case_pane.pop(case, None)
+
     def event_without_activity_or_case(self, event):
         """
         Print an error message when an event is without the
@@ -118,6 +153,18 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         """
         return str(tup)
 
+    def increment(self, dictio, key):
+        """
+        Increments the count associated to a key in a generic dictionary (using the atomic increment of the
+        dictionary, when available, to avoid a read-modify-write)
+        """
+        if hasattr(dictio, "increment"):
+            dictio.increment(key)
+        elif key not in dictio:
+            dictio[key] = 1
+        else:
+            dictio[key] = int(dictio[key]) + 1
+
     def _process(self, event):
         """
         Receives an event from the live event stream,
@@ -131,21 +178,24 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         if self.case_id_key in event and self.activity_key in event:
             case = self.encode_str(event[self.case_id_key])
             activity = self.encode_str(event[self.activity_key])
-            if case not in self.case_dict:
-                if activity not in self.start_activities:
-                    self.start_activities[activity] = 1
-                else:
-                    self.start_activities[activity] = int(self.start_activities[activity]) + 1
-            else:
-                df = self.encode_tuple((self.case_dict[case], activity))
-                if df not in self.dfg:
-                    self.dfg[df] = 1
-                else:
-                    self.dfg[df] = int(self.dfg[df]) + 1
-            if activity not in self.activities:
-                self.activities[activity] = 1
+            # a single access to the case dictionary (the case could expire between two accesses)
+            prev = self.case_dict.get(case)
+            if prev is None:
+                self.increment(self.start_activities, activity)
+                self._window_add(("start_activities", activity))
             else:
-                self.activities[activity] = int(self.activities[activity]) + 1
+                self.increment(self.dfg, self.encode_tuple((prev, activity)))
+                self._window_add(("dfg", (prev, activity)))
+            self.increment(self.activities, activity)
+            pane = self._window_pane()
+            if pane is not None:
+                if case in self.window_case_pane:
+                    # the previous event is no more the last one of the case
+                    prev_pane, prev_activity = self.window_case_pane[case]
+                    self._window_add(("end_activities", prev_activity), -1, pane=prev_pane)
+                self._window_add(("activities", activity))
+                self._window_add(("end_activities", activity))
+                self.window_case_pane[case] = (pane, activity)
             self.case_dict[case] = activity
         else:
             self.event_without_activity_or_case(event)
@@ -165,12 +215,54 @@ class StreamingDfgDiscovery(StreamingAlgorithm):
         end_activities
             End activities
         """
-        dfg = {eval(x): int(self.dfg[x]) for x in self.dfg}
-        activities = {x: int(self.activities[x]) for x in self.activities}
-        start_activities = {x: int(self.start_activities[x]) for x in self.start_activities}
-        end_activities = dict(Counter(self.case_dict[x] for x in self.case_dict))
+        dfg = {eval(x): int(y) for x, y in self.dfg.items()}
+        activities = {x: int(y) for x, y in self.activities.items()}
+        start_activities = {x: int(y) for x, y in self.start_activities.items()}
+        end_activities = Counter(v for k, v in self.case_dict.items())
+        end_activities.update(self.evicted_end_activities)
+        end_activities = dict(end_activities)
         return dfg, activities, start_activities, end_activities
 
+    def _window_result(self, aggregate):
+        """
+        Gets the DFG of a window, from the aggregate of the contributions of its events.
+        The end activities of the window are the last activities of the cases having their last event in the window.
+
+        Returns
+        ----------------
+        dfg
+            Directly-Follows Graph
+        activities
+            Activities
+        start_activities
+            Start activities
+        end_activities
+            End activities
+        """
+        ret = {"dfg": {}, "activities": {}, "start_activities": {}, "end_activities": {}}
+        for (kind, key), count in aggregate.items():
+            if count > 0:
+                ret[kind][key] = count
+        return ret["dfg"], ret["activities"], ret["start_activities"], ret["end_activities"]
+
+    def _get_dictionaries(self):
+        return [self.case_dict, self.dfg, self.activities, self.start_activities]
+
+    def _get_state(self):
+        return {"case_dict": get_dictionary_state(self.case_dict), "dfg": get_dictionary_state(self.dfg),
+                "activities": get_dictionary_state(self.activities),
+                "start_activities": get_dictionary_state(self.start_activities),
+                "evicted_end_activities": dict(self.evicted_end_activities),
+                "window_case_pane": dict(self.window_case_pane)}
+
+    def _set_state(self, state):
+        set_dictionary_state(self.case_dict, state["case_dict"])
+        set_dictionary_state(self.dfg, state["dfg"])
+        set_dictionary_state(self.activities, state["activities"])
+        set_dictionary_state(self.start_activities, state["start_activities"])
+        self.evicted_end_activities = dict(state["evicted_end_activities"])
+        self.window_case_pane = dict(state.get("window_case_pane", {}))
+
 
 def apply(parameters=None):
     """
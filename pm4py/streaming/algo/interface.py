@@ -20,13 +20,104 @@ Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
 import abc
+import time
+from enum import Enum
 from threading import Lock
 import traceback
 
+from pm4py.util import exec_utils, xes_constants
+
+
+class Parameters(Enum):
+    CHECKPOINT_PATH = "checkpoint_path"
+    CHECKPOINT_INTERVAL = "checkpoint_interval"
+    WINDOW_SIZE = "window_size"
+    WINDOW_SLIDE = "window_slide"
+    WINDOW_MEASURE = "window_measure"
+    WINDOW_TIMESTAMP_KEY = "window_timestamp_key"
+    WINDOW_HISTORY = "window_history"
+    WINDOW_CALLBACK = "window_callback"
+
+
+def get_dictionary_state(dictio):
+    """
+    Gets the state of a dictionary used by a streaming algorithm (for the checkpoints).
+    For the bounded case-state stores, the state is a list of (key, value, seconds since the last access),
+    otherwise it is a dictionary.
+    """
+    if hasattr(dictio, "get_state"):
+        return dictio.get_state()
+    return dict(dictio.items())
+
+
+def set_dictionary_state(dictio, state):
+    """
+    Restores the state of a dictionary used by a streaming algorithm (from the checkpoints).
+    The state can be restored also in a different type of dictionary (e.g., when the eviction is enabled
+    after a restart).
+    """
+    if hasattr(dictio, "set_state"):
+        if isinstance(state, dict):
+            state = [(key, value, 0.0) for key, value in state.items()]
+        dictio.set_state(state)
+    else:
+        if not isinstance(state, dict):
+            state = {x[0]: x[1] for x in state}
+        for key in list(dictio.keys()):
+            del dictio[key]
+        for key, value in state.items():
+            dictio[key] = value
+
+
+def close_dictionary(dictio):
+    """
+    Closes a dictionary used by a streaming algorithm, sending its buffered writes (for the dictionaries buffering
+    them, e.g., the pipelined Redis hashes)
+    """
+    if hasattr(dictio, "close"):
+        dictio.close()
+
 
 class StreamingAlgorithm(abc.ABC):
     def __init__(self, parameters=None):
+        """
+        Initializes the streaming algorithm
+
+        Parameters
+        ---------------
+        parameters
+            Parameters of the algorithm, including:
+            - Parameters.CHECKPOINT_PATH => path of the local file in which the state is periodically stored
+                                            (default: None, no periodic checkpoint)
+            - Parameters.CHECKPOINT_INTERVAL => seconds between two periodic checkpoints (default: 60)
+            - Parameters.WINDOW_SIZE => if provided, the results are also computed on a window of the stream
+                                        of the given size (seconds, or number of events) (default: None)
+            - Parameters.WINDOW_SLIDE => slide of the window (default: the size, i.e., tumbling windows)
+            - Parameters.WINDOW_MEASURE => measure of the window: time or count (default: time)
+            - Parameters.WINDOW_TIMESTAMP_KEY => attribute of the events to use as timestamp (default: time:timestamp)
+            - Parameters.WINDOW_HISTORY => number of closed windows for which the result is kept (default: 1)
+            - Parameters.WINDOW_CALLBACK => function called with the start, the end and the result of every
+                                            closed window (default: None)
+        """
+        if parameters is None:
+            parameters = {}
+
         self._lock = Lock()
+        self._checkpoint_path = exec_utils.get_param_value(Parameters.CHECKPOINT_PATH, parameters, None)
+        self._checkpoint_interval = exec_utils.get_param_value(Parameters.CHECKPOINT_INTERVAL, parameters, 60)
+        self._last_checkpoint = time.time()
+        self._window = None
+        window_size = exec_utils.get_param_value(Parameters.WINDOW_SIZE, parameters, None)
+        if window_size is not None:
+            from pm4py.streaming.util import windowing
+            self._window = windowing.PaneWindow(
+                window_size, slide=exec_utils.get_param_value(Parameters.WINDOW_SLIDE, parameters, None),
+                measure=exec_utils.get_param_value(Parameters.WINDOW_MEASURE, parameters, windowing.MEASURE_TIME),
+                timestamp_key=exec_utils.get_param_value(Parameters.WINDOW_TIMESTAMP_KEY, parameters,
+                                                         xes_constants.DEFAULT_TIMESTAMP_KEY),
+                history=exec_utils.get_param_value(Parameters.WINDOW_HISTORY, parameters, 1),
+                callback=exec_utils.get_param_value(Parameters.WINDOW_CALLBACK, parameters, None),
+                result_function=self._window_result)
 
     @abc.abstractmethod
     def _process(self, event):
@@ -36,6 +127,117 @@ class StreamingAlgorithm(abc.ABC):
     def _current_result(self):
         pass
 
+    def _get_state(self):
+        """
+        Gets the state of the algorithm (to be stored in a checkpoint).
+        Should be overridden by the algorithms supporting the checkpoints.
+        """
+        raise NotImplementedError("the algorithm does not support checkpoints")
+
+    def _set_state(self, state):
+        """
+        Restores the state of the algorithm (from a checkpoint).
+        Should be overridden by the algorithms supporting the checkpoints.
+        """
+        raise NotImplementedError("the algorithm does not support checkpoints")
+
+    def _get_dictionaries(self):
+        """
+        Gets the dictionaries hosting the state of the algorithm (closed by close()).
+        Should be overridden by the algorithms storing their state in dictionaries.
+        """
+        return []
+
+    def _window_result(self, aggregate):
+        """
+        Computes the result of a window from the aggregate of the contributions of its events.
+        Should be overridden by the algorithms supporting the windows.
+        """
+        raise NotImplementedError("the algorithm does not support windows")
+
+    def _window_add(self, key, amount=1, pane=None):
+        """
+        Adds a contribution to the window (if enabled), by default to the pane of the current event
+        """
+        if self._window is not None:
+            self._window.add(key, amount, pane=pane)
+
+    def _window_pane(self):
+        """
+        Gets the pane of the current event (None if the windows are not enabled, or the event is not counted in them)
+        """
+        if self._window is not None:
+            return self._window.event_pane
+
+    def _receive_event(self, event):
+        # an error in the windows does not prevent the processing of the event (and vice versa)
+        if self._window is not None:
+            try:
+                self._window.begin(event)
+            except:
+                traceback.print_exc()
+        try:
+            self._process(event)
+        except:
+            traceback.print_exc()
+        if self._window is not None:
+            self._window.end()
+
+    def _write_checkpoint(self, file_path):
+        from pm4py.streaming.util.dictio.versions import bounded
+        state = self._get_state()
+        if self._window is not None:
+            state["window"] = self._window.get_state()
+        bounded.write_state(state, file_path)
+        self._last_checkpoint = time.time()
+
+    def _periodic_checkpoint(self):
+        if self._checkpoint_path is not None and time.time() - self._last_checkpoint >= self._checkpoint_interval:
+            try:
+                self._write_checkpoint(self._checkpoint_path)
+            except:
+                traceback.print_exc()
+
+    def checkpoint(self, file_path=None):
+        """
+        Stores the state of the algorithm in a local file (replaced atomically)
+
+        Parameters
+        ---------------
+        file_path
+            Path of the file (default: the checkpoint path provided in the parameters)
+        """
+        if file_path is None:
+            file_path = self._checkpoint_path
+        self._lock.acquire()
+        try:
+            self._write_checkpoint(file_path)
+        finally:
+            self._lock.release()
+
+    def restore(self, file_path=None):
+        """
+        Restores the state of the algorithm from a local file written by a checkpoint,
+        e.g., to resume the computation after a restart.
+        The file is unpickled: it should be read only from trusted locations.
+
+        Parameters
+        ---------------
+        file_path
+            Path of the file (default: the checkpoint path provided in the parameters)
+        """
+        from pm4py.streaming.util.dictio.versions import bounded
+        if file_path is None:
+            file_path = self._checkpoint_path
+        state = bounded.read_state(file_path)
+        self._lock.acquire()
+        try:
+            self._set_state(state)
+            if self._window is not None and "window" in state:
+                self._window.set_state(state["window"])
+        finally:
+            self._lock.release()
+
     def get(self):
         self._lock.acquire()
         try:
@@ -46,10 +248,60 @@ class StreamingAlgorithm(abc.ABC):
         self._lock.release()
         return ret
 
-    def receive(self, event):
+    def get_window(self):
+        """
+        Gets the result of the current window of the stream (requires the windows to be enabled, see the parameters)
+        """
+        if self._window is None:
+            raise Exception("the windows are not enabled for the streaming algorithm")
         self._lock.acquire()
         try:
-            self._process(event)
-        except:
-            traceback.print_exc()
+            return self._window.get_result()
+        finally:
+            self._lock.release()
+
+    def get_closed_windows(self):
+        """
+        Gets the list of the (start, end, result) of the last closed windows of the stream
+        (requires the windows to be enabled, see the parameters)
+        """
+        if self._window is None:
+            raise Exception("the windows are not enabled for the streaming algorithm")
+        self._lock.acquire()
+        try:
+            return self._window.get_closed_windows()
+        finally:
+            self._lock.release()
+
+    def close(self):
+        """
+        Terminates the algorithm, sending the buffered writes of its dictionaries (e.g., the pipelined Redis hashes).
+        To be called when the stream is finished.
+        """
+        self._lock.acquire()
+        try:
+            for dictio in self._get_dictionaries():
+                close_dictionary(dictio)
+        finally:
+            self._lock.release()
+
+    def receive(self, event):
+        self._lock.acquire()
+        self._receive_event(event)
+        self._periodic_checkpoint()
+        self._lock.release()
+
+    def receive_batch(self, events):
+        """
+        Receives a batch of events, processing them in order (the lock is acquired once for the entire batch)
+
+        Parameters
+        ---------------
+        events
+            List of events
+        """
+        self._lock.acquire()
+        for event in events:
+            self._receive_event(event)
+        self._periodic_checkpoint()
         self._lock.release()
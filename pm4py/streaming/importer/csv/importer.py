@@ -21,11 +21,12 @@ Contact: info@processintelligence.solutions
 '''
 from enum import Enum
 from pm4py.util import exec_utils
-from pm4py.streaming.importer.csv.variants import csv_event_stream
+from pm4py.streaming.importer.csv.variants import csv_event_stream, csv_batch_stream
 
 
 class Variants(Enum):
     CSV_EVENT_STREAM = csv_event_stream
+    CSV_BATCH_STREAM = csv_batch_stream
 
 
 DEFAULT_VARIANT = Variants.CSV_EVENT_STREAM
@@ -42,6 +43,7 @@ def apply(path, variant=DEFAULT_VARIANT, parameters=None):
     variant
         Variant of the importer, possible values:
          - Variants.CSV_EVENT_STREAM
+         - Variants.CSV_BATCH_STREAM
     parameters
         Parameters of the importer
 
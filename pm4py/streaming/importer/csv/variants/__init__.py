@@ -19,4 +19,4 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from pm4py.streaming.importer.csv.variants import csv_event_stream
+from pm4py.streaming.importer.csv.variants import csv_event_stream, csv_batch_stream
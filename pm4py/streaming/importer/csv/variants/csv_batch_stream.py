@@ -0,0 +1,216 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+from enum import Enum
+
+from pm4py.objects.log.util import dataframe_utils
+from pm4py.streaming.util.rate_limiter import RateLimiter
+from pm4py.util import exec_utils, pandas_utils, xes_constants, constants
+
+
+class Parameters(Enum):
+    BATCH_SIZE = "batch_size"
+    SEP = "sep"
+    ENCODING = "encoding"
+    TIMESTAMP_COLUMNS = "timestamp_columns"
+    TIMESTAMP_FORMAT = "timestamp_format"
+    BATCH_TRANSFORMATION_FUNCTION = "batch_transformation_function"
+    BATCH_ACCEPTANCE_CONDITION = "batch_acceptance_condition"
+    TRANSFORMATION_FUNCTION = "transformation_function"
+    ACCEPTANCE_CONDITION = "acceptance_condition"
+    SPEED_UP = "speed_up"
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+
+class CSVBatchStreamReader(object):
+    def __init__(self, path, parameters=None):
+        """
+        Reads a CSV file as a stream of events, parsing it in chunks of rows (pandas).
+        The timestamp columns are parsed, and the transformations and filters are applied, once per chunk.
+
+        Parameters
+        -------------
+        path
+            Path to the CSV file
+        parameters
+            Parameters of the reader, including:
+            - Parameters.BATCH_SIZE => number of rows of every chunk (default: 10000)
+            - Parameters.SEP => separator of the CSV file (default: ,)
+            - Parameters.ENCODING => encoding of the CSV file (default: utf-8)
+            - Parameters.TIMESTAMP_COLUMNS => columns to parse as timestamps (default: the timestamp key)
+            - Parameters.TIMESTAMP_FORMAT => format of the timestamps (default: inferred)
+            - Parameters.BATCH_TRANSFORMATION_FUNCTION => function transforming every chunk (dataframe)
+            - Parameters.BATCH_ACCEPTANCE_CONDITION => function returning, for a chunk, the boolean mask
+                                                       of the rows to keep
+            - Parameters.TRANSFORMATION_FUNCTION => function transforming every event (default: None)
+            - Parameters.ACCEPTANCE_CONDITION => function deciding if an event is kept (default: None)
+            - Parameters.SPEED_UP => if provided, the events are sent to the event stream reproducing their
+                                     original inter-arrival times, accelerated by the given factor (default: None)
+            - Parameters.TIMESTAMP_KEY => attribute used as timestamp by the rate limiter (default: time:timestamp)
+        """
+        if parameters is None:
+            parameters = {}
+        self.path = path
+        self.parameters = parameters
+        self.batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 10000)
+        self.sep = exec_utils.get_param_value(Parameters.SEP, parameters, ",")
+        self.encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+        self.timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                                        xes_constants.DEFAULT_TIMESTAMP_KEY)
+        self.timestamp_columns = exec_utils.get_param_value(Parameters.TIMESTAMP_COLUMNS, parameters,
+                                                            [self.timestamp_key])
+        self.timestamp_format = exec_utils.get_param_value(Parameters.TIMESTAMP_FORMAT, parameters, None)
+        self.batch_transformation_function = exec_utils.get_param_value(
+            Parameters.BATCH_TRANSFORMATION_FUNCTION, parameters, None)
+        self.batch_acceptance_condition = exec_utils.get_param_value(Parameters.BATCH_ACCEPTANCE_CONDITION,
+                                                                     parameters, None)
+        self.transformation_function = exec_utils.get_param_value(Parameters.TRANSFORMATION_FUNCTION, parameters,
+                                                                  None)
+        self.acceptance_condition = exec_utils.get_param_value(Parameters.ACCEPTANCE_CONDITION, parameters, None)
+        speed_up = exec_utils.get_param_value(Parameters.SPEED_UP, parameters, None)
+        self.rate_limiter = RateLimiter(speed_up, timestamp_key=self.timestamp_key) if speed_up is not None else None
+        self.reset()
+
+    def reset(self):
+        """
+        Resets the reader (restarting from the beginning of the file)
+        """
+        # the values are kept as strings (as in the event-by-event CSV reader), except for the timestamps
+        self.chunks = pandas_utils.read_csv(self.path, sep=self.sep, encoding=self.encoding, dtype=str,
+                                            keep_default_na=False, na_filter=False, chunksize=self.batch_size)
+        self.batch = []
+        self.batch_index = 0
+        self.reading_log = True
+        if self.rate_limiter is not None:
+            self.rate_limiter.reset()
+
+    def __iter__(self):
+        """
+        Starts the iteration
+        """
+        return self
+
+    def __next__(self):
+        """
+        Gets the next event of the log
+        """
+        while self.batch_index >= len(self.batch):
+            self.batch = self.read_batch()
+            self.batch_index = 0
+            if self.batch is None:
+                self.batch = []
+                raise StopIteration
+        self.batch_index += 1
+        return self.batch[self.batch_index - 1]
+
+    def read_batch(self):
+        """
+        Reads the next batch of events from the CSV file
+
+        Returns
+        ------------
+        events
+            List of events (None when the end of the file is reached)
+        """
+        while self.reading_log:
+            try:
+                df = next(self.chunks)
+            except StopIteration:
+                self.reading_log = False
+                self.chunks.close()
+                return None
+            timestamp_columns = [x for x in self.timestamp_columns if x in df.columns]
+            if timestamp_columns:
+                df = dataframe_utils.convert_timestamp_columns_in_df(df, timest_format=self.timestamp_format,
+                                                                    timest_columns=timestamp_columns)
+            if self.batch_transformation_function is not None:
+                df = self.batch_transformation_function(df)
+            if self.batch_acceptance_condition is not None:
+                df = df[self.batch_acceptance_condition(df)]
+            events = self.to_events(df)
+            if self.transformation_function is not None:
+                events = [self.transformation_function(event) for event in events]
+            if self.acceptance_condition is not None:
+                events = [event for event in events if self.acceptance_condition(event)]
+            if events:
+                return events
+        return None
+
+    def to_events(self, df):
+        """
+        Converts a chunk to a list of events (column by column, which is faster than the records conversion of pandas)
+        """
+        columns = list(df.columns)
+        values = []
+        for col in columns:
+            if "date" in str(df[col].dtype) or "time" in str(df[col].dtype):
+                values.append(list(df[col].dt.to_pydatetime()))
+            else:
+                values.append(df[col].tolist())
+        return [dict(zip(columns, row)) for row in zip(*values)]
+
+    def iterate_batches(self):
+        """
+        Iterates over the batches of events of the CSV file
+        """
+        while True:
+            events = self.read_batch()
+            if events is None:
+                return
+            yield events
+
+    def to_event_stream(self, event_stream):
+        """
+        Sends the content of a CSV log to an event stream (batch by batch, if the stream supports it).
+        If the speed-up is provided, the original inter-arrival times of the events are reproduced.
+
+        Parameters
+        --------------
+        event_stream
+            Event stream
+        """
+        for events in self.iterate_batches():
+            sub_batches = self.rate_limiter.release(events) if self.rate_limiter is not None else [events]
+            for sub_batch in sub_batches:
+                if hasattr(event_stream, "append_batch"):
+                    event_stream.append_batch(sub_batch)
+                else:
+                    for event in sub_batch:
+                        event_stream.append(event)
+
+
+def apply(path, parameters=None):
+    """
+    Creates the CSVBatchStreamReader object
+
+    Parameters
+    -------------
+    path
+        Path to the CSV file
+    parameters
+        Parameters
+
+    Returns
+    -------------
+    stream_read_obj
+        Stream reader object
+    """
+    return CSVBatchStreamReader(path, parameters=parameters)
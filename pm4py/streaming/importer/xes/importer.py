@@ -19,7 +19,7 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from pm4py.streaming.importer.xes.variants import xes_trace_stream, xes_event_stream
+from pm4py.streaming.importer.xes.variants import xes_trace_stream, xes_event_stream, xes_batch_stream
 from enum import Enum
 from pm4py.util import exec_utils
 
@@ -27,6 +27,7 @@ from pm4py.util import exec_utils
 class Variants(Enum):
     XES_EVENT_STREAM = xes_event_stream
     XES_TRACE_STREAM = xes_trace_stream
+    XES_BATCH_STREAM = xes_batch_stream
 
 
 DEFAULT_VARIANT = Variants.XES_EVENT_STREAM
@@ -44,6 +45,7 @@ def apply(path, variant=DEFAULT_VARIANT, parameters=None):
         Variant of the importer:
          - Variants.XES_EVENT_STREAM
          - Variants.XES_TRACE_STREAM
+         - Variants.XES_BATCH_STREAM
 
     Returns
     ---------------
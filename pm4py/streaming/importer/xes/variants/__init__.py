@@ -19,4 +19,4 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from pm4py.streaming.importer.xes.variants import xes_event_stream, xes_trace_stream
+from pm4py.streaming.importer.xes.variants import xes_event_stream, xes_trace_stream, xes_batch_stream
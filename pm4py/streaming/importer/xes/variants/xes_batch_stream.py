@@ -0,0 +1,293 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import logging
+from enum import Enum
+
+from pm4py.objects.log.obj import Event
+from pm4py.streaming.util.rate_limiter import RateLimiter
+from pm4py.util import xes_constants, exec_utils, constants, pandas_utils
+from pm4py.util.dt_parsing import parser as dt_parser
+from pm4py.util.dt_parsing.variants import strpfromiso
+
+
+class Parameters(Enum):
+    BATCH_SIZE = "batch_size"
+    ACCEPTANCE_CONDITION = "acceptance_condition"
+    BATCH_ACCEPTANCE_CONDITION = "batch_acceptance_condition"
+    SPEED_UP = "speed_up"
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+
+_EVENT_END = 'end'
+_EVENT_START = 'start'
+
+# regular expression matching the timezone designator at the end of an ISO timestamp
+_TIMEZONE_DESIGNATOR = r"(Z|[+-]\d\d:?\d\d)$"
+
+
+def _local_tag(elem):
+    return elem.tag.rpartition("}")[2]
+
+
+class StreamingBatchXesReader:
+    def __init__(self, path, parameters=None):
+        """
+        Reads a XES log as a stream of events, in batches.
+        The events are parsed directly from the elements of the XES (without the generic attribute parsing of the
+        event-by-event reader), and the timestamps of a batch are parsed together (vectorized).
+
+        Parameters
+        -------------
+        path
+            Path to the XES log
+        parameters
+            Parameters of the reader, including:
+            - Parameters.BATCH_SIZE => number of events of every batch (default: 10000)
+            - Parameters.ACCEPTANCE_CONDITION => function deciding if an event is kept (default: None)
+            - Parameters.BATCH_ACCEPTANCE_CONDITION => function filtering the list of events of a batch (default: None)
+            - Parameters.SPEED_UP => if provided, the events are sent to the event stream reproducing their
+                                     original inter-arrival times, accelerated by the given factor (default: None)
+            - Parameters.TIMESTAMP_KEY => attribute used as timestamp by the rate limiter (default: time:timestamp)
+        """
+        if parameters is None:
+            parameters = {}
+        self.path = path
+        self.batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 10000)
+        self.acceptance_condition = exec_utils.get_param_value(Parameters.ACCEPTANCE_CONDITION, parameters, None)
+        self.batch_acceptance_condition = exec_utils.get_param_value(Parameters.BATCH_ACCEPTANCE_CONDITION,
+                                                                     parameters, None)
+        timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                                   xes_constants.DEFAULT_TIMESTAMP_KEY)
+        speed_up = exec_utils.get_param_value(Parameters.SPEED_UP, parameters, None)
+        self.rate_limiter = RateLimiter(speed_up, timestamp_key=timestamp_key) if speed_up is not None else None
+        self.date_parser = dt_parser.get()
+        self.reset()
+
+    def reset(self):
+        """
+        Resets the reader (restarting from the beginning of the log)
+        """
+        from lxml import etree
+
+        self.context = etree.iterparse(self.path, events=[_EVENT_START, _EVENT_END],
+                                       tag=["{*}" + xes_constants.TAG_TRACE, "{*}" + xes_constants.TAG_EVENT])
+        self.trace_attributes = None
+        self.batch = []
+        self.batch_index = 0
+        self.reading_log = True
+        if self.rate_limiter is not None:
+            self.rate_limiter.reset()
+
+    def __iter__(self):
+        """
+        Starts the iteration
+        """
+        return self
+
+    def __next__(self):
+        """
+        Gets the next event of the log
+        """
+        while self.batch_index >= len(self.batch):
+            self.batch = self.read_batch()
+            self.batch_index = 0
+            if self.batch is None:
+                self.batch = []
+                raise StopIteration
+        self.batch_index += 1
+        return self.batch[self.batch_index - 1]
+
+    def parse_children(self, elem, store, dates):
+        """
+        Parses the attributes contained in an element of the XES
+
+        Parameters
+        -------------
+        elem
+            Element (event, trace, or attribute with children)
+        store
+            Dictionary (or list, for the values of a list attribute) in which the attributes are stored
+        dates
+            List in which the (store, key, value) of the date attributes are inserted (to be parsed later)
+        """
+        for child in elem:
+            tag = _local_tag(child)
+            key = child.get(xes_constants.KEY_KEY)
+            value = child.get(xes_constants.KEY_VALUE)
+            try:
+                if tag == xes_constants.TAG_STRING or tag == xes_constants.TAG_ID:
+                    pass
+                elif tag == xes_constants.TAG_DATE:
+                    if len(child) == 0 and type(store) is not list:
+                        dates.append((store, key, value))
+                        continue
+                    value = self.date_parser.apply(value)
+                elif tag == xes_constants.TAG_INT:
+                    value = int(value)
+                elif tag == xes_constants.TAG_FLOAT:
+                    value = float(value)
+                elif tag == xes_constants.TAG_BOOLEAN:
+                    value = str(value).lower() == "true"
+                elif tag == xes_constants.TAG_LIST:
+                    # lists have no value, hence we put None as a value
+                    value = None
+                else:
+                    continue
+            except (AttributeError, TypeError, ValueError):
+                logging.info("failed to parse " + str(tag) + ": " + str(value))
+                continue
+            if len(child) == 0:
+                if type(store) is list:
+                    store.append((key, value))
+                else:
+                    store[key] = value
+            elif _local_tag(child[0]) == xes_constants.TAG_VALUES:
+                store[key] = {xes_constants.KEY_VALUE: value, xes_constants.KEY_CHILDREN: list()}
+                self.parse_children(child[0], store[key][xes_constants.KEY_CHILDREN], dates)
+            else:
+                store[key] = {xes_constants.KEY_VALUE: value, xes_constants.KEY_CHILDREN: dict()}
+                self.parse_children(child, store[key][xes_constants.KEY_CHILDREN], dates)
+
+    def parse_dates(self, dates):
+        """
+        Parses the date attributes of a batch (all at once) and stores them in their events.
+        Consistently with the XES importers, the timezone designator is discarded.
+        """
+        if not dates:
+            return
+        values = pandas_utils.DATAFRAME.Series([x[2] for x in dates], dtype=str)
+        parsed = pandas_utils.dataframe_column_string_to_datetime(
+            values.str.replace(_TIMEZONE_DESIGNATOR, "", regex=True), format="ISO8601", errors="coerce")
+        parsed = strpfromiso.fix_dataframe_column(parsed)
+        for (store, key, value), dt, is_nat in zip(dates, parsed.dt.to_pydatetime(), parsed.isna()):
+            if is_nat:
+                # fallback to the parser of the XES importers
+                try:
+                    dt = self.date_parser.apply(value)
+                except (AttributeError, TypeError, ValueError):
+                    logging.info("failed to parse date: " + str(value))
+                    continue
+            store[key] = dt
+
+    def read_batch(self):
+        """
+        Reads the next batch of events from the XES log
+
+        Returns
+        ------------
+        events
+            List of events (None when the end of the log is reached)
+        """
+        while self.reading_log:
+            events = []
+            dates = []
+            for tree_event, elem in self.context:
+                tag = _local_tag(elem)
+                if tree_event == _EVENT_START:
+                    if tag == xes_constants.TAG_EVENT and self.trace_attributes is None:
+                        # the attributes of the trace preceding its first event
+                        self.trace_attributes = {}
+                        trace_dates = []
+                        if elem.getparent() is not None and _local_tag(elem.getparent()) == xes_constants.TAG_TRACE:
+                            self.parse_children(elem.getparent(), self.trace_attributes, trace_dates)
+                            self.parse_dates(trace_dates)
+                        self.trace_attributes = {constants.CASE_ATTRIBUTE_PREFIX + k: v for k, v in
+                                                 self.trace_attributes.items()}
+                    continue
+                if tag == xes_constants.TAG_EVENT:
+                    event = Event()
+                    self.parse_children(elem, event, dates)
+                    for key, value in self.trace_attributes.items():
+                        event[key] = value
+                    events.append(event)
+                    elem.clear()
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+                    if len(events) >= self.batch_size:
+                        break
+                elif tag == xes_constants.TAG_TRACE:
+                    self.trace_attributes = None
+                    elem.clear()
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+            else:
+                self.reading_log = False
+            self.parse_dates(dates)
+            if self.acceptance_condition is not None:
+                events = [event for event in events if self.acceptance_condition(event)]
+            if self.batch_acceptance_condition is not None:
+                events = self.batch_acceptance_condition(events)
+            if events:
+                return events
+        return None
+
+    def iterate_batches(self):
+        """
+        Iterates over the batches of events of the XES log
+        """
+        while True:
+            events = self.read_batch()
+            if events is None:
+                return
+            yield events
+
+    def to_event_stream(self, event_stream):
+        """
+        Sends the content of a XES log to an event stream (batch by batch, if the stream supports it).
+        If the speed-up is provided, the original inter-arrival times of the events are reproduced.
+
+        Parameters
+        --------------
+        event_stream
+            Event stream
+        """
+        for events in self.iterate_batches():
+            sub_batches = self.rate_limiter.release(events) if self.rate_limiter is not None else [events]
+            for sub_batch in sub_batches:
+                if hasattr(event_stream, "append_batch"):
+                    event_stream.append_batch(sub_batch)
+                else:
+                    for event in sub_batch:
+                        event_stream.append(event)
+
+
+def apply(path, parameters=None):
+    """
+    Creates a StreamingBatchXesReader object
+
+    Parameters
+    ---------------
+    path
+        Path
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    ---------------
+    stream_read_obj
+        Stream reader object
+    """
+    return StreamingBatchXesReader(path, parameters=parameters)
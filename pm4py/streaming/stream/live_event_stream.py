@@ -21,6 +21,7 @@ Contact: info@processintelligence.solutions
 '''
 import collections
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pm4py.util import exec_utils
@@ -32,13 +33,54 @@ class StreamState(Enum):
     FINISHED = 3
 
 
+class OverflowPolicy(Enum):
+    # the producer waits until there is space in the buffer
+    BLOCK = "block"
+    # the incoming event is discarded (and counted as dropped)
+    DROP = "drop"
+
+
 class Parameters(Enum):
     THREAD_POOL_SIZE = "thread_pool_size"
+    BATCHED_DELIVERY = "batched_delivery"
+    MAX_BATCH_SIZE = "max_batch_size"
+    MAX_BUFFER_SIZE = "max_buffer_size"
+    OVERFLOW_POLICY = "overflow_policy"
+
+
+class _Batch:
+    def __init__(self, events, num_observers):
+        self.events = events
+        # number of observers that did not process the batch yet
+        self.remaining = num_observers
 
 
 class LiveEventStream:
 
     def __init__(self, parameters=None):
+        """
+        Live event stream, notifying the registered algorithms of the appended events.
+
+        By default, every event is delivered separately to every algorithm through a thread pool.
+        With Parameters.BATCHED_DELIVERY, the events are delivered in micro-batches (receive_batch):
+        each algorithm receives the batches in the order of the stream (one batch at a time),
+        while different algorithms are served in parallel by the thread pool.
+        In this mode, the events appended but not yet processed by all the algorithms can be bounded
+        (Parameters.MAX_BUFFER_SIZE), either blocking the producer or dropping the events
+        (Parameters.OVERFLOW_POLICY). The bound applies also before start(): a blocked producer is released
+        when the stream delivers the buffered events, or when the stream is finished.
+
+        Parameters
+        ---------------
+        parameters
+            Parameters of the stream, including:
+            - Parameters.THREAD_POOL_SIZE => size of the thread pool
+            - Parameters.BATCHED_DELIVERY => enables the batched delivery (default: False)
+            - Parameters.MAX_BATCH_SIZE => maximum number of events in a batch (default: 1000)
+            - Parameters.MAX_BUFFER_SIZE => maximum number of buffered events (default: None, unbounded)
+            - Parameters.OVERFLOW_POLICY => policy when the buffer is full (OverflowPolicy.BLOCK, the default,
+              or OverflowPolicy.DROP)
+        """
         self._dq = collections.deque()
         self._state = StreamState.INACTIVE
         self._lock = threading.Lock()
@@ -46,12 +88,67 @@ class LiveEventStream:
         self._observers = set()
         self._mail_man = None
         self._tp = ThreadPoolExecutor(exec_utils.get_param_value(Parameters.THREAD_POOL_SIZE, parameters, 6))
+        self._batched = exec_utils.get_param_value(Parameters.BATCHED_DELIVERY, parameters, False)
+        self._max_batch_size = exec_utils.get_param_value(Parameters.MAX_BATCH_SIZE, parameters, 1000)
+        self._max_buffer_size = exec_utils.get_param_value(Parameters.MAX_BUFFER_SIZE, parameters, None)
+        self._overflow_policy = OverflowPolicy(exec_utils.get_param_value(Parameters.OVERFLOW_POLICY, parameters,
+                                                                          OverflowPolicy.BLOCK))
+        # batches waiting to be processed by each algorithm, and algorithms having a running delivery task
+        self._pending = {}
+        self._draining = set()
+        # counters
+        self._buffered = 0
+        self._received = 0
+        self._dropped = 0
+        self._delivered = 0
+        self._num_batches = 0
+        self._start_time = None
 
     def append(self, event):
         self._cond.acquire()
+        if self._batched and self._max_buffer_size is not None:
+            if self._overflow_policy == OverflowPolicy.BLOCK:
+                while self._buffered >= self._max_buffer_size and self._state != StreamState.FINISHED:
+                    self._cond.wait()
+            elif self._buffered >= self._max_buffer_size:
+                self._dropped += 1
+                self._cond.release()
+                return
         if self._state != StreamState.FINISHED:
             self._dq.append(event)
-            self._cond.notify()
+            self._buffered += 1
+            self._received += 1
+            if self._batched:
+                self._cond.notify_all()
+            else:
+                self._cond.notify()
+        self._cond.release()
+
+    def append_batch(self, events):
+        """
+        Appends a batch of events to the stream (acquiring the lock once for the entire batch,
+        unless the producer has to wait for space in the buffer)
+
+        Parameters
+        ---------------
+        events
+            List of events
+        """
+        self._cond.acquire()
+        for event in events:
+            if self._batched and self._max_buffer_size is not None:
+                if self._overflow_policy == OverflowPolicy.BLOCK:
+                    while self._buffered >= self._max_buffer_size and self._state != StreamState.FINISHED:
+                        self._cond.notify_all()
+                        self._cond.wait()
+                elif self._buffered >= self._max_buffer_size:
+                    self._dropped += 1
+                    continue
+            if self._state != StreamState.FINISHED:
+                self._dq.append(event)
+                self._buffered += 1
+                self._received += 1
+        self._cond.notify_all()
         self._cond.release()
 
     def _deliver(self):
@@ -65,40 +162,126 @@ class LiveEventStream:
                     self._cond.release()
                     return
             event = self._dq.popleft()
+            self._buffered -= 1
+            self._delivered += 1
             for algo in self._observers:
                 self._tp.submit(algo.receive, event)
             self._cond.release()
 
+    def _deliver_batches(self):
+        while self._state != StreamState.INACTIVE:
+            self._cond.acquire()
+            while len(self._dq) == 0:
+                self._cond.notify_all()
+                if self._state != StreamState.FINISHED:
+                    self._cond.wait()
+                else:
+                    self._cond.release()
+                    return
+            # takes all the events that are available (up to the maximum size of a batch)
+            events = [self._dq.popleft() for _ in range(min(len(self._dq), self._max_batch_size))]
+            batch = _Batch(events, len(self._observers))
+            self._num_batches += 1
+            if batch.remaining == 0:
+                self._complete_batch(batch)
+            for algo in self._observers:
+                self._pending[algo].append(batch)
+                if algo not in self._draining:
+                    # at most one delivery task per algorithm, so the batches are processed in order
+                    self._draining.add(algo)
+                    self._tp.submit(self._drain, algo)
+            self._cond.notify_all()
+            self._cond.release()
+
+    def _drain(self, algo):
+        while True:
+            self._cond.acquire()
+            queue = self._pending.get(algo)
+            if not queue:
+                self._draining.discard(algo)
+                self._cond.notify_all()
+                self._cond.release()
+                return
+            batch = queue.popleft()
+            self._cond.release()
+
+            if hasattr(algo, "receive_batch"):
+                algo.receive_batch(batch.events)
+            else:
+                for event in batch.events:
+                    algo.receive(event)
+
+            self._cond.acquire()
+            batch.remaining -= 1
+            if batch.remaining == 0:
+                self._complete_batch(batch)
+            self._cond.release()
+
+    def _complete_batch(self, batch):
+        # to be called while holding the lock
+        self._buffered -= len(batch.events)
+        self._delivered += len(batch.events)
+        self._cond.notify_all()
+
     def start(self):
         self._cond.acquire()
         self._state = StreamState.ACTIVE
-        self._mail_man = threading.Thread(target=self._deliver)
+        self._start_time = time.time()
+        self._mail_man = threading.Thread(target=self._deliver_batches if self._batched else self._deliver)
         self._mail_man.start()
         self._cond.release()
 
     def stop(self):
         self._cond.acquire()
-        while len(self._dq) > 0:
+        while len(self._dq) > 0 or (self._batched and (self._buffered > 0 or self._draining)):
             self._cond.wait()
         self._tp.shutdown()
         if self._state == StreamState.ACTIVE:
             self._state = StreamState.FINISHED
-            self._cond.notify()
+            self._cond.notify_all()
         self._cond.release()
 
     def register(self, algo):
         self._cond.acquire()
         self._observers.add(algo)
+        if algo not in self._pending:
+            self._pending[algo] = collections.deque()
         self._cond.release()
 
     async def deregister(self, algo):
         self._cond.acquire()
         self._observers.remove(algo)
+        # the batches not yet processed by the algorithm do not need to wait for it anymore
+        for batch in self._pending.pop(algo, []):
+            batch.remaining -= 1
+            if batch.remaining == 0:
+                self._complete_batch(batch)
         self._cond.release()
 
+    def get_statistics(self):
+        """
+        Gets the throughput and lag counters of the stream
+
+        Returns
+        ---------------
+        statistics
+            Dictionary containing:
+            - received => number of events appended to the stream
+            - dropped => number of events dropped because the buffer was full
+            - delivered => number of events delivered (in batched mode, processed by all the algorithms)
+            - batches => number of batches delivered (batched mode)
+            - lag => number of events appended to the stream and not yet delivered
+            - throughput => delivered events per second since the start of the stream
+        """
+        self._cond.acquire()
+        elapsed = time.time() - self._start_time if self._start_time is not None else 0
+        statistics = {"received": self._received, "dropped": self._dropped, "delivered": self._delivered,
+                      "batches": self._num_batches, "lag": self._buffered,
+                      "throughput": self._delivered / elapsed if elapsed > 0 else 0.0}
+        self._cond.release()
+        return statistics
+
     def _get_state(self):
         return self._state
 
     state = property(_get_state)
-
-
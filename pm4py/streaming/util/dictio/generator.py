@@ -21,7 +21,7 @@ Contact: info@processintelligence.solutions
 '''
 from enum import Enum
 
-from pm4py.streaming.util.dictio.versions import classic, thread_safe, redis
+from pm4py.streaming.util.dictio.versions import classic, thread_safe, redis, redis_pipelined, bounded
 from pm4py.util import exec_utils
 
 
@@ -29,6 +29,8 @@ class Variants(Enum):
     CLASSIC = classic
     THREAD_SAFE = thread_safe
     REDIS = redis
+    REDIS_PIPELINED = redis_pipelined
+    BOUNDED = bounded
 
 
 DEFAULT_VARIANT = Variants.THREAD_SAFE
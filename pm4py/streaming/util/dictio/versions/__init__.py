@@ -19,4 +19,4 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from pm4py.streaming.util.dictio.versions import classic, thread_safe
+from pm4py.streaming.util.dictio.versions import classic, thread_safe, bounded, redis_pipelined
@@ -0,0 +1,270 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import os
+import pickle
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from enum import Enum
+from threading import Lock
+from typing import Optional, Dict, Any, Callable, List, Tuple
+
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    MAX_SIZE = "max_size"
+    IDLE_TTL = "idle_ttl"
+    EVICTION_CALLBACK = "eviction_callback"
+
+
+EVICTION_SIZE = "size"
+EVICTION_TTL = "ttl"
+
+
+class CaseStateStore(MutableMapping):
+    """
+    Dictionary (for the state of the cases of streaming algorithms) with a bounded size.
+    The entries that are not accessed for more than idle_ttl seconds expire, and the least recently used entries
+    are evicted when the store exceeds max_size entries. For every expired/evicted entry, the eviction callback
+    is invoked with the key, the value and the reason (EVICTION_TTL or EVICTION_SIZE), so the case can be finalized.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, idle_ttl: Optional[float] = None,
+                 eviction_callback: Optional[Callable[[Any, Any, str], Any]] = None):
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self.eviction_callback = eviction_callback
+        # associates the key to a list [value, time of the last access], in order of last access
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def __expire(self, now: float, evicted: List[Tuple[Any, Any, str]]):
+        # the entries are sorted by last access: the expired ones are at the beginning of the store
+        if self.idle_ttl is not None:
+            while self.entries:
+                key, entry = next(iter(self.entries.items()))
+                if now - entry[1] <= self.idle_ttl:
+                    break
+                del self.entries[key]
+                evicted.append((key, entry[0], EVICTION_TTL))
+
+    def __evict(self, evicted: List[Tuple[Any, Any, str]]):
+        if self.max_size is not None:
+            while len(self.entries) > self.max_size:
+                old_key, old_entry = self.entries.popitem(last=False)
+                evicted.append((old_key, old_entry[0], EVICTION_SIZE))
+
+    def __notify(self, evicted: List[Tuple[Any, Any, str]]):
+        # the callback is invoked outside the lock, so it can also access the store
+        if self.eviction_callback is not None:
+            for key, value, reason in evicted:
+                self.eviction_callback(key, value, reason)
+
+    def __getitem__(self, key):
+        now = time.time()
+        evicted = []
+        self.lock.acquire()
+        try:
+            self.__expire(now, evicted)
+            entry = self.entries.get(key, None)
+            if entry is not None:
+                entry[1] = now
+                self.entries.move_to_end(key)
+        finally:
+            self.lock.release()
+        self.__notify(evicted)
+        if entry is None:
+            raise KeyError(key)
+        return entry[0]
+
+    def __setitem__(self, key, value):
+        now = time.time()
+        evicted = []
+        self.lock.acquire()
+        try:
+            self.__expire(now, evicted)
+            if key in self.entries:
+                self.entries.move_to_end(key)
+            self.entries[key] = [value, now]
+            self.__evict(evicted)
+        finally:
+            self.lock.release()
+        self.__notify(evicted)
+
+    def __delitem__(self, key):
+        self.lock.acquire()
+        try:
+            del self.entries[key]
+        finally:
+            self.lock.release()
+
+    def __contains__(self, key):
+        now = time.time()
+        evicted = []
+        self.lock.acquire()
+        try:
+            self.__expire(now, evicted)
+            ret = key in self.entries
+        finally:
+            self.lock.release()
+        self.__notify(evicted)
+        return ret
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.entries)
+
+    def keys(self):
+        self.lock.acquire()
+        ret = list(self.entries.keys())
+        self.lock.release()
+        return ret
+
+    def values(self):
+        """
+        Gets the values of the store (without updating the time of the last access)
+        """
+        return [value for key, value in self.items()]
+
+    def items(self):
+        """
+        Gets the entries of the store (without updating the time of the last access)
+        """
+        self.lock.acquire()
+        ret = [(key, entry[0]) for key, entry in self.entries.items()]
+        self.lock.release()
+        return ret
+
+    def clear(self):
+        self.lock.acquire()
+        self.entries.clear()
+        self.lock.release()
+
+    def expire(self) -> int:
+        """
+        Removes the expired entries from the whole store (otherwise, they are removed when the store is accessed)
+
+        Returns
+        ---------------
+        num_expired
+            Number of expired entries
+        """
+        now = time.time()
+        evicted = []
+        self.lock.acquire()
+        try:
+            self.__expire(now, evicted)
+        finally:
+            self.lock.release()
+        self.__notify(evicted)
+        return len(evicted)
+
+    def get_state(self) -> List[Tuple[Any, Any, float]]:
+        """
+        Gets the state of the store, as a list of (key, value, seconds since the last access),
+        in order of last access
+        """
+        now = time.time()
+        self.lock.acquire()
+        ret = [(key, entry[0], now - entry[1]) for key, entry in self.entries.items()]
+        self.lock.release()
+        return ret
+
+    def set_state(self, state: List[Tuple[Any, Any, float]]):
+        """
+        Restores the state of the store (see get_state). The idle time of the entries is preserved, and
+        the entries exceeding the capacity of the store (or already expired) are evicted.
+        """
+        now = time.time()
+        evicted = []
+        self.lock.acquire()
+        try:
+            self.entries.clear()
+            # restores the order of last access
+            for key, value, age in sorted(state, key=lambda x: -x[2]):
+                self.entries[key] = [value, now - age]
+            self.__expire(now, evicted)
+            self.__evict(evicted)
+        finally:
+            self.lock.release()
+        self.__notify(evicted)
+
+    def snapshot(self, file_path: str):
+        """
+        Stores the state of the store in a local file (the file is replaced atomically)
+        """
+        write_state(self.get_state(), file_path)
+
+    def restore(self, file_path: str):
+        """
+        Restores the state of the store from a local file written by snapshot.
+        The file is unpickled: it should be read only from trusted locations.
+        """
+        self.set_state(read_state(file_path))
+
+
+def write_state(state: Any, file_path: str):
+    """
+    Pickles a state to a local file, replacing it atomically
+    """
+    temp_path = file_path + ".tmp"
+    with open(temp_path, "wb") as F:
+        pickle.dump(state, F, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, file_path)
+
+
+def read_state(file_path: str) -> Any:
+    """
+    Reads a state pickled by write_state
+    """
+    with open(file_path, "rb") as F:
+        return pickle.load(F)
+
+
+def apply(parameters: Optional[Dict[Any, Any]] = None) -> CaseStateStore:
+    """
+    Creates a bounded dictionary for the state of the cases, with idle-TTL and LRU eviction
+
+    Parameters
+    --------------
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.MAX_SIZE => maximum number of entries (default: None, unbounded)
+        - Parameters.IDLE_TTL => seconds after the last access after which an entry expires (default: None, never)
+        - Parameters.EVICTION_CALLBACK => function invoked with (key, value, reason) for every evicted entry
+
+    Returns
+    --------------
+    store
+        Case-state store
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_size = exec_utils.get_param_value(Parameters.MAX_SIZE, parameters, None)
+    idle_ttl = exec_utils.get_param_value(Parameters.IDLE_TTL, parameters, None)
+    eviction_callback = exec_utils.get_param_value(Parameters.EVICTION_CALLBACK, parameters, None)
+
+    return CaseStateStore(max_size=max_size, idle_ttl=idle_ttl, eviction_callback=eviction_callback)
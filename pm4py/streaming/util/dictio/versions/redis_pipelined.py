@@ -0,0 +1,279 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from enum import Enum
+from threading import RLock
+from typing import Optional, Dict, Any, Iterator, Tuple
+
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    HOSTNAME = "hostname"
+    PORT = "port"
+    DB = "db"
+    DICT_ID = "dict_id"
+    HASH_KEY = "hash_key"
+    BATCH_SIZE = "batch_size"
+    FLUSH_INTERVAL = "flush_interval"
+    SCAN_COUNT = "scan_count"
+    CACHE_SIZE = "cache_size"
+    CONNECTION = "connection"
+
+
+# pending operations on a key (buffered, not yet sent to Redis)
+OP_SET = "set"
+OP_INCR = "incr"
+OP_DEL = "del"
+
+
+def encode_value(value):
+    """
+    Encodes a value as Redis does when it is written (and read back with decode_responses=True)
+    """
+    if isinstance(value, (str, bytes)):
+        return value
+    if isinstance(value, bool):
+        raise TypeError("invalid value for Redis: " + repr(value))
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, int):
+        return str(value)
+    raise TypeError("invalid value for Redis: " + repr(value))
+
+
+class PipelinedRedisDict(MutableMapping):
+    """
+    Dictionary stored in a Redis hash.
+
+    The writes are buffered locally (coalescing the writes to the same key) and sent to Redis through a single
+    pipeline (one round trip) when batch_size keys are pending, or when flush_interval seconds are elapsed
+    since the last flush (checked on every write). The last pending writes are sent by close(), which is invoked
+    when the streaming algorithm using the dictionary is closed.
+    The counters are updated with HINCRBY (see increment), without reading their value.
+    The reads see the pending writes, and the values read from (or written to) Redis are kept in a local LRU cache
+    of cache_size entries, so the values of the active keys (e.g., the last activity of the open cases) are read
+    without a round trip. The iteration (keys, values, items) flushes the pending writes and
+    scans the hash incrementally (HSCAN), without loading the whole keyspace in a single reply.
+
+    The dictionary assumes to be the only writer of its hash (otherwise, the cache should be disabled with
+    cache_size=0).
+    """
+
+    def __init__(self, redis_connection, hash_key: str, batch_size: int = 1000, flush_interval: float = 1.0,
+                 scan_count: int = 1000, cache_size: int = 10000):
+        self.redis_connection = redis_connection
+        self.hash_key = hash_key
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.scan_count = scan_count
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        # associates to a key the pending operation (OP_SET, value), (OP_INCR, amount) or (OP_DEL, None)
+        self.pending = {}
+        self.last_flush = time.time()
+        self.lock = RLock()
+
+    def __cache_value(self, key, value):
+        if self.cache_size > 0:
+            self.cache[key] = value
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def __read(self, key):
+        # reads the value of a key without pending writes (from the cache, or from Redis)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        stored = self.redis_connection.hget(self.hash_key, key)
+        if stored is not None:
+            self.__cache_value(key, stored)
+        return stored
+
+    def __after_write(self):
+        if len(self.pending) >= self.batch_size or (
+                self.flush_interval is not None and time.time() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """
+        Sends the pending writes to Redis (in a single pipeline)
+        """
+        with self.lock:
+            if self.pending:
+                to_set = {}
+                to_del = []
+                pipe = self.redis_connection.pipeline(transaction=False)
+                for key, (op, value) in self.pending.items():
+                    if op == OP_SET:
+                        to_set[key] = value
+                        self.__cache_value(key, value)
+                    elif op == OP_DEL:
+                        to_del.append(key)
+                        self.cache.pop(key, None)
+                    else:
+                        pipe.hincrby(self.hash_key, key, value)
+                        self.cache.pop(key, None)
+                if to_del:
+                    pipe.hdel(self.hash_key, *to_del)
+                if to_set:
+                    pipe.hset(self.hash_key, mapping=to_set)
+                pipe.execute()
+                self.pending = {}
+            self.last_flush = time.time()
+
+    def close(self):
+        """
+        Sends the pending writes to Redis, when the dictionary is not used anymore
+        (e.g., when the streaming algorithm using it is closed)
+        """
+        self.flush()
+
+    def increment(self, key, amount: int = 1):
+        """
+        Increments the (integer) value of a key by the given amount (the key is created if not existing)
+        """
+        with self.lock:
+            if key in self.pending:
+                op, value = self.pending[key]
+                if op == OP_SET:
+                    self.pending[key] = (OP_SET, str(int(value) + amount))
+                elif op == OP_DEL:
+                    self.pending[key] = (OP_SET, str(amount))
+                else:
+                    self.pending[key] = (OP_INCR, value + amount)
+            else:
+                self.pending[key] = (OP_INCR, amount)
+            self.__after_write()
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self.pending[key] = (OP_SET, encode_value(value))
+            self.__after_write()
+
+    def __delitem__(self, key):
+        with self.lock:
+            if key not in self:
+                raise KeyError(key)
+            self.pending[key] = (OP_DEL, None)
+            self.__after_write()
+
+    def __getitem__(self, key):
+        with self.lock:
+            op, value = self.pending.get(key, (None, None))
+            if op == OP_SET:
+                return value
+            if op == OP_DEL:
+                raise KeyError(key)
+            stored = self.__read(key)
+            if op == OP_INCR:
+                return str((0 if stored is None else int(stored)) + value)
+            if stored is None:
+                raise KeyError(key)
+            return stored
+
+    def __contains__(self, key):
+        with self.lock:
+            op = self.pending[key][0] if key in self.pending else None
+            if op is not None:
+                return op != OP_DEL
+            return self.__read(key) is not None
+
+    def __len__(self):
+        with self.lock:
+            self.flush()
+            return self.redis_connection.hlen(self.hash_key)
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        Iterates over the (key, value) pairs of the hash (after flushing the pending writes), using HSCAN
+        """
+        with self.lock:
+            self.flush()
+        return self.redis_connection.hscan_iter(self.hash_key, count=self.scan_count)
+
+    def __iter__(self):
+        return (key for key, value in self.items())
+
+    def keys(self):
+        return [key for key, value in self.items()]
+
+    def values(self):
+        return [value for key, value in self.items()]
+
+    def clear(self):
+        with self.lock:
+            self.pending = {}
+            self.cache = OrderedDict()
+            self.redis_connection.delete(self.hash_key)
+
+
+# typing not applied, since redis is not installed by default
+def apply(parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Create a Python dictionary supported by a hash of a Redis database, with pipelined batched writes
+
+    Parameters
+    --------------
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.HOSTNAME => hostname of the connection to Redis (default: 127.0.0.1)
+        - Parameters.PORT => port of the connection to Redis (default: 6379)
+        - Parameters.DB => Redis database (default: 0)
+        - Parameters.DICT_ID => identifier of the specific dictionary (default: 0)
+        - Parameters.HASH_KEY => Redis key of the hash hosting the dictionary (default: pm4py_dict_{DICT_ID})
+        - Parameters.BATCH_SIZE => number of pending keys after which the writes are flushed (default: 1000)
+        - Parameters.FLUSH_INTERVAL => seconds after which the pending writes are flushed (default: 1.0)
+        - Parameters.SCAN_COUNT => number of entries requested at every HSCAN iteration (default: 1000)
+        - Parameters.CACHE_SIZE => number of entries of the local read cache (0 disables it) (default: 10000)
+        - Parameters.CONNECTION => an existing (redis-py compatible) connection to use
+
+    Returns
+    --------------
+    r
+        Redis (Python-like) dictionary
+    """
+    if parameters is None:
+        parameters = {}
+
+    dict_id = exec_utils.get_param_value(Parameters.DICT_ID, parameters, 0)
+    hash_key = exec_utils.get_param_value(Parameters.HASH_KEY, parameters, "pm4py_dict_" + str(dict_id))
+    batch_size = exec_utils.get_param_value(Parameters.BATCH_SIZE, parameters, 1000)
+    flush_interval = exec_utils.get_param_value(Parameters.FLUSH_INTERVAL, parameters, 1.0)
+    scan_count = exec_utils.get_param_value(Parameters.SCAN_COUNT, parameters, 1000)
+    cache_size = exec_utils.get_param_value(Parameters.CACHE_SIZE, parameters, 10000)
+    r = exec_utils.get_param_value(Parameters.CONNECTION, parameters, None)
+
+    if r is None:
+        import redis
+
+        hostname = exec_utils.get_param_value(Parameters.HOSTNAME, parameters, "127.0.0.1")
+        port = exec_utils.get_param_value(Parameters.PORT, parameters, 6379)
+        db = exec_utils.get_param_value(Parameters.DB, parameters, 0)
+
+        r = redis.StrictRedis(host=hostname, port=port, db=db, decode_responses=True)
+
+    return PipelinedRedisDict(r, hash_key, batch_size=batch_size, flush_interval=flush_interval,
+                              scan_count=scan_count, cache_size=cache_size)
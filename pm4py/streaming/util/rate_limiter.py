@@ -0,0 +1,95 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import time
+from bisect import bisect_right
+from typing import List, Iterator, Dict, Any
+
+from pm4py.util import xes_constants
+
+
+class RateLimiter(object):
+    """
+    Replays the events of a log reproducing their original inter-arrival times (accelerated by a speed-up factor).
+
+    The batches of events are split in sub-batches containing the events that are due at the current time
+    (according to their timestamp, relative to the first event), sleeping until the next event is due.
+    Out-of-order events are released as soon as they are reached, and events without timestamp are released
+    together with the previous event.
+    """
+
+    def __init__(self, speed_up: float = 1.0, timestamp_key: str = xes_constants.DEFAULT_TIMESTAMP_KEY):
+        if speed_up <= 0:
+            raise Exception("the speed-up factor should be positive")
+        self.speed_up = speed_up
+        self.timestamp_key = timestamp_key
+        self.first_timestamp = None
+        self.start_time = None
+        self.last_due = 0.0
+
+    def reset(self):
+        """
+        Restarts the replay (the next event is released immediately)
+        """
+        self.first_timestamp = None
+        self.start_time = None
+        self.last_due = 0.0
+
+    def __get_due(self, events: List[Dict[str, Any]]) -> List[float]:
+        # seconds (since the start of the replay) at which every event is due
+        due = []
+        last_due = self.last_due
+        for event in events:
+            timestamp = event.get(self.timestamp_key, None)
+            if timestamp is not None and timestamp == timestamp:
+                timestamp = timestamp.timestamp() if hasattr(timestamp, "timestamp") else float(timestamp)
+                if self.first_timestamp is None:
+                    self.first_timestamp = timestamp
+                    self.start_time = time.monotonic()
+                last_due = max(last_due, (timestamp - self.first_timestamp) / self.speed_up)
+            due.append(last_due)
+        self.last_due = last_due
+        return due
+
+    def release(self, events: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Splits a batch of events in sub-batches, yielding every sub-batch when its events are due
+
+        Parameters
+        ---------------
+        events
+            Batch of events (sorted by timestamp)
+
+        Returns
+        ---------------
+        sub_batches
+            Iterator over the sub-batches
+        """
+        due = self.__get_due(events)
+        i = 0
+        while i < len(events):
+            now = time.monotonic() - self.start_time if self.start_time is not None else 0.0
+            j = bisect_right(due, now, lo=i)
+            if j > i:
+                yield events[i:j]
+                i = j
+            else:
+                time.sleep(due[i] - now)
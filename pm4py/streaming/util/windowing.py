@@ -0,0 +1,214 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import math
+from collections import Counter, deque
+from typing import Optional, Any, Callable, Dict, Hashable, List, Tuple
+
+MEASURE_TIME = "time"
+MEASURE_COUNT = "count"
+
+
+class PaneWindow(object):
+    """
+    Tumbling or sliding window over an event stream, split in panes.
+
+    The positions of the events (their timestamp, in seconds, or their index in the stream) are grouped in panes of
+    length slide, and a window spans size / slide consecutive panes (tumbling windows have slide = size).
+    The streaming algorithm contributes, for every event, some (key, amount) pairs to the pane of the event.
+    The aggregate of the current window is maintained incrementally: the contributions are added when they are
+    received, and the contributions of a pane are retracted when the pane exits the window, so updating the window
+    costs O(contributions of the pane).
+
+    The windows close when an event of a later pane is received. The result of a closed window (computed by the
+    result function on the aggregate) is passed to the callback and kept in a history of the last closed windows.
+    Events of panes already out of the current window (too late) are not counted in the windows.
+    """
+
+    def __init__(self, size: float, slide: Optional[float] = None, measure: str = MEASURE_TIME,
+                 timestamp_key: str = "time:timestamp", history: int = 1,
+                 callback: Optional[Callable[[float, float, Any], Any]] = None,
+                 result_function: Optional[Callable[[Counter], Any]] = None):
+        if slide is None:
+            slide = size
+        if size <= 0 or slide <= 0:
+            raise Exception("the size and the slide of the window should be positive")
+        num_panes = size / slide
+        if abs(num_panes - round(num_panes)) > 1e-9:
+            raise Exception("the size of the window should be a multiple of the slide")
+        self.size = size
+        self.slide = slide
+        self.num_panes = int(round(num_panes))
+        self.measure = measure
+        self.timestamp_key = timestamp_key
+        self.callback = callback
+        self.result_function = result_function
+        self.history = deque(maxlen=history)
+        # contributions of the panes of the current window
+        self.panes = {}
+        self.aggregate = Counter()
+        # last pane that has been reached by the stream
+        self.current_pane = None
+        # pane of the event that is being processed (None if the event is not counted in the window)
+        self.event_pane = None
+        self.count = 0
+        self.date_parser = None
+
+    def position(self, event) -> Optional[float]:
+        """
+        Gets the position of an event (its timestamp, or its index in the stream)
+        """
+        if self.measure == MEASURE_COUNT:
+            self.count += 1
+            return self.count - 1
+        if self.timestamp_key not in event or event[self.timestamp_key] is None:
+            return None
+        timestamp = event[self.timestamp_key]
+        if isinstance(timestamp, str):
+            # timestamps provided as ISO strings
+            if self.date_parser is None:
+                from pm4py.util import dt_parsing
+                self.date_parser = dt_parsing.parser.get()
+            try:
+                timestamp = self.date_parser.apply(timestamp)
+            except (TypeError, ValueError):
+                pass
+        if hasattr(timestamp, "timestamp"):
+            return timestamp.timestamp()
+        try:
+            return float(timestamp)
+        except (TypeError, ValueError):
+            # the events with an invalid timestamp are not counted in the windows
+            return None
+
+    def begin(self, event) -> bool:
+        """
+        Assigns an incoming event to its pane, closing the windows that end before it
+
+        Returns
+        --------------
+        boolean
+            True if the event is counted in the current window
+        """
+        self.event_pane = None
+        position = self.position(event)
+        if position is None:
+            return False
+        pane = int(math.floor(position / self.slide))
+        if self.current_pane is None:
+            self.current_pane = pane
+        elif pane > self.current_pane:
+            self.advance(pane)
+        if pane <= self.current_pane - self.num_panes:
+            return False
+        self.event_pane = pane
+        return True
+
+    def end(self):
+        """
+        Ends the processing of an event (the contributions received outside the processing of an event,
+        e.g., on the termination of a case, go to the last pane)
+        """
+        self.event_pane = self.current_pane
+
+    def advance(self, pane: int):
+        """
+        Advances the stream to the given pane, closing the windows ending before it and retracting the expired panes
+        """
+        last_window = min(pane - 1, self.current_pane + self.num_panes - 1)
+        for window_end in range(self.current_pane, last_window + 1):
+            if self.aggregate and (self.callback is not None or self.history.maxlen):
+                start, end = self.window_bounds(window_end)
+                result = self.result_function(Counter(self.aggregate))
+                self.history.append((start, end, result))
+                if self.callback is not None:
+                    self.callback(start, end, result)
+            self.retract(window_end - self.num_panes + 1)
+        for p in [p for p in self.panes if p <= pane - self.num_panes]:
+            self.retract(p)
+        self.current_pane = pane
+
+    def retract(self, pane: int):
+        """
+        Retracts the contributions of a pane from the aggregate of the window
+        """
+        contributions = self.panes.pop(pane, None)
+        if contributions:
+            for key, amount in contributions.items():
+                value = self.aggregate[key] - amount
+                if value:
+                    self.aggregate[key] = value
+                else:
+                    del self.aggregate[key]
+
+    def add(self, key: Hashable, amount: int = 1, pane: Optional[int] = None):
+        """
+        Adds a contribution to a pane of the window (by default, the pane of the current event).
+        Contributions to panes that are no more in the window are ignored.
+        """
+        if pane is None:
+            pane = self.event_pane
+        if pane is None or self.current_pane is None or pane <= self.current_pane - self.num_panes:
+            return
+        if pane not in self.panes:
+            self.panes[pane] = Counter()
+        self.panes[pane][key] += amount
+        value = self.aggregate[key] + amount
+        if value:
+            self.aggregate[key] = value
+        else:
+            del self.aggregate[key]
+
+    def window_bounds(self, window_end: Optional[int] = None) -> Tuple[float, float]:
+        """
+        Gets the (start, end) positions of the window ending at the given pane (by default, the current window)
+        """
+        if window_end is None:
+            window_end = self.current_pane
+        return (window_end - self.num_panes + 1) * self.slide, (window_end + 1) * self.slide
+
+    def get_result(self) -> Any:
+        """
+        Gets the result of the current window
+        """
+        return self.result_function(Counter(self.aggregate))
+
+    def get_closed_windows(self) -> List[Tuple[float, float, Any]]:
+        """
+        Gets the (start, end, result) of the last closed windows
+        """
+        return list(self.history)
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"panes": {p: dict(c) for p, c in self.panes.items()}, "current_pane": self.current_pane,
+                "count": self.count, "history": list(self.history)}
+
+    def set_state(self, state: Dict[str, Any]):
+        self.panes = {p: Counter(c) for p, c in state["panes"].items()}
+        self.aggregate = Counter()
+        for c in self.panes.values():
+            self.aggregate.update(c)
+        self.aggregate = Counter({k: v for k, v in self.aggregate.items() if v})
+        self.current_pane = state["current_pane"]
+        self.event_pane = self.current_pane
+        self.count = state["count"]
+        self.history.clear()
+        self.history.extend(state["history"])
@@ -19,5 +19,9 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-from pm4py.util import exec_utils, constants, xes_constants, pandas_utils, nx_utils, lp, variants_util, points_subset, business_hours, vis_utils, \
-    dt_parsing, colors, typing, compression
+from pm4py.util import constants, lazy_imports
+
+# the submodules are imported when they are accessed for the first time
+__getattr__, __dir__ = lazy_imports.lazy_module(__name__, ["exec_utils", "xes_constants", "pandas_utils", "nx_utils",
+                                                           "lp", "variants_util", "points_subset", "business_hours",
+                                                           "vis_utils", "dt_parsing", "colors", "typing", "compression"])
@@ -19,12 +19,20 @@ visit <https://www.gnu.org/licenses/>.
 Website: https://processintelligence.solutions
 Contact: info@processintelligence.solutions
 '''
-import math
-from datetime import timedelta, datetime, time
-from typing import List, Tuple
+from datetime import timedelta, datetime
+from typing import List, Tuple, Optional, Collection, Any
+
+import numpy as np
 
 from pm4py.util import constants
-from pm4py.util.dt_parsing.variants import strpfromiso
+
+
+_NS_PER_SECOND = 10 ** 9
+_NS_PER_DAY = 24 * 60 * 60 * _NS_PER_SECOND
+_NS_PER_WEEK = 7 * _NS_PER_DAY
+_EPOCH = datetime(1970, 1, 1)
+# the weeks are counted from the first Monday after the epoch (1970-01-05)
+_FIRST_MONDAY_NS = 4 * _NS_PER_DAY
 
 
 def soj_time_business_hours_diff(st: datetime, et: datetime, business_hour_slots: List[Tuple[int]],
@@ -60,6 +68,36 @@ def soj_time_business_hours_diff(st: datetime, et: datetime, business_hour_slots
     return bh.get_seconds()
 
 
+def soj_time_business_hours_diff_array(st: Collection[Any], et: Collection[Any],
+                                       business_hour_slots: Optional[List[Tuple[int]]] = None,
+                                       work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR) -> np.ndarray:
+    """
+    Calculates the differences, based on the business hours, between two arrays of timestamps
+    (vectorized version of soj_time_business_hours_diff)
+
+    Parameters
+    -----------------
+    st
+        Start timestamps (pandas series, NumPy datetime64 array, or list of datetimes). Timezone-aware timestamps
+        are evaluated on their local (wall) time.
+    et
+        Complete timestamps (same length as the start timestamps)
+    business_hour_slots
+        work schedule of the company (see soj_time_business_hours_diff)
+    work_calendar
+        work calendar, providing the holidays that are not counted as business hours. It can be an object
+        providing the method holidays(year) (such as the calendars of the workalendar package), or a collection
+        of dates.
+
+    Returns
+    -----------------
+    diff
+        NumPy array containing the difference in business hours (in seconds) of each couple of timestamps
+        (NaN if one of the timestamps is missing)
+    """
+    return get_calculator(business_hour_slots=business_hour_slots, work_calendar=work_calendar).get_seconds(st, et)
+
+
 def get_overlapping_time(timespan1_begin: datetime, timespan1_end: datetime,
                          timespan2_begin: datetime, timespan2_end: datetime) -> float:
     latest_start = max(timespan1_begin, timespan2_begin)
@@ -69,53 +107,255 @@ def get_overlapping_time(timespan1_begin: datetime, timespan1_end: datetime,
     return overlap
 
 
-class BusinessHours:
-    def __init__(self, datetime1, datetime2, **kwargs):
-        self.datetime1 = datetime1.replace(tzinfo=None)
-        self.datetime2 = datetime2.replace(tzinfo=None)
+def unify_business_hour_slots(business_hour_slots: List[Tuple[int]]) -> List[List[int]]:
+    """
+    Union of the business hour slots (in order to avoid overlapping business hours)
+    """
+    business_hour_slots_unified = []
+    for begin, end in sorted(business_hour_slots):
+        if business_hour_slots_unified and business_hour_slots_unified[-1][1] >= begin - 1:
+            business_hour_slots_unified[-1][1] = max(business_hour_slots_unified[-1][1], end)
+        else:
+            business_hour_slots_unified.append([begin, end])
+    return business_hour_slots_unified
 
-        self.business_hour_slots = kwargs[
-            "business_hour_slots"] if "business_hour_slots" in kwargs else constants.DEFAULT_BUSINESS_HOUR_SLOTS
 
-        # union of business hour slots in order to avoid overlapping business hours
-        self.business_hour_slots_unified = []
-        for begin, end in sorted(self.business_hour_slots):
-            if self.business_hour_slots_unified and self.business_hour_slots_unified[-1][1] >= begin - 1:
-                self.business_hour_slots_unified[-1][1] = max(self.business_hour_slots_unified[-1][1], end)
+def _to_wall_ns(timestamps) -> Tuple[np.ndarray, np.ndarray]:
+    # local (wall) time of the timestamps, as nanoseconds since the epoch, along with the mask of the missing values
+    if isinstance(timestamps, np.ndarray) and np.issubdtype(timestamps.dtype, np.datetime64):
+        values = timestamps.astype("datetime64[ns]")
+    else:
+        import pandas as pd
+        try:
+            index = pd.DatetimeIndex(timestamps)
+        except (TypeError, ValueError):
+            # timestamps with different time zones
+            index = pd.DatetimeIndex([x.replace(tzinfo=None) if isinstance(x, datetime) and not pd.isna(x) else x
+                                      for x in timestamps])
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        values = index.to_numpy(dtype="datetime64[ns]")
+    return values.astype(np.int64), np.isnat(values)
+
+
+def _datetime_to_wall_ns(timestamp: datetime) -> int:
+    timestamp = timestamp.replace(tzinfo=None)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1) * 1000 + getattr(timestamp, "nanosecond", 0)
+
+
+class BusinessHoursCalculator(object):
+    """
+    Computes the business hours elapsed between (arrays of) timestamps.
+
+    The business hour slots are folded into a weekly profile, so the working time elapsed from a fixed Monday
+    to any instant is the number of whole weeks times the working time of a week, plus the working time elapsed
+    in the current week. The business hours between two timestamps are the difference of the two values.
+    The holidays of the work calendar are excluded by subtracting the working time of the holidays preceding
+    each timestamp (a cumulative sum over the sorted holidays).
+    """
+
+    def __init__(self, business_hour_slots: Optional[List[Tuple[int]]] = None, work_calendar=None):
+        if business_hour_slots is None:
+            business_hour_slots = constants.DEFAULT_BUSINESS_HOUR_SLOTS
+
+        # folds the slots in a single week (a slot may cross the end of the week)
+        pieces = []
+        for begin, end in unify_business_hour_slots(business_hour_slots):
+            begin = int(round(begin * _NS_PER_SECOND))
+            end = int(round(end * _NS_PER_SECOND))
+            if end - begin >= _NS_PER_WEEK:
+                pieces = [(0, _NS_PER_WEEK)]
+                break
+            begin0 = begin % _NS_PER_WEEK
+            end0 = begin0 + (end - begin)
+            if end0 <= _NS_PER_WEEK:
+                pieces.append((begin0, end0))
             else:
-                self.business_hour_slots_unified.append([begin, end])
+                pieces.append((begin0, _NS_PER_WEEK))
+                pieces.append((0, end0 - _NS_PER_WEEK))
+        folded = []
+        for begin, end in sorted(pieces):
+            if folded and folded[-1][1] >= begin:
+                folded[-1][1] = max(folded[-1][1], end)
+            elif end > begin:
+                folded.append([begin, end])
 
-        # work calendar (it permits querying if a given day is a working day in a given culture) - not used yet
-        self.work_calendar = kwargs[
-            "work_calendar"] if "work_calendar" in kwargs else constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR
+        self.slot_begins = np.array([x[0] for x in folded], dtype=np.int64)
+        self.slot_lengths = np.array([x[1] - x[0] for x in folded], dtype=np.int64)
+        self.week_working_time = int(self.slot_lengths.sum())
+        self.work_calendar = work_calendar
+        self.__holidays = {}
+        self.__slots = list(zip(self.slot_begins.tolist(), self.slot_lengths.tolist()))
 
-    def get_seconds(self):
-        sum = 0
-        week_start = self.datetime1.date() - timedelta(days=self.datetime1.weekday())
+    def __get_holiday_days(self, min_day: int, max_day: int) -> np.ndarray:
+        # sorted days (since the epoch) of the holidays included between the given days
+        if hasattr(self.work_calendar, "holidays"):
+            first_year = (_EPOCH + timedelta(days=min_day)).year
+            last_year = (_EPOCH + timedelta(days=max_day)).year
+            dates = []
+            for year in range(first_year, last_year + 1):
+                if year not in self.__holidays:
+                    self.__holidays[year] = [x[0] if isinstance(x, tuple) else x
+                                             for x in self.work_calendar.holidays(year)]
+                dates.extend(self.__holidays[year])
+        else:
+            dates = self.work_calendar
+        days = np.unique(np.array([(datetime(d.year, d.month, d.day) - _EPOCH).days for d in dates],
+                                  dtype=np.int64))
+        return days[(days >= min_day) & (days <= max_day)]
+
+    def __get_week_elapsed(self, ns: np.ndarray) -> np.ndarray:
+        relative = ns - _FIRST_MONDAY_NS
+        weeks = relative // _NS_PER_WEEK
+        offset = relative - weeks * _NS_PER_WEEK
+        elapsed = weeks * self.week_working_time
+        for i in range(len(self.slot_begins)):
+            elapsed += np.clip(offset - self.slot_begins[i], 0, self.slot_lengths[i])
+        return elapsed
+
+    def get_elapsed(self, ns: np.ndarray) -> np.ndarray:
+        """
+        Gets the working time (in nanoseconds) elapsed from the first Monday after the epoch
+
+        Parameters
+        -----------------
+        ns
+            Local (wall) times, as nanoseconds since the epoch
+
+        Returns
+        -----------------
+        elapsed
+            Working time (in nanoseconds) elapsed from the first Monday after the epoch to the given times
+        """
+        ns = np.asarray(ns, dtype=np.int64)
+        elapsed = self.__get_week_elapsed(ns)
+        if self.work_calendar is None or len(ns) == 0:
+            return elapsed
+
+        days = ns // _NS_PER_DAY
+        holidays = self.__get_holiday_days(int(days.min()), int(days.max()))
+        if len(holidays) == 0:
+            return elapsed
+        holidays_start = self.__get_week_elapsed(holidays * _NS_PER_DAY)
+        holidays_working_time = self.__get_week_elapsed((holidays + 1) * _NS_PER_DAY) - holidays_start
+        cumulative = np.concatenate(([0], np.cumsum(holidays_working_time)))
+        # working time of the holidays before the day of the timestamp
+        position = np.searchsorted(holidays, days, side="left")
+        correction = cumulative[position]
+        # working time elapsed in the day of the timestamp, if the day is a holiday
+        on_holiday = position < len(holidays)
+        on_holiday[on_holiday] = holidays[position[on_holiday]] == days[on_holiday]
+        correction[on_holiday] += elapsed[on_holiday] - holidays_start[position[on_holiday]]
+        return elapsed - correction
+
+    def get_seconds(self, st: Collection[Any], et: Collection[Any]) -> np.ndarray:
+        """
+        Gets the business hours (in seconds) between the couples of timestamps
+
+        Parameters
+        -----------------
+        st
+            Start timestamps
+        et
+            Complete timestamps
+
+        Returns
+        -----------------
+        diff
+            Business hours between each couple of timestamps (0 if the complete timestamp precedes the start
+            timestamp, NaN if one of the timestamps is missing)
+        """
+        st_ns, st_missing = _to_wall_ns(st)
+        et_ns, et_missing = _to_wall_ns(et)
+        ret = np.full(len(st_ns), np.nan, dtype=np.float64)
+        valid = ~(st_missing | et_missing)
+        num_valid = int(valid.sum())
+        if num_valid > 0:
+            elapsed = self.get_elapsed(np.concatenate((st_ns[valid], et_ns[valid])))
+            ret[valid] = np.maximum(0, elapsed[num_valid:] - elapsed[:num_valid]) / _NS_PER_SECOND
+        return ret
+
+    def __get_week_elapsed_scalar(self, ns: int) -> int:
+        # same as __get_week_elapsed, on a single time (without the overhead of NumPy)
+        weeks, offset = divmod(ns - _FIRST_MONDAY_NS, _NS_PER_WEEK)
+        elapsed = weeks * self.week_working_time
+        for begin, length in self.__slots:
+            if offset <= begin:
+                break
+            elapsed += min(offset - begin, length)
+        return elapsed
+
+    def get_seconds_between(self, st: datetime, et: datetime) -> float:
+        """
+        Gets the business hours (in seconds) between two timestamps
+        """
+        st_ns = _datetime_to_wall_ns(st)
+        et_ns = _datetime_to_wall_ns(et)
+        if self.work_calendar is None:
+            diff = self.__get_week_elapsed_scalar(et_ns) - self.__get_week_elapsed_scalar(st_ns)
+        else:
+            elapsed = self.get_elapsed(np.array([st_ns, et_ns], dtype=np.int64))
+            diff = int(elapsed[1] - elapsed[0])
+        return max(0.0, diff / _NS_PER_SECOND)
+
+
+# calculators built for the most recent (business hour slots, work calendar) couples
+_CALCULATORS = {}
+_MAX_CALCULATORS = 16
+
+
+def get_calculator(business_hour_slots: Optional[List[Tuple[int]]] = None,
+                   work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR) -> BusinessHoursCalculator:
+    """
+    Gets a business hours calculator for the given business hour slots and work calendar. The calculators are
+    cached, so the weekly profile (and the holidays of the calendar) are not computed again at every call.
 
-        for bhs, bhe in self.business_hour_slots_unified:
-            begin_day_of_week = math.floor(bhs / 60 / 60 / 24)
-            begin_seconds_of_day = bhs - 24 * 60 * 60 * begin_day_of_week
-            bh_start = datetime.combine(week_start, time.min) + timedelta(days=begin_day_of_week) + timedelta(
-                seconds=begin_seconds_of_day)
+    Parameters
+    -----------------
+    business_hour_slots
+        work schedule of the company (see soj_time_business_hours_diff)
+    work_calendar
+        work calendar (see soj_time_business_hours_diff_array)
 
-            end_day_of_week = math.floor(bhe / 60 / 60 / 24)
-            end_seconds_of_day = bhe - 24 * 60 * 60 * end_day_of_week
-            bh_end = datetime.combine(week_start, time.min) + timedelta(days=end_day_of_week) + timedelta(
-                seconds=end_seconds_of_day)
+    Returns
+    -----------------
+    calculator
+        Business hours calculator
+    """
+    if business_hour_slots is None:
+        business_hour_slots = constants.DEFAULT_BUSINESS_HOUR_SLOTS
+    # the work calendar is identified by its id (it may be unhashable); the cache keeps it alive, so the id
+    # cannot be reused by another object while the calculator is cached
+    key = (tuple(tuple(x) for x in business_hour_slots), id(work_calendar))
+    entry = _CALCULATORS.get(key)
+    if entry is None or entry[0] is not work_calendar:
+        if len(_CALCULATORS) >= _MAX_CALCULATORS:
+            del _CALCULATORS[next(iter(_CALCULATORS))]
+        entry = (work_calendar, BusinessHoursCalculator(business_hour_slots=business_hour_slots,
+                                                        work_calendar=work_calendar))
+        _CALCULATORS[key] = entry
+    return entry[1]
 
-            overlapping_time = get_overlapping_time(self.datetime1, self.datetime2, bh_start, bh_end)
-            sum += overlapping_time
 
-            while True:
-                bh_start += timedelta(days=7)
-                bh_end += timedelta(days=7)
+class BusinessHours:
+    def __init__(self, datetime1, datetime2, **kwargs):
+        self.datetime1 = datetime1.replace(tzinfo=None)
+        self.datetime2 = datetime2.replace(tzinfo=None)
+
+        self.business_hour_slots = kwargs[
+            "business_hour_slots"] if "business_hour_slots" in kwargs else constants.DEFAULT_BUSINESS_HOUR_SLOTS
 
-                overlapping_time = get_overlapping_time(self.datetime1, self.datetime2, bh_start, bh_end)
+        # union of business hour slots in order to avoid overlapping business hours
+        self.business_hour_slots_unified = unify_business_hour_slots(self.business_hour_slots)
 
-                if overlapping_time <= 0:
-                    break
+        # work calendar (it permits querying if a given day is a working day in a given culture)
+        self.work_calendar = kwargs["work_calendar"] if "work_calendar" in kwargs else kwargs.get(
+            "workcalendar", constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
 
-                sum += overlapping_time
+        self.__calculator = None
 
-        return sum
+    def get_seconds(self):
+        if self.__calculator is None:
+            self.__calculator = get_calculator(business_hour_slots=self.business_hour_slots,
+                                               work_calendar=self.work_calendar)
+        return self.__calculator.get_seconds_between(self.datetime1, self.datetime2)
@@ -188,13 +188,10 @@ def discover_dfg(log: Union[UCL, MCL], index: int = 0) -> DFG:
 def discover_dfg_uvcl(log: UVCL) -> DFG:
     dfg = DFG()
     [dfg.graph.update({(t[i], t[i + 1]): log[t]}) for t in log for i in range(0, len(t) - 1) if len(t)]
-    for a in get_alphabet(log):
-        for t in log:
-            if len(t) > 0:
-                if t[0] == a:
-                    dfg.start_activities.update({a: log[t]})
-                if t[len(t) - 1] == a:
-                    dfg.end_activities.update({a: log[t]})
+    for t in log:
+        if len(t) > 0:
+            dfg.start_activities.update({t[0]: log[t]})
+            dfg.end_activities.update({t[len(t) - 1]: log[t]})
     return dfg
 
 
@@ -0,0 +1,85 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import importlib
+import sys
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+
+def lazy_module(package_name: str, submodules: Collection[str],
+                attributes: Optional[Dict[str, str]] = None) -> Tuple[Callable, Callable]:
+    """
+    Gets the module-level __getattr__ and __dir__ functions (PEP 562) that import the submodules of a package
+    (and, optionally, some attributes defined in them) only when they are accessed for the first time.
+
+    Parameters
+    ---------------
+    package_name
+        Name of the package (__name__)
+    submodules
+        Names of the submodules that are loaded on demand
+    attributes
+        (optional) Dictionary associating to an attribute name the (absolute) name of the module defining it
+
+    Returns
+    ---------------
+    __getattr__
+        Function resolving the lazy attributes
+    __dir__
+        Function listing the attributes of the package (including the lazy ones)
+    """
+    submodules = set(submodules)
+    if attributes is None:
+        attributes = {}
+
+    def __getattr__(name):
+        if name in submodules:
+            value = importlib.import_module(package_name + "." + name)
+        elif name in attributes:
+            value = getattr(importlib.import_module(attributes[name]), name)
+        else:
+            raise AttributeError("module " + repr(package_name) + " has no attribute " + repr(name))
+        # cache the value, so the next accesses do not go through __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])).union(submodules).union(attributes))
+
+    return __getattr__, __dir__
+
+
+def get_lazy_attributes(modules_attributes: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Given a dictionary associating to each module the attributes it exports, gets a dictionary associating
+    to each attribute the module defining it
+
+    Parameters
+    ---------------
+    modules_attributes
+        Dictionary associating to a (absolute) module name the list of attributes it exports
+
+    Returns
+    ---------------
+    attributes
+        Dictionary associating to an attribute the (absolute) name of the module defining it
+    """
+    return {attr: module for module, attrs in modules_attributes.items() for attr in attrs}
@@ -0,0 +1,284 @@
+'''
+    PM4Py – A Process Mining Library for Python
+Copyright (C) 2024 Process Intelligence Solutions UG (haftungsbeschränkt)
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as
+published by the Free Software Foundation, either version 3 of the
+License, or any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with this program.  If not, see this software project's root or
+visit <https://www.gnu.org/licenses/>.
+
+Website: https://processintelligence.solutions
+Contact: info@processintelligence.solutions
+'''
+import atexit
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from enum import Enum
+from typing import Any, Callable, Generator, Iterable, List, Optional, Sequence, Tuple, Dict
+
+from pm4py.util import exec_utils
+
+
+class Parameters(Enum):
+    CORES = "cores"
+    CHUNKS_PER_CORE = "chunks_per_core"
+    MAX_CHUNK_SIZE = "max_chunk_size"
+    MAX_IN_FLIGHT = "max_in_flight"
+
+
+# state shared by all the items processed by a worker process (set once by the initializer of the pool)
+__worker_state = {}
+
+# long-lived pool of processes, shared by all the calls of get_shared_executor
+__shared_executor = {}
+
+
+def _initialize_worker(function: Callable, shared_args: Tuple):
+    __worker_state["function"] = function
+    __worker_state["shared_args"] = shared_args
+
+
+def _process_item(item: Any) -> Any:
+    return __worker_state["function"](item, *__worker_state["shared_args"])
+
+
+def _process_chunk(chunk: List[Tuple[int, Any]]) -> List[Tuple[int, Any]]:
+    function = __worker_state["function"]
+    shared_args = __worker_state["shared_args"]
+    return [(idx, function(item, *shared_args)) for idx, item in chunk]
+
+
+def get_default_cores() -> int:
+    """
+    Gets the default number of worker processes (leaving some cores free for the main process)
+
+    Returns
+    ---------------
+    num_cores
+        Default number of worker processes
+    """
+    return max(1, multiprocessing.cpu_count() - 2)
+
+
+def __next_chunk(order: List[int], weights: Sequence[float], position: int, target_weight: float,
+                 max_chunk_size: int) -> int:
+    # takes items (in the given order) until their overall weight reaches the target weight of the chunk
+    end = position
+    chunk_weight = 0
+    while end < len(order) and (end == position or (chunk_weight < target_weight and end - position < max_chunk_size)):
+        chunk_weight += weights[order[end]]
+        end += 1
+    return end
+
+
+def iterate_results(items: Sequence[Any], function: Callable, shared_args: Tuple = (),
+                    weights: Optional[Sequence[float]] = None,
+                    parameters: Optional[Dict[Any, Any]] = None) -> Generator[Tuple[int, Any], None, None]:
+    """
+    Applies a function to a collection of items using a pool of processes, yielding the results as soon as they
+    are available.
+
+    The shared arguments (e.g., the process model) are sent once to each worker process (through the initializer
+    of the pool) instead of being pickled together with each item. The items are dispatched in chunks, processing
+    the heaviest items first: the size of each chunk is adapted to the weight that still needs to be processed,
+    so that the heavy items are sent in small chunks and the light items at the end in bigger chunks.
+
+    Parameters
+    ---------------
+    items
+        Items to process
+    function
+        Function (defined at the module level) called as function(item, *shared_args) on each item
+    shared_args
+        Arguments that are shared by all the calls
+    weights
+        (optional) Expected cost of processing each item (default: the length of the item, when available)
+    parameters
+        Parameters of the method, including:
+        - Parameters.CORES => number of worker processes
+        - Parameters.CHUNKS_PER_CORE => number of chunks (at the beginning) per worker, regulating the granularity
+        - Parameters.MAX_CHUNK_SIZE => maximum number of items in a chunk
+
+    Returns
+    ---------------
+    generator
+        Generator of tuples (index of the item, result), in order of completion
+    """
+    if parameters is None:
+        parameters = {}
+
+    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, get_default_cores())
+    chunks_per_core = exec_utils.get_param_value(Parameters.CHUNKS_PER_CORE, parameters, 4)
+    max_chunk_size = exec_utils.get_param_value(Parameters.MAX_CHUNK_SIZE, parameters, 1000)
+
+    if weights is None:
+        weights = [max(1, len(item)) if hasattr(item, "__len__") else 1 for item in items]
+
+    # the heaviest items are processed first, so they do not delay the end of the computation
+    order = sorted(range(len(items)), key=lambda i: -weights[i])
+
+    if num_cores <= 1 or len(items) <= 1:
+        for i in order:
+            yield i, function(items[i], *shared_args)
+        return
+
+    remaining_weight = sum(weights)
+    position = 0
+    max_in_flight = 2 * num_cores
+
+    with ProcessPoolExecutor(max_workers=num_cores, initializer=_initialize_worker,
+                             initargs=(function, shared_args)) as executor:
+        in_flight = set()
+        while position < len(order) or in_flight:
+            while position < len(order) and len(in_flight) < max_in_flight:
+                target_weight = remaining_weight / (num_cores * chunks_per_core)
+                end = __next_chunk(order, weights, position, target_weight, max_chunk_size)
+                chunk = [(i, items[i]) for i in order[position:end]]
+                remaining_weight -= sum(weights[i] for i in order[position:end])
+                position = end
+                in_flight.add(executor.submit(_process_chunk, chunk))
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                for idx, result in future.result():
+                    yield idx, result
+
+
+def apply(items: Sequence[Any], function: Callable, shared_args: Tuple = (),
+          weights: Optional[Sequence[float]] = None, progress=None,
+          parameters: Optional[Dict[Any, Any]] = None) -> List[Any]:
+    """
+    Applies a function to a collection of items using a pool of processes
+    (see iterate_results), returning the results in the order of the items
+
+    Parameters
+    ---------------
+    items
+        Items to process
+    function
+        Function (defined at the module level) called as function(item, *shared_args) on each item
+    shared_args
+        Arguments that are shared by all the calls
+    weights
+        (optional) Expected cost of processing each item
+    progress
+        (optional) Progress bar, updated when the result of an item is available
+    parameters
+        Parameters of the method
+
+    Returns
+    ---------------
+    results
+        List of results (one for each item)
+    """
+    results = [None] * len(items)
+    for idx, result in iterate_results(items, function, shared_args=shared_args, weights=weights,
+                                       parameters=parameters):
+        results[idx] = result
+        if progress is not None:
+            progress.update()
+    return results
+
+
+def iterate_ordered(items: Iterable[Any], function: Callable, shared_args: Tuple = (),
+                    parameters: Optional[Dict[Any, Any]] = None) -> Generator[Any, None, None]:
+    """
+    Applies a function to a (possibly lazy) stream of items using a pool of processes, yielding the results
+    in the order of the items.
+
+    The items are consumed from the iterable only when a worker is ready to process them, so at most
+    Parameters.MAX_IN_FLIGHT items (and their results) are in memory at the same time. This permits to process
+    streams (e.g., the blocks of a file) that do not fit in memory.
+
+    Parameters
+    ---------------
+    items
+        Iterable of items to process
+    function
+        Function (defined at the module level) called as function(item, *shared_args) on each item
+    shared_args
+        Arguments that are shared by all the calls
+    parameters
+        Parameters of the method, including:
+        - Parameters.CORES => number of worker processes
+        - Parameters.MAX_IN_FLIGHT => maximum number of items submitted and not yet yielded (default: 2 * cores)
+
+    Returns
+    ---------------
+    generator
+        Generator of the results, in the order of the items
+    """
+    if parameters is None:
+        parameters = {}
+
+    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, get_default_cores())
+    max_in_flight = exec_utils.get_param_value(Parameters.MAX_IN_FLIGHT, parameters, 2 * num_cores)
+
+    if num_cores <= 1:
+        for item in items:
+            yield function(item, *shared_args)
+        return
+
+    with ProcessPoolExecutor(max_workers=num_cores, initializer=_initialize_worker,
+                             initargs=(function, shared_args)) as executor:
+        in_flight = deque()
+        for item in items:
+            in_flight.append(executor.submit(_process_item, item))
+            if len(in_flight) >= max_in_flight:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def get_shared_executor(num_cores: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Gets a long-lived pool of processes, shared across the calls of the algorithms (so that the worker processes
+    are not started again at every call). The pool is created at the first request, re-created only when a different
+    number of workers is requested, and shut down when the interpreter exits.
+
+    Parameters
+    ---------------
+    num_cores
+        (optional) Number of worker processes (default: get_default_cores())
+
+    Returns
+    ---------------
+    executor
+        Pool of processes
+    """
+    if num_cores is None:
+        num_cores = get_default_cores()
+    num_cores = max(1, num_cores)
+
+    executor = __shared_executor.get("executor")
+    # the pool is also re-created when a worker process terminated abruptly (making the pool unusable)
+    if executor is None or __shared_executor["cores"] != num_cores or getattr(executor, "_broken", False):
+        if executor is not None:
+            executor.shutdown(wait=True)
+        executor = ProcessPoolExecutor(max_workers=num_cores)
+        __shared_executor["executor"] = executor
+        __shared_executor["cores"] = num_cores
+    return executor
+
+
+def shutdown_shared_executor():
+    """
+    Shuts down the long-lived pool of processes (if it has been created)
+    """
+    executor = __shared_executor.pop("executor", None)
+    __shared_executor.pop("cores", None)
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+atexit.register(shutdown_shared_executor)
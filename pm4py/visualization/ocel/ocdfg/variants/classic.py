@@ -50,6 +50,16 @@ def ot_to_color(ot: str) -> str:
     return ret
 
 
+def get_count(value) -> int:
+    """
+    Gets the count associated to an element of the OC-DFG (which is either a collection, as in the classic
+    discovery, or directly the count, as in the aggregated discovery)
+    """
+    if isinstance(value, int):
+        return value
+    return len(value)
+
+
 def add_activity(G: Digraph, act, freq, act_prefix, nodes, annotation, min_freq, max_freq):
     """
     Adds an activity node to the graph
@@ -82,7 +92,10 @@ def add_performance_edge(G: Digraph, ot, act1, act2, perf, edge_prefix, nodes, a
     from statistics import mean, median
 
     otc = ot_to_color(ot)
-    if aggregation_measure == "median":
+    if isinstance(perf, dict):
+        # aggregated performance statistics
+        perf = perf[aggregation_measure] if aggregation_measure in perf else perf["mean"]
+    elif aggregation_measure == "median":
         perf = median(perf)
     elif aggregation_measure == "min":
         perf = min(perf)
@@ -245,32 +258,32 @@ def apply(ocdfg: Dict[str, Any], parameters: Optional[Dict[Any, Any]] = None) ->
     max_edges_count = {}
 
     for ot in edges_count:
-        all_edges_count = [len(y) for y in edges_count[ot].values()]
+        all_edges_count = [get_count(y) for y in edges_count[ot].values()]
         min_edges_count[ot] = min(all_edges_count)
         max_edges_count[ot] = max(all_edges_count)
-        all_sa_count = [len(y) for y in sa_count[ot].values()]
+        all_sa_count = [get_count(y) for y in sa_count[ot].values()]
         min_edges_count[ot] = min(min(all_sa_count), min_edges_count[ot])
         max_edges_count[ot] = max(max(all_sa_count), max_edges_count[ot])
-        all_ea_count = [len(y) for y in ea_count[ot].values()]
+        all_ea_count = [get_count(y) for y in ea_count[ot].values()]
         min_edges_count[ot] = min(min(all_ea_count), min_edges_count[ot])
         max_edges_count[ot] = max(max(all_ea_count), max_edges_count[ot])
 
-    act_count_values = [len(y) for y in act_count.values()]
+    act_count_values = [get_count(y) for y in act_count.values()]
     min_act_count = min(act_count_values)
     max_act_count = max(act_count_values)
 
     nodes = {}
     for act in act_count:
-        if len(act_count[act]) >= act_threshold:
-            add_activity(viz, act, len(act_count[act]), act_prefix, nodes, annotation, min_act_count, max_act_count)
+        if get_count(act_count[act]) >= act_threshold:
+            add_activity(viz, act, get_count(act_count[act]), act_prefix, nodes, annotation, min_act_count, max_act_count)
 
     for ot in edges_count:
         for act_cou in edges_count[ot]:
             if act_cou[0] in nodes and act_cou[1] in nodes:
-                if len(edges_count[ot][act_cou]) >= edge_threshold:
+                if get_count(edges_count[ot][act_cou]) >= edge_threshold:
                     if annotation == "frequency":
-                        add_frequency_edge(viz, ot, act_cou[0], act_cou[1], len(edges_count[ot][act_cou]), edge_prefix,
-                                           nodes, min_edges_count[ot], max_edges_count[ot])
+                        add_frequency_edge(viz, ot, act_cou[0], act_cou[1], get_count(edges_count[ot][act_cou]),
+                                           edge_prefix, nodes, min_edges_count[ot], max_edges_count[ot])
                     elif annotation == "performance":
                         add_performance_edge(viz, ot, act_cou[0], act_cou[1], edges_performance[ot][act_cou],
                                              edge_prefix, nodes, performance_aggregation_measure)
@@ -278,19 +291,19 @@ def apply(ocdfg: Dict[str, Any], parameters: Optional[Dict[Any, Any]] = None) ->
     for ot in sa_count:
         for act in sa_count[ot]:
             if act in nodes:
-                if len(sa_count[ot][act]) >= edge_threshold:
-                    miec = min_edges_count[ot] if ot in min_edges_count else len(sa_count[ot][act])
-                    maec = max_edges_count[ot] if ot in max_edges_count else len(sa_count[ot][act])
-                    add_start_node(viz, ot, act, len(sa_count[ot][act]), edge_prefix, nodes, annotation,
+                if get_count(sa_count[ot][act]) >= edge_threshold:
+                    miec = min_edges_count[ot] if ot in min_edges_count else get_count(sa_count[ot][act])
+                    maec = max_edges_count[ot] if ot in max_edges_count else get_count(sa_count[ot][act])
+                    add_start_node(viz, ot, act, get_count(sa_count[ot][act]), edge_prefix, nodes, annotation,
                                    miec, maec)
 
     for ot in ea_count:
         for act in ea_count[ot]:
             if act in nodes:
-                if len(ea_count[ot][act]) >= edge_threshold:
-                    miec = min_edges_count[ot] if ot in min_edges_count else len(ea_count[ot][act])
-                    maec = max_edges_count[ot] if ot in max_edges_count else len(ea_count[ot][act])
-                    add_end_node(viz, ot, act, len(ea_count[ot][act]), edge_prefix, nodes, annotation,
+                if get_count(ea_count[ot][act]) >= edge_threshold:
+                    miec = min_edges_count[ot] if ot in min_edges_count else get_count(ea_count[ot][act])
+                    maec = max_edges_count[ot] if ot in max_edges_count else get_count(ea_count[ot][act])
+                    add_end_node(viz, ot, act, get_count(ea_count[ot][act]), edge_prefix, nodes, annotation,
                                  miec, maec)
 
     viz.attr(rankdir=rankdir)
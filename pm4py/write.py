@@ -324,13 +324,14 @@ def write_ocel2(ocel: OCEL, file_path: str, encoding: str = constants.DEFAULT_EN
         raise Exception("Unsupported file format for OCEL2.0 export.")
 
 
-def write_ocel2_json(ocel: OCEL, file_path: str, encoding: str = constants.DEFAULT_ENCODING) -> None:
+def write_ocel2_json(ocel: OCEL, file_path: str, encoding: str = constants.DEFAULT_ENCODING, streaming: bool = False) -> None:
     """
     Writes an OCEL2.0 object to disk in the ``.jsonocel`` file format.
 
     :param ocel: OCEL object.
     :param file_path: Target file path to the JSON-OCEL file.
     :param encoding: The encoding to be used (default: utf-8).
+    :param streaming: If True, serializes the objects and the events in batches directly to the file, without building the JSON document in memory (default: False).
 
     .. code-block:: python3
 
@@ -343,7 +344,8 @@ def write_ocel2_json(ocel: OCEL, file_path: str, encoding: str = constants.DEFAU
         file_path = file_path + ".jsonocel"
 
     from pm4py.objects.ocel.exporter.jsonocel import exporter as jsonocel_exporter
-    jsonocel_exporter.apply(ocel, file_path, variant=jsonocel_exporter.Variants.OCEL20_STANDARD, parameters={"encoding": encoding})
+    variant = jsonocel_exporter.Variants.OCEL20_STREAMING if streaming else jsonocel_exporter.Variants.OCEL20_STANDARD
+    jsonocel_exporter.apply(ocel, file_path, variant=variant, parameters={"encoding": encoding})
 
 
 def write_ocel2_sqlite(ocel: OCEL, file_path: str, encoding: str = constants.DEFAULT_ENCODING) -> None:
@@ -368,13 +370,14 @@ def write_ocel2_sqlite(ocel: OCEL, file_path: str, encoding: str = constants.DEF
     sqlite_exporter.apply(ocel, file_path, variant=sqlite_exporter.Variants.OCEL20, parameters={"encoding": encoding})
 
 
-def write_ocel2_xml(ocel: OCEL, file_path: str, encoding: str = constants.DEFAULT_ENCODING) -> None:
+def write_ocel2_xml(ocel: OCEL, file_path: str, encoding: str = constants.DEFAULT_ENCODING, streaming: bool = False) -> None:
     """
     Writes an OCEL2.0 object to disk in the ``.xmlocel`` file format.
 
     :param ocel: OCEL object.
     :param file_path: Target file path to the XML-OCEL file.
     :param encoding: The encoding to be used (default: utf-8).
+    :param streaming: If True, serializes the objects and the events in batches directly to the file, without building the XML tree in memory (default: False).
 
     .. code-block:: python3
 
@@ -387,4 +390,40 @@ def write_ocel2_xml(ocel: OCEL, file_path: str, encoding: str = constants.DEFAUL
         file_path = file_path + ".xmlocel"
 
     from pm4py.objects.ocel.exporter.xmlocel import exporter as xml_exporter
-    xml_exporter.apply(ocel, file_path, variant=xml_exporter.Variants.OCEL20, parameters={"encoding": encoding})
+    variant = xml_exporter.Variants.OCEL20_STREAMING if streaming else xml_exporter.Variants.OCEL20
+    xml_exporter.apply(ocel, file_path, variant=variant, parameters={"encoding": encoding})
+
+
+def write_cache(log: Union[EventLog, pd.DataFrame], file_path: str, case_id_key: str = "case:concept:name") -> None:
+    """
+    Writes an event log to disk in the columnar cache format of pm4py (``.pm4pycache``), which can be read back
+    (memory-mapping its columns) with ``pm4py.read_cache``. The string columns are dictionary-encoded
+    and the timestamps are stored as 64-bit integers.
+
+    Columns that do not contain numbers, timestamps or strings (e.g., nested attributes) are stored as JSON documents;
+    values that cannot be represented in JSON are not supported (a ``TypeError`` is raised).
+
+    :param log: Log object (``EventLog`` or ``pandas.DataFrame``) that needs to be written to disk.
+    :param file_path: Target file path of the cache file on disk.
+    :param case_id_key: Column key that identifies the case identifier.
+
+    .. code-block:: python3
+
+        import pm4py
+
+        pm4py.write_cache(log, '<path_to_export_to>')
+    """
+    __event_log_deprecation_warning(log)
+
+    if check_is_pandas_dataframe(log):
+        check_pandas_dataframe_columns(log, case_id_key=case_id_key)
+    else:
+        from pm4py.objects.conversion.log import converter as log_converter
+        log = log_converter.apply(log, variant=log_converter.Variants.TO_DATA_FRAME)
+
+    file_path = str(file_path)
+    if not file_path.lower().endswith("pm4pycache"):
+        file_path = file_path + ".pm4pycache"
+
+    from pm4py.objects.log.util import columnar_cache
+    columnar_cache.write(log, file_path)
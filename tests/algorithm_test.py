@@ -70,6 +70,89 @@ class AlgorithmTest(unittest.TestCase):
         generalization = generalization_evaluation.apply(log, net, im, fm,
                                                          variant=generalization_evaluation.Variants.GENERALIZATION_TOKEN)
 
+    def test_tokenreplay_prefix_trie(self):
+        log = xes_importer.apply(os.path.join("compressed_input_data", "08_receipt.xes.gz"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        net, im, fm = process_tree_converter.apply(inductive_miner.apply(log, parameters={"noise_threshold": 0.2}))
+        from pm4py.algo.conformance.tokenreplay import algorithm as token_replay
+        parameters = token_replay.Variants.TOKEN_REPLAY.value.Parameters
+        for configuration in [{}, {parameters.STOP_IMMEDIATELY_UNFIT: True},
+                              {parameters.CLEANING_TOKEN_FLOOD: True}]:
+            results = []
+            for use_prefix_trie in [False, True]:
+                configuration[parameters.USE_PREFIX_TRIE] = use_prefix_trie
+                configuration[parameters.RETURN_NAMES] = True
+                results.append(token_replay.apply(log, net, im, fm, variant=token_replay.Variants.TOKEN_REPLAY,
+                                                  parameters=configuration))
+            self.assertEqual(results[0], results[1])
+
+    def test_tokenreplay_columnar(self):
+        log = xes_importer.apply(os.path.join("compressed_input_data", "03_repairExample.xes.gz"))
+        from pm4py.algo.discovery.alpha import algorithm as alpha_miner
+        net, im, fm = alpha_miner.apply(log)
+        from pm4py.algo.conformance.tokenreplay import algorithm as token_replay
+        from pm4py.algo.conformance.tokenreplay.variants import token_replay as token_replay_variant
+        replayed_traces = token_replay.apply(log, net, im, fm, variant=token_replay.Variants.TOKEN_REPLAY)
+        parameters = {token_replay_variant.Parameters.MULTIPROCESSING: True, token_replay_variant.Parameters.CORES: 2}
+        columnar_result = token_replay_variant.apply_columnar(log, net, im, fm, parameters=parameters)
+        self.assertEqual(len(columnar_result), len(log))
+        for i in range(len(log)):
+            case_result = columnar_result.get_case_result(i)
+            for key in ["trace_is_fit", "missing_tokens", "consumed_tokens", "remaining_tokens", "produced_tokens"]:
+                self.assertEqual(case_result[key], replayed_traces[i][key])
+        from pm4py.algo.evaluation.replay_fitness import algorithm as rp_fitness_evaluator
+        evaluation = rp_fitness_evaluator.evaluate(replayed_traces, variant=rp_fitness_evaluator.Variants.TOKEN_BASED)
+        columnar_evaluation = rp_fitness_evaluator.evaluate(columnar_result,
+                                                            variant=rp_fitness_evaluator.Variants.TOKEN_BASED)
+        for key in evaluation:
+            self.assertAlmostEqual(evaluation[key], columnar_evaluation[key])
+        from pm4py.algo.evaluation.precision import algorithm as precision_evaluator
+        precision = precision_evaluator.apply(log, net, im, fm,
+                                              variant=precision_evaluator.Variants.ETCONFORMANCE_TOKEN)
+        parallel_precision = precision_evaluator.apply(log, net, im, fm,
+                                                       variant=precision_evaluator.Variants.ETCONFORMANCE_TOKEN,
+                                                       parameters={"multiprocessing": True, "cores": 2})
+        self.assertAlmostEqual(precision, parallel_precision)
+        # the columnar evaluation is equal to the one based on the executor of the token-based replay
+        executor_precision = precision_evaluator.apply(log, net, im, fm,
+                                                       variant=precision_evaluator.Variants.ETCONFORMANCE_TOKEN,
+                                                       parameters={"columnar_replay": False})
+        self.assertEqual(precision, executor_precision)
+
+    def test_tokenreplay_prepared_model(self):
+        log = xes_importer.apply(os.path.join("compressed_input_data", "08_receipt.xes.gz"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        net, im, fm = process_tree_converter.apply(inductive_miner.apply(log, parameters={"noise_threshold": 0.2}))
+        from pm4py.algo.conformance.tokenreplay.variants import token_replay
+        keys = ["trace_is_fit", "trace_fitness", "missing_tokens", "consumed_tokens", "remaining_tokens",
+                "produced_tokens"]
+        replayed_traces = token_replay.apply(log, net, im, fm)
+        prepared_model = token_replay.prepare_model(net, im, fm,
+                                                    parameters={token_replay.Parameters.MAX_CACHE_SIZE: 100})
+        for i in range(2):
+            cached_replayed_traces = token_replay.apply(log, net, im, fm, parameters={
+                token_replay.Parameters.PREPARED_MODEL: prepared_model})
+            for j in range(len(log)):
+                for key in keys:
+                    self.assertEqual(replayed_traces[j][key], cached_replayed_traces[j][key])
+        statistics = prepared_model.get_cache_statistics()
+        self.assertGreater(statistics["marking_to_activity"]["hits"], 0)
+        self.assertLessEqual(statistics["marking_to_activity"]["size"], 100)
+        path = os.path.join("test_output_data", "prepared_model.pkl")
+        token_replay.write_prepared_model(prepared_model, path)
+        read_model = token_replay.read_prepared_model(path)
+        os.remove(path)
+        self.assertEqual(read_model.get_cache_statistics(), statistics)
+        cached_replayed_traces = token_replay.apply(log, read_model.net, read_model.initial_marking,
+                                                    read_model.final_marking,
+                                                    parameters={token_replay.Parameters.PREPARED_MODEL: read_model})
+        for j in range(len(log)):
+            for key in keys:
+                self.assertEqual(replayed_traces[j][key], cached_replayed_traces[j][key])
+        # the caches populated by the replays of the other process are used
+        self.assertGreater(read_model.get_cache_statistics()["marking_to_activity"]["hits"],
+                           statistics["marking_to_activity"]["hits"])
+
     def test_evaluation(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
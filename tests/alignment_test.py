@@ -100,6 +100,21 @@ class AlignmentTest(unittest.TestCase):
         net, im, fm = pm4py.discover_petri_net_inductive(log)
         align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_TWEAKED_STATE_EQUATION_A_STAR)
 
+    def test_alignments_multiprocessing(self):
+        import pm4py
+        from pm4py.algo.evaluation.precision.variants import align_etconformance
+        log = pm4py.read_xes("input_data/running-example.xes")
+        net, im, fm = pm4py.discover_petri_net_inductive(log, noise_threshold=0.2)
+        parameters = {align_alg.Parameters.CORES: 2}
+        aligned_traces = align_alg.apply(log, net, im, fm)
+        aligned_traces_mp = align_alg.apply_multiprocessing(log, net, im, fm, parameters=parameters)
+        self.assertEqual([x["cost"] for x in aligned_traces], [x["cost"] for x in aligned_traces_mp])
+        self.assertEqual([x["fitness"] for x in aligned_traces], [x["fitness"] for x in aligned_traces_mp])
+        precision = align_etconformance.apply(log, net, im, fm)
+        precision_mp = align_etconformance.apply(log, net, im, fm, parameters={
+            align_etconformance.Parameters.MULTIPROCESSING: True, align_etconformance.Parameters.CORES: 2})
+        self.assertAlmostEqual(precision, precision_mp)
+
 
 
 if __name__ == "__main__":
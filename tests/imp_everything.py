@@ -1,7 +1,24 @@
 import os
+import subprocess
+import sys
 import unittest
 
 
+FACADES = ["read", "write", "discovery", "conformance", "vis", "ocel", "stats", "filtering", "convert", "utils",
+           "analysis", "sim", "ml", "org", "llm", "connectors", "hof"]
+
+
+def get_import_footprint(statement, modules):
+    # executes the import in a fresh interpreter, returning which of the given modules got loaded
+    code = "import sys; " + statement + "; print(','.join(m for m in " + repr(modules) + " if m in sys.modules))"
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = parent_dir + os.pathsep + env.get("PYTHONPATH", "")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True).stdout
+    loaded = out.split("\n")[0]
+    return [m for m in loaded.split(",") if m]
+
+
 class Pm4pyImportPackageTest(unittest.TestCase):
     def test_importeverything(self):
         # to avoid static method warnings in tests,
@@ -12,6 +29,25 @@ class Pm4pyImportPackageTest(unittest.TestCase):
             os.path.join("input_data", "running-example.xes"))
         self.assertEqual(len(log), 6)
 
+    def test_lazy_top_level_import(self):
+        loaded = get_import_footprint("import pm4py", ["pandas", "numpy", "scipy", "networkx", "lxml", "graphviz",
+                                                       "matplotlib", "sklearn"])
+        self.assertEqual(loaded, [])
+
+    def test_lazy_attribute_access(self):
+        import pm4py
+        self.assertTrue(callable(pm4py.discover_petri_net_inductive))
+        self.assertIn("read_xes", dir(pm4py))
+        self.assertIsNotNone(pm4py.util.xes_constants.DEFAULT_NAME_KEY)
+        with self.assertRaises(AttributeError):
+            pm4py.non_existing_function
+
+    def test_facades_import_cost(self):
+        # importing a facade should not load the dependencies of the visualizations and of the ML subsystem
+        for facade in FACADES:
+            loaded = get_import_footprint("import pm4py." + facade, ["graphviz", "matplotlib", "sklearn"])
+            self.assertEqual(loaded, [], facade)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,7 +6,7 @@ from pm4py.objects.log.importer.xes import importer as xes_importer
 from pm4py.visualization.process_tree import visualizer as pt_vis
 from pm4py.objects.process_tree import semantics as pt_semantics
 from pm4py.objects.process_tree.utils import generic as pt_util
-from tests.constants import INPUT_DATA_DIR
+from tests.constants import INPUT_DATA_DIR, COMPRESSED_INPUT_DATA
 
 
 class InductiveMinerTreeTest(unittest.TestCase):
@@ -40,6 +40,58 @@ class InductiveMinerTreeTest(unittest.TestCase):
         # test log generation
         log = pt_semantics.generate_log(tree)
 
+    def test_tree_parallel_recursion(self):
+        log = xes_importer.apply(os.path.join(COMPRESSED_INPUT_DATA, "08_receipt.xes.gz"))
+        for variant in [inductive_miner.Variants.IM, inductive_miner.Variants.IMf, inductive_miner.Variants.IMd]:
+            tree = inductive_miner.apply(log, variant=variant)
+            # small threshold, so the sub-logs of the cuts are mined in the worker processes
+            parameters = {inductive_miner.Parameters.PARALLEL_RECURSION: True,
+                          inductive_miner.Parameters.MIN_PARALLEL_SIZE: 10, inductive_miner.Parameters.CORES: 2}
+            self.assertEqual(str(tree), str(inductive_miner.apply(log, variant=variant, parameters=parameters)))
+
+    def test_tree_high_noise_threshold(self):
+        from pm4py.algo.discovery.inductive.cuts.xor import ExclusiveChoiceCut
+        from pm4py.objects.dfg import util as dfu
+        from pm4py.util import nx_utils
+
+        def nx_holds(cls, obj, parameters=None):
+            # detection of the xor cut on the networkx graph of the DFG (previous implementation)
+            nx_und = dfu.as_nx_graph(obj.dfg).to_undirected()
+            conn_comps = [set(c) for c in nx_utils.connected_components(nx_und)]
+            return conn_comps if len(conn_comps) > 1 else None
+
+        log = xes_importer.apply(os.path.join(COMPRESSED_INPUT_DATA, "15_bpic2020_permit_log_1t_per_variant.xes.gz"))
+        parameters = {"noise_threshold": 0.5}
+        tree = inductive_miner.apply(log, variant=inductive_miner.Variants.IMf, parameters=parameters)
+        holds = ExclusiveChoiceCut.__dict__["holds"]
+        ExclusiveChoiceCut.holds = classmethod(nx_holds)
+        try:
+            nx_tree = inductive_miner.apply(log, variant=inductive_miner.Variants.IMf, parameters=parameters)
+        finally:
+            ExclusiveChoiceCut.holds = holds
+        # the variants tied between the groups of the xor cut go to the same sub-log
+        self.assertEqual(str(nx_tree), str(tree))
+
+    def test_encoded_uvcl(self):
+        from collections import Counter
+        from pm4py.algo.discovery.inductive.dtypes.im_encoded import EncodedUVCL
+        from pm4py.util.compression import util as comut
+        log = Counter({("a", "b", "c"): 3, ("a", "c", "b"): 2, ("a", "d"): 1, (): 1})
+        encoded = EncodedUVCL.from_uvcl(log)
+        self.assertEqual(log, encoded.to_uvcl())
+        self.assertEqual(comut.discover_dfg_uvcl(log).graph, encoded.discover_dfg().graph)
+        # removing the activities b and d merges the projected variants
+        projected = encoded.project(encoded.group_index([{"b", "d"}])[encoded.events] != 0)
+        self.assertEqual(Counter({("a", "c"): 5, ("a",): 1, (): 1}), projected.to_uvcl())
+        # the concurrency projection keeps the count of the last equal projected variant, as the Counter-based one
+        projected = encoded.project(encoded.group_index([{"b", "d"}])[encoded.events] != 0, overwrite=True)
+        self.assertEqual(Counter({("a", "c"): 2, ("a",): 1, (): 1}), projected.to_uvcl())
+        from pm4py.algo.discovery.inductive.cuts.concurrency import ConcurrencyCutUVCL
+        from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL
+        sub_logs = ConcurrencyCutUVCL.project(IMDataStructureUVCL(log), [{"a", "c"}, {"b", "d"}])
+        self.assertEqual(Counter({("a", "c"): 2, ("a",): 1, (): 1}), sub_logs[0].data_structure)
+        self.assertEqual(Counter({("b",): 2, ("d",): 1, (): 1}), sub_logs[1].data_structure)
+
 
 if __name__ == "__main__":
     unittest.main()
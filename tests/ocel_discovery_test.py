@@ -87,6 +87,44 @@ class OcelDiscoveryTest(unittest.TestCase):
         pm4py.save_vis_ocdfg(ocdfg, target_path, annotation="performance", act_metric="unique_objects", edge_metric="total_objects", act_threshold=2, edge_threshold=1, performance_aggregation="median")
         os.remove(target_path)
 
+    def assert_same_ocdfg(self, ocdfg, aggregated):
+        import numpy as np
+        self.assertEqual(ocdfg["activities"], aggregated["activities"])
+        self.assertEqual(ocdfg["object_types"], aggregated["object_types"])
+        for section in ["edges", "activities_indep", "activities_ot", "start_activities", "end_activities"]:
+            self.assertEqual(set(ocdfg[section]), set(aggregated[section]))
+            for metric in ocdfg[section]:
+                if section == "activities_indep":
+                    self.assertEqual({x: len(y) for x, y in ocdfg[section][metric].items()},
+                                     aggregated[section][metric], (section, metric))
+                else:
+                    self.assertEqual({ot: {x: len(y) for x, y in v.items()} for ot, v in ocdfg[section][metric].items()},
+                                     aggregated[section][metric], (section, metric))
+        for metric in ocdfg["edges_performance"]:
+            for ot, edges in ocdfg["edges_performance"][metric].items():
+                self.assertEqual(set(edges), set(aggregated["edges_performance"][metric][ot]))
+                for edge, times in edges.items():
+                    stats = aggregated["edges_performance"][metric][ot][edge]
+                    self.assertAlmostEqual(np.mean(times), stats["mean"])
+                    self.assertAlmostEqual(np.median(times), stats["median"])
+                    self.assertAlmostEqual(min(times), stats["min"])
+                    self.assertAlmostEqual(max(times), stats["max"])
+
+    def test_discovery_ocfg_aggregated(self):
+        target_path = os.path.join("test_output_data", "model.svg")
+        ocel = pm4py.read_ocel(os.path.join("input_data", "ocel", "example_log.jsonocel"))
+        ocdfg = pm4py.discover_ocdfg(ocel)
+        aggregated = pm4py.discover_ocdfg(ocel, aggregated=True)
+        self.assert_same_ocdfg(ocdfg, aggregated)
+        # the start and end activities follow the order of the relations also when the events are shuffled
+        ocel.events = ocel.events.sample(frac=1, random_state=7).reset_index(drop=True)
+        self.assert_same_ocdfg(pm4py.discover_ocdfg(ocel), pm4py.discover_ocdfg(ocel, aggregated=True))
+        ocel.relations = ocel.relations.sample(frac=1, random_state=7).reset_index(drop=True)
+        self.assert_same_ocdfg(pm4py.discover_ocdfg(ocel), pm4py.discover_ocdfg(ocel, aggregated=True))
+        pm4py.save_vis_ocdfg(aggregated, target_path, annotation="frequency", act_metric="events", edge_metric="ev_couples", act_threshold=2, edge_threshold=1)
+        pm4py.save_vis_ocdfg(aggregated, target_path, annotation="performance", act_metric="unique_objects", edge_metric="total_objects", act_threshold=2, edge_threshold=1, performance_aggregation="median")
+        os.remove(target_path)
+
     def test_discovery_ocpn_im(self):
         ocel = pm4py.read_ocel(os.path.join("input_data", "ocel", "example_log.jsonocel"))
         ocpn = pm4py.discover_oc_petri_net(ocel, inductive_miner_variant="im")
@@ -1,6 +1,7 @@
 import unittest
 import pm4py
 import os
+import pandas as pd
 
 
 class OcelFilteringTest(unittest.TestCase):
@@ -114,6 +115,24 @@ class OcelFilteringTest(unittest.TestCase):
         ocel = pm4py.read_ocel(input_path)
         pm4py.filter_ocel_events_timestamp(ocel, "1981-01-01 00:00:00", "1982-01-01 00:00:00")
 
+    def test_ocel_index(self):
+        from pm4py.objects.ocel.util import related_events, related_objects
+        input_path = os.path.join("input_data", "ocel", "example_log.jsonocel")
+        ocel = pm4py.read_ocel(input_path)
+        rel_events = related_events.related_events_dct(ocel)
+        rel_objects = related_objects.related_objects_dct_overall(ocel)
+        summary = pm4py.ocel_objects_interactions_summary(ocel)
+        index = ocel.get_index()
+        self.assertTrue(ocel.has_index())
+        self.assertEqual(rel_events, related_events.related_events_dct(ocel))
+        self.assertEqual(rel_objects, related_objects.related_objects_dct_overall(ocel))
+        pd.testing.assert_frame_equal(summary, pm4py.ocel_objects_interactions_summary(ocel))
+        obj = ocel.objects[ocel.object_id_column].iloc[0]
+        self.assertEqual(rel_events[ocel.objects[ocel.object_type_column].iloc[0]][obj], index.get_events_of_object(obj))
+        # replacing a dataframe invalidates the index
+        ocel.events = ocel.events.iloc[:10]
+        self.assertFalse(ocel.has_index())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,6 +21,11 @@ from pm4py.util import constants, pandas_utils
 from pm4py.objects.conversion.process_tree import converter as process_tree_converter
 
 
+def get_synthetic_stream_events(num_events):
+    # stream of events of consecutive cases, each one containing the activities A, B and C
+    return [{"case:concept:name": str(i // 3), "concept:name": "ABC"[i % 3]} for i in range(num_events)]
+
+
 class OtherPartsTests(unittest.TestCase):
     def test_emd_1(self):
         if importlib.util.find_spec("pyemd"):
@@ -194,6 +199,34 @@ class OtherPartsTests(unittest.TestCase):
         from pm4py.statistics.eventually_follows.pandas import get
         efg = get.apply(dataframe, parameters={get.Parameters.START_TIMESTAMP_KEY: "start_timestamp"})
 
+    def test_efg_statistics_pandas(self):
+        dataframe = pandas_utils.read_csv(os.path.join("input_data", "interval_event_log.csv"))
+        from pm4py.objects.log.util import dataframe_utils
+        dataframe = dataframe_utils.convert_timestamp_columns_in_df(dataframe, timest_format=constants.DEFAULT_TIMESTAMP_PARSE_FORMAT)
+        from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics, efg_statistics
+        stats = efg_statistics.get_eventually_follows_statistics(dataframe, start_timestamp_key="start_timestamp", measure="both")
+        partial_order = df_statistics.get_partial_order_dataframe(dataframe.copy(), start_timestamp_key="start_timestamp",
+                                                                  keep_first_following=False)
+        grouped = partial_order.groupby(["concept:name", "concept:name_2"])[constants.DEFAULT_FLOW_TIME]
+        counts = grouped.size().to_dict()
+        means = grouped.mean().to_dict()
+        self.assertEqual(set(stats), set(counts))
+        for key in stats:
+            self.assertEqual(stats[key][0], counts[key])
+            self.assertAlmostEqual(stats[key][1], means[key], places=3)
+
+    def test_concurrent_activities_missing_timestamps(self):
+        import pandas as pd
+        from pm4py.statistics.concurrent_activities.pandas import get
+        dataframe = pd.DataFrame({"case:concept:name": ["1", "1", "1", "1"], "concept:name": ["A", "B", "C", "D"],
+                                  "start_timestamp": pd.to_datetime(["2024-01-01 00:00", "2024-01-01 00:05", None,
+                                                                     "2024-01-01 00:02"]),
+                                  "time:timestamp": pd.to_datetime(["2024-01-01 00:10", "2024-01-01 00:15",
+                                                                    "2024-01-01 00:08", None])})
+        # the events with a missing timestamp (C, D) are not concurrent to any other event
+        concurrent = get.apply(dataframe, parameters={get.Parameters.START_TIMESTAMP_KEY: "start_timestamp"})
+        self.assertEqual({("A", "B"): 1}, concurrent)
+
     def test_dfg_playout(self):
         import pm4py
         from pm4py.algo.simulation.playout.dfg import algorithm as dfg_playout
@@ -388,6 +421,321 @@ class OtherPartsTests(unittest.TestCase):
         from pm4py.algo.transformation.ocel.description.variants import variant1
         variant1.apply(ocel)
 
+    def test_live_event_stream_batched_delivery(self):
+        from pm4py.objects.log.obj import Event
+        from pm4py.streaming.stream.live_event_stream import LiveEventStream, Parameters, OverflowPolicy
+        from pm4py.streaming.util.live_to_static_stream import LiveToStaticStream
+        stream = LiveEventStream(parameters={Parameters.BATCHED_DELIVERY: True, Parameters.MAX_BUFFER_SIZE: 100})
+        observer1 = LiveToStaticStream()
+        observer2 = LiveToStaticStream()
+        stream.register(observer1)
+        stream.register(observer2)
+        stream.start()
+        for i in range(5000):
+            stream.append(Event({"concept:name": "A", "index": i}))
+        stream.stop()
+        # each observer receives all the events, in the order of the stream
+        self.assertEqual([e["index"] for e in observer1.get()], list(range(5000)))
+        self.assertEqual([e["index"] for e in observer2.get()], list(range(5000)))
+        statistics = stream.get_statistics()
+        self.assertEqual(statistics["delivered"], 5000)
+        self.assertEqual(statistics["lag"], 0)
+        stream = LiveEventStream(parameters={Parameters.BATCHED_DELIVERY: True, Parameters.MAX_BUFFER_SIZE: 10,
+                                             Parameters.OVERFLOW_POLICY: OverflowPolicy.DROP})
+        observer = LiveToStaticStream()
+        stream.register(observer)
+        for i in range(20):
+            stream.append(Event({"concept:name": "A", "index": i}))
+        stream.start()
+        stream.stop()
+        self.assertEqual([e["index"] for e in observer.get()], list(range(10)))
+        self.assertEqual(stream.get_statistics()["dropped"], 10)
+        # with the blocking policy, the bound applies also before the stream is started
+        import threading
+        import time
+        stream = LiveEventStream(parameters={Parameters.BATCHED_DELIVERY: True, Parameters.MAX_BUFFER_SIZE: 10})
+        observer = LiveToStaticStream()
+        stream.register(observer)
+        producer = threading.Thread(target=stream.append_batch,
+                                    args=([Event({"concept:name": "A", "index": i}) for i in range(20)],))
+        producer.start()
+        time.sleep(0.2)
+        self.assertTrue(producer.is_alive())
+        self.assertEqual(stream.get_statistics()["received"], 10)
+        stream.start()
+        producer.join()
+        stream.stop()
+        self.assertEqual([e["index"] for e in observer.get()], list(range(20)))
+
+    def test_streaming_bounded_case_state(self):
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        from pm4py.streaming.util.dictio.versions import bounded
+        evicted = []
+        store = bounded.apply(parameters={bounded.Parameters.MAX_SIZE: 2,
+                                          bounded.Parameters.EVICTION_CALLBACK: lambda k, v, r: evicted.append((k, r))})
+        store["a"] = 1
+        store["b"] = 2
+        self.assertEqual(store["a"], 1)
+        store["c"] = 3
+        # the least recently used entry is evicted
+        self.assertEqual(evicted, [("b", bounded.EVICTION_SIZE)])
+        self.assertEqual(set(store.keys()), {"a", "c"})
+        events = get_synthetic_stream_events(300)
+        unbounded = streaming_dfg.apply()
+        unbounded.receive_batch(events)
+        discovery = streaming_dfg.apply(parameters={"max_cases": 5})
+        discovery.receive_batch(events)
+        self.assertLessEqual(len(discovery.case_dict), 5)
+        # the last activity of the evicted cases is counted as end activity
+        self.assertEqual(unbounded.get(), discovery.get())
+        discovery.checkpoint(os.path.join("test_output_data", "streaming_dfg.ckpt"))
+        restored = streaming_dfg.apply()
+        restored.restore(os.path.join("test_output_data", "streaming_dfg.ckpt"))
+        self.assertEqual(restored.get(), discovery.get())
+        os.remove(os.path.join("test_output_data", "streaming_dfg.ckpt"))
+
+    def test_streaming_bounded_case_state_tbr(self):
+        import time
+        from pm4py.streaming.algo.conformance.tbr import algorithm as tbr_algorithm
+        from pm4py.streaming.util.dictio.versions import bounded
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = process_tree_converter.apply(inductive_miner.apply(log))
+        evicted = []
+        tbr = tbr_algorithm.apply(net, im, fm, parameters={"max_cases": 2})
+        tbr.message_case_evicted = lambda case, diagnostics, reason: evicted.append((case, reason, diagnostics))
+        for case in ["1", "2", "3"]:
+            tbr.receive({"case:concept:name": case, "concept:name": "register request"})
+        # the least recently updated case is evicted, and finalized as incomplete
+        self.assertEqual([(x[0], x[1]) for x in evicted], [("1", bounded.EVICTION_SIZE)])
+        self.assertTrue(evicted[0][2]["incomplete"])
+        self.assertFalse(evicted[0][2]["is_fit"])
+        self.assertNotIn("1", tbr.missing)
+        self.assertEqual(sorted(tbr.case_dict.keys()), ["2", "3"])
+        # the cases without events for more than the idle TTL expire
+        evicted.clear()
+        tbr = tbr_algorithm.apply(net, im, fm, parameters={"case_idle_ttl": 0.05})
+        tbr.message_case_evicted = lambda case, diagnostics, reason: evicted.append((case, reason, diagnostics))
+        tbr.receive({"case:concept:name": "1", "concept:name": "register request"})
+        time.sleep(0.1)
+        tbr.receive({"case:concept:name": "2", "concept:name": "register request"})
+        self.assertEqual([(x[0], x[1]) for x in evicted], [("1", bounded.EVICTION_TTL)])
+        self.assertNotIn("1", tbr.missing)
+        self.assertEqual(list(tbr.case_dict.keys()), ["2"])
+        # the cases expiring while all the cases are terminated are finalized only by the eviction
+        not_in_dictionary = []
+        tbr.message_case_not_in_dictionary = lambda case: not_in_dictionary.append(case)
+        time.sleep(0.1)
+        tbr.terminate_all()
+        self.assertEqual([(x[0], x[1]) for x in evicted], [("1", bounded.EVICTION_TTL), ("2", bounded.EVICTION_TTL)])
+        self.assertEqual(not_in_dictionary, [])
+        self.assertEqual(len(tbr.case_dict), 0)
+
+    def test_streaming_redis_pipelined_dict(self):
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        from pm4py.streaming.util.dictio import generator
+        from pm4py.streaming.util.dictio.versions import redis_pipelined
+
+        class FakeRedis(object):
+            # minimal stand-in of a Redis connection (hashes only), counting the round trips
+            def __init__(self):
+                self.hashes = {}
+                self.round_trips = 0
+
+            def pipeline(self, transaction=True):
+                fake = self
+
+                class Pipeline(object):
+                    def __init__(self):
+                        self.commands = []
+
+                    def __getattr__(self, name):
+                        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+                    def execute(self):
+                        fake.round_trips += 1
+                        return [getattr(fake, "_" + name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+                return Pipeline()
+
+            def _hset(self, name, mapping):
+                self.hashes.setdefault(name, {}).update({k: str(v) for k, v in mapping.items()})
+
+            def _hincrby(self, name, key, amount):
+                h = self.hashes.setdefault(name, {})
+                h[key] = str(int(h.get(key, 0)) + amount)
+
+            def _hdel(self, name, *keys):
+                for key in keys:
+                    self.hashes.get(name, {}).pop(key, None)
+
+            def __getattr__(self, name):
+                def command(*args, **kwargs):
+                    self.round_trips += 1
+                    return getattr(self, "_" + name)(*args, **kwargs)
+                return command
+
+            def _hget(self, name, key):
+                return self.hashes.get(name, {}).get(key)
+
+            def _hexists(self, name, key):
+                return key in self.hashes.get(name, {})
+
+            def _hlen(self, name):
+                return len(self.hashes.get(name, {}))
+
+            def _delete(self, name):
+                self.hashes.pop(name, None)
+
+            def hscan_iter(self, name, count=None):
+                return iter(list(self.hashes.get(name, {}).items()))
+
+        connection = FakeRedis()
+        dictio = redis_pipelined.apply(parameters={redis_pipelined.Parameters.CONNECTION: connection,
+                                                   redis_pipelined.Parameters.BATCH_SIZE: 3,
+                                                   redis_pipelined.Parameters.FLUSH_INTERVAL: None})
+        dictio["a"] = 1
+        dictio.increment("a")
+        dictio.increment("b", 5)
+        # the pending writes are visible before the flush
+        self.assertEqual(connection.round_trips, 0)
+        self.assertEqual(dictio["a"], "2")
+        self.assertIn("b", dictio)
+        del dictio["a"]
+        self.assertNotIn("a", dictio)
+        dictio["c"] = "x"
+        self.assertEqual(connection.round_trips, 1)
+        self.assertEqual(connection.hashes["pm4py_dict_0"], {"b": "5", "c": "x"})
+        dictio.increment("b")
+        self.assertEqual(dictio["b"], "6")
+        self.assertEqual(dict(dictio.items()), {"b": "6", "c": "x"})
+        events = get_synthetic_stream_events(300)
+        reference = streaming_dfg.apply()
+        reference.receive_batch(events)
+        connection = FakeRedis()
+        discovery = streaming_dfg.apply(parameters={"dict_variant": generator.Variants.REDIS_PIPELINED,
+                                                    "connection": connection, "flush_interval": None})
+        discovery.receive_batch(events)
+        self.assertEqual(reference.get(), discovery.get())
+        # the last pending writes are sent when the algorithm is closed
+        connection = FakeRedis()
+        discovery = streaming_dfg.apply(parameters={"dict_variant": generator.Variants.REDIS_PIPELINED,
+                                                    "connection": connection, "flush_interval": None,
+                                                    "batch_size": 10000})
+        discovery.receive_batch(events)
+        self.assertNotIn("pm4py_dict_1", connection.hashes)
+        discovery.close()
+        self.assertEqual(sorted(int(x) for x in connection.hashes["pm4py_dict_1"].values()), [100, 100])
+
+    def test_streaming_windows(self):
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        from pm4py.streaming.algo.conformance.tbr import algorithm as tbr_algorithm
+        from pm4py.streaming.algo.conformance.footprints import algorithm as fp_algorithm
+        from pm4py.algo.discovery.footprints import algorithm as fp_discovery
+        events = get_synthetic_stream_events(30)
+        closed = []
+        discovery = streaming_dfg.apply(parameters={"window_size": 6, "window_slide": 3, "window_measure": "count",
+                                                    "window_history": 2,
+                                                    "window_callback": lambda s, e, r: closed.append((s, e))})
+        discovery.receive_batch(events)
+        # the current window contains the last two cases
+        self.assertEqual(discovery.get_window(), ({("A", "B"): 2, ("B", "C"): 2}, {"A": 2, "B": 2, "C": 2},
+                                                  {"A": 2}, {"C": 2}))
+        self.assertEqual(closed[-1], (21, 27))
+        self.assertEqual(len(discovery.get_closed_windows()), 2)
+        self.assertEqual(discovery.get()[0], {("A", "B"): 10, ("B", "C"): 10})
+        discovery.checkpoint(os.path.join("test_output_data", "streaming_window.ckpt"))
+        restored = streaming_dfg.apply(parameters={"window_size": 6, "window_slide": 3, "window_measure": "count"})
+        restored.restore(os.path.join("test_output_data", "streaming_window.ckpt"))
+        self.assertEqual(restored.get_window(), discovery.get_window())
+        os.remove(os.path.join("test_output_data", "streaming_window.ckpt"))
+        # time windows (of 3 minutes) over timestamps provided as ISO strings
+        events = get_synthetic_stream_events(12)
+        for i, event in enumerate(events):
+            event["time:timestamp"] = "2024-01-01T00:%02d:00" % i
+        closed = []
+        discovery = streaming_dfg.apply(parameters={"window_size": 180,
+                                                    "window_callback": lambda s, e, r: closed.append((s, e))})
+        discovery.receive_batch(events)
+        self.assertEqual(discovery.get_window(), ({("A", "B"): 1, ("B", "C"): 1}, {"A": 1, "B": 1, "C": 1},
+                                                  {"A": 1}, {"C": 1}))
+        self.assertEqual(len(closed), 3)
+        self.assertEqual(closed[0], (1704067200, 1704067380))
+        # an event with an invalid timestamp is not counted in the windows, but it is processed
+        discovery.receive({"case:concept:name": "3", "concept:name": "D", "time:timestamp": "invalid"})
+        self.assertEqual(discovery.get_window()[0], {("A", "B"): 1, ("B", "C"): 1})
+        self.assertEqual(discovery.get()[0], {("A", "B"): 4, ("B", "C"): 4, ("C", "D"): 1})
+        log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
+        net, im, fm = process_tree_converter.apply(inductive_miner.apply(log))
+        fp = fp_discovery.apply(log, variant=fp_discovery.Variants.ENTIRE_EVENT_LOG)
+        events = [{"case:concept:name": "1", "concept:name": "register request"},
+                  {"case:concept:name": "1", "concept:name": "decide"},
+                  {"case:concept:name": "2", "concept:name": "register request"},
+                  {"case:concept:name": "2", "concept:name": "examine casually"}]
+        for algo in [tbr_algorithm.apply(net, im, fm, parameters={"window_size": 2, "window_measure": "count"}),
+                     fp_algorithm.apply(fp, parameters={"window_size": 2, "window_measure": "count"})]:
+            algo.receive_batch(events)
+            # the deviation of case 1 happened in the previous (tumbling) window
+            self.assertEqual(list(algo.get_window()["is_fit"]), [True])
+            self.assertEqual(list(algo.get_closed_windows()[-1][2]["is_fit"]), [False])
+
+    def test_streaming_batch_readers(self):
+        import time
+        from pm4py.streaming.importer.xes import importer as xes_stream_importer
+        from pm4py.streaming.importer.csv import importer as csv_stream_importer
+        from pm4py.streaming.stream.live_event_stream import LiveEventStream
+        from pm4py.streaming.algo.discovery.dfg import algorithm as streaming_dfg
+        events = list(xes_stream_importer.apply(os.path.join("input_data", "running-example.xes")))
+        batch_events = list(xes_stream_importer.apply(os.path.join("input_data", "running-example.xes"),
+                                                      variant=xes_stream_importer.Variants.XES_BATCH_STREAM,
+                                                      parameters={"batch_size": 5}))
+        self.assertEqual([dict(x) for x in events], [dict(x) for x in batch_events])
+        reader = csv_stream_importer.apply(os.path.join("input_data", "running-example.csv"),
+                                           variant=csv_stream_importer.Variants.CSV_BATCH_STREAM,
+                                           parameters={"batch_size": 10, "batch_acceptance_condition":
+                                                       lambda df: df["concept:name"] != "decide"})
+        batches = list(reader.iterate_batches())
+        self.assertEqual(sum(len(x) for x in batches), 33)
+        self.assertTrue(all(hasattr(x["time:timestamp"], "timestamp") for b in batches for x in b))
+        # replay reproducing the inter-arrival times (the log spans some weeks)
+        reader = csv_stream_importer.apply(os.path.join("input_data", "running-example.csv"),
+                                           variant=csv_stream_importer.Variants.CSV_BATCH_STREAM,
+                                           parameters={"speed_up": 10 ** 8})
+        live_stream = LiveEventStream(parameters={"batched_delivery": True})
+        discovery = streaming_dfg.apply()
+        live_stream.register(discovery)
+        live_stream.start()
+        aa = time.time()
+        reader.to_event_stream(live_stream)
+        live_stream.stop()
+        self.assertGreater(time.time() - aa, 0.01)
+        self.assertEqual(sum(discovery.get()[1].values()), 42)
+
+    def test_business_hours_vectorized(self):
+        from pm4py.util.business_hours import BusinessHours, soj_time_business_hours_diff_array
+        from datetime import datetime, date
+        import math
+        # default business hours: Monday to Friday, 07:00 - 17:00 (2024-01-01 is a Monday)
+        cases = [(datetime(2024, 1, 1, 8), datetime(2024, 1, 1, 10), 2),
+                 (datetime(2024, 1, 1, 8), datetime(2024, 1, 2, 8), 10),
+                 (datetime(2024, 1, 5, 16), datetime(2024, 1, 8, 8), 2),
+                 (datetime(2024, 1, 6, 10), datetime(2024, 1, 7, 12), 0),
+                 (datetime(2024, 1, 1, 6), datetime(2024, 1, 8, 6), 50),
+                 (datetime(2024, 1, 3, 18), datetime(2024, 1, 31, 7, 30), 19 * 10 + 0.5),
+                 (datetime(2024, 1, 2, 12), datetime(2024, 1, 2, 9), 0)]
+        diff = soj_time_business_hours_diff_array([x[0] for x in cases], [x[1] for x in cases])
+        for i, (st, et, hours) in enumerate(cases):
+            self.assertEqual(diff[i], hours * 3600)
+            self.assertEqual(BusinessHours(st, et).get_seconds(), hours * 3600)
+        # Tuesday 13:00 - 17:00 only
+        slots = [((24 + 13) * 3600, (24 + 17) * 3600)]
+        self.assertEqual(BusinessHours(datetime(2024, 1, 2, 15), datetime(2024, 1, 9, 14), business_hour_slots=slots)
+                         .get_seconds(), 3 * 3600)
+        self.assertTrue(math.isnan(soj_time_business_hours_diff_array([datetime(2024, 1, 1)], [None])[0]))
+        # Monday 08:00 - Wednesday 08:00, with Tuesday as holiday
+        diff = soj_time_business_hours_diff_array([datetime(2024, 1, 1, 8)], [datetime(2024, 1, 3, 8)],
+                                                  work_calendar=[date(2024, 1, 2)])
+        self.assertEqual(diff[0], 10 * 3600)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -576,6 +576,15 @@ class SimplifiedInterfaceTest(unittest.TestCase):
     def test_ocel_flattening(self):
         ocel = pm4py.read_ocel("input_data/ocel/example_log.csv")
         pm4py.ocel_flattening(ocel, "order")
+
+    def test_ocel_flattening_all(self):
+        ocel = pm4py.read_ocel("input_data/ocel/example_log.csv")
+        flattened_logs = pm4py.ocel_flattening_all(ocel)
+        for ot in pm4py.ocel_get_object_types(ocel):
+            self.assertTrue(flattened_logs[ot].equals(pm4py.ocel_flattening(ocel, ot)))
+        long_table = pm4py.ocel_flattening_all(ocel, long_format=True)
+        self.assertEqual(len(long_table), sum(len(x) for x in flattened_logs.values()))
+
     def test_stats_var_tuples_df(self):
         dataframe = pandas_utils.read_csv("input_data/running-example-transformed.csv")
         dataframe = dataframe_utils.convert_timestamp_columns_in_df(dataframe, timest_format=constants.DEFAULT_TIMESTAMP_PARSE_FORMAT, timest_columns=["Timestamp"])
@@ -1100,11 +1109,58 @@ class SimplifiedInterfaceTest(unittest.TestCase):
         pm4py.write_ocel2(ocel, "test_output_data/ocel20_example.xmlocel")
         os.remove("test_output_data/ocel20_example.xmlocel")
 
+    def test_ocel2_streaming(self):
+        import pandas as pd
+        from pm4py.objects.ocel.importer.jsonocel import importer as jsonocel_importer
+        from pm4py.objects.ocel.importer.xmlocel import importer as xmlocel_importer
+        for ext in ["xmlocel", "jsonocel"]:
+            ocel = pm4py.read_ocel2("input_data/ocel/ocel20_example." + ext)
+            path = "test_output_data/ocel20_example." + ext
+            if ext == "xmlocel":
+                pm4py.write_ocel2_xml(ocel, path, streaming=True)
+                ocel = pm4py.read_ocel2_xml(path)
+                ocel2 = pm4py.read_ocel2_xml(path, variant_str="ocel20_streaming")
+                # small batches, to cover the concatenation of the batches
+                ocel3 = xmlocel_importer.apply(path, variant=xmlocel_importer.Variants.OCEL20_STREAMING,
+                                               parameters={"batch_size": 7})
+            else:
+                pm4py.write_ocel2_json(ocel, path, streaming=True)
+                ocel = pm4py.read_ocel2_json(path)
+                ocel2 = pm4py.read_ocel2_json(path, variant_str="ocel20_streaming")
+                # small batches and blocks, to cover the values split between two blocks of the file
+                ocel3 = jsonocel_importer.apply(path, variant=jsonocel_importer.Variants.OCEL20_STREAMING,
+                                                parameters={"batch_size": 7, "read_size": 13})
+            for streamed in [ocel2, ocel3]:
+                for frame in ["events", "objects", "relations", "o2o", "object_changes"]:
+                    pd.testing.assert_frame_equal(getattr(ocel, frame), getattr(streamed, frame))
+            os.remove(path)
+
     def test_ocel2_sqlite(self):
         ocel = pm4py.read_ocel2("input_data/ocel/ocel20_example.sqlite")
         pm4py.write_ocel2(ocel, "test_output_data/ocel20_example.sqlite")
         os.remove("test_output_data/ocel20_example.sqlite")
 
+    def test_ocel2_sqlite_lazy(self):
+        ocel = pm4py.read_ocel2_sqlite("input_data/ocel/ocel20_example.sqlite")
+        lazy_ocel = pm4py.read_ocel2_sqlite("input_data/ocel/ocel20_example.sqlite", lazy=True)
+        filtered_ocel = pm4py.filter_ocel_events_timestamp(pm4py.filter_ocel_object_types(ocel, ["Invoice", "Payment"]), "2022-01-01 00:00:00", "2022-02-15 00:00:00")
+        sliced_ocel = lazy_ocel.filter_object_types(["Invoice", "Payment"]).filter_timestamp("2022-01-01 00:00:00", "2022-02-15 00:00:00").materialize()
+        self.assertEqual(len(filtered_ocel.events), len(sliced_ocel.events))
+        self.assertEqual(len(filtered_ocel.relations), len(sliced_ocel.relations))
+        self.assertEqual(len(filtered_ocel.objects), len(sliced_ocel.objects))
+        ocel = pm4py.read_ocel2_sqlite("input_data/ocel/ocel20_example.sqlite", activities=["Insert Invoice"])
+        self.assertEqual({"Insert Invoice"}, set(ocel.events["ocel:activity"].unique()))
+        # the filters are supported only by the lazy variant
+        with self.assertRaises(Exception):
+            pm4py.read_ocel2_sqlite("input_data/ocel/ocel20_example.sqlite", variant_str="ocel20",
+                                    activities=["Insert Invoice"])
+        # the empty slices keep the attribute columns
+        empty_ocel = pm4py.read_ocel2_sqlite("input_data/ocel/ocel20_example.sqlite", activities=["non existing"])
+        full_ocel = pm4py.read_ocel2_sqlite("input_data/ocel/ocel20_example.sqlite")
+        for frame in ["events", "objects", "relations", "object_changes"]:
+            self.assertEqual(0, len(getattr(empty_ocel, frame)))
+            self.assertEqual(list(getattr(full_ocel, frame).columns), list(getattr(empty_ocel, frame).columns))
+
 
 if __name__ == "__main__":
     unittest.main()
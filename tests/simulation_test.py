@@ -1,4 +1,5 @@
 import os
+import time
 import unittest
 
 from pm4py.objects.petri_net.importer import importer as pnml_importer
@@ -41,6 +42,96 @@ class SimulationTest(unittest.TestCase):
         self.assertEqual(datetime.timestamp(eventlog[0][0]['time:timestamp']), timestamp)
         self.assertEqual(eventlog[-1].attributes['concept:name'], str(last_case_id))
 
+    def test_montecarlo_des_seed(self):
+        from pm4py.objects.log.importer.xes import importer as xes_importer
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        from pm4py.objects.conversion.process_tree import converter as process_tree_converter
+        from pm4py.algo.simulation.montecarlo import algorithm as montecarlo_simulation
+        log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "running-example.xes"))
+        net, im, fm = process_tree_converter.apply(inductive_miner.apply(log))
+        variant = montecarlo_simulation.Variants.PETRI_DES_FIFO
+        parameters = {variant.value.Parameters.PARAM_SEED: 42, variant.value.Parameters.PARAM_NUM_SIMULATIONS: 50,
+                      variant.value.Parameters.PARAM_ENABLE_DIAGNOSTICS: False,
+                      variant.value.Parameters.PARAM_NUM_REPLICATIONS: 3}
+        log1, res1 = montecarlo_simulation.apply(log, net, im, fm, variant=variant, parameters=parameters)
+        log2, res2 = montecarlo_simulation.apply(log, net, im, fm, variant=variant, parameters=parameters)
+        self.assertEqual(res1["cases_ex_time"], res2["cases_ex_time"])
+        self.assertEqual(len(log1) + res1["num_not_completed_cases"], 50)
+        self.assertEqual(len(res1["replications_statistics"]["median_cases_ex_time"]["values"]), 3)
+
+    def test_compiled_petri_net(self):
+        from pm4py.objects.petri_net import semantics
+        from pm4py.objects.petri_net.utils import compiled_net, reachability_graph
+        net, im, fm = pnml_importer.apply(
+            os.path.join(INPUT_DATA_DIR, "running-example.pnml"))
+        compiled = compiled_net.construct(net)
+        cim = compiled.encode_marking(im)
+        self.assertEqual(compiled.decode_marking(cim), im)
+        enabled = compiled.enabled_transitions(cim)
+        self.assertEqual({compiled.transitions[t] for t in enabled}, semantics.enabled_transitions(net, im))
+        for t, m in zip(enabled, compiled.fire_all(enabled, cim)):
+            self.assertEqual(m, compiled.fire(t, cim))
+            self.assertEqual(compiled.decode_marking(m), semantics.execute(compiled.transitions[t], net, im))
+        # the compiled net is used when no semantics is provided
+        classic = {reachability_graph.Parameters.PETRI_SEMANTICS: semantics.ClassicSemantics()}
+        self.assertEqual(reachability_graph.marking_flow_petri(net, im)[:2],
+                         reachability_graph.marking_flow_petri(net, im, parameters=classic)[:2])
+        variant = simulator.Variants.EXTENSIVE
+        parameters = {variant.value.Parameters.MAX_TRACE_LENGTH: 12}
+        log1 = simulator.apply(net, im, fm, variant=variant, parameters=parameters)
+        parameters[variant.value.Parameters.PETRI_SEMANTICS] = semantics.ClassicSemantics()
+        log2 = simulator.apply(net, im, fm, variant=variant, parameters=parameters)
+        self.assertEqual(sorted(tuple(e["concept:name"] for e in t) for t in log1),
+                         sorted(tuple(e["concept:name"] for e in t) for t in log2))
+
+    def test_state_space(self):
+        from pm4py.objects.petri_net.utils import reachability_graph, state_space
+        net, im, fm = pnml_importer.apply(
+            os.path.join(INPUT_DATA_DIR, "running-example.pnml"))
+        space = state_space.apply(net, im, fm)
+        self.assertTrue(space.complete)
+        incoming, outgoing, _ = reachability_graph.marking_flow_petri(net, im)
+        self.assertEqual(space.num_states, len(incoming))
+        self.assertEqual(space.num_edges, sum(len(x) for x in outgoing.values()))
+        self.assertEqual([space.get_marking(s) for s in space.deadlocks], [fm])
+        self.assertEqual(space.get_state(im), 0)
+        # the decoding of the markings is part of the time budget
+        parameters = {reachability_graph.Parameters.MAX_ELAB_TIME: 0}
+        self.assertEqual(reachability_graph.marking_flow_petri(net, im, parameters=parameters), ({im: set()}, {}, {}))
+        # when the time is over while computing the eventually enabled transitions, the remaining states are
+        # returned as not expanded
+        from pm4py.objects.petri_net.utils import align_utils
+        eventually_enabled_function = align_utils.get_visible_transitions_eventually_enabled_by_marking
+
+        def slow_eventually_enabled(net, marking):
+            time.sleep(0.05)
+            return eventually_enabled_function(net, marking)
+
+        align_utils.get_visible_transitions_eventually_enabled_by_marking = slow_eventually_enabled
+        try:
+            parameters = {reachability_graph.Parameters.MAX_ELAB_TIME: 0.2}
+            incoming, outgoing, eventually_enabled = reachability_graph.marking_flow_petri(
+                net, im, return_eventually_enabled=True, parameters=parameters)
+        finally:
+            align_utils.get_visible_transitions_eventually_enabled_by_marking = eventually_enabled_function
+        self.assertGreater(len(outgoing), 0)
+        self.assertLess(len(outgoing), space.num_states)
+        self.assertEqual(set(outgoing), set(eventually_enabled))
+        self.assertTrue(all(m2 in incoming for m1 in outgoing for m2 in outgoing[m1].values()))
+        # the reduced state space preserves the deadlocks
+        parameters = {state_space.Parameters.REDUCTION: state_space.REDUCTION_STUBBORN}
+        reduced = state_space.apply(net, im, fm, parameters=parameters)
+        self.assertLessEqual(reduced.num_states, space.num_states)
+        self.assertEqual([reduced.get_marking(s) for s in reduced.deadlocks], [fm])
+        budget = state_space.apply(net, im, fm, parameters={state_space.Parameters.MAX_STATES: 3})
+        self.assertEqual(budget.num_states, 3)
+        self.assertEqual(budget.interrupted, state_space.INTERRUPTED_MAX_STATES)
+        sound, diagnostics = state_space.check_soundness(net, im, fm)
+        self.assertTrue(sound)
+        parameters = {state_space.Parameters.MAX_STATES: 3}
+        sound, diagnostics = state_space.check_soundness(net, im, fm, parameters=parameters)
+        self.assertIsNone(sound)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -73,6 +73,28 @@ class StatisticsDfTest(unittest.TestCase):
         df = self.get_dataframe()
         msd_pandas.apply(df)
 
+    def test_prepared_log(self):
+        from pm4py.objects.log.util import prepared_log
+        from pm4py.algo.discovery.dfg import algorithm as dfg_discovery
+        from pm4py.statistics.start_activities.pandas import get as sa_get
+        from pm4py.statistics.end_activities.pandas import get as ea_get
+        from pm4py.statistics.variants.pandas import get as variants_get
+        from pm4py.algo.filtering.pandas.start_activities import start_activities_filter
+        from pm4py.algo.filtering.pandas.variants import variants_filter
+        df = self.get_dataframe()
+        prepared = prepared_log.apply(df)
+        self.assertEqual(dfg_discovery.apply(prepared), dfg_discovery.apply(df))
+        performance = dfg_discovery.Variants.PERFORMANCE
+        self.assertEqual(dfg_discovery.apply(prepared, variant=performance), dfg_discovery.apply(df, variant=performance))
+        self.assertEqual(sa_get.get_start_activities(prepared), sa_get.get_start_activities(df))
+        self.assertEqual(ea_get.get_end_activities(prepared), ea_get.get_end_activities(df))
+        self.assertEqual(variants_get.get_variants_count(prepared), variants_get.get_variants_count(df))
+        parameters = {start_activities_filter.Parameters.POSITIVE: False}
+        self.assertTrue(start_activities_filter.apply(prepared, ["Create Fine"], parameters=parameters).equals(
+            start_activities_filter.apply(df, ["Create Fine"], parameters=parameters)))
+        self.assertTrue(variants_filter.filter_variants_top_k(prepared, 3).equals(
+            variants_filter.filter_variants_top_k(df, 3)))
+
 
 if __name__ == "__main__":
     unittest.main()
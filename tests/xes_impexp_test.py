@@ -2,6 +2,7 @@ from pm4py.objects.log.importer.xes import importer as xes_importer
 from pm4py.objects.log.exporter.xes import exporter as xes_exporter
 from tests.constants import INPUT_DATA_DIR, OUTPUT_DATA_DIR, PROBLEMATIC_XES_DIR, COMPRESSED_INPUT_DATA
 import logging
+import pm4py
 import unittest
 import importlib.util
 import os
@@ -62,6 +63,62 @@ class XesImportExportTest(unittest.TestCase):
             log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "bpic2012.xes.gz"), variant=xes_importer.Variants.RUSTXES)
             self.assertEqual(len(log), 13087)
 
+    def test_chunk_regex_parallel_import(self):
+        import pandas as pd
+        from pm4py.objects.log.importer.xes.variants import chunk_regex_parallel
+        variant = xes_importer.Variants.CHUNK_REGEX_PARALLEL
+        for file in [os.path.join(INPUT_DATA_DIR, "reviewing.xes"), os.path.join(INPUT_DATA_DIR, "helpdesk.xes.gz")]:
+            df = xes_importer.apply(file, variant=xes_importer.Variants.ITERPARSE,
+                                    parameters={"return_legacy_log_object": False})
+            df = pm4py.convert_to_dataframe(df)
+            # small blocks, so the file is split in several parts
+            parameters = {variant.value.Parameters.RETURN_LEGACY_LOG_OBJECT: False,
+                          variant.value.Parameters.BLOCK_SIZE: 2 ** 16, variant.value.Parameters.CORES: 2}
+            pd.testing.assert_frame_equal(df, xes_importer.apply(file, variant=variant, parameters=parameters))
+            chunks = list(chunk_regex_parallel.iterate_dataframes(file, parameters=parameters))
+            self.assertGreater(len(chunks), 1)
+            self.assertEqual(sum(len(x) for x in chunks), len(df))
+
+    def test_columnar_cache(self):
+        import pandas as pd
+        import shutil
+        from datetime import datetime
+        from pm4py.objects.log.util import columnar_cache
+        file = os.path.join(INPUT_DATA_DIR, "reviewing.xes")
+        cache_dir = os.path.join(OUTPUT_DATA_DIR, "columnar_cache")
+        df = pm4py.read_xes(file)
+        # first read: the cache is created
+        pd.testing.assert_frame_equal(df.reset_index(drop=True), pm4py.read_xes(file, cache_dir=cache_dir))
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        # second read: the cache is re-used
+        cached = pm4py.read_xes(file, cache_dir=cache_dir)
+        pd.testing.assert_frame_equal(df.reset_index(drop=True), cached)
+        self.assertEqual(cached.attrs, df.attrs)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        log = pm4py.read_xes(file, cache_dir=cache_dir, return_legacy_log_object=True)
+        self.assertEqual(len(log), df["case:concept:name"].nunique())
+        # the options of the importer are part of the key of the cache
+        pm4py.read_xes(file, cache_dir=cache_dir, show_progress_bar=False)
+        self.assertEqual(len(os.listdir(cache_dir)), 2)
+        shutil.rmtree(cache_dir)
+        # missing strings, mixed types and nested values are restored as in the original dataframe
+        mixed = pd.DataFrame({"case:concept:name": ["1", "1", "2"], "concept:name": ["A", None, "B"],
+                              "org:resource": ["x", 1, None], "nested": [[1, "a"], {"k": 2.5}, None],
+                              "when": [datetime(2020, 1, 1), pd.Timestamp("2021-01-01 10:00:00+01:00"), pd.NaT]})
+        mixed_path = os.path.join(OUTPUT_DATA_DIR, "mixed.pm4pycache")
+        columnar_cache.write(mixed, mixed_path)
+        restored = columnar_cache.read(mixed_path)
+        pd.testing.assert_frame_equal(mixed, restored)
+        self.assertTrue(pd.isna(restored["concept:name"][1]))
+        self.assertIsNot(restored["concept:name"][1], None)
+        os.remove(mixed_path)
+        cache_path = os.path.join(OUTPUT_DATA_DIR, "reviewing.pm4pycache")
+        pm4py.write_cache(df, cache_path)
+        categorical = pm4py.read_cache(cache_path, categorical=True)
+        self.assertIsInstance(categorical["concept:name"].dtype, pd.CategoricalDtype)
+        self.assertEqual(categorical["concept:name"].astype(str).tolist(), df["concept:name"].tolist())
+        os.remove(cache_path)
+
 
 if __name__ == "__main__":
     unittest.main()